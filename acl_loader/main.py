@@ -5,6 +5,8 @@ import ipaddress
 import json
 import syslog
 import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import openconfig_acl
 import tabulate
@@ -12,6 +14,7 @@ import pyangbind.lib.pybindJSON as pybindJSON
 from natsort import natsorted
 from sonic_py_common import multi_asic
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
+from utilities_common import bulk_db
 from utilities_common.general import load_db_config
 
 def info(msg):
@@ -893,93 +896,105 @@ class AclLoader(object):
         be removed and new rules in that table will be installed.
         :return:
         """
-        for key in self.rules_db_info:
+        changes = []
+        for key in natsorted(self.rules_db_info):
             if self.current_table is None or self.current_table == key[0]:
-                self.configdb.mod_entry(self.ACL_RULE, key, None)
-                # Program for per front asic namespace also if present
-                for namespace_configdb in self.per_npu_configdb.values():
-                    namespace_configdb.mod_entry(self.ACL_RULE, key, None)
+                changes.append((key, None, None))
 
+        for key in natsorted(self.rules_info):
+            changes.append((key, self.rules_info[key], None))
 
-        self.configdb.mod_config({self.ACL_RULE: self.rules_info})
-        # Program for per front asic namespace also if present
-        for namespace_configdb in self.per_npu_configdb.values():
-            namespace_configdb.mod_config({self.ACL_RULE: self.rules_info})
+        self.write_rules(changes)
 
-    def incremental_update(self):
+    def diff_rules(self, keys, make_before_break=False):
+        """
+        Diff the rules loaded from file against the rules in Config DB.
+        :param keys: Set of rule keys to diff, from either side
+        :param make_before_break: Order added and changed rules before the
+                                  removed ones instead of after them
+        :return: List of (key, new rule or None, current rule or None)
+        """
+        added = []
+        removed = []
+        changed = []
+        for key in natsorted(keys):
+            if key not in self.rules_db_info:
+                added.append((key, self.rules_info[key], None))
+            elif key not in self.rules_info:
+                removed.append((key, None, self.rules_db_info[key]))
+            elif not operator.eq(self.rules_info[key], self.rules_db_info[key]):
+                changed.append((key, self.rules_info[key], self.rules_db_info[key]))
+
+        if make_before_break:
+            return added + changed + removed
+        return removed + added + changed
+
+    def incremental_update(self, dataplane_diff=False, make_before_break=False):
         """
         Perform incremental ACL rules configuration update. Get existing rules from
         Config DB. Compare with rules specified in file and perform corresponding
         modifications.
+        :param dataplane_diff: Only write the dataplane rules which changed instead
+                               of removing and re-adding all of them
+        :param make_before_break: Write added and changed rules before removing
+                                  the stale ones. Implies dataplane_diff.
         :return:
         """
 
         # TODO: Until we test ASIC behavior, we cannot assume that we can insert
-        # dataplane ACLs and shift existing ACLs. Therefore, we perform a full
-        # update on dataplane ACLs, and only perform an incremental update on
-        # control plane ACLs.
-
-        new_rules = set(self.rules_info.keys())
-        new_dataplane_rules = set()
-        new_controlplane_rules = set()
-        current_rules = set(self.rules_db_info.keys())
-        current_dataplane_rules = set()
-        current_controlplane_rules = set()
-
-        for key in new_rules:
-            table_name = key[0]
-            if self.tables_db_info[table_name]['type'].upper() == self.ACL_TABLE_TYPE_CTRLPLANE:
-                new_controlplane_rules.add(key)
-            else:
-                new_dataplane_rules.add(key)
+        # dataplane ACLs and shift existing ACLs. Therefore, unless asked for a
+        # dataplane diff, we perform a full update on dataplane ACLs, and only
+        # perform an incremental update on control plane ACLs.
 
-        for key in current_rules:
+        dataplane_rules = set()
+        controlplane_rules = set()
+
+        for key in set(self.rules_info).union(self.rules_db_info):
             table_name = key[0]
             if self.tables_db_info[table_name]['type'].upper() == self.ACL_TABLE_TYPE_CTRLPLANE:
-                current_controlplane_rules.add(key)
+                controlplane_rules.add(key)
             else:
-                current_dataplane_rules.add(key)
-
-        # Remove all existing dataplane rules
-        for key in current_dataplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, None)
-            # Program for per-asic namespace also if present
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-
-        # Add all new dataplane rules
-        for key in new_dataplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-            # Program for per-asic namespace corresponding to front asic also if present.
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-
-        added_controlplane_rules = new_controlplane_rules.difference(current_controlplane_rules)
-        removed_controlplane_rules = current_controlplane_rules.difference(new_controlplane_rules)
-        existing_controlplane_rules = new_rules.intersection(current_controlplane_rules)
-
-        for key in added_controlplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-            # Program for per-asic namespace corresponding to front asic also if present.
-            # For control plane ACL it's not needed but to keep all db in sync program everywhere
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, self.rules_info[key])
-
-        for key in removed_controlplane_rules:
-            self.configdb.mod_entry(self.ACL_RULE, key, None)
-            # Program for per-asic namespace corresponding to front asic also if present.
-            # For control plane ACL it's not needed but to keep all db in sync program everywhere
-            for namespace_configdb in self.per_npu_configdb.values():
-                namespace_configdb.mod_entry(self.ACL_RULE, key, None)
-
-        for key in existing_controlplane_rules:
-            if not operator.eq(self.rules_info[key], self.rules_db_info[key]):
-                self.configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
-                # Program for per-asic namespace corresponding to front asic also if present.
-                # For control plane ACL it's not needed but to keep all db in sync program everywhere
-                for namespace_configdb in self.per_npu_configdb.values():
-                    namespace_configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
+                dataplane_rules.add(key)
+
+        if dataplane_diff or make_before_break:
+            changes = self.diff_rules(dataplane_rules, make_before_break)
+        else:
+            # Remove all existing dataplane rules, then add all new ones
+            changes = [(key, None, None) for key in natsorted(dataplane_rules) if key in self.rules_db_info]
+            changes += [(key, self.rules_info[key], None)
+                        for key in natsorted(dataplane_rules) if key in self.rules_info]
+
+        changes += self.diff_rules(controlplane_rules, make_before_break)
+        self.write_rules(changes)
+
+    def write_rules(self, changes):
+        """
+        Write ACL rule changes to Config DB and, if present, to the Config DB
+        of every front asic namespace. Each namespace is written from its own
+        thread, in pipelined batches and in the order of changes.
+        :param changes: List of (key, new rule or None, current rule or None)
+        :return:
+        """
+        if not changes:
+            return
+
+        configdbs = [(multi_asic.DEFAULT_NAMESPACE, self.configdb)]
+        # Program for per front asic namespace also if present.
+        # For control plane ACL it's not needed but to keep all db in sync program everywhere
+        if self.per_npu_configdb:
+            configdbs += list(self.per_npu_configdb.items())
+
+        def write(configdb):
+            start = time.monotonic()
+            bulk_db.set_entries_pipelined(configdb, self.ACL_RULE, changes)
+            return time.monotonic() - start
+
+        with ThreadPoolExecutor(max_workers=len(configdbs)) as executor:
+            futures = [(namespace, executor.submit(write, configdb)) for namespace, configdb in configdbs]
+            for namespace, future in futures:
+                elapsed = future.result()
+                info("Wrote %d ACL rule changes to %s namespace in %.3fs"
+                     % (len(changes), namespace or "global", elapsed))
 
     def delete(self, table=None, rule=None):
         """
@@ -987,13 +1002,13 @@ class AclLoader(object):
         :param rule:
         :return:
         """
-        for key in self.rules_db_info:
+        changes = []
+        for key in natsorted(self.rules_db_info):
             if not table or table == key[0]:
                 if not rule or rule == key[1]:
-                    self.configdb.set_entry(self.ACL_RULE, key, None)
-                    # Program for per-asic namespace corresponding to front asic also if present.
-                    for namespace_configdb in self.per_npu_configdb.values():
-                        namespace_configdb.set_entry(self.ACL_RULE, key, None)
+                    changes.append((key, None, None))
+
+        self.write_rules(changes)
 
     def show_table(self, table_name):
         """
@@ -1278,8 +1293,12 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
 @click.option('--session_name', type=click.STRING, required=False)
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
+@click.option('--dataplane_diff', is_flag=True, default=False,
+              help="Only write the dataplane rules which changed")
+@click.option('--make_before_break', is_flag=True, default=False,
+              help="Write added and changed rules before removing stale ones. Implies --dataplane_diff")
 @click.pass_context
-def incremental(ctx, filename, session_name, mirror_stage, max_priority):
+def incremental(ctx, filename, session_name, mirror_stage, max_priority, dataplane_diff, make_before_break):
     """
     Incremental update of ACL rule configuration.
     """
@@ -1294,7 +1313,7 @@ def incremental(ctx, filename, session_name, mirror_stage, max_priority):
         acl_loader.set_max_priority(max_priority)
 
     acl_loader.load_rules_from_file(filename)
-    acl_loader.incremental_update()
+    acl_loader.incremental_update(dataplane_diff, make_before_break)
 
 
 @cli.command()
@@ -0,0 +1,268 @@
+# Generated by 'python -m utilities_common.cli_manifest config', do not edit.
+"""Name and help of the lazily loaded top-level 'config' commands, by import path,
+and of the top-level commands of the 'config' plugins, by plugin module"""
+
+COMMANDS = {
+    'config.aaa:aaa': {
+        'name': 'aaa',
+        'help': 'AAA command line',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.aaa:tacacs': {
+        'name': 'tacacs',
+        'help': 'TACACS+ server configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.aaa:radius': {
+        'name': 'radius',
+        'help': 'RADIUS server configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.bmc:bmc': {
+        'name': 'bmc',
+        'help': 'BMC (Baseboard Management Controller) configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.chassis_modules:chassis': {
+        'name': 'chassis',
+        'help': 'Configure chassis commands group',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.liquid_cool:liquid_cool': {
+        'name': 'liquid-cool',
+        'help': 'Liquid cooling configuration commands',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.console:console': {
+        'name': 'console',
+        'help': 'Console-related configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.fabric:fabric': {
+        'name': 'fabric',
+        'help': 'FABRIC-related configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.feature:feature': {
+        'name': 'feature',
+        'help': 'Configure features',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.flow_counters:flowcnt_route': {
+        'name': 'flowcnt-route',
+        'help': 'Route flow counter related configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.hft:hft': {
+        'name': 'hft',
+        'help': 'Top-level command group for HFT operations.',
+        'short_help': 'Manage high frequency telemetry',
+        'hidden': False,
+    },
+    'config.kdump:kdump': {
+        'name': 'kdump',
+        'help': 'Configure the KDUMP mechanism',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.kube:kubernetes': {
+        'name': 'kubernetes',
+        'help': 'kubernetes command line',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.muxcable:muxcable': {
+        'name': 'muxcable',
+        'help': 'Show muxcable information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.nat:nat': {
+        'name': 'nat',
+        'help': 'NAT-related configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.vlan:vlan': {
+        'name': 'vlan',
+        'help': 'VLAN-related configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.vxlan:vxlan': {
+        'name': 'vxlan',
+        'help': None,
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.evpn_mh:evpn_mh': {
+        'name': 'evpn-mh',
+        'help': 'Set EVPN MH attributes',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.stp:spanning_tree': {
+        'name': 'spanning-tree',
+        'help': 'STP command line',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.llr:llr': {
+        'name': 'llr',
+        'help': 'Configure LLR (Link Layer Retry)',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.mclag:mclag': {
+        'name': 'mclag',
+        'help': None,
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.mclag:mclag_member': {
+        'name': 'member',
+        'help': None,
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.mclag:mclag_unique_ip': {
+        'name': 'unique-ip',
+        'help': 'Configure Unique IP on MCLAG Vlan interface',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.syslog:syslog': {
+        'name': 'syslog',
+        'help': 'Configure syslog server',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.sed:sed': {
+        'name': 'sed',
+        'help': 'SED (Self-Encrypting Drive) password management commands',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.dns:dns': {
+        'name': 'dns',
+        'help': 'Static DNS configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'config.switchport:switchport': {
+        'name': 'switchport',
+        'help': 'Switchport mode configuration tasks',
+        'short_help': None,
+        'hidden': False,
+    },
+}
+
+PLUGINS = {
+    'config.plugins.auto_techsupport': {
+        'auto-techsupport': {
+            'name': 'auto-techsupport',
+            'help': 'AUTO_TECHSUPPORT part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+        'auto-techsupport-feature': {
+            'name': 'auto-techsupport-feature',
+            'help': 'AUTO_TECHSUPPORT_FEATURE part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.barefoot': {},
+    'config.plugins.mlnx': {},
+    'config.plugins.nvgre_tunnel': {
+        'nvgre-tunnel': {
+            'name': 'nvgre-tunnel',
+            'help': 'NVGRE_TUNNEL part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+        'nvgre-tunnel-map': {
+            'name': 'nvgre-tunnel-map',
+            'help': 'NVGRE_TUNNEL_MAP part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.nvidia_bluefield': {},
+    'config.plugins.pbh': {
+        'pbh': {
+            'name': 'pbh',
+            'help': 'Configure PBH (Policy based hashing) feature',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.sonic-fine-grained-ecmp_yang': {
+        'fg-nhg': {
+            'name': 'fg-nhg',
+            'help': 'FG_NHG part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+        'fg-nhg-prefix': {
+            'name': 'fg-nhg-prefix',
+            'help': 'FG_NHG_PREFIX part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+        'fg-nhg-member': {
+            'name': 'fg-nhg-member',
+            'help': 'FG_NHG_MEMBER part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.sonic-hash': {
+        'switch-hash': {
+            'name': 'switch-hash',
+            'help': 'Configure switch hash feature',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.sonic-passwh_yang': {
+        'passw-hardening': {
+            'name': 'passw-hardening',
+            'help': 'PASSWORD HARDENING part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.sonic-system-ldap_yang': {
+        'ldap-server': {
+            'name': 'ldap-server',
+            'help': '',
+            'short_help': None,
+            'hidden': False,
+        },
+        'ldap': {
+            'name': 'ldap',
+            'help': '',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'config.plugins.sonic-trimming': {
+        'switch-trimming': {
+            'name': 'switch-trimming',
+            'help': 'Configure switch trimming feature',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+}
@@ -13,6 +13,7 @@ from sys import flags
 from time import sleep as tsleep
 
 import sonic_yang
+from generic_config_updater.yang_cache import load_yang_models
 from jsondiff import diff
 from sonic_py_common import port_util
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
@@ -70,7 +71,7 @@ class ConfigMgmt():
     def __init_sonic_yang(self):
         self.sy = sonic_yang.SonicYang(YANG_DIR, debug=self.DEBUG)
         # load yang models
-        self.sy.loadYangModel()
+        load_yang_models(self.sy)
         # load jIn from config DB or from config DB json file.
         if self.source.lower() == 'configdb':
             self.readConfigDB()
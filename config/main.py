@@ -21,6 +21,7 @@ from jsonpointer import JsonPointerException
 from collections import OrderedDict
 from generic_config_updater.generic_updater import GenericUpdater, ConfigFormat
 from generic_config_updater.gu_common import HOST_NAMESPACE
+from generic_config_updater.yang_cache import load_yang_models
 from generic_config_updater.main import (
     apply_patch_from_file as _gcu_apply_patch_from_file
 )
@@ -38,6 +39,7 @@ from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector, ConfigDBP
 from utilities_common.db import Db
 from utilities_common.intf_filter import parse_interface_in_filter
 from utilities_common import bgp_util
+from utilities_common.parallel import imap_ordered
 import utilities_common.cli as clicommon
 from utilities_common.helper import get_port_pbh_binding, get_port_acl_binding, update_config
 from utilities_common.general import load_db_config, load_module_from_source
@@ -48,32 +50,45 @@ from utilities_common import hft as hft_common
 
 from .utils import log
 
-from . import aaa
-from . import bmc
-from . import chassis_modules
-from . import liquid_cool
-from . import console
-from . import feature
-from . import fabric
-from . import flow_counters
-from . import hft
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import sed
-from . import vlan
-from . import vxlan
 from . import plugins
 from .config_mgmt import ConfigMgmtDPB, ConfigMgmt, YANG_DIR
-from . import mclag
-from . import syslog
-from . import switchport
-from . import dns
 from . import bgp_cli
-from . import stp
-from . import evpn_mh
-from . import llr
+from .commands_manifest import COMMANDS as COMMANDS_MANIFEST, PLUGINS as PLUGINS_MANIFEST
+
+# Top-level commands of the submodules, imported when they are first looked
+# up. Run 'python -m utilities_common.cli_manifest config' after changing them.
+LAZY_COMMANDS = [
+    'config.aaa:aaa',
+    'config.aaa:tacacs',
+    'config.aaa:radius',
+    'config.bmc:bmc',
+    'config.chassis_modules:chassis',
+    'config.liquid_cool:liquid_cool',
+    'config.console:console',
+    'config.fabric:fabric',
+    'config.feature:feature',
+    'config.flow_counters:flowcnt_route',
+    'config.hft:hft',
+    'config.kdump:kdump',
+    'config.kube:kubernetes',
+    'config.muxcable:muxcable',
+    'config.nat:nat',
+    'config.vlan:vlan',
+    'config.vxlan:vxlan',
+    'config.evpn_mh:evpn_mh',
+    'config.stp:spanning_tree',
+    'config.llr:llr',
+    'config.mclag:mclag',
+    'config.mclag:mclag_member',
+    'config.mclag:mclag_unique_ip',
+    'config.syslog:syslog',
+    'config.sed:sed',
+    'config.dns:dns',
+    'config.switchport:switchport',
+]
+
+# The submodules stay reachable as attributes, e.g. config.main.vlan
+__getattr__ = clicommon.lazy_submodule_getattr(__name__, LAZY_COMMANDS)
 
 # mock masic APIs for unit test
 try:
@@ -1653,9 +1668,54 @@ def migrate_db_to_lastest(namespace=DEFAULT_NAMESPACE):
         clicommon.run_command(command, display_cmd=True)
 
 
-def multiasic_write_to_db(filename, load_sysinfo):
+def run_namespaces_in_parallel(action, namespaces, func, host_first=True):
+    """
+    Run func(namespace) for all the namespaces at once, one thread each.
+    With host_first, the host namespace runs alone before the others, which
+    are skipped if it fails. Echoes the time each namespace took, then the
+    namespaces which failed with their error, and exits with 1 if any did.
+    """
+    def run(namespace):
+        start = time.monotonic()
+        error = None
+        try:
+            func(namespace)
+        except SystemExit as e:
+            # clicommon.run_command() exits when a command fails
+            if e.code:
+                error = "exited with code {}".format(e.code)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        return time.monotonic() - start, error
+
+    first = [ns for ns in namespaces if host_first and ns == DEFAULT_NAMESPACE]
+    others = [ns for ns in namespaces if ns not in first]
+    results = [(ns, run(ns)) for ns in first]
+    failed = [ns for ns, (_, error) in results if error]
+    if failed:
+        results += [(ns, (0, "skipped as the host namespace failed")) for ns in others]
+    elif others:
+        results += [(ns, result) for ns, result, _ in
+                    imap_ordered(run, others, workers=len(others))]
+
+    errors = []
+    for ns, (elapsed, error) in results:
+        asic_name = HOST_NAMESPACE if ns == DEFAULT_NAMESPACE else ns
+        click.echo("'{}' {} {} in {:.1f}s".format(action, asic_name, "failed" if error else "done", elapsed))
+        if error:
+            errors.append("{}: {}".format(asic_name, error))
+    if errors:
+        click.secho("'{}' failed in {} of {} namespace(s):".format(action, len(errors), len(results)),
+                    fg='red', err=True)
+        for error in errors:
+            click.secho("    {}".format(error), fg='red', err=True)
+        sys.exit(1)
+
+
+def multiasic_write_to_db(filename, load_sysinfo, parallel=False):
     file_input = read_json_file(filename)
-    for ns in [DEFAULT_NAMESPACE, *multi_asic.get_namespace_list()]:
+
+    def write_to_db(ns):
         asic_name = HOST_NAMESPACE if ns == DEFAULT_NAMESPACE else ns
         asic_config = file_input[asic_name]
 
@@ -1692,6 +1752,65 @@ def multiasic_write_to_db(filename, load_sysinfo):
 
         migrate_db_to_lastest(ns)
 
+    namespaces = [DEFAULT_NAMESPACE, *multi_asic.get_namespace_list()]
+    if parallel:
+        run_namespaces_in_parallel('reload', namespaces, write_to_db)
+    else:
+        for ns in namespaces:
+            write_to_db(ns)
+
+
+def reload_namespace_config(namespace, file, file_format, load_sysinfo, cfg_hwsku, clear_state_tables=True):
+    """
+    Replace the CONFIG_DB of namespace with the config in file, then
+    migrate it to the latest version
+    """
+    client, config_db = flush_configdb(namespace)
+    if clear_state_tables:
+        delete_transceiver_tables()
+        delete_bgp_peer_table()
+
+    if load_sysinfo:
+        if namespace is DEFAULT_NAMESPACE:
+            command = [
+                str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '--write-to-db']
+        else:
+            command = [
+                str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '-n', str(namespace), '--write-to-db']
+        clicommon.run_command(command, display_cmd=True)
+
+    # For the database service running in linux host we use the file user gives as input
+    # or by default DEFAULT_CONFIG_DB_FILE. In the case of database service running in namespace,
+    # the default config_db<namespaceID>.json format is used.
+
+    config_gen_opts = []
+
+    if os.path.isfile(INIT_CFG_FILE):
+        config_gen_opts += ['-j', str(INIT_CFG_FILE)]
+
+    if file_format == 'config_db':
+        config_gen_opts += ['-j', str(file)]
+    else:
+        config_gen_opts += ['-Y', str(file)]
+
+    if namespace is not DEFAULT_NAMESPACE:
+        config_gen_opts += ['-n', str(namespace)]
+
+    command = [SONIC_CFGGEN_PATH] + config_gen_opts + ['--write-to-db']
+
+    clicommon.run_command(command, display_cmd=True)
+    client.set(config_db.INIT_INDICATOR, 1)
+
+    if os.path.exists(file) and file.endswith("_configReloadStdin"):
+        # Remove tmpfile
+        try:
+            os.remove(file)
+        except OSError as e:
+            click.echo("An error occurred while removing the temporary file: {}".format(str(e)), err=True)
+
+    # Migrate DB contents to latest version
+    migrate_db_to_lastest(namespace)
+
 
 def config_file_yang_validation(filename):
     config = read_json_file(filename)
@@ -1701,7 +1820,7 @@ def config_file_yang_validation(filename):
         return False
 
     sy = sonic_yang.SonicYang(YANG_DIR)
-    sy.loadYangModel()
+    load_yang_models(sy)
     asic_list = [HOST_NAMESPACE]
     if multi_asic.is_multi_asic():
         asic_list.extend(multi_asic.get_namespace_list())
@@ -1750,7 +1869,7 @@ def check_dhcpv4_relay_dependencies(db, object_name, object_type):
 
 
 # This is our main entrypoint - the main 'config' command
-@click.group(cls=clicommon.AbbreviationGroup, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=clicommon.LazyAbbreviationGroup, context_settings=CONTEXT_SETTINGS)
 @click.pass_context
 def config(ctx):
     """SONiC command line - 'config' command"""
@@ -1783,55 +1902,17 @@ def config(ctx):
 
 
 # Add groups from other modules
-config.add_command(aaa.aaa)
-config.add_command(aaa.tacacs)
-config.add_command(aaa.radius)
-config.add_command(bmc.bmc)
-config.add_command(chassis_modules.chassis)
-config.add_command(liquid_cool.liquid_cool)
-config.add_command(console.console)
-config.add_command(fabric.fabric)
-config.add_command(feature.feature)
-config.add_command(flow_counters.flowcnt_route)
-if hft_common.is_supported_platform():
-    config.add_command(hft.hft)
-config.add_command(kdump.kdump)
-config.add_command(kube.kubernetes)
-config.add_command(muxcable.muxcable)
-config.add_command(nat.nat)
-config.add_command(vlan.vlan)
-config.add_command(vxlan.vxlan)
-config.add_command(evpn_mh.evpn_mh)
-
-# add stp commands
-config.add_command(stp.spanning_tree)
-
-# add llr commands
-config.add_command(llr.llr)
-
-# add mclag commands
-config.add_command(mclag.mclag)
-config.add_command(mclag.mclag_member)
-config.add_command(mclag.mclag_unique_ip)
-
-# syslog module
-config.add_command(syslog.syslog)
-
-# SED module
-config.add_command(sed.sed)
-
-# DNS module
-config.add_command(dns.dns)
-
-# Switchport module
-config.add_command(switchport.switchport)
+config.add_lazy_commands(LAZY_COMMANDS, COMMANDS_MANIFEST, conditions={
+    'config.hft:hft': hft_common.is_supported_platform,
+})
 
 @config.command()
 @click.option('-y', '--yes', is_flag=True, callback=_abort_if_false,
                 expose_value=False, prompt='Existing files will be overwritten, continue?')
+@click.option('--parallel', default=False, is_flag=True, help='Save the config of the namespaces concurrently')
 @click.argument('filename', required=False)
 @clicommon.pass_db
-def save(db, filename):
+def save(db, filename, parallel):
     """Export current config DB to a file on disk.\n
        <filename> : Names of configuration file(s) to save, separated by comma with no spaces in between
     """
@@ -1858,6 +1939,7 @@ def save(db, filename):
 
     # In case of multi-asic mode we have additional config_db{NS}.json files for
     # various namespaces created per ASIC. {NS} is the namespace index.
+    namespace_files = OrderedDict()
     for inst in range(-1, num_cfg_file-1):
         #inst = -1, refers to the linux host where there is no namespace.
         if inst == -1:
@@ -1874,19 +1956,34 @@ def save(db, filename):
             else:
                 file = "/etc/sonic/config_db{}.json".format(inst)
 
-        if namespace is None:
-            command = "{} -d --print-data > {}".format(SONIC_CFGGEN_PATH, file)
+        if parallel:
+            namespace_files[namespace or DEFAULT_NAMESPACE] = file
         else:
-            command = "{} -n {} -d --print-data > {}".format(SONIC_CFGGEN_PATH, namespace, file)
+            save_namespace_config(namespace, file)
+
+    if parallel:
+        run_namespaces_in_parallel('save', list(namespace_files),
+                                   lambda ns: save_namespace_config(ns or None, namespace_files[ns]),
+                                   host_first=False)
+
+
+def save_namespace_config(namespace, file):
+    """
+    Write the CONFIG_DB of namespace, None for the host, to file
+    """
+    if namespace is None:
+        command = "{} -d --print-data > {}".format(SONIC_CFGGEN_PATH, file)
+    else:
+        command = "{} -n {} -d --print-data > {}".format(SONIC_CFGGEN_PATH, namespace, file)
 
-        log.log_info("'save' executing...")
-        clicommon.run_command(command, display_cmd=True, shell=True)
+    log.log_info("'save' executing...")
+    clicommon.run_command(command, display_cmd=True, shell=True)
 
-        config_db = sort_dict(read_json_file(file))
-        with open(file, 'w') as config_db_file:
-            json.dump(config_db, config_db_file, indent=4)
-            config_db_file.flush()
-            os.fsync(config_db_file.fileno())
+    config_db = sort_dict(read_json_file(file))
+    with open(file, 'w') as config_db_file:
+        json.dump(config_db, config_db_file, indent=4)
+        config_db_file.flush()
+        os.fsync(config_db_file.fileno())
 
 @config.command()
 @click.option('-y', '--yes', is_flag=True)
@@ -1972,6 +2069,9 @@ def print_dry_run_message(dry_run):
     help='filename to write decision path trace for patch generation as JSON',
     hidden=True,
 )
+@click.option('-w', '--validation-workers', type=int, default=0, show_default=True,
+              help='number of processes validating candidate moves concurrently, 0 to validate in-process',
+              hidden=True)
 
 @click.pass_context
 def apply_patch(
@@ -1984,6 +2084,7 @@ def apply_patch(
     ignore_path,
     verbose,
     path_trace,
+    validation_workers,
 ):
     """Apply given patch of updates to Config. A patch is a JsonPatch which follows rfc6902.
        This command can be used do partial updates to the config with minimum disruption to running processes.
@@ -2007,6 +2108,7 @@ def apply_patch(
             ignore_non_yang_tables=ignore_non_yang_tables,
             ignore_path=ignore_path,
             trace_io=trace_io,
+            validation_workers=validation_workers,
         )
 
         log.log_notice("Patch applied successfully.")
@@ -2035,8 +2137,12 @@ def apply_patch(
     help='filename to output decision path trace for patch generation as JSON',
     hidden=True,
 )
+@click.option('-w', '--validation-workers', type=int, default=0, show_default=True,
+              help='number of processes validating candidate moves concurrently, 0 to validate in-process',
+              hidden=True)
 @click.pass_context
-def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose, path_trace):
+def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, ignore_path, verbose, path_trace,
+            validation_workers):
     """Replace the whole config with the specified config. The config is replaced with minimum disruption e.g.
        if ACL config is different between current and target config only ACL config is updated, and other config/services
        such as DHCP will not be affected.
@@ -2057,7 +2163,7 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
         if path_trace is not None:
             trace_io = open(path_trace, 'w')
 
-        GenericUpdater().replace(
+        GenericUpdater(validation_workers=validation_workers).replace(
             target_config,
             config_format,
             verbose,
@@ -2081,8 +2187,11 @@ def replace(ctx, target_file_path, format, dry_run, ignore_non_yang_tables, igno
 @click.option('-n', '--ignore-non-yang-tables', is_flag=True, default=False, help='ignore validation for tables without YANG models', hidden=True)
 @click.option('-i', '--ignore-path', multiple=True, help='ignore validation for config specified by given path which is a JsonPointer', hidden=True)
 @click.option('-v', '--verbose', is_flag=True, default=False, help='print additional details of what the operation is doing')
+@click.option('-w', '--validation-workers', type=int, default=0, show_default=True,
+              help='number of processes validating candidate moves concurrently, 0 to validate in-process',
+              hidden=True)
 @click.pass_context
-def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path, verbose):
+def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path, verbose, validation_workers):
     """Rollback the whole config to the specified checkpoint. The config is rolled back with minimum disruption e.g.
        if ACL config is different between current and checkpoint config only ACL config is updated, and other config/services
        such as DHCP will not be affected.
@@ -2091,7 +2200,8 @@ def rollback(ctx, checkpoint_name, dry_run, ignore_non_yang_tables, ignore_path,
     try:
         print_dry_run_message(dry_run)
 
-        GenericUpdater().rollback(checkpoint_name, verbose, dry_run, ignore_non_yang_tables, ignore_path)
+        GenericUpdater(validation_workers=validation_workers).rollback(
+            checkpoint_name, verbose, dry_run, ignore_non_yang_tables, ignore_path)
 
         click.secho("Config rolled back successfully.", fg="cyan", underline=True)
     except Exception as ex:
@@ -2152,10 +2262,12 @@ def list_checkpoints(ctx, time, verbose):
 @click.option('-f', '--force', default=False, is_flag=True, help='Force config reload without system checks')
 @click.option('-t', '--file_format', default='config_db',type=click.Choice(['config_yang', 'config_db']),show_default=True,help='specify the file format')
 @click.option('-b', '--bypass-lock', default=False, is_flag=True, help='Do reload without acquiring lock')
+@click.option('--parallel', default=False, is_flag=True,
+              help='Load the config of the ASIC namespaces concurrently, after the host')
 @click.argument('filename', required=False)
 @clicommon.pass_db
 @try_lock(SYSTEM_RELOAD_LOCK, timeout=0)
-def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_format, bypass_lock):
+def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_format, bypass_lock, parallel):
     """Clear current configuration and import a previous saved config DB dump file.
        <filename> : Names of configuration file(s) to load, separated by comma with no spaces in between
     """
@@ -2258,12 +2370,14 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
         _stop_services()
 
     if multiasic_single_file_mode:
-        multiasic_write_to_db(cfg_files[0], load_sysinfo)
+        multiasic_write_to_db(cfg_files[0], load_sysinfo, parallel)
     else:
         # In Single ASIC platforms we have single DB service. In multi-ASIC platforms we have a global DB
         # service running in the host + DB services running in each ASIC namespace created per ASIC.
         # In the below logic, we get all namespaces in this platform and add an empty namespace ''
         # denoting the current namespace which we are in ( the linux host )
+        cfg_hwsku = None
+        namespace_loads = OrderedDict()
         for inst in range(-1, num_cfg_file-1):
             # Get the namespace name, for linux host it is DEFAULT_NAMESPACE
             if inst == -1:
@@ -2318,50 +2432,18 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
 
                 cfg_hwsku = output.strip()
 
-            client, config_db = flush_configdb(namespace)
-            delete_transceiver_tables()
-            delete_bgp_peer_table()
-
-            if load_sysinfo:
-                if namespace is DEFAULT_NAMESPACE:
-                    command = [
-                        str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '--write-to-db']
-                else:
-                    command = [
-                        str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '-n', str(namespace), '--write-to-db']
-                clicommon.run_command(command, display_cmd=True)
-
-            # For the database service running in linux host we use the file user gives as input
-            # or by default DEFAULT_CONFIG_DB_FILE. In the case of database service running in namespace,
-            # the default config_db<namespaceID>.json format is used.
-
-            config_gen_opts = []
-
-            if os.path.isfile(INIT_CFG_FILE):
-                config_gen_opts += ['-j', str(INIT_CFG_FILE)]
-
-            if file_format == 'config_db':
-                config_gen_opts += ['-j', str(file)]
+            if parallel:
+                namespace_loads[namespace] = (file, file_format, load_sysinfo, cfg_hwsku)
             else:
-                config_gen_opts += ['-Y', str(file)]
-
-            if namespace is not DEFAULT_NAMESPACE:
-                config_gen_opts += ['-n', str(namespace)]
+                reload_namespace_config(namespace, file, file_format, load_sysinfo, cfg_hwsku)
 
-            command = [SONIC_CFGGEN_PATH] + config_gen_opts + ['--write-to-db']
-
-            clicommon.run_command(command, display_cmd=True)
-            client.set(config_db.INIT_INDICATOR, 1)
-
-            if os.path.exists(file) and file.endswith("_configReloadStdin"):
-                # Remove tmpfile
-                try:
-                    os.remove(file)
-                except OSError as e:
-                    click.echo("An error occurred while removing the temporary file: {}".format(str(e)), err=True)
-
-            # Migrate DB contents to latest version
-            migrate_db_to_lastest(namespace)
+        if parallel:
+            # The host STATE_DB tables are cleared once for all the namespaces
+            delete_transceiver_tables()
+            delete_bgp_peer_table()
+            run_namespaces_in_parallel(
+                'reload', list(namespace_loads),
+                lambda ns: reload_namespace_config(ns, *namespace_loads[ns], clear_state_tables=False))
 
     # Re-generate the environment variable in case config_db.json was edited
     update_sonic_environment()
@@ -10158,9 +10240,10 @@ def smoothing_interval(interval, rates_type):
         counters_db.set('COUNTERS_DB', 'RATES:TRAP', 'TRAP_ALPHA', alpha)
 
 
-# Load plugins and register them
+# Load plugins and register them, when a command could be theirs
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, config)
+config.defer(lambda: helper.load_and_register_plugins(plugins, config),
+             clicommon.plugin_manifest(plugins, PLUGINS_MANIFEST))
 
 #
 # 'subinterface' group ('config subinterface ...')
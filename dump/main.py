@@ -2,11 +2,14 @@ import os
 import sys
 import json
 import re
+import threading
 import click
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tabulate import tabulate
 from sonic_py_common import multi_asic
 from utilities_common.constants import DEFAULT_NAMESPACE
-from dump.match_infra import RedisSource, JsonSource, MatchEngine, CONN
+from dump.match_infra import RedisSource, JsonSource, MatchEngine
 from swsscommon.swsscommon import ConfigDBConnector, SonicDBConfig
 from dump import plugins
 
@@ -50,7 +53,9 @@ def dump(ctx):
               help="Prints any intermediate output to stdout useful for dev & troubleshooting")
 @click.option('--namespace', '-n', default=DEFAULT_NAMESPACE, type=str,
               show_default=True, help='Dump the redis-state for this namespace.')
-def state(ctx, module, identifier, db, table, key_map, verbose, namespace):
+@click.option('--workers', '-w', default=1, type=click.IntRange(min=1), show_default=True,
+              help='Number of identifiers dumped concurrently')
+def state(ctx, module, identifier, db, table, key_map, verbose, namespace, workers):
     """
     Dump the current state of the identifier for the specified module from Redis DB or CONFIG_FILE
     """
@@ -79,32 +84,114 @@ def state(ctx, module, identifier, db, table, key_map, verbose, namespace):
     if identifier == "all":
         ids = obj.get_all_args(namespace)
     else:
-        ids = identifier.split(",")
-
-    params = {}
-    collected_info = {}
-    params['namespace'] = namespace
-    for arg in ids:
-        params[plugins.dump_modules[module].ARG_NAME] = arg
-        try:
-            collected_info[arg] = obj.execute(params)
-        except ValueError as err:
-            click.fail(f"Failed to execute plugin: {err}")
-
-    if len(db) > 0:
-        collected_info = filter_out_dbs(db, collected_info)
-
-    vidtorid = extract_rid(collected_info, namespace, ctx.obj.conn_pool)
+        # Dump each identifier once, a repeated one would repeat its key in the JSON object
+        ids = list(dict.fromkeys(identifier.split(",")))
+
+    if len(ids) > 1:
+        # Several objects request keys of the same tables, read each table's keys once
+        ctx.obj.conn_pool.index_keys = True
+
+    collector = Collector(ctx.obj, module, namespace, db, key_map, obj)
+    try:
+        results = collector.run(ids, workers)
+        if table:
+            collected_info = {}
+            for arg, info in results:
+                collected_info.update(info)
+            print_dump(collected_info, table, module, identifier, key_map)
+        else:
+            stream_dump(results)
+    except ValueError as err:
+        ctx.fail(f"Failed to execute plugin: {err}")
 
-    if not key_map:
-        collected_info = populate_fv(collected_info, module, namespace, ctx.obj.conn_pool, obj.return_pb2_obj())
+    return
 
-    for id in vidtorid.keys():
-        collected_info[id]["ASIC_DB"]["vidtorid"] = vidtorid[id]
 
-    print_dump(collected_info, table, module, identifier, key_map)
+class Collector:
+    """
+    Collects the dump of identifiers, one at a time or with a pool of worker
+    threads. Each worker thread runs its own plugin instance, all of them
+    share the MatchEngine and its ConnectionPool.
+    """
 
-    return
+    def __init__(self, match_engine, module, namespace, db, key_map, plugin):
+        self.match_engine = match_engine
+        self.module = module
+        self.namespace = namespace
+        self.db = db
+        self.key_map = key_map
+        self.plugin = plugin
+        self.owner = threading.get_ident()
+        self.local = threading.local()
+
+    def get_plugin(self):
+        if threading.get_ident() == self.owner:
+            return self.plugin
+        if not hasattr(self.local, "plugin"):
+            self.local.plugin = plugins.dump_modules[self.module](self.match_engine)
+        return self.local.plugin
+
+    def collect(self, arg):
+        """ Returns the dump of one identifier as {arg: info} """
+        plugin = self.get_plugin()
+        params = {'namespace': self.namespace, plugins.dump_modules[self.module].ARG_NAME: arg}
+        collected_info = {arg: plugin.execute(params)}
+
+        if len(self.db) > 0:
+            collected_info = filter_out_dbs(self.db, collected_info)
+
+        conn_pool = self.match_engine.conn_pool
+        vidtorid = extract_rid(collected_info, self.namespace, conn_pool)
+
+        if not self.key_map:
+            collected_info = populate_fv(collected_info, self.module, self.namespace, conn_pool,
+                                         plugin.return_pb2_obj())
+
+        for id in vidtorid.keys():
+            collected_info[id]["ASIC_DB"]["vidtorid"] = vidtorid[id]
+        return collected_info
+
+    def run(self, ids, workers=1):
+        """
+        Generator of (arg, {arg: info}) in the order of ids. With more than one
+        worker, at most 2 * workers identifiers are in flight, so memory does
+        not grow with the number of identifiers.
+        """
+        if workers <= 1:
+            for arg in ids:
+                yield arg, self.collect(arg)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for arg in ids:
+                pending.append((arg, executor.submit(self.collect, arg)))
+                if len(pending) >= 2 * workers:
+                    arg, future = pending.popleft()
+                    yield arg, future.result()
+            while pending:
+                arg, future = pending.popleft()
+                yield arg, future.result()
+
+
+def stream_dump(results):
+    """
+    Print the results as one JSON object, as print_dump does, writing each
+    identifier as soon as it is collected. The object is closed even if
+    collecting an identifier fails, so the output printed so far stays valid
+    JSON.
+    """
+    first = True
+    try:
+        for arg, info in results:
+            # Members of the top level object, as json.dumps(collected_info, indent=4) prints them
+            members = json.dumps(info, indent=4).split("\n")[1:-1]
+            if not members:
+                continue
+            click.echo(("{\n" if first else ",\n") + "\n".join(members), nl=False)
+            first = False
+    finally:
+        click.echo("{}" if first else "\n}")
 
 
 def extract_rid(info, ns, conn_pool):
@@ -156,15 +243,14 @@ def populate_fv(info, module, namespace, conn_pool, dash_object):
             all_dbs.add(db_name)
 
     db_cfg_file = JsonSource()
+    db_conn = None
     for db_name in all_dbs:
         if db_name == "CONFIG_FILE":
             db_cfg_file.connect(plugins.dump_modules[module].CONFIG_FILE, namespace)
         else:
-            conn_pool.get(db_name, namespace)
+            db_conn = conn_pool.get(db_name, namespace)
     if dash_object:
-        conn_pool.get_dash_conn(namespace)
-        redis_conn = conn_pool.cache.get(namespace, {}).get("DASH_"+CONN, None)
-    db_conn = conn_pool.cache.get(namespace, {}).get(CONN, None)
+        redis_conn = conn_pool.get_dash_conn(namespace)
 
     final_info = {}
     for id in info.keys():
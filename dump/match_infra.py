@@ -1,12 +1,15 @@
 import json
 import fnmatch
 import copy
+import re
+import threading
 from abc import ABC, abstractmethod
 from dump.helper import verbose_print
 from swsscommon.swsscommon import SonicV2Connector, SonicDBConfig
 from sonic_py_common import multi_asic
 from utilities_common.constants import DEFAULT_NAMESPACE
 from utilities_common.general import load_db_config
+from utilities_common import bulk_db
 import redis
 
 
@@ -31,6 +34,8 @@ EXCEP_DICT = {
     "INV_NS": "Namespace is invalid"
 }
 
+GLOB_CHARS = set("*?[")
+
 
 class MatchRequest:
     """
@@ -166,17 +171,24 @@ class SourceAdapter(ABC):
     def hgetall(self, db, key):
         raise NotImplementedError
 
+    def prefetch(self, db, keys):
+        """ Optionally read the fv-pairs of keys in bulk ahead of get/hget calls """
+        pass
+
 
 class RedisSource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to Redis Data Sources """
 
     def __init__(self, conn_pool):
         self.conn = None
+        self.ns = DEFAULT_NAMESPACE
         self.pool = conn_pool
+        self.fv_cache = {}
 
     def connect(self, db, ns):
         try:
             self.conn = self.pool.get(db, ns)
+            self.ns = ns
         except Exception as e:
             verbose_print("RedisSource: Connection Failed\n" + str(e))
             return False
@@ -186,16 +198,36 @@ class RedisSource(SourceAdapter):
         return self.conn.get_db_separator(db)
 
     def getKeys(self, db, table, key_pattern):
-        return self.conn.keys(db, table + self.get_separator(db) + key_pattern)
+        table_prefix = table + self.get_separator(db)
+        if not self.pool.index_keys:
+            return self.conn.keys(db, table_prefix + key_pattern)
+        index = self.pool.get_key_index(self.ns, db, table,
+                                        lambda: self.conn.keys(db, table_prefix + "*"))
+        return index.match(table_prefix + key_pattern)
+
+    def prefetch(self, db, keys):
+        """
+        Read the fv-pairs of all the keys through pipelined HGETALLs,
+        replacing the ones read for the previous request
+        """
+        self.fv_cache = {}
+        client = bulk_db.get_redis_client(self.conn, db, self.ns)
+        for start in range(0, len(keys), bulk_db.SCAN_BATCH_SIZE):
+            batch = keys[start:start + bulk_db.SCAN_BATCH_SIZE]
+            self.fv_cache.update(zip(batch, bulk_db.get_all_pipelined(client, batch)))
 
     def get(self, db, key):
+        if key in self.fv_cache:
+            return self.fv_cache[key]
         return self.conn.get_all(db, key)
 
     def hget(self, db, key, field):
+        if key in self.fv_cache:
+            return self.fv_cache[key].get(field)
         return self.conn.get(db, key, field)
 
     def hgetall(self, db, key):
-        return self.conn.get_all(db, key)
+        return self.get(db, key)
 
 
 class RedisPySource(SourceAdapter):
@@ -285,10 +317,51 @@ class JsonSource(SourceAdapter):
         return self.json_data.get(table, {}).get(key)
 
 
+class KeyIndex:
+    """
+    Keys of one table, read once and matched against glob-style
+    key patterns in memory
+    """
+    def __init__(self, keys):
+        self.keys = list(keys) if keys else []
+        self.key_set = set(self.keys)
+
+    def match(self, pattern):
+        if not GLOB_CHARS.intersection(pattern):
+            return [pattern] if pattern in self.key_set else []
+        # https://docs.python.org/3.7/library/fnmatch.html
+        matcher = re.compile(fnmatch.translate(pattern.replace("[^", "[!"))).match
+        return [key for key in self.keys if matcher(key)]
+
+
 class ConnectionPool:
-    """ Caches SonicV2Connector objects for effective reuse """
-    def __init__(self):
+    """
+    Caches SonicV2Connector objects for effective reuse
+
+    Connectors are not thread safe. The thread which created the pool uses
+    self.cache, every other thread gets connectors of its own. The key
+    indexes are shared by all the threads.
+
+    Keys are matched by the server, one KEYS request per pattern. When
+    index_keys is set, for runs which request many keys of the same tables,
+    a table is instead indexed by its first request and later ones are
+    matched against the index.
+    """
+    def __init__(self, index_keys=False):
         self.cache = dict()  # Pool of SonicV2Connector objects
+        self.index_keys = index_keys
+        self.key_index = dict()  # (ns, db, table) -> KeyIndex
+        self.key_index_lock = threading.Lock()
+        self.owner = threading.get_ident()
+        self.local = threading.local()
+
+    def thread_cache(self):
+        """ Returns the connector cache of the calling thread """
+        if threading.get_ident() == self.owner:
+            return self.cache
+        if not hasattr(self.local, "cache"):
+            self.local.cache = dict()
+        return self.local.cache
 
     def initialize_connector(self, ns):
         load_db_config()
@@ -307,26 +380,50 @@ class ConnectionPool:
 
     def get(self, db_name, ns, update=False):
         """ Returns a SonicV2Connector Object and caches it for further requests """
-        if ns not in self.cache:
-            self.cache[ns] = {}
-        if CONN not in self.cache[ns]:
-            self.cache[ns][CONN] = self.initialize_connector(ns)
-        if CONN_TO not in self.cache[ns]:
-            self.cache[ns][CONN_TO] = set()
-        if update or db_name not in self.cache[ns][CONN_TO]:
-            self.cache[ns][CONN].connect(db_name)
-            self.cache[ns][CONN_TO].add(db_name)
-        return self.cache[ns][CONN]
+        cache = self.thread_cache()
+        if ns not in cache:
+            cache[ns] = {}
+        if CONN not in cache[ns]:
+            cache[ns][CONN] = self.initialize_connector(ns)
+        if CONN_TO not in cache[ns]:
+            cache[ns][CONN_TO] = set()
+        if update or db_name not in cache[ns][CONN_TO]:
+            cache[ns][CONN].connect(db_name)
+            cache[ns][CONN_TO].add(db_name)
+        return cache[ns][CONN]
 
     def get_dash_conn(self, ns):
         """ Returns a Redis Connection Object and caches it for further requests """
-        if ns not in self.cache:
-            self.cache[ns] = {}
-        if "DASH_"+CONN not in self.cache[ns]:
-            self.cache[ns]["DASH_"+CONN] = self.initialize_redis_conn(ns)
-        return self.cache[ns]["DASH_"+CONN]
+        cache = self.thread_cache()
+        if ns not in cache:
+            cache[ns] = {}
+        if "DASH_"+CONN not in cache[ns]:
+            cache[ns]["DASH_"+CONN] = self.initialize_redis_conn(ns)
+        return cache[ns]["DASH_"+CONN]
+
+    def get_key_index(self, ns, db_name, table, load_keys):
+        """
+        Returns the KeyIndex of the table, reading its keys with load_keys
+        on the first request. Keys are read once per run of the pool.
+        """
+        index_key = (ns, db_name, table)
+        index = self.key_index.get(index_key)
+        if index is None:
+            with self.key_index_lock:
+                index = self.key_index.get(index_key)
+                if index is None:
+                    index = self.key_index[index_key] = KeyIndex(load_keys())
+        return index
+
+    def clear_key_index(self, namespace=None):
+        if not namespace:
+            self.key_index.clear()
+            return
+        for index_key in [k for k in self.key_index if k[0] == namespace]:
+            del self.key_index[index_key]
 
     def clear(self, namespace=None):
+        self.clear_key_index(namespace)
         if not namespace:
             self.cache.clear()
         elif namespace in self.cache:
@@ -334,6 +431,7 @@ class ConnectionPool:
 
     def fill(self, ns, conn, connected_to, dash_object=False):
         """ Update internal cache """
+        self.clear_key_index(ns)
         if ns not in self.cache:
             self.cache[ns] = {}
         if dash_object:
@@ -357,7 +455,7 @@ class MatchEngine:
             self.conn_pool = pool
 
     def clear_cache(self, ns):
-        self.conn_pool(ns)
+        self.conn_pool.clear(ns)
 
     def get_redis_source_adapter(self):
         return RedisSource(self.conn_pool)
@@ -444,6 +542,9 @@ class MatchEngine:
         if not all_matched_keys:
             return self.__display_error(EXCEP_DICT["NO_MATCHES"])
 
+        if len(all_matched_keys) > 1 and (req.field or not req.just_keys or req.return_fields):
+            src.prefetch(req.db, all_matched_keys)
+
         filtered_keys = self.__filter_out_keys(src, req, all_matched_keys)
         verbose_print("Filtered Keys:" + str(filtered_keys))
         if not filtered_keys:
@@ -495,8 +495,9 @@ class ConfigLockDecorator(Decorator):
 
 
 class GenericUpdateFactory:
-    def __init__(self, scope=multi_asic.DEFAULT_NAMESPACE):
+    def __init__(self, scope=multi_asic.DEFAULT_NAMESPACE, validation_workers=0):
         self.scope = scope
+        self.validation_workers = validation_workers
 
     def create_patch_applier(
         self,
@@ -619,7 +620,7 @@ class GenericUpdateFactory:
 
     def get_patch_sorter(self, ignore_non_yang_tables, ignore_paths, config_wrapper, patch_wrapper):
         if not ignore_non_yang_tables and not ignore_paths:
-            return StrictPatchSorter(config_wrapper, patch_wrapper)
+            return StrictPatchSorter(config_wrapper, patch_wrapper, validation_workers=self.validation_workers)
 
         inner_config_splitters = []
         if ignore_non_yang_tables:
@@ -630,13 +631,14 @@ class GenericUpdateFactory:
 
         config_splitter = ConfigSplitter(config_wrapper, inner_config_splitters)
 
-        return NonStrictPatchSorter(config_wrapper, patch_wrapper, config_splitter)
+        return NonStrictPatchSorter(config_wrapper, patch_wrapper, config_splitter,
+                                    validation_workers=self.validation_workers)
 
 
 class GenericUpdater:
-    def __init__(self, generic_update_factory=None, scope=multi_asic.DEFAULT_NAMESPACE):
-        self.generic_update_factory = \
-            generic_update_factory if generic_update_factory is not None else GenericUpdateFactory(scope=scope)
+    def __init__(self, generic_update_factory=None, scope=multi_asic.DEFAULT_NAMESPACE, validation_workers=0):
+        self.generic_update_factory = generic_update_factory if generic_update_factory is not None else \
+            GenericUpdateFactory(scope=scope, validation_workers=validation_workers)
 
     def apply_patch(
         self,
@@ -10,8 +10,10 @@ import re
 import os
 import hashlib
 from sonic_py_common import logger, multi_asic
+from collections import OrderedDict
 from enum import Enum
 from functools import cmp_to_key
+from .yang_cache import load_yang_models
 
 YANG_DIR = "/usr/local/yang-models"
 SYSLOG_IDENTIFIER = "GenericConfigUpdater"
@@ -55,6 +57,66 @@ class JsonChange:
         return False
 
 
+class ConfigDigest:
+    """
+    Content digests of ConfigDB configs, to key caches by config content.
+
+    The digest of a config is built Merkle-style from a digest of every table, and the
+    digest of a table from a digest of every key. Configs built by a JsonMove share all the
+    tables and keys the move does not change with the config they were built from
+    (see patch_sorter.copy_on_write), so the digests of tables and keys are memoized by
+    container: the digest of a config built by a move only serializes what the move changed.
+    Like the patch sorter, this relies on configs not being modified after being built.
+
+    The memo holds a strong reference to every memoized container, so that its id is not
+    reused by another one, and is bounded by evicting the least recently used containers.
+    A digest only looks up the tables and the keys of the tables which changed, so a few
+    thousand entries keep the memo warm for tables of up to that many keys.
+    """
+    # Number of memoized containers, beyond which the least recently used ones are evicted
+    MAX_ENTRIES = 4096
+    DIGEST_SIZE = 16
+    # Tables and keys are combined from their children, values below are serialized
+    COMBINED_DEPTH = 2
+
+    def __init__(self):
+        self._memo = OrderedDict()
+
+    def digest(self, config):
+        """Returns the digest of config, equal for configs with equal content"""
+        return self._digest(config, 0)
+
+    def _digest(self, value, depth):
+        if not isinstance(value, (dict, list)):
+            return self._leaf_digest(value)
+        memo_key = (id(value), depth)
+        entry = self._memo.get(memo_key)
+        if entry is not None and entry[0] is value:
+            self._memo.move_to_end(memo_key)
+            return entry[1]
+
+        if depth < self.COMBINED_DEPTH and isinstance(value, dict):
+            combined = hashlib.blake2b(b"d", digest_size=self.DIGEST_SIZE)
+            for key in sorted(value):
+                name = json.dumps(key).encode()
+                combined.update(len(name).to_bytes(4, "little") + name)
+                combined.update(self._digest(value[key], depth + 1))
+            result = combined.digest()
+        else:
+            result = self._leaf_digest(value)
+
+        # The memo keeps value alive, so its id is not reused by another container
+        self._memo[memo_key] = (value, result)
+        self._memo.move_to_end(memo_key)
+        if len(self._memo) > self.MAX_ENTRIES:
+            self._memo.popitem(last=False)
+        return result
+
+    def _leaf_digest(self, value):
+        return hashlib.blake2b(b"j" + json.dumps(value, sort_keys=True).encode(),
+                               digest_size=self.DIGEST_SIZE).digest()
+
+
 def get_config_db_as_json(scope=None):
     text = get_config_db_as_text(scope=scope)
     config_db_json = json.loads(text)
@@ -83,6 +145,7 @@ class ConfigWrapper:
         self.sonic_yang_with_loaded_models = None
         self._validate_config_cache = {}
         self._currently_loaded_hash = None
+        self.config_digest = ConfigDigest()
 
     def get_config_db_as_json(self):
         return get_config_db_as_json(self.scope)
@@ -144,9 +207,7 @@ class ConfigWrapper:
         # validate_config_db_config is a pure function: same config always produces
         # the same result. Caching avoids redundant loadData() calls when the DFS
         # revisits the same config state during backtracking.
-        _cache_key = hashlib.md5(
-            json.dumps(config_db_as_json, sort_keys=True).encode()
-        ).hexdigest()
+        _cache_key = self.config_digest.digest(config_db_as_json)
         if _cache_key in self._validate_config_cache:
             return self._validate_config_cache[_cache_key]
 
@@ -377,7 +438,9 @@ class ConfigWrapper:
         if self.sonic_yang_with_loaded_models is None:
             sonic_yang_print_log_enabled = genericUpdaterLogging.get_verbose()
             loaded_models_sy = sonic_yang.SonicYang(self.yang_dir, print_log_enabled=sonic_yang_print_log_enabled)
-            loaded_models_sy.loadYangModel() # This call takes a long time (100s of ms) because it reads files from disk
+            # Parsing the models takes a long time (100s of ms), load_yang_models reuses the
+            # models parsed by an earlier process when the YANG files did not change
+            load_yang_models(loaded_models_sy)
             self.sonic_yang_with_loaded_models = loaded_models_sy
 
         return self.sonic_yang_with_loaded_models
@@ -392,7 +455,8 @@ class DryRunConfigWrapper(ConfigWrapper):
     def apply_change_to_config_db(self, current_config_db: dict, change):
         self._init_imitated_config_db_if_none()
         self.logger.log_notice(f"Would apply {change}")
-        self.imitated_config_db = change.apply(current_config_db, in_place=True)
+        # Not in place: current_config_db may share tables with configs already digested
+        self.imitated_config_db = change.apply(current_config_db)
         return self.imitated_config_db
 
     def get_config_db_as_json(self):
@@ -558,16 +622,12 @@ class PathAddressing:
         sy = self._create_sonic_yang_with_loaded_models()
 
         if reload_config:
-            _config_hash = hashlib.md5(
-                json.dumps(config, sort_keys=True).encode()
-            ).hexdigest()
-            already_loaded = (
-                self.config_wrapper is not None and
-                self.config_wrapper._currently_loaded_hash == _config_hash
-            )
-            if not already_loaded:
+            if self.config_wrapper is None:
                 sy.loadData(config)
-                if self.config_wrapper is not None:
+            else:
+                _config_hash = self.config_wrapper.config_digest.digest(config)
+                if self.config_wrapper._currently_loaded_hash != _config_hash:
+                    sy.loadData(config)
                     self.config_wrapper._currently_loaded_hash = _config_hash
 
         # Force to be a list
@@ -253,7 +253,7 @@ def validate_patch(patch_ops, all_running_config):
 def apply_patch_for_scope(scope_changes, results, config_format,
                           verbose, dry_run,
                           ignore_non_yang_tables, ignore_path,
-                          trace_io=None):
+                          trace_io=None, validation_workers=0):
     """Apply a patch for a single ASIC scope and record the outcome in
     *results* (a shared dict)."""
     scope, changes = scope_changes
@@ -268,7 +268,7 @@ def apply_patch_for_scope(scope_changes, results, config_format,
     )
 
     try:
-        GenericUpdater(scope=scope).apply_patch(
+        GenericUpdater(scope=scope, validation_workers=validation_workers).apply_patch(
             jsonpatch.JsonPatch(changes),
             config_format,
             verbose,
@@ -295,7 +295,8 @@ def _apply_patch_wrapper(args):
 
 def apply_patch_from_file(patch_file_path, config_format_name, verbose,
                           dry_run, parallel, ignore_non_yang_tables,
-                          ignore_path, preprocess=True, trace_io=None):
+                          ignore_path, preprocess=True, trace_io=None,
+                          validation_workers=0):
     """Read a JSON-Patch file and apply it — the single implementation
     used by all entry points.
 
@@ -319,6 +320,11 @@ def apply_patch_from_file(patch_file_path, config_format_name, verbose,
     trace_io : IO, optional
         Writable file-like object for writing the patch-sorter decision path
         trace as JSON.  ``None`` (default) disables tracing.
+    validation_workers : int
+        Number of processes validating candidate moves concurrently while
+        sorting the patch.  ``0`` (default) validates in-process.  Ignored
+        with *parallel*, as the pool cannot be safely forked from the
+        per-ASIC threads.
 
     Raises
     ------
@@ -371,10 +377,14 @@ def apply_patch_from_file(patch_file_path, config_format_name, verbose,
     # 4. Dispatch
     results = {}
     if parallel:
+        if validation_workers > 1:
+            logger.info("validation workers ignored when applying the patch in parallel")
+            validation_workers = 0
         with concurrent.futures.ThreadPoolExecutor() as executor:
             arguments = [
                 (sc, results, config_format, verbose, dry_run,
-                 ignore_non_yang_tables, ignore_path, trace_io)
+                 ignore_non_yang_tables, ignore_path, trace_io,
+                 validation_workers)
                 for sc in changes_by_scope.items()
             ]
             futures = [
@@ -387,7 +397,7 @@ def apply_patch_from_file(patch_file_path, config_format_name, verbose,
             apply_patch_for_scope(
                 scope_changes, results, config_format,
                 verbose, dry_run, ignore_non_yang_tables, ignore_path,
-                trace_io,
+                trace_io, validation_workers,
             )
 
     # 5. Aggregate results
@@ -530,6 +540,7 @@ def apply_patch(args):
             ignore_path=args.ignore_path,
             preprocess=True,
             trace_io=trace_file,
+            validation_workers=getattr(args, 'validation_workers', 0),
         )
 
         print_success("Patch applied successfully.")
@@ -552,7 +563,7 @@ def replace_config(args):
             target_config = json.loads(f.read())
 
         config_format = ConfigFormat[args.format.upper()]
-        updater = GenericUpdater()
+        updater = GenericUpdater(validation_workers=getattr(args, 'validation_workers', 0))
         updater.replace(
             target_config, config_format, args.verbose, False,
             args.ignore_non_yang_tables, args.ignore_path,
@@ -714,6 +725,11 @@ Examples:
         default=None,
         help='Filename to write decision path trace for patch generation as JSON',
     )
+    p.add_argument(
+        '-w', '--validation-workers', type=int, default=0,
+        help='Number of processes validating candidate moves concurrently '
+             '(default: 0, validate in-process)',
+    )
 
     # ---- replace ----
     p = subparsers.add_parser(
@@ -738,6 +754,11 @@ Examples:
         help='Ignore validation for config specified by given path '
              '(JsonPointer)',
     )
+    p.add_argument(
+        '-w', '--validation-workers', type=int, default=0,
+        help='Number of processes validating candidate moves concurrently '
+             '(default: 0, validate in-process)',
+    )
 
     # ---- save ----
     p = subparsers.add_parser(
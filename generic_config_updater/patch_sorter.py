@@ -1,26 +1,81 @@
 import copy
 import json
 import jsonpatch
+import jsonpointer
+import multiprocessing
+import pickle
 import sonic_yang
+import threading
+import time
 from collections import deque, OrderedDict
 from enum import Enum
 from typing import Any, IO, List, Optional, Tuple
 from .gu_common import OperationWrapper, OperationType, GenericConfigUpdaterError, \
-                       JsonChange, PathAddressing, genericUpdaterLogging
+                       JsonChange, PathAddressing, ConfigDigest, genericUpdaterLogging
+
+
+def copy_on_write(config, path, copied=None):
+    """
+    Returns a copy of config which shares all its content with config, except the
+    containers on the given JsonPointer path, which are shallow copied. Applying a
+    JsonPatch operation on path in place to the returned copy leaves config untouched,
+    at the cost of copying one container per path token instead of the whole config.
+
+    copied is an optional set of ids of the containers already owned by config, which
+    can then be modified without copying them again. It is updated with the copies made.
+    """
+    if copied is None:
+        copied = set()
+
+    def own(container):
+        if id(container) in copied:
+            return container
+        container = copy.copy(container)
+        copied.add(id(container))
+        return container
+
+    root = own(config)
+    parent = root
+    for token in jsonpointer.JsonPointer(path).parts[:-1]:
+        try:
+            key = int(token) if isinstance(parent, list) else token
+            child = parent[key]
+        except (KeyError, IndexError, ValueError):
+            # Let the JsonPatch operation report the missing path
+            break
+        if not isinstance(child, (dict, list)):
+            break
+        child = own(child)
+        parent[key] = child
+        parent = child
+    return root
+
 
 class Diff:
     """
     A class that contains the diff info between current and target configs.
     """
-    def __init__(self, current_config, target_config):
+    def __init__(self, current_config, target_config, config_digest=None):
         self.current_config = current_config
         self.target_config = target_config
+        # Shared by the diffs built from this one by moves, which share most of their configs
+        self.config_digest = config_digest if config_digest is not None else ConfigDigest()
 
     def __hash__(self):
-        cc = json.dumps(self.current_config, sort_keys=True)
-        tc = json.dumps(self.target_config, sort_keys=True)
+        cc = self.config_digest.digest(self.current_config)
+        tc = self.config_digest.digest(self.target_config)
         return hash((cc,tc))
 
+    def __getstate__(self):
+        # The digest memo holds whole configs, it is not worth sending to validation workers
+        state = self.__dict__.copy()
+        del state['config_digest']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.config_digest = ConfigDigest()
+
     def __eq__(self, other):
         """Overrides the default implementation"""
         if isinstance(other, Diff):
@@ -28,16 +83,16 @@ class Diff:
 
         return False
 
-    # TODO: Can be optimized to apply the move in place. JsonPatch supports that using the option 'in_place=True'
-    # Check: https://python-json-patch.readthedocs.io/en/latest/tutorial.html#applying-a-patch
-    # NOTE: in case move is applied in place, we will need to support `undo_move` as well.
+    # Unless in_place, the new current_config shares all the tables and keys the move does not
+    # touch with this diff's current_config (see copy_on_write). Configs are never modified
+    # after being built, so the sorter can keep every explored diff without copying whole configs.
     def apply_move(self, move, in_place: bool = False):
         new_current_config = move.apply(self.current_config, in_place)
-        return Diff(new_current_config, self.target_config)
+        return Diff(new_current_config, self.target_config, self.config_digest)
 
     def undo_move(self, move, in_place: bool = False):
         new_current_config = move.undo(self.current_config, in_place)
-        return Diff(new_current_config, self.target_config)
+        return Diff(new_current_config, self.target_config, self.config_digest)
 
     def has_no_diff(self):
         return self.current_config == self.target_config
@@ -281,13 +336,15 @@ class JsonMove:
 
         return JsonMove(diff, op_type, current_config_tokens, target_config_tokens)
 
-    def apply(self, config, in_place: bool = False):
+    def apply(self, config, in_place: bool = False, copied=None):
         if self.op_type == OperationType.REMOVE or self.op_type == OperationType.REPLACE:
             self.orig_value = JsonMove._get_value(config, sonic_yang.SonicYang.configdb_path_split(self.path))
 
-        return self.patch.apply(config, in_place=in_place)
+        if not in_place:
+            config = copy_on_write(config, self.path, copied)
+        return self.patch.apply(config, in_place=True)
 
-    def undo(self, config, in_place: bool = False):
+    def undo(self, config, in_place: bool = False, copied=None):
         # Create new patch to undo previous application
         if self.patch.patch[0]['op'] == 'add':
             patch = jsonpatch.JsonPatch([{'op': 'remove', 'path': self.patch.patch[0]['path']}])
@@ -300,7 +357,9 @@ class JsonMove:
         elif self.patch.patch[0]['op'] == 'remove':
             patch = jsonpatch.JsonPatch([{'op': 'add', 'path': self.patch.patch[0]['path'], 'value': self.orig_value}])
 
-        return patch.apply(config, in_place=in_place)
+        if not in_place:
+            config = copy_on_write(config, self.path, copied)
+        return patch.apply(config, in_place=True)
 
     def __str__(self):
         return str(self.patch)
@@ -317,6 +376,16 @@ class JsonMove:
     def __hash__(self):
         return hash((self.op_type, self.path, json.dumps(self.value)))
 
+    def __getstate__(self):
+        # JsonPatch is not picklable, keep its raw operations instead
+        state = self.__dict__.copy()
+        state['patch'] = self.patch.patch
+        return state
+
+    def __setstate__(self, state):
+        state['patch'] = jsonpatch.JsonPatch(state['patch'])
+        self.__dict__.update(state)
+
 
 class JsonMoveGroup:
     """
@@ -332,21 +401,21 @@ class JsonMoveGroup:
         self.patches.append(move)
 
     def apply(self, config, in_place: bool = False):
+        # Containers copied by the first patches are owned by the update and
+        # are not copied again by the next ones
+        copied = None if in_place else set()
         update = config
-        for i, patch in enumerate(self.patches):
-            if i != 0:
-                in_place = True
-            update = patch.apply(update, in_place=in_place)
+        for patch in self.patches:
+            update = patch.apply(update, in_place=in_place, copied=copied)
             if update is None:
                 return None
         return update
 
     def undo(self, config, in_place: bool = False):
+        copied = None if in_place else set()
         update = config
-        for i, patch in enumerate(reversed(self.patches)):
-            if i != 0:
-                in_place = True
-            update = patch.undo(update, in_place=in_place)
+        for patch in reversed(self.patches):
+            update = patch.undo(update, in_place=in_place, copied=copied)
             if update is None:
                 return None
         return update
@@ -419,12 +488,72 @@ class JsonMoveGroup:
             yield patch
 
 
+class ValidationStats:
+    """
+    Counters of the move validations done by a MoveWrapper.
+    """
+    def __init__(self):
+        self.cache_hits = 0
+        self.validations = 0
+        # validator name -> [runs, seconds]
+        self.validators = OrderedDict()
+
+    def add_validator_time(self, name, elapsed, runs=1):
+        entry = self.validators.setdefault(name, [0, 0.0])
+        entry[0] += runs
+        entry[1] += elapsed
+
+    def merge(self, other):
+        self.cache_hits += other.cache_hits
+        self.validations += other.validations
+        for name, (runs, elapsed) in other.validators.items():
+            self.add_validator_time(name, elapsed, runs)
+
+    def summary(self):
+        lines = [f"Move validations: {self.validations} run, {self.cache_hits} cache hits"]
+        for name, (runs, elapsed) in self.validators.items():
+            lines.append(f"  {name}: {runs} runs, {elapsed:.3f}s")
+        return lines
+
+
+# MoveWrapper, target config and digest used by the validation pool workers, inherited on fork
+_pool_move_wrapper = None
+_pool_target_config = None
+_pool_config_digest = None
+
+
+def _init_validation_worker(move_wrapper, target_config):
+    global _pool_move_wrapper, _pool_target_config, _pool_config_digest
+    _pool_move_wrapper = move_wrapper
+    _pool_target_config = target_config
+    _pool_config_digest = ConfigDigest()
+
+
+def _validate_in_worker(task):
+    current_config, move = task
+    diff = Diff(pickle.loads(current_config), _pool_target_config, _pool_config_digest)
+    stats = ValidationStats()
+    success, errmsg = _pool_move_wrapper._run_validators(move, diff, stats)
+    return success, errmsg, stats
+
+
 class MoveWrapper:
-    def __init__(self, move_generators, move_non_extendable_generators, move_extenders, move_validators):
+    def __init__(self, move_generators, move_non_extendable_generators, move_extenders, move_validators,
+                 validation_workers: int = 0):
         self.move_generators = move_generators
         self.move_non_extendable_generators = move_non_extendable_generators
         self.move_extenders = move_extenders
         self.move_validators = move_validators
+        # Results of the validators flagged simulated_config_only, keyed on (validator
+        # index, digest of the simulated config). Different moves from different diffs
+        # often lead to the same config, e.g. the same two moves done in either order.
+        self.validation_cache = {}
+        self.stats = ValidationStats()
+        # Number of processes validating candidate moves concurrently, 0 or 1 to
+        # validate in the calling process only
+        self.validation_workers = validation_workers
+        self.pool = None
+        self.pool_target_config = None
 
     def generate(self, diff):
         """
@@ -467,11 +596,84 @@ class MoveWrapper:
                 moves.extend(self._extend_moves(move, diff))
 
     def validate(self, move, diff) -> Tuple[bool, Optional[str]]:
+        return self._run_validators(move, diff, self.stats)
+
+    def validate_all(self, moves, diff):
+        """
+        Generator of (move, success, errmsg) for the given moves, in order.
+
+        Moves are validated lazily one at a time, unless validation_workers is
+        more than 1. Then moves are taken validation_workers at a time and
+        validated concurrently in a process pool. The pool is started once per
+        target config and kept until close(). The current config is pickled once
+        per batch and sent along with each move.
+        """
+        pool = self._get_pool(diff) if self.validation_workers > 1 else None
+        if pool is None:
+            for move in moves:
+                success, errmsg = self.validate(move, diff)
+                yield move, success, errmsg
+            return
+
+        current_config = pickle.dumps(diff.current_config, pickle.HIGHEST_PROTOCOL)
+        moves = iter(moves)
+        while True:
+            batch = [move for _, move in zip(range(self.validation_workers), moves)]
+            if not batch:
+                return
+
+            results = pool.map(_validate_in_worker, [(current_config, move) for move in batch])
+            for move, (success, errmsg, stats) in zip(batch, results):
+                self.stats.merge(stats)
+                yield move, success, errmsg
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+            self.pool_target_config = None
+
+    def _get_pool(self, diff):
+        if self.pool is not None and self.pool_target_config is not diff.target_config:
+            self.close()
+        if self.pool is None:
+            # Forking a process with other threads running can deadlock the child on
+            # a lock held by another thread, e.g. when applying a patch to several
+            # ASICs in parallel. Validate in this process then.
+            if threading.active_count() > 1:
+                return None
+            # Workers are forked so they inherit the validators, including the
+            # YANG models already loaded by the config wrapper, and the target
+            # config without pickling them
+            self.pool = multiprocessing.get_context("fork").Pool(
+                self.validation_workers, initializer=_init_validation_worker, initargs=(self, diff.target_config))
+            self.pool_target_config = diff.target_config
+        return self.pool
+
+    def _run_validators(self, move, diff, stats) -> Tuple[bool, Optional[str]]:
+        stats.validations += 1
         # Generate simulated config once, not once per validator as this performs
         # a deep copy
         simulated_config = move.apply(diff.current_config)
-        for validator in self.move_validators:
-            success, errmsg = validator.validate(move, diff, simulated_config)
+        simulated_digest = None
+        for index, validator in enumerate(self.move_validators):
+            key = None
+            if getattr(type(validator), "simulated_config_only", False):
+                if simulated_digest is None:
+                    simulated_digest = diff.config_digest.digest(simulated_config)
+                key = (index, simulated_digest)
+
+            if key is not None and key in self.validation_cache:
+                stats.cache_hits += 1
+                success, errmsg = self.validation_cache[key]
+            else:
+                start = time.monotonic()
+                success, errmsg = validator.validate(move, diff, simulated_config)
+                stats.add_validator_time(validator.__class__.__name__, time.monotonic() - start)
+                if key is not None:
+                    self.validation_cache[key] = (success, errmsg)
+
             if not success:
                 error = f"{validator.__class__.__name__} failed"
                 if errmsg is not None:
@@ -867,6 +1069,9 @@ class FullConfigMoveValidator:
     """
     A class to validate that full config is valid according to YANG models after applying the move.
     """
+    # Only depends on the simulated config, see MoveWrapper.validation_cache
+    simulated_config_only = True
+
     def __init__(self, config_wrapper):
         self.config_wrapper = config_wrapper
 
@@ -2242,12 +2447,11 @@ class DfsSorter:
 
         moves = self.move_wrapper.generate(diff)
 
-        for move in moves:
+        for move, success, errmsg in self.move_wrapper.validate_all(moves, diff):
             path_item = None
             if path_tracker is not None:
                 path_item = path_tracker.append(move)
 
-            success, errmsg = self.move_wrapper.validate(move, diff)
             if success:
                 # NOTE: due to the recursive nature, we can't modify in-place as on error we will
                 #       receive "RuntimeError: dictionary changed size during iteration"
@@ -2298,8 +2502,7 @@ class BfsSorter:
                 return prv_moves
 
             moves = self.move_wrapper.generate(diff)
-            for move in moves:
-                success, errmsg = self.move_wrapper.validate(move, diff)
+            for move, success, errmsg in self.move_wrapper.validate_all(moves, diff):
                 if success:
                     new_diff = self.move_wrapper.simulate(move, diff)
                     new_prv_moves = prv_moves + [move]
@@ -2332,8 +2535,7 @@ class MemoizationSorter:
         moves = self.move_wrapper.generate(diff)
 
         bst_moves = None
-        for move in moves:
-            success, errmsg = self.move_wrapper.validate(move, diff)
+        for move, success, errmsg in self.move_wrapper.validate_all(moves, diff):
             if success:
                 new_diff = self.move_wrapper.simulate(move, diff)
                 new_moves = self.sort(new_diff)
@@ -2351,10 +2553,11 @@ class Algorithm(Enum):
 
 
 class SortAlgorithmFactory:
-    def __init__(self, operation_wrapper, config_wrapper, path_addressing):
+    def __init__(self, operation_wrapper, config_wrapper, path_addressing, validation_workers: int = 0):
         self.operation_wrapper = operation_wrapper
         self.config_wrapper = config_wrapper
         self.path_addressing = path_addressing
+        self.validation_workers = validation_workers
 
     def create(self, algorithm=Algorithm.DFS, path_trace: bool = False):
         move_generators = [LowLevelMoveGenerator(self.path_addressing)]
@@ -2377,7 +2580,8 @@ class SortAlgorithmFactory:
                            RemoveCreateOnlyDependencyMoveValidator(self.path_addressing),
                            NoEmptyTableMoveValidator(self.path_addressing)]
 
-        move_wrapper = MoveWrapper(move_generators, move_non_extendable_generators, move_extenders, move_validators)
+        move_wrapper = MoveWrapper(move_generators, move_non_extendable_generators, move_extenders, move_validators,
+                                   validation_workers=self.validation_workers)
 
         if algorithm == Algorithm.DFS:
             sorter = DfsSorter(move_wrapper, path_trace=path_trace)
@@ -2392,11 +2596,12 @@ class SortAlgorithmFactory:
 
 
 class StrictPatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, inner_patch_sorter=None):
+    def __init__(self, config_wrapper, patch_wrapper, inner_patch_sorter=None, validation_workers: int = 0):
         self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter - Strict", print_all_to_console=True)
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
-        self.inner_patch_sorter = inner_patch_sorter if inner_patch_sorter else PatchSorter(config_wrapper, patch_wrapper)
+        self.inner_patch_sorter = inner_patch_sorter if inner_patch_sorter else \
+            PatchSorter(config_wrapper, patch_wrapper, validation_workers=validation_workers)
 
     def sort(self, patch, algorithm=Algorithm.DFS, trace_io: Optional[IO] = None):
         current_config = self.config_wrapper.get_config_db_as_json()
@@ -2586,13 +2791,15 @@ class ChangeWrapper:
         return adjusted_changes
 
 class NonStrictPatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, config_splitter, change_wrapper=None, patch_sorter=None):
+    def __init__(self, config_wrapper, patch_wrapper, config_splitter, change_wrapper=None, patch_sorter=None,
+                 validation_workers: int = 0):
         self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter - Non-Strict", print_all_to_console=True)
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
         self.config_splitter = config_splitter
         self.change_wrapper = change_wrapper if change_wrapper else ChangeWrapper(patch_wrapper, config_splitter)
-        self.inner_patch_sorter = patch_sorter if patch_sorter else PatchSorter(config_wrapper, patch_wrapper)
+        self.inner_patch_sorter = patch_sorter if patch_sorter else \
+            PatchSorter(config_wrapper, patch_wrapper, validation_workers=validation_workers)
 
     def sort(self, patch, algorithm=Algorithm.DFS, trace_io: Optional[IO] = None):
         current_config = self.config_wrapper.get_config_db_as_json()
@@ -2647,13 +2854,13 @@ class NonStrictPatchSorter:
         return changes
 
 class PatchSorter:
-    def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None):
+    def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None, validation_workers: int = 0):
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
         self.operation_wrapper = OperationWrapper()
         self.path_addressing = PathAddressing(self.config_wrapper)
         self.sort_algorithm_factory = sort_algorithm_factory if sort_algorithm_factory else \
-            SortAlgorithmFactory(self.operation_wrapper, config_wrapper, self.path_addressing)
+            SortAlgorithmFactory(self.operation_wrapper, config_wrapper, self.path_addressing, validation_workers)
         self.logger = genericUpdaterLogging.get_logger(title="Patch Sorter", print_all_to_console=True)
 
     def sort(self, patch, algorithm=Algorithm.DFS, preloaded_current_config=None, trace_io: Optional[IO] = None):
@@ -2663,7 +2870,14 @@ class PatchSorter:
         diff = Diff(copy.deepcopy(current_config), target_config)
 
         sort_algorithm = self.sort_algorithm_factory.create(algorithm, path_trace=False if trace_io is None else True)
-        moves = sort_algorithm.sort(diff)
+        move_wrapper = getattr(sort_algorithm, "move_wrapper", None)
+        try:
+            moves = sort_algorithm.sort(diff)
+        finally:
+            if isinstance(move_wrapper, MoveWrapper):
+                move_wrapper.close()
+                for line in move_wrapper.stats.summary():
+                    self.logger.log_debug(line)
 
         if trace_io is not None:
             json.dump(sort_algorithm.path_tracker, trace_io, default=PatchSorterPath.json_encoder, indent=2)
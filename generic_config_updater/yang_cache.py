@@ -0,0 +1,127 @@
+"""
+On-disk cache of the parsed SONiC YANG models.
+
+SonicYang.loadYangModel() parses every YANG module into the libyang
+context, then prints every module as YIN and converts it to a dict
+(sy.yJson), from which the config DB table to YANG container map is
+built. The conversion takes most of the time of the load, and every
+process validating config (GCU, config commands, cli-gen) pays it again.
+
+load_yang_models() saves sy.yJson to a JSON file keyed by a hash of the
+YANG directory contents. A later load with the same models parses the
+modules into libyang, which it cannot do without, and takes sy.yJson from
+the cache in one read. Adding, removing or changing a module, e.g. when a
+package is installed, changes the key, and the next load rebuilds the
+cache.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import tempfile
+
+import sonic_yang
+from sonic_py_common import logger
+
+YANG_CACHE_PATH = "/var/cache/sonic/yang_models.json"
+CACHE_VERSION = 1
+SYSLOG_IDENTIFIER = "YangModelCache"
+
+log = logger.Logger(SYSLOG_IDENTIFIER)
+
+
+def get_yang_files(yang_dir):
+    """
+    Return the YANG files of yang_dir, in the order loadYangModel loads them.
+    """
+    return glob.glob(os.path.join(yang_dir, "*.yang"))
+
+
+def yang_dir_digest(yang_files):
+    """
+    Return the cache key of the YANG files: a digest of their names and contents.
+    """
+    digest = hashlib.sha256("{}\0".format(CACHE_VERSION).encode())
+    for path in sorted(yang_files):
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest.update(os.path.basename(path).encode() + b"\0")
+        digest.update(hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+def read_cache(cache_path, key):
+    """
+    Return the cache at cache_path if it was saved for key, else None.
+    A file which another user could have written is not used.
+    """
+    try:
+        with open(cache_path) as f:
+            st = os.fstat(f.fileno())
+            if st.st_uid not in (0, os.geteuid()) or st.st_mode & 0o022:
+                return None
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return None
+    return cache
+
+
+def write_cache(cache_path, key, yang_files, yJson):
+    """
+    Save the parsed models to cache_path, replacing the file atomically.
+    Failures are only logged: the cache is an optimization.
+    """
+    dirname = os.path.dirname(os.path.abspath(cache_path))
+    tmp_path = None
+    try:
+        os.makedirs(dirname, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=".yang-cache-")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"key": key,
+                       "files": [os.path.basename(path) for path in yang_files],
+                       "yJson": yJson}, f, separators=(',', ':'))
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        log.log_info("Failed to save YANG model cache {}: {}".format(cache_path, e))
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def load_yang_models(sy, cache_path=None):
+    """
+    Load the YANG models of sy, as sy.loadYangModel() does, using the cache.
+    :param sy: SonicYang with no model loaded yet
+    :param cache_path: Path of the cache file; YANG_CACHE_PATH if None, and
+                       a false value of YANG_CACHE_PATH disables the cache
+    :return: sy
+    """
+    if cache_path is None:
+        cache_path = YANG_CACHE_PATH
+    if not cache_path or not hasattr(sy, '_load_schema_module') or \
+            not hasattr(sy, '_createDBTableToModuleMap'):
+        sy.loadYangModel()
+        return sy
+
+    yang_files = get_yang_files(sy.yang_dir)
+    key = yang_dir_digest(yang_files)
+    cache = read_cache(cache_path, key)
+    if cache is None:
+        sy.loadYangModel()
+        write_cache(cache_path, key, yang_files, sy.yJson)
+        return sy
+
+    try:
+        for name in cache["files"]:
+            if sy._load_schema_module(os.path.join(sy.yang_dir, name)) is None:
+                raise Exception("Could not load module {}".format(name))
+        # Module names, as loadYangModel keeps them
+        sy.yangFiles = [name.split('.')[0] for name in cache["files"]]
+        sy.yJson = cache["yJson"]
+        sy._createDBTableToModuleMap()
+    except Exception as e:
+        raise sonic_yang.SonicYangException("Yang Models Load failed\n{}".format(str(e)))
+    return sy
@@ -19,6 +19,13 @@ How:
     5) Rule out local interfaces & default routes
     6) If still outstanding diffs, report failure.
 
+    With --daemon, the full read of step 2 is done once per namespace (and
+    again every --resync_interval seconds). In between, the APPL-DB
+    ROUTE_TABLE/INTF_TABLE and ASIC-DB subscriptions stay open and keep an
+    in-memory route index up to date, so each scan only re-evaluates the
+    prefixes touched since the previous one. FRR offload state is checked
+    on full resyncs only.
+
 To verify:
     Run this tool in SONiC switch and watch the result. In case of failure
     checkout the result to validate the failure.
@@ -36,6 +43,7 @@ To verify:
 
 import argparse
 from enum import Enum
+import functools
 import ipaddress
 import json
 import os
@@ -54,6 +62,7 @@ from swsscommon import swsscommon
 from utilities_common import chassis
 from sonic_py_common import multi_asic, device_info
 from utilities_common.general import load_db_config
+from utilities_common.prefix_set import PrefixSet, diff_prefixes
 
 APPL_DB_NAME = 'APPL_DB'
 ASIC_DB_NAME = 'ASIC_DB'
@@ -124,6 +133,14 @@ def set_level(lvl, log_to_syslog):
         report_level = syslog.LOG_DEBUG
 
 
+def is_debug_enabled():
+    """
+    :return True if debug messages get reported; lets callers skip
+    building large debug dumps otherwise
+    """
+    return report_level >= syslog.LOG_DEBUG
+
+
 def print_message(lvl, *args, write_to_stdout=True):
     """
     print and log the message for given level.
@@ -259,6 +276,37 @@ def checkout_rt_entry(k):
     return False, None
 
 
+def checkout_appl_rt_entry(k):
+    """
+    helper to normalize an APPL-DB:ROUTE_TABLE key into a prefix.
+    :param k: key to check as string
+    :return (True, prefix) or (False, None)
+    """
+    if (is_vrf(k)):
+        k = k.split(":", 1)[1]
+
+    if is_local(k):
+        return False, None
+    return True, add_prefix_ifnot(k.lower())
+
+
+def checkout_intf_entry(k):
+    """
+    helper to strip the IP out of an APPL-DB:INTF_TABLE key.
+    :param k: key to check as string
+    :return (True, ip with added prefix) or (False, None)
+    """
+    lst = re.split(':', k.lower(), maxsplit=1)
+    if len(lst) == 1:
+        # No IP address in key; ignore
+        return False, None
+
+    ip = add_prefix(lst[1].split("/", -1)[0])
+    if is_local(ip):
+        return False, None
+    return True, ip
+
+
 def get_subscribe_updates(selector, subs):
     """
     helper to collect subscribe messages for a period
@@ -294,52 +342,70 @@ def is_vrf(k):
     return k.startswith("Vrf")
 
 
+def report_invalid_prefixes(prefixes, table, reported=None):
+    """
+    Log the malformed prefixes read from a table; they are still checked,
+    compared as text.
+    :param prefixes: PrefixSet read from table
+    :param reported: set of (table, prefix) already logged, updated; None
+    to log them all
+    """
+    for prefix in prefixes.invalid:
+        if reported is not None:
+            if (table, prefix) in reported:
+                continue
+            reported.add((table, prefix))
+        print_message(syslog.LOG_WARNING, "Invalid prefix {} in {}".format(prefix, table))
+
+
 def get_appdb_routes(namespace):
     """
     helper to read route table from APPL-DB.
-    :return list of sorted routes with prefix ensured
+    :return PrefixSet of routes with prefix ensured
     """
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     print_message(syslog.LOG_DEBUG, "APPL DB connected for routes")
     tbl = swsscommon.Table(db, 'ROUTE_TABLE')
     keys = tbl.getKeys()
 
-    valid_rt = []
+    valid_rt = PrefixSet()
     for k in keys:
-        if (is_vrf(k)):
-            k = k.split(":", 1)[1]
-
-        if not is_local(k):
-            valid_rt.append(add_prefix_ifnot(k.lower()))
+        res, e = checkout_appl_rt_entry(k)
+        if res:
+            valid_rt.add(e)
+    report_invalid_prefixes(valid_rt, 'ROUTE_TABLE')
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": sorted(valid_rt)}, indent=4))
-    return sorted(valid_rt)
+    if is_debug_enabled():
+        print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": valid_rt.sorted()}, indent=4))
+    return valid_rt
 
 
 def get_asicdb_routes(namespace):
     """
     helper to read present route entries from ASIC-DB and
     as well initiate selector for ASIC-DB:ASIC-state updates.
-    :return (selector,  subscriber, <list of sorted routes>)
+    :return (selector,  subscriber, <PrefixSet of routes>)
     """
     db = swsscommon.DBConnector(ASIC_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     subs = swsscommon.SubscriberStateTable(db, ASIC_TABLE_NAME)
     print_message(syslog.LOG_DEBUG, "ASIC DB {} connected".format(namespace))
 
-    rt = []
+    rt = PrefixSet()
     while True:
         k, _, _ = subs.pop()
         if not k:
             break
         res, e = checkout_rt_entry(k)
         if res:
-            rt.append(e)
+            rt.add(e)
+    report_invalid_prefixes(rt, ASIC_TABLE_NAME)
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"ASIC_ROUTE_ENTRY": sorted(rt)}, indent=4))
+    if is_debug_enabled():
+        print_message(syslog.LOG_DEBUG, json.dumps({"ASIC_ROUTE_ENTRY": rt.sorted()}, indent=4))
 
     selector = swsscommon.Select()
     selector.addSelectable(subs)
-    return (selector, subs, sorted(rt))
+    return (selector, subs, rt)
 
 
 def get_appdb_sids(namespace):
@@ -494,26 +560,23 @@ def get_frr_routes_parallel(namespace):
 def get_interfaces(namespace):
     """
     helper to read interface table from APPL-DB.
-    :return sorted list of IP addresses with added prefix
+    :return PrefixSet of IP addresses with added prefix
     """
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     print_message(syslog.LOG_DEBUG, "APPL DB connected for interfaces")
     tbl = swsscommon.Table(db, 'INTF_TABLE')
     keys = tbl.getKeys()
 
-    intf = []
+    intf = PrefixSet()
     for k in keys:
-        lst = re.split(':', k.lower(), maxsplit=1)
-        if len(lst) == 1:
-            # No IP address in key; ignore
-            continue
-
-        ip = add_prefix(lst[1].split("/", -1)[0])
-        if not is_local(ip):
-            intf.append(ip)
+        res, ip = checkout_intf_entry(k)
+        if res:
+            intf.add(ip)
+    report_invalid_prefixes(intf, 'INTF_TABLE')
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"APPL_DB_INTF": sorted(intf)}, indent=4))
-    return sorted(intf)
+    if is_debug_enabled():
+        print_message(syslog.LOG_DEBUG, json.dumps({"APPL_DB_INTF": intf.sorted()}, indent=4))
+    return intf
 
 
 def is_point_to_point_prefix(prefix):
@@ -561,27 +624,18 @@ def get_local_p2p_ips(namespace):
 def filter_out_local_p2p_ips(namespace, keys):
     """
     helper to filter out local p2p IPs
-    :param keys: APPL-DB:ROUTE_TABLE Routes to check.
+    :param keys: PrefixSet of APPL-DB:ROUTE_TABLE Routes to check.
     :return keys filtered out of local
     """
-    rt = []
-    if_tbl_ips = set(get_local_p2p_ips(namespace))
-
-    for k in keys:
-        if k in if_tbl_ips:
-            continue
-        rt.append(k)
-
-    return rt
+    return keys.exclude(get_local_p2p_ips(namespace))
 
 
 def filter_out_local_interfaces(namespace, keys):
     """
     helper to filter out local interfaces
-    :param keys: APPL-DB:ROUTE_TABLE Routes to check.
+    :param keys: PrefixSet of APPL-DB:ROUTE_TABLE Routes to check.
     :return keys filtered out of local
     """
-    rt = []
     local_if_lst = {'eth0', 'eth1', 'docker0'}  # eth1 is added to skip route installed in AAPL_DB on packet-chassis
     local_if_lo = [r'tun0', r'lo', r'Loopback\d+']
 
@@ -591,21 +645,21 @@ def filter_out_local_interfaces(namespace, keys):
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     tbl = swsscommon.Table(db, 'ROUTE_TABLE')
 
-    for k in keys:
+    def is_not_local(k):
         e = dict(tbl.get(k)[1])
 
         ifname = e.get('ifname', '')
         if ifname in local_if_lst:
-            continue
+            return False
 
         if any([re.match(x, ifname) for x in local_if_lo]):
             nh = e.get('nexthop')
             if not nh or ipaddress.ip_address(nh).is_unspecified:
-                continue
+                return False
 
-        rt.append(k)
+        return True
 
-    return rt
+    return keys.filter(is_not_local)
 
 
 def filter_out_voq_neigh_routes(namespace, keys):
@@ -615,50 +669,42 @@ def filter_out_voq_neigh_routes(namespace, keys):
     writing route entries in asic db for these. We filter
     out reporting error on all the host routes written on
     inband interface prefixed with "Ethernte-IB"
-    :param namespace: Asic namespace, keys: APPL-DB:ROUTE_TABLE Routes to check.
+    :param namespace: Asic namespace, keys: PrefixSet of APPL-DB:ROUTE_TABLE Routes to check.
     :return keys filtered out for voq neigh routes
     """
-    rt = []
     local_if_re = [r'Ethernet-IB\d+']
 
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     tbl = swsscommon.Table(db, 'ROUTE_TABLE')
 
-    for k in keys:
+    def is_not_voq_neigh(k):
         prefix = k.split("/")
         e = dict(tbl.get(k)[1])
         if not e:
             # Prefix might have been added. So try w/o it.
             e = dict(tbl.get(prefix[0])[1])
-        if not e or \
+        return not e or \
             all([not (re.match(x, e['ifname']) and
                 ((prefix[1] == "32" and e['nexthop'] == "0.0.0.0") or
-                (prefix[1] == "128" and e['nexthop'] == "::"))) for x in local_if_re]):
-            rt.append(k)
+                (prefix[1] == "128" and e['nexthop'] == "::"))) for x in local_if_re])
 
-    return rt
+    return keys.filter(is_not_voq_neigh)
 
 
 def filter_out_default_routes(lst):
     """
     helper to filter out default routes
-    :param lst: list to filter
-    :return filtered list.
+    :param lst: PrefixSet to filter
+    :return filtered PrefixSet.
     """
-    upd = []
-
-    for rt in lst:
-        if not is_default_route(rt):
-            upd.append(rt)
-
-    return upd
+    return lst.filter(lambda rt: not is_default_route(rt))
 
 
 def filter_out_vnet_routes(namespace, routes):
     """
     Helper to filter out VNET routes
-    :param routes: list of routes to filter
-    :return filtered list of routes.
+    :param routes: PrefixSet of routes to filter
+    :return filtered PrefixSet of routes.
     """
     db = swsscommon.DBConnector('APPL_DB', REDIS_TIMEOUT_MSECS, True, namespace)
 
@@ -674,13 +720,7 @@ def filter_out_vnet_routes(namespace, routes):
         vnet_route = vnet_route_attrs[1]
         vnet_routes.append(vnet_route)
 
-    updated_routes = []
-
-    for route in routes:
-        if not (route in vnet_routes):
-            updated_routes.append(route)
-
-    return updated_routes
+    return routes.exclude(vnet_routes)
 
 
 def is_dualtor(config_db):
@@ -699,31 +739,29 @@ def filter_out_standalone_tunnel_routes(namespace, routes):
     app_db = swsscommon.DBConnector('APPL_DB', REDIS_TIMEOUT_MSECS, True, namespace)
     neigh_table = swsscommon.Table(app_db, 'NEIGH_TABLE')
     neigh_keys = neigh_table.getKeys()
-    standalone_tunnel_route_ips = []
-    updated_routes = []
+    standalone_tunnel_route_ips = set()
 
     for neigh in neigh_keys:
         _, mac = neigh_table.hget(neigh, 'neigh')
         if mac == '00:00:00:00:00:00':
             # remove preceding 'VlanXXXX' to get just the neighbor IP
             neigh_ip = ':'.join(neigh.split(':')[1:])
-            standalone_tunnel_route_ips.append(neigh_ip)
+            standalone_tunnel_route_ips.add(neigh_ip)
 
     if not standalone_tunnel_route_ips:
         return routes
 
-    for route in routes:
+    def is_not_standalone_tunnel_route(route):
         ip, subnet = route.split('/')
         ip_version = ipaddress.ip_address(ip).version
 
         # we want to keep the route if it is not a standalone tunnel route.
         # if the route subnet contains more than one address, it is not a
         # standalone tunnel route
-        if (ip not in standalone_tunnel_route_ips) or \
-           ((ip_version == 6 and subnet != '128') or (ip_version == 4 and subnet != '32')):
-            updated_routes.append(route)
+        return (ip not in standalone_tunnel_route_ips) or \
+            ((ip_version == 6 and subnet != '128') or (ip_version == 4 and subnet != '32'))
 
-    return updated_routes
+    return routes.filter(is_not_standalone_tunnel_route)
 
 
 def is_feature_bgp_enabled(namespace):
@@ -841,12 +879,7 @@ def filter_out_soc_ip_routes(namespace, routes):
     if not soc_ips:
         return routes
 
-    updated_routes = []
-    for route in routes:
-        if route not in soc_ips:
-            updated_routes.append(route)
-
-    return updated_routes
+    return routes.exclude(soc_ips)
 
 
 def get_vlan_neighbors(namespace):
@@ -870,24 +903,18 @@ def get_vlan_neighbors(namespace):
 def filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss):
     """Ignore any route miss for vlan neighbor IPs."""
 
-    def _filter_out_neigh_route(routes, neighs):
-        updated_routes = []
-        ignored_routes = []
-        for route in routes:
-            if route in neighs:
-                ignored_routes.append(route)
-            else:
-                updated_routes.append(route)
-        return updated_routes, ignored_routes
-
     config_db = multi_asic.connect_config_db_for_ns(namespace)
 
     if is_dualtor(config_db):
-        vlan_neighs = set(get_vlan_neighbors(namespace))
-        rt_appl_miss, ignored_rt_appl_miss = _filter_out_neigh_route(rt_appl_miss, vlan_neighs)
-        print_message(syslog.LOG_DEBUG, "Ignored appl route miss:",  json.dumps(ignored_rt_appl_miss, indent=4))
-        rt_asic_miss, ignored_rt_asic_miss = _filter_out_neigh_route(rt_asic_miss, vlan_neighs)
-        print_message(syslog.LOG_DEBUG, "Ignored asic route miss:",  json.dumps(ignored_rt_asic_miss, indent=4))
+        vlan_neighs = PrefixSet(get_vlan_neighbors(namespace))
+        ignored_rt_appl_miss = rt_appl_miss.intersection(vlan_neighs)
+        rt_appl_miss = rt_appl_miss.difference(vlan_neighs)
+        print_message(syslog.LOG_DEBUG, "Ignored appl route miss:",
+                      json.dumps(ignored_rt_appl_miss.sorted(), indent=4))
+        ignored_rt_asic_miss = rt_asic_miss.intersection(vlan_neighs)
+        rt_asic_miss = rt_asic_miss.difference(vlan_neighs)
+        print_message(syslog.LOG_DEBUG, "Ignored asic route miss:",
+                      json.dumps(ignored_rt_asic_miss.sorted(), indent=4))
 
     return rt_appl_miss, rt_asic_miss
 
@@ -913,12 +940,6 @@ def check_routes_for_namespace(namespace):
     the unjustifiable entries.
     """
 
-    results = {}
-    adds = []
-    deletes = []
-    intf_appl_miss = []
-    rt_appl_miss = []
-    rt_asic_miss = []
     rt_frr_miss = []
     rt_frr_failed = []
 
@@ -930,17 +951,49 @@ def check_routes_for_namespace(namespace):
     intf_appl = get_interfaces(namespace)
 
     # Diff APPL-DB routes & ASIC-DB routes
-    rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
+    rt_appl_miss, rt_asic_miss = diff_prefixes(rt_appl, rt_asic)
 
     # Check missed ASIC routes against APPL-DB INTF_TABLE
-    _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
-    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
-    rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
-    rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
-    rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
+    rt_asic_miss = rt_asic_miss.difference(intf_appl)
 
     # Check APPL-DB INTF_TABLE with ASIC table route entries
-    intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
+    intf_appl_miss = intf_appl.difference(rt_asic)
+
+    ret = check_route_misses(namespace, rt_appl_miss, rt_asic_miss, intf_appl_miss,
+                             rt_frr_miss, rt_frr_failed, rt_appl,
+                             functools.partial(get_subscribe_updates, selector, subs))
+
+    # Release the subscriber. If we keep the subscriber open then route updates will accumulate in the subscriber queue
+    # causing high client memory usage in redis.
+    del subs
+    del selector
+
+    return ret
+
+
+def check_route_misses(namespace, rt_appl_miss, rt_asic_miss, intf_appl_miss,
+                       rt_frr_miss, rt_frr_failed, rt_appl, get_updates):
+    """
+    Rule out the justifiable entries from the raw APPL-DB / ASIC-DB diffs
+    of a namespace and build its results.
+    :param rt_appl_miss: PrefixSet of APPL-DB routes missing in ASIC-DB
+    :param rt_asic_miss: PrefixSet of ASIC-DB routes missing in APPL-DB ROUTE_TABLE & INTF_TABLE
+    :param intf_appl_miss: PrefixSet of APPL-DB INTF_TABLE entries missing in ASIC-DB
+    :param rt_frr_miss, rt_frr_failed: as returned by check_frr_pending_routes
+    :param rt_appl: APPL-DB routes, used for FRR mitigation
+    :param get_updates: callable returning sorted ASIC-DB (adds, deletes)
+    seen over the subscribe wait period
+    :return (results, adds, deletes)
+    """
+    results = {}
+    adds = []
+    deletes = []
+
+    if rt_asic_miss:
+        rt_asic_miss = filter_out_default_routes(rt_asic_miss)
+        rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
+        rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
+        rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
 
     if rt_appl_miss:
         rt_appl_miss = filter_out_local_interfaces(namespace, rt_appl_miss)
@@ -955,31 +1008,26 @@ def check_routes_for_namespace(namespace):
 
     if rt_appl_miss or rt_asic_miss:
         # Look for subscribe updates for a second
-        adds, deletes = get_subscribe_updates(selector, subs)
-
-    # Release the subscriber. If we keep the subscriber open then route updates will accumulate in the subscriber queue
-    # causing high client memory usage in redis.
-    del subs
-    del selector
+        adds, deletes = get_updates()
 
     # Drop all those for which SET received
-    rt_appl_miss, _ = diff_sorted_lists(rt_appl_miss, adds)
+    rt_appl_miss = rt_appl_miss.exclude(adds)
 
     # Drop all those for which DEL received
-    rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, deletes)
+    rt_asic_miss = rt_asic_miss.exclude(deletes)
 
     # Filter local p2p IPs if any that are reported as missing in APPL_DB
     if rt_appl_miss:
         rt_appl_miss = filter_out_local_p2p_ips(namespace, rt_appl_miss)
 
     if rt_appl_miss:
-        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss.sorted()
 
     if intf_appl_miss:
-        results["missed_INTF_TABLE_entries"] = intf_appl_miss
+        results["missed_INTF_TABLE_entries"] = intf_appl_miss.sorted()
 
     if rt_asic_miss:
-        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
+        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss.sorted()
 
     if rt_frr_miss:
         results["missed_FRR_routes"] = rt_frr_miss
@@ -1000,6 +1048,261 @@ def check_routes_for_namespace(namespace):
     return results, adds, deletes
 
 
+def split_key(k, start, end=None):
+    """
+    Cut a raw table key around its prefix text.
+    :param start: text right before the prefix
+    :param end: text right after the prefix, None for the end of the key
+    :return (head, prefix text, tail) with head + text + tail == k; head
+    is "" when start is not found
+    """
+    i = k.find(start)
+    if i < 0:
+        return "", k, ""
+    i += len(start)
+    j = k.find(end, i) if end else -1
+    if j < 0:
+        j = len(k)
+    return k[:i], k[i:j], k[j:]
+
+
+def split_rt_key(k):
+    return split_key(k, '"dest":"', '"')
+
+
+def split_appl_rt_key(k):
+    return split_key(k, ":") if is_vrf(k) else ("", k, "")
+
+
+def split_intf_key(k):
+    return split_key(k, ":")
+
+
+class PrefixIndex(object):
+    """
+    Reference counted set of prefixes, fed by raw table keys.
+    Several keys (e.g. the same prefix in different VRFs) may map to one
+    prefix, which stays present until the last of its keys is deleted.
+    """
+
+    def __init__(self, checkout, split):
+        """
+        :param checkout: helper mapping a raw key to (True, prefix) or (False, None)
+        :param split: helper cutting a raw key into (head, prefix text, tail)
+        """
+        self.checkout = checkout
+        self.split = split
+        # (head, prefix text, tail) of the raw key -> prefix.
+        # ASIC-DB keys are JSON strings of over a hundred characters, but
+        # their head and tail are the same for all routes of a VRF, so they
+        # are interned and each entry only holds its own prefix text.
+        self.keys = {}
+        self.prefixes = {}
+
+    def __contains__(self, prefix):
+        return prefix in self.prefixes
+
+    def __len__(self):
+        return len(self.prefixes)
+
+    def update(self, key, op):
+        """
+        Apply one subscribe message.
+        :return the prefix touched by the message, or None
+        """
+        head, text, tail = self.split(key)
+        ckey = (sys.intern(head), text, sys.intern(tail))
+        if op == "SET":
+            e = self.keys.get(ckey)
+            if e is not None:
+                return e
+            res, e = self.checkout(key)
+            if not res:
+                return None
+            if text == e:
+                ckey = (ckey[0], e, ckey[2])
+            self.keys[ckey] = e
+            self.prefixes[e] = self.prefixes.get(e, 0) + 1
+            return e
+
+        if op == "DEL":
+            e = self.keys.pop(ckey, None)
+            if e is None:
+                res, e = self.checkout(key)
+                return e if res else None
+            cnt = self.prefixes[e] - 1
+            if cnt:
+                self.prefixes[e] = cnt
+            else:
+                del self.prefixes[e]
+            return e
+
+        return None
+
+
+class RouteIndex(object):
+    """
+    In-memory route state of one namespace, used in daemon mode.
+    resync() opens subscriptions on APPL-DB ROUTE_TABLE, APPL-DB INTF_TABLE
+    and ASIC-DB ASIC_STATE and reads the baseline from them. Afterwards the
+    subscriptions are drained on every scan and only the prefixes they
+    touched are re-evaluated against the mismatch sets.
+    """
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.last_resync = None
+        # (table, prefix) of the invalid prefixes already logged
+        self.reported_invalid = set()
+        self.reset()
+
+    def reset(self):
+        """
+        Drop the subscriptions and all indexed state.
+        """
+        self.selector = None
+        self.subs = []
+        self.rt_appl = PrefixIndex(checkout_appl_rt_entry, split_appl_rt_key)
+        self.intf_appl = PrefixIndex(checkout_intf_entry, split_intf_key)
+        self.rt_asic = PrefixIndex(checkout_rt_entry, split_rt_key)
+        self.rt_appl_miss = set()
+        self.rt_asic_miss = set()
+        self.intf_appl_miss = set()
+        self.dirty = set()
+
+    def needs_resync(self, resync_interval):
+        if self.last_resync is None:
+            return True
+        return bool(resync_interval) and time.time() - self.last_resync >= resync_interval
+
+    def invalidate(self):
+        """
+        Drop the subscriptions and force a full resync on next scan.
+        """
+        self.reset()
+        self.last_resync = None
+
+    def resync(self):
+        """
+        Re-read the full baseline through fresh subscriptions.
+        """
+        self.reset()
+
+        appl_db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, self.namespace)
+        asic_db = swsscommon.DBConnector(ASIC_DB_NAME, REDIS_TIMEOUT_MSECS, True, self.namespace)
+        self.subs = [
+            (swsscommon.SubscriberStateTable(appl_db, 'ROUTE_TABLE'), self.rt_appl),
+            (swsscommon.SubscriberStateTable(appl_db, 'INTF_TABLE'), self.intf_appl),
+            (swsscommon.SubscriberStateTable(asic_db, ASIC_TABLE_NAME), self.rt_asic)
+        ]
+        self.selector = swsscommon.Select()
+        for subs, _ in self.subs:
+            self.selector.addSelectable(subs)
+
+        self.drain(collect=False)
+        self.last_resync = time.time()
+        print_message(syslog.LOG_DEBUG, "Route index {} resynced: appl={} asic={} intf={}".format(
+            self.namespace, len(self.rt_appl), len(self.rt_asic), len(self.intf_appl)))
+
+    def drain(self, collect=True):
+        """
+        Pop all pending subscribe messages into the index.
+        :param collect: False to not list the ASIC-DB messages, e.g. for
+        the baseline, where they are all adds
+        :return (adds, deletes) seen for ASIC-DB route entries
+        """
+        adds = []
+        deletes = []
+        for subs, index in self.subs:
+            while True:
+                key, op, _ = subs.pop()
+                if not key:
+                    break
+                e = index.update(key, op)
+                if e is None:
+                    continue
+                self.dirty.add(e)
+                if collect and index is self.rt_asic:
+                    if op == "SET":
+                        adds.append(e)
+                    elif op == "DEL":
+                        deletes.append(e)
+        return adds, deletes
+
+    def refresh(self):
+        """
+        Re-evaluate the dirty prefixes against the mismatch sets.
+        """
+        for e in self.dirty:
+            in_appl = e in self.rt_appl
+            in_asic = e in self.rt_asic
+            in_intf = e in self.intf_appl
+            for miss, missing in ((self.rt_appl_miss, in_appl and not in_asic),
+                                  (self.rt_asic_miss, in_asic and not in_appl and not in_intf),
+                                  (self.intf_appl_miss, in_intf and not in_asic)):
+                if missing:
+                    miss.add(e)
+                else:
+                    miss.discard(e)
+        print_message(syslog.LOG_DEBUG, "Route index {}: {} dirty prefixes".format(self.namespace, len(self.dirty)))
+        self.dirty.clear()
+
+    def get_subscribe_updates(self):
+        """
+        Same as get_subscribe_updates, but keeps every message in the index.
+        :return (add, del) ASIC-DB messages as sorted
+        """
+        adds = []
+        deletes = []
+        t_end = time.time() + SUBSCRIBE_WAIT_SECS
+        t_wait = SUBSCRIBE_WAIT_SECS
+
+        while t_wait > 0:
+            self.selector.select(t_wait)
+            t_wait = int(t_end - time.time())
+            a, d = self.drain()
+            adds += a
+            deletes += d
+
+        print_message(syslog.LOG_DEBUG, "adds={}".format(adds))
+        print_message(syslog.LOG_DEBUG, "dels={}".format(deletes))
+        return (sorted(adds), sorted(deletes))
+
+
+def check_routes_for_namespace_incremental(index, resync_interval):
+    """
+    Daemon mode counterpart of check_routes_for_namespace.
+    Does a full resync of the route index when due, else only applies the
+    updates received since the previous scan, then runs the same checks
+    on the resulting mismatches. FRR routes are checked on resync only.
+    :return (results, adds, deletes) as check_routes_for_namespace
+    """
+    namespace = index.namespace
+    rt_frr_miss = []
+    rt_frr_failed = []
+
+    try:
+        if index.needs_resync(resync_interval):
+            rt_frr_miss, rt_frr_failed = check_frr_pending_routes(namespace)
+            index.resync()
+        else:
+            index.drain()
+        index.refresh()
+
+        rt_appl_miss = PrefixSet(index.rt_appl_miss)
+        rt_asic_miss = PrefixSet(index.rt_asic_miss)
+        intf_appl_miss = PrefixSet(index.intf_appl_miss)
+        report_invalid_prefixes(rt_appl_miss, 'ROUTE_TABLE', index.reported_invalid)
+        report_invalid_prefixes(rt_asic_miss, ASIC_TABLE_NAME, index.reported_invalid)
+        report_invalid_prefixes(intf_appl_miss, 'INTF_TABLE', index.reported_invalid)
+
+        return check_route_misses(namespace, rt_appl_miss, rt_asic_miss, intf_appl_miss,
+                                  rt_frr_miss, rt_frr_failed, index.rt_appl, index.get_subscribe_updates)
+    except Exception:
+        index.invalidate()
+        raise
+
+
 def summarize_results(results):
     """
     Summarize mismatch results by counting entries per namespace/category.
@@ -1010,9 +1313,12 @@ def summarize_results(results):
             for ns, entries in results.items()}
 
 
-def check_routes(namespace):
+def check_routes(namespace, route_indexes=None, resync_interval=0):
     """
     Main function to parallelize route checks across all namespaces.
+    :param route_indexes: dict of namespace to RouteIndex for daemon mode,
+    filled in as needed; None to do a full check
+    :param resync_interval: seconds between full resyncs of route indexes
     """
     namespace_list = []
     if namespace is not multi_asic.DEFAULT_NAMESPACE and namespace in multi_asic.get_namespace_list():
@@ -1027,7 +1333,12 @@ def check_routes(namespace):
 
     # Use ThreadPoolExecutor to parallelize the check for each namespace
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = {executor.submit(check_routes_for_namespace, ns): ns for ns in namespace_list}
+        if route_indexes is not None:
+            futures = {executor.submit(check_routes_for_namespace_incremental,
+                                       route_indexes.setdefault(ns, RouteIndex(ns)), resync_interval): ns
+                       for ns in namespace_list}
+        else:
+            futures = {executor.submit(check_routes_for_namespace, ns): ns for ns in namespace_list}
 
         for future in concurrent.futures.as_completed(futures):
             ns = futures[future]
@@ -1159,6 +1470,17 @@ def main():
                         type=int,
                         default=TIMEOUT_SECONDS,
                         help='Timeout in secs')
+    parser.add_argument('-d',
+                        '--daemon',
+                        action='store_true',
+                        default=False,
+                        help='Keep an in-memory route index updated from DB subscriptions '
+                             'and only re-check changed prefixes between scans; requires --interval')
+    parser.add_argument('-r',
+                        '--resync_interval',
+                        type=int,
+                        default=MAX_SCAN_INTERVAL,
+                        help='Full resync interval in secs for daemon mode, 0 to never resync')
     args = parser.parse_args()
 
     namespace = args.namespace
@@ -1173,6 +1495,10 @@ def main():
         print_message(syslog.LOG_ERR, "Namespace option is not valid. Choose one of {}".format(multi_asic.get_namespace_list()))
         return -1, None
 
+    if args.daemon and not args.interval:
+        print_message(syslog.LOG_ERR, "Daemon mode requires a scan interval")
+        return -1, None
+
     set_level(args.mode, args.log_to_syslog)
 
     if args.interval:
@@ -1192,9 +1518,11 @@ def main():
         print_message(syslog.LOG_INFO, "BGP feature is disabled, exiting without checking routes!!")
         return 0, None
 
+    route_indexes = {} if args.daemon else None
+
     while True:
         signal.alarm(TIMEOUT_SECONDS)
-        ret1, res1 = check_routes(namespace)
+        ret1, res1 = check_routes(namespace, route_indexes, args.resync_interval)
         print_message(syslog.LOG_DEBUG, "check_routes: ret={}, res={}".format(ret1, res1))
         ret2, res2 = check_sids(namespace)
         print_message(syslog.LOG_DEBUG, "check_sids: ret={}, res={}".format(ret2, res2))
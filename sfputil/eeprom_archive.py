@@ -0,0 +1,128 @@
+"""
+Binary archive of transceiver EEPROM pages, for offline decoding.
+
+The archive keeps the raw bytes of every page dumped by
+'sfputil show eeprom-hexdump --archive', with the port, the page number
+and the offset of the page in the flat EEPROM address space the xcvr
+APIs read through read_eeprom(). FlatEeprom serves those reads from an
+archive, so a module can be decoded away from the switch, e.g. with
+sonic_platform_base.sonic_xcvr.xcvr_api_factory.XcvrApiFactory(
+    eeprom.read_eeprom, None).
+
+File layout:
+    MAGIC | version (u32) | records
+    record: port name length (u16) | page (u16) | flat offset (u32) |
+            page offset (u32) | size (u32) | port name | data
+"""
+
+import os
+import struct
+import tempfile
+
+MAGIC = b"SFPPAGES"
+VERSION = 1
+PREAMBLE = struct.Struct("=8sI")
+RECORD = struct.Struct("=HHIII")
+
+
+class ArchiveWriter(object):
+    """
+    Write the pages of one port after the other. The file only replaces
+    path once close() is called.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        dirname = os.path.dirname(os.path.abspath(path))
+        fd, self.tmp_path = tempfile.mkstemp(dir=dirname, prefix=".eeprom-archive-")
+        self.file = os.fdopen(fd, 'wb')
+        self.file.write(PREAMBLE.pack(MAGIC, VERSION))
+
+    def add(self, port, pages):
+        """
+        Add the pages of port.
+        :param pages: List of (page, flat offset, page offset, data)
+        """
+        name = port.encode()
+        for page, flat_offset, page_offset, data in pages:
+            self.file.write(RECORD.pack(len(name), page, flat_offset, page_offset, len(data)))
+            self.file.write(name)
+            self.file.write(bytes(data))
+
+    def close(self):
+        self.file.close()
+        os.chmod(self.tmp_path, 0o644)
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        self.file.close()
+        os.unlink(self.tmp_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def read_archive(path):
+    """
+    Generator of (port, page, flat offset, page offset, data) of every page
+    in the archive at path, in the order they were written.
+    """
+    with open(path, 'rb') as f:
+        preamble = f.read(PREAMBLE.size)
+        if len(preamble) != PREAMBLE.size or PREAMBLE.unpack(preamble) != (MAGIC, VERSION):
+            raise ValueError("{} is not an EEPROM page archive".format(path))
+        while True:
+            header = f.read(RECORD.size)
+            if not header:
+                return
+            if len(header) != RECORD.size:
+                raise ValueError("Truncated EEPROM page archive {}".format(path))
+            name_len, page, flat_offset, page_offset, size = RECORD.unpack(header)
+            port = f.read(name_len).decode()
+            data = f.read(size)
+            if len(data) != size:
+                raise ValueError("Truncated EEPROM page archive {}".format(path))
+            yield port, page, flat_offset, page_offset, data
+
+
+def load_archive(path):
+    """
+    Return {port: FlatEeprom} of the archive at path.
+    """
+    eeproms = {}
+    for port, _, flat_offset, _, data in read_archive(path):
+        eeproms.setdefault(port, FlatEeprom()).add(flat_offset, data)
+    return eeproms
+
+
+class FlatEeprom(object):
+    """
+    Flat EEPROM address space of one module, made of the archived pages.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def add(self, flat_offset, data):
+        self.chunks.append((flat_offset, bytes(data)))
+
+    def read_eeprom(self, offset, num_bytes):
+        """
+        Return num_bytes from offset as a bytearray, like Sfp.read_eeprom,
+        or None if the range was not archived.
+        """
+        result = bytearray(num_bytes)
+        covered = bytearray(num_bytes)
+        for start, data in self.chunks:
+            lo = max(offset, start)
+            hi = min(offset + num_bytes, start + len(data))
+            if lo < hi:
+                result[lo - offset:hi - offset] = data[lo - start:hi - start]
+                covered[lo - offset:hi - offset] = b'\x01' * (hi - lo)
+        return result if all(covered) else None
@@ -0,0 +1,325 @@
+"""
+Firmware download and upgrade of many transceivers at once.
+
+A CDB firmware download writes the image to the module a block at a time
+and takes minutes per module, most of it waiting on the module. The batch
+reads the image once and drives the downloads of several modules
+concurrently. Modules sharing an I2C bus or mux are serialized on it
+(bounded by per_group), so concurrency only overlaps downloads which do
+not contend for the same bus.
+
+Every port goes through the stages of the batch in order, and the last
+stage completed by each port is saved to a state file after every stage.
+Running the batch again with the same state file and image resumes every
+port after its last completed stage, so only the failed ports are redone.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+STAGE_DOWNLOAD = 'download'
+STAGE_RUN = 'run'
+STAGE_SWITCH = 'switch'
+STAGE_COMMIT = 'commit'
+DOWNLOAD_STAGES = [STAGE_DOWNLOAD]
+UPGRADE_STAGES = [STAGE_DOWNLOAD, STAGE_RUN, STAGE_SWITCH, STAGE_COMMIT]
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+STATUS_SKIPPED = 'skipped'
+
+SMBUS_BLOCK_WRITE_SIZE = 32
+MAX_LPL_FIRMWARE_BLOCK_SIZE = 116  # Bytes
+DEFAULT_RUN_MODE = 0
+FW_SWITCH_TIMEOUT = 60  # seconds
+FW_SWITCH_POLL_INTERVAL = 2  # seconds
+
+
+class FirmwareError(Exception):
+    """
+    A firmware operation failed on a module; the message says which step.
+    """
+    pass
+
+
+def get_fw_mgmt_feature(api):
+    """
+    Return (start LPL size, max block size, LPL only flag) of the module.
+    NotImplementedError of the api is propagated.
+    """
+    fwinfo = api.get_module_fw_mgmt_feature()
+    if fwinfo['status'] is not True:
+        raise FirmwareError("Failed to fetch CDB Firmware management features")
+    start_lpl_size, max_block_size, lpl_only, _, _ = fwinfo['feature']
+    return start_lpl_size, max_block_size, lpl_only
+
+
+def write_firmware_blocks(api, fd, file_size, start_lpl_size, max_block_size, lpl_only, progress=None):
+    """
+    Write the image in fd, from start_lpl_size on, to the module CDB.
+    :param progress: Callable called with the number of bytes of every block written
+    """
+    address = 0
+    if lpl_only:
+        block_size = min(MAX_LPL_FIRMWARE_BLOCK_SIZE, max_block_size)
+    else:
+        block_size = max_block_size
+    remaining = file_size - start_lpl_size
+    while remaining > 0:
+        count = block_size if remaining >= block_size else remaining
+        data = fd.read(count)
+        if len(data) != count:
+            raise FirmwareError("Firmware file read failed!")
+
+        if lpl_only:
+            status = api.cdb_lpl_block_write(address, data)
+        else:
+            status = api.cdb_epl_block_write(address, data)
+        if status != 1:
+            raise FirmwareError("CDB: firmware download failed! - status {}".format(status))
+
+        if progress is not None:
+            progress(count)
+        address += count
+        remaining -= count
+
+
+def check_fw_switch(fw_info):
+    """
+    Check the module firmware info after a run_firmware.
+    :return: Tuple of (1 if the inactive image now runs, -1 on error, or
+             None if the switch is not done yet) and a message
+    """
+    if fw_info['status'] is not True or fw_info['result'] is None:
+        return None, None
+    (_, image_a_running, image_a_committed, image_a_invalid,
+     _, image_b_running, image_b_committed, image_b_invalid, _, _) = fw_info['result']
+
+    if (image_a_running == 1) and (image_a_invalid == 1):
+        return -1, "FW info error : ImageA shows running, but also shows invalid!"
+    elif (image_b_running == 1) and (image_b_invalid == 1):
+        return -1, "FW info error : ImageB shows running, but also shows invalid!"
+    elif (image_a_running == 1) and (image_a_committed == 0):
+        return 1, "FW images switch successful : ImageA is running"
+    elif (image_b_running == 1) and (image_b_committed == 0):
+        return 1, "FW images switch successful : ImageB is running"
+    # Switch not done yet — module may have returned stale pre-reset data
+    return None, None
+
+
+class BatchState(object):
+    """
+    Last completed stage of every port, saved to a JSON file after every
+    change. The state only applies to the image it was saved for.
+    """
+
+    def __init__(self, path, image_digest):
+        self.path = path
+        self.image_digest = image_digest
+        self.ports = {}
+        self.lock = threading.Lock()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            if saved.get('image') == image_digest:
+                self.ports = saved.get('ports', {})
+
+    def last_stage(self, port):
+        return self.ports.get(port, {}).get('stage')
+
+    def update(self, port, stage=None, error=None):
+        with self.lock:
+            entry = self.ports.setdefault(port, {})
+            if stage is not None:
+                entry['stage'] = stage
+            entry['error'] = error
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=".fwbatch-")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'image': self.image_digest, 'ports': self.ports}, f, indent=4)
+        os.replace(tmp_path, self.path)
+
+
+class FirmwareBatch(object):
+    """
+    Download, and optionally run and commit, one firmware image on many
+    modules concurrently.
+    """
+
+    def __init__(self, image_path, stages=UPGRADE_STAGES, max_parallel=8, per_group=1,
+                 state_path=None, progress=None, on_stage=None):
+        """
+        :param image_path: Path of the firmware image, read once
+        :param stages: Stages to run on every port, in order
+        :param max_parallel: Maximum number of ports worked on at once
+        :param per_group: Maximum number of concurrent downloads per I2C group
+        :param state_path: File to save the progress to, and resume from
+        :param progress: Callable called with the number of bytes of every block written
+        :param on_stage: Callable called with (port, stage) after every completed stage
+        """
+        with open(image_path, 'rb') as f:
+            self.image = f.read()
+        self.image_path = image_path
+        self.stages = list(stages)
+        self.max_parallel = max_parallel
+        self.per_group = per_group
+        self.state = BatchState(state_path, hashlib.sha256(self.image).hexdigest())
+        self.progress = progress
+        self.on_stage = on_stage
+        self.groups = {}
+        self.groups_lock = threading.Lock()
+        # Port name to the (start LPL size, max block size, LPL only) of its module
+        self.features = {}
+
+    def pending_stages(self, port):
+        """
+        Return the stages left to run on port.
+        """
+        last = self.state.last_stage(port)
+        if last not in self.stages:
+            return list(self.stages)
+        return self.stages[self.stages.index(last) + 1:]
+
+    def fw_mgmt_feature(self, port, api):
+        """
+        Return the firmware management feature of the module of port, read
+        once per batch.
+        """
+        if port not in self.features:
+            self.features[port] = get_fw_mgmt_feature(api)
+        return self.features[port]
+
+    def download_size(self, ports):
+        """
+        Return the number of bytes left to download to ports, the image past
+        the start LPL of each module, as write_firmware_blocks writes it.
+        :param ports: List of (port name, sfp, I2C group or None if unknown)
+        """
+        size = 0
+        for port, sfp, _ in ports:
+            if STAGE_DOWNLOAD not in self.pending_stages(port):
+                continue
+            try:
+                start_lpl_size, _, _ = self.fw_mgmt_feature(port, sfp.get_xcvr_api())
+            except Exception:
+                # The download of this port fails the same way, nothing is written
+                continue
+            size += max(len(self.image) - start_lpl_size, 0)
+        return size
+
+    def _group_lock(self, group):
+        with self.groups_lock:
+            if group not in self.groups:
+                self.groups[group] = threading.BoundedSemaphore(self.per_group)
+            return self.groups[group]
+
+    def download(self, port, sfp, api):
+        start_lpl_size, max_block_size, lpl_only = self.fw_mgmt_feature(port, api)
+
+        status = api.cdb_start_firmware_download(self.image_path)
+        if status != 1:
+            raise FirmwareError('CDB: Start firmware download failed - status {}'.format(status))
+
+        try:
+            sfp.set_optoe_write_max(SMBUS_BLOCK_WRITE_SIZE)
+        except NotImplementedError:
+            pass
+        try:
+            fd = io.BytesIO(self.image)
+            fd.seek(start_lpl_size)
+            write_firmware_blocks(api, fd, len(self.image), start_lpl_size, max_block_size, lpl_only,
+                                  self.progress)
+        finally:
+            try:
+                sfp.set_optoe_write_max(1)
+            except NotImplementedError:
+                pass
+
+        status = api.cdb_firmware_download_complete()
+        if status != 1:
+            raise FirmwareError("Firmware download complete failed! CDB status = {}".format(status))
+
+    def run_firmware(self, api):
+        status = api.cdb_run_firmware(DEFAULT_RUN_MODE)
+        if status != 1:
+            raise FirmwareError('Failed to run firmware in mode={} ! CDB status: {}'.format(
+                DEFAULT_RUN_MODE, status))
+
+    def wait_fw_switch(self, api):
+        timeout_time = time.time() + FW_SWITCH_TIMEOUT
+        while time.time() < timeout_time:
+            status, message = check_fw_switch(api.get_module_fw_info())
+            if status == 1:
+                return
+            if status is not None:
+                raise FirmwareError(message)
+            time.sleep(FW_SWITCH_POLL_INTERVAL)
+        raise FirmwareError("FW switch : Timeout!")
+
+    def commit_firmware(self, api):
+        status = api.cdb_commit_firmware()
+        if status != 1:
+            raise FirmwareError('Failed to commit firmware! CDB status: {}'.format(status))
+
+    def upgrade_port(self, port, sfp, group=None):
+        """
+        Run the pending stages on one port.
+        :return: Tuple of (status, last completed stage, error message)
+        """
+        stages = self.pending_stages(port)
+        if not stages:
+            return STATUS_SKIPPED, self.state.last_stage(port), None
+
+        try:
+            api = sfp.get_xcvr_api()
+            for stage in stages:
+                if stage == STAGE_DOWNLOAD:
+                    lock = self._group_lock(port if group is None else group)
+                    with lock:
+                        self.download(port, sfp, api)
+                elif stage == STAGE_RUN:
+                    self.run_firmware(api)
+                elif stage == STAGE_SWITCH:
+                    self.wait_fw_switch(api)
+                elif stage == STAGE_COMMIT:
+                    self.commit_firmware(api)
+                self.state.update(port, stage=stage)
+                if self.on_stage is not None:
+                    self.on_stage(port, stage)
+        except NotImplementedError:
+            error = "This functionality is NOT applicable for this transceiver"
+        except FirmwareError as e:
+            error = str(e)
+        except Exception as e:
+            error = "{}: {}".format(type(e).__name__, e)
+        else:
+            return STATUS_DONE, self.state.last_stage(port), None
+
+        self.state.update(port, error=error)
+        return STATUS_FAILED, self.state.last_stage(port), error
+
+    def run(self, ports):
+        """
+        Upgrade ports concurrently.
+        :param ports: List of (port name, sfp, I2C group or None if unknown)
+        :return: Dict of port name to (status, last completed stage, error message)
+        """
+        results = {}
+        if not ports:
+            return results
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(ports))) as executor:
+            futures = {executor.submit(self.upgrade_port, port, sfp, group): port for port, sfp, group in ports}
+            for future, port in futures.items():
+                results[port] = future.result()
+        return results
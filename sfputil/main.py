@@ -10,6 +10,8 @@ import os
 import sys
 import natsort
 import ast
+import re
+import threading
 import time
 import datetime
 
@@ -17,6 +19,7 @@ import subprocess
 import click
 import sonic_platform
 import sonic_platform_base.sonic_sfp.sfputilhelper
+from sfputil import eeprom_archive, firmware_batch
 from sfputil.debug import debug
 from sonic_platform_base.sfp_base import SfpBase
 from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
@@ -31,6 +34,8 @@ from utilities_common.sfp_helper import QSFP_DATA_MAP
 from utilities_common.sfp_helper import is_transceiver_cmis, get_data_map_sort_key
 from tabulate import tabulate
 from utilities_common.general import load_db_config
+from utilities_common.intf_filter import parse_interface_in_filter
+from utilities_common.parallel import imap_ordered
 
 VERSION = '3.0'
 
@@ -48,13 +53,10 @@ ERROR_PORT_CONFIG_LOAD = 4
 ERROR_NOT_IMPLEMENTED = 5
 ERROR_INVALID_PORT = 6
 ERROR_INVALID_PAGE = 7
-SMBUS_BLOCK_WRITE_SIZE = 32
 # Default host password as per CMIS spec:
 # http://www.qsfp-dd.com/wp-content/uploads/2021/05/CMIS5p0.pdf
 CDB_DEFAULT_HOST_PASSWORD = 0x00001011
 
-MAX_LPL_FIRMWARE_BLOCK_SIZE = 116 #Bytes
-
 PAGE_SIZE = 128
 PAGE_OFFSET = 128
 
@@ -343,6 +345,10 @@ platform_sfputil = None
 # Global logger instance
 log = logger.Logger(SYSLOG_IDENTIFIER)
 
+# Raw pages read by eeprom_dump_general in the current thread, when its
+# 'pages' attribute is set to a list
+eeprom_page_recorder = threading.local()
+
 def is_sfp_present(port_name):
     physical_port = logical_port_to_physical_port_index(port_name)
     sfp = platform_chassis.get_sfp(physical_port)
@@ -713,15 +719,105 @@ def show():
     pass
 
 
+class EepromOutputError(Exception):
+    """
+    Reading a port for 'show eeprom' failed: the message is printed and the
+    command ends, with exit_code if it is not None.
+    """
+
+    def __init__(self, message, exit_code=None):
+        super(EepromOutputError, self).__init__(message)
+        self.message = message
+        self.exit_code = exit_code
+
+
+def get_port_eeprom_output(logical_port_name, dump_dom):
+    """
+    Return the 'show eeprom' output of one logical port, with its DOM data
+    if dump_dom. Raises EepromOutputError.
+    """
+    output = ""
+    ganged = False
+    i = 1
+
+    physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
+    if physical_port_list is None:
+        raise EepromOutputError("Error: No physical ports found for logical port '{}'".format(logical_port_name))
+
+    if len(physical_port_list) > 1:
+        ganged = True
+
+    for physical_port in physical_port_list:
+        port_name = get_physical_port_name(logical_port_name, i, ganged)
+
+        if is_port_type_rj45(port_name):
+            output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
+            output += '\n'
+            continue
+
+        try:
+            presence = platform_chassis.get_sfp(physical_port).get_presence()
+        except NotImplementedError:
+            raise EepromOutputError("Sfp.get_presence() is currently not implemented for this platform",
+                                    ERROR_NOT_IMPLEMENTED)
+
+        if not presence:
+            output += "{}: SFP EEPROM not detected\n".format(port_name)
+        else:
+            output += "{}: SFP EEPROM detected\n".format(port_name)
+
+            try:
+                xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
+                is_sfp_cmis = is_transceiver_cmis(xcvr_info)
+            except NotImplementedError:
+                raise EepromOutputError("Sfp.get_transceiver_info() is currently not implemented for this platform",
+                                        ERROR_NOT_IMPLEMENTED)
+
+            output += convert_sfp_info_to_output_string(xcvr_info)
+
+            if dump_dom:
+                try:
+                    api = platform_chassis.get_sfp(physical_port).get_xcvr_api()
+                except NotImplementedError:
+                    output += "API is currently not implemented for this platform\n"
+                    raise EepromOutputError(output, ERROR_NOT_IMPLEMENTED)
+                if api is None:
+                    output += "API is none while getting DOM info!\n"
+                    raise EepromOutputError(output, ERROR_NOT_IMPLEMENTED)
+                try:
+                    xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_dom_real_value()
+                except NotImplementedError:
+                    raise EepromOutputError("Sfp.get_transceiver_dom_real_value() is currently not implemented "
+                                            "for this platform", ERROR_NOT_IMPLEMENTED)
+
+                try:
+                    xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
+                    if xcvr_dom_threshold_info:
+                        xcvr_dom_info.update(xcvr_dom_threshold_info)
+                except NotImplementedError:
+                    raise EepromOutputError("Sfp.get_transceiver_threshold_info() is currently not implemented "
+                                            "for this platform", ERROR_NOT_IMPLEMENTED)
+
+                output += convert_dom_to_output_string(xcvr_info['type'],
+                                                       is_sfp_cmis, xcvr_dom_info)
+
+        output += '\n'
+
+    return output
+
+
 # 'eeprom' subcommand
 @show.command()
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP EEPROM data for port <port_name> only")
 @click.option('-d', '--dom', 'dump_dom', is_flag=True, help="Also display Digital Optical Monitoring (DOM) data")
 @click.option('-n', '--namespace', default=None, help="Display interfaces for specific namespace")
-def eeprom(port, dump_dom, namespace):
+@click.option('-w', '--workers', type=click.IntRange(1, 64), default=1, show_default=True,
+              help="Number of ports read concurrently")
+@click.option('-t', '--timeout', type=click.IntRange(1, 3600), default=None,
+              help="Seconds after which a port which is still being read is reported as failed")
+def eeprom(port, dump_dom, namespace, workers, timeout):
     """Display EEPROM data of SFP transceiver(s)"""
     logical_port_list = []
-    output = ""
 
     # Create a list containing the logical port names of all ports we're interested in
     if port is None:
@@ -734,78 +830,21 @@ def eeprom(port, dump_dom, namespace):
 
         logical_port_list = [port]
 
-    for logical_port_name in logical_port_list:
-        ganged = False
-        i = 1
-
-        physical_port_list = logical_port_name_to_physical_port_list(logical_port_name)
-        if physical_port_list is None:
-            click.echo("Error: No physical ports found for logical port '{}'".format(logical_port_name))
+    # Each port is printed as soon as it and the ports before it are read
+    results = imap_ordered(lambda port_name: get_port_eeprom_output(port_name, dump_dom),
+                           logical_port_list, workers, timeout)
+    try:
+        for logical_port_name, output, error in results:
+            if error is not None:
+                output = "{}: Failed to read SFP EEPROM: {}\n\n".format(logical_port_name, error)
+            click.echo(output, nl=False)
+    except EepromOutputError as e:
+        click.echo(e.message)
+        if e.exit_code is None:
             return
+        sys.exit(e.exit_code)
 
-        if len(physical_port_list) > 1:
-            ganged = True
-
-        for physical_port in physical_port_list:
-            port_name = get_physical_port_name(logical_port_name, i, ganged)
-
-            if is_port_type_rj45(port_name):
-                output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
-                output += '\n'
-                continue
-
-            try:
-                presence = platform_chassis.get_sfp(physical_port).get_presence()
-            except NotImplementedError:
-                click.echo("Sfp.get_presence() is currently not implemented for this platform")
-                sys.exit(ERROR_NOT_IMPLEMENTED)
-
-            if not presence:
-                output += "{}: SFP EEPROM not detected\n".format(port_name)
-            else:
-                output += "{}: SFP EEPROM detected\n".format(port_name)
-
-                try:
-                    xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
-                    is_sfp_cmis = is_transceiver_cmis(xcvr_info)
-                except NotImplementedError:
-                    click.echo("Sfp.get_transceiver_info() is currently not implemented for this platform")
-                    sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                output += convert_sfp_info_to_output_string(xcvr_info)
-
-                if dump_dom:
-                    try:
-                        api = platform_chassis.get_sfp(physical_port).get_xcvr_api()
-                    except NotImplementedError:
-                        output += "API is currently not implemented for this platform\n"
-                        click.echo(output)
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-                    if api is None:
-                        output += "API is none while getting DOM info!\n"
-                        click.echo(output)
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-                    try:
-                        xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_dom_real_value()
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_dom_real_value() is currently not implemented "
-                                   "for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    try:
-                        xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
-                        if xcvr_dom_threshold_info:
-                            xcvr_dom_info.update(xcvr_dom_threshold_info)
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_threshold_info() is currently not implemented for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    output += convert_dom_to_output_string(xcvr_info['type'],
-                                                           is_sfp_cmis, xcvr_dom_info)
-
-            output += '\n'
-
-    click.echo(output)
+    click.echo("")
 
 
 # 'eeprom-hexdump' subcommand
@@ -814,29 +853,72 @@ def eeprom(port, dump_dom, namespace):
 @click.option('-n', '--page', metavar='<page_number>',
               help="Display SFP EEPROM hexdump for <page_number> "
                    "(decimal, hex (with 0x prefix) or octal (with 0o prefix))")
-def eeprom_hexdump(port, page):
+@click.option('-w', '--workers', type=click.IntRange(1, 64), default=1, show_default=True,
+              help="Number of ports read concurrently")
+@click.option('-t', '--timeout', type=click.IntRange(1, 3600), default=None,
+              help="Seconds after which a port which is still being read is reported as failed")
+@click.option('-a', '--archive', metavar='<path>', default=None,
+              help="Also write the raw pages read to a binary archive at <path>, for offline decoding")
+def eeprom_hexdump(port, page, workers, timeout, archive):
     """Display EEPROM hexdump of SFP transceiver(s)"""
-    if port:
-        if page is None:
-            page = 0
+    archive_writer = eeprom_archive.ArchiveWriter(archive) if archive else None
+    record = archive_writer is not None
+    try:
+        if port:
+            if page is None:
+                page = 0
+            else:
+                page = validate_eeprom_page(page)
+            return_code, output, pages = eeprom_hexdump_recorded(port, page, record)
+            if archive_writer is not None:
+                archive_writer.add(port, pages)
+                archive_writer.close()
+                archive_writer = None
+            click.echo(output)
+            sys.exit(return_code)
         else:
-            page = validate_eeprom_page(page)
-        return_code, output = eeprom_hexdump_single_port(port, page)
-        click.echo(output)
-        sys.exit(return_code)
-    else:
-        if page is not None:
-            page = validate_eeprom_page(page)
-        logical_port_list = natsorted(platform_sfputil.logical)
-        lines = []
-        for logical_port_name in logical_port_list:
-            return_code, output = eeprom_hexdump_single_port(logical_port_name, page)
-            if return_code != 0:
-                lines.append(f'EEPROM hexdump for port {logical_port_name}')
-                lines.append(f'{EEPROM_DUMP_INDENT}{output}\n')
-                continue
-            lines.append(output)
-        click.echo('\n'.join(lines))
+            if page is not None:
+                page = validate_eeprom_page(page)
+            logical_port_list = natsorted(platform_sfputil.logical)
+            results = imap_ordered(lambda port_name: eeprom_hexdump_recorded(port_name, page, record),
+                                   logical_port_list, workers, timeout)
+            printed = False
+            for logical_port_name, result, error in results:
+                if error is not None:
+                    result = (ERROR_NOT_IMPLEMENTED, f'Error: {error}', [])
+                return_code, output, pages = result
+                if archive_writer is not None:
+                    archive_writer.add(logical_port_name, pages)
+                # Each port is printed as soon as it and the ports before it are read
+                if return_code != 0:
+                    click.echo(f'EEPROM hexdump for port {logical_port_name}')
+                    click.echo(f'{EEPROM_DUMP_INDENT}{output}\n')
+                else:
+                    click.echo(output)
+                printed = True
+            if not printed:
+                click.echo('')
+            if archive_writer is not None:
+                archive_writer.close()
+                archive_writer = None
+    finally:
+        if archive_writer is not None:
+            archive_writer.abort()
+
+
+def eeprom_hexdump_recorded(logical_port_name, page, record):
+    """
+    Dump EEPROM for a single logical port in hex format, like
+    eeprom_hexdump_single_port, and also return the raw pages read.
+    Returns:
+        tuple(return code, dump string or error message, list of (page, flat offset, page offset, data))
+    """
+    eeprom_page_recorder.pages = [] if record else None
+    try:
+        return_code, output = eeprom_hexdump_single_port(logical_port_name, page)
+        return return_code, output, eeprom_page_recorder.pages or []
+    finally:
+        eeprom_page_recorder.pages = None
 
 
 def validate_eeprom_page(page: str) -> int:
@@ -1029,6 +1111,9 @@ def eeprom_dump_general(physical_port, page, flat_offset, size, page_offset, no_
     page_dump = sfp.read_eeprom(flat_offset, size)
     if page_dump is None:
         return ERROR_NOT_IMPLEMENTED, f'Error: Failed to read EEPROM for page {page:x}h, flat_offset {flat_offset}, page_offset {page_offset}, size {size}!'
+    recorded_pages = getattr(eeprom_page_recorder, 'pages', None)
+    if recorded_pages is not None:
+        recorded_pages.append((page, flat_offset, page_offset, bytes(page_dump)))
     if not no_format:
         return 0, hexdump(EEPROM_DUMP_INDENT, page_dump, page_offset, start_newline=False)
     else:
@@ -1569,24 +1654,10 @@ def is_fw_switch_done(port_name):
         MAX_WAIT = 60
         timeout_time = time.time() + MAX_WAIT
         while time.time() < timeout_time:
-            fw_info = api.get_module_fw_info()
-            if fw_info['status'] is True and fw_info['result'] is not None:
-                (ImageA, ImageARunning, ImageACommitted, ImageAInvalid,
-                 ImageB, ImageBRunning, ImageBCommitted, ImageBInvalid, _, _) = fw_info['result']
-
-                if (ImageARunning == 1) and (ImageAInvalid == 1):
-                    click.echo("FW info error : ImageA shows running, but also shows invalid!")
-                    return -1
-                elif (ImageBRunning == 1) and (ImageBInvalid == 1):
-                    click.echo("FW info error : ImageB shows running, but also shows invalid!")
-                    return -1
-                elif (ImageARunning == 1) and (ImageACommitted == 0):
-                    click.echo("FW images switch successful : ImageA is running")
-                    return 1
-                elif (ImageBRunning == 1) and (ImageBCommitted == 0):
-                    click.echo("FW images switch successful : ImageB is running")
-                    return 1
-                # Switch not done yet — module may have returned stale pre-reset data, keep polling
+            status, message = firmware_batch.check_fw_switch(api.get_module_fw_info())
+            if status is not None:
+                click.echo(message)
+                return status
 
             time.sleep(2)
 
@@ -1636,12 +1707,10 @@ def download_firmware(port_name, filepath):
         sys.exit(ERROR_NOT_IMPLEMENTED)
 
     try:
-        fwinfo = api.get_module_fw_mgmt_feature()
-        if fwinfo['status'] == True:
-            startLPLsize, maxblocksize, lplonly_flag, _, _ = fwinfo['feature']
-        else:
-            click.echo("Failed to fetch CDB Firmware management features")
-            sys.exit(EXIT_FAIL)
+        startLPLsize, maxblocksize, lplonly_flag = firmware_batch.get_fw_mgmt_feature(api)
+    except firmware_batch.FirmwareError as e:
+        click.echo(str(e))
+        sys.exit(EXIT_FAIL)
     except NotImplementedError:
         click.echo("This functionality is NOT applicable for this transceiver")
         sys.exit(ERROR_NOT_IMPLEMENTED)
@@ -1655,35 +1724,17 @@ def download_firmware(port_name, filepath):
 
     # Increase the optoe driver's write max to speed up firmware download
     try:
-        sfp.set_optoe_write_max(SMBUS_BLOCK_WRITE_SIZE)
+        sfp.set_optoe_write_max(firmware_batch.SMBUS_BLOCK_WRITE_SIZE)
     except NotImplementedError:
         click.echo("Platform doesn't implement optoe write max change. Skipping value increase.")
 
     with click.progressbar(length=file_size, label="Downloading ...") as bar:
-        address = 0
-        if lplonly_flag:
-            BLOCK_SIZE = min(MAX_LPL_FIRMWARE_BLOCK_SIZE, maxblocksize)
-        else:
-            BLOCK_SIZE = maxblocksize
-        remaining = file_size - startLPLsize
-        while remaining > 0:
-            count = BLOCK_SIZE if remaining >= BLOCK_SIZE else remaining
-            data = fd.read(count)
-            if len(data) != count:
-                click.echo("Firmware file read failed!")
-                sys.exit(EXIT_FAIL)
-
-            if lplonly_flag:
-                status = api.cdb_lpl_block_write(address, data)
-            else:
-                status = api.cdb_epl_block_write(address, data)
-            if (status != 1):
-                click.echo("CDB: firmware download failed! - status {}".format(status))
-                sys.exit(EXIT_FAIL)
-
-            bar.update(count)
-            address += count
-            remaining -= count
+        try:
+            firmware_batch.write_firmware_blocks(api, fd, file_size, startLPLsize, maxblocksize,
+                                                 lplonly_flag, bar.update)
+        except firmware_batch.FirmwareError as e:
+            click.echo(str(e))
+            sys.exit(EXIT_FAIL)
 
     # Restore the optoe driver's write max to '1' (default value)
     try:
@@ -1823,6 +1874,113 @@ def download(port_name, filepath):
     click.echo("Total download Time: {}".format(str(datetime.timedelta(seconds=end-start))))
 
 
+def get_sfp_i2c_group(sfp):
+    """
+        Return the I2C root bus the module EEPROM is behind, or None if unknown.
+        Modules behind muxes of the same root bus share it.
+    """
+    try:
+        eeprom_path = os.path.realpath(sfp.get_eeprom_path())
+    except (AttributeError, NotImplementedError, TypeError):
+        return None
+    match = re.search(r'/(i2c-\d+)/', eeprom_path)
+    return match.group(1) if match else None
+
+
+def get_batch_ports(port_list):
+    """
+        Resolve the port list of a firmware batch to (port name, sfp, I2C group).
+        Ports of a range which do not exist are ignored, ports listed by name
+        have to exist. Modules without EEPROM and RJ45 ports are skipped.
+    """
+    ports = []
+    seen = set()
+    for token in port_list.split(','):
+        try:
+            port_names = parse_interface_in_filter(token)
+        except ValueError as e:
+            click.echo(str(e))
+            sys.exit(EXIT_FAIL)
+
+        for port_name in port_names:
+            if len(port_names) > 1 and not platform_sfputil.is_logical_port(port_name):
+                continue
+            physical_port = logical_port_to_physical_port_index(port_name)
+            # Breakout ports share the module of their first port
+            if physical_port in seen:
+                continue
+            seen.add(physical_port)
+
+            if is_port_type_rj45(port_name):
+                click.echo("{}: Skipped, not applicable for RJ45 port".format(port_name))
+                continue
+            if not is_sfp_present(port_name):
+                click.echo("{}: Skipped, SFP EEPROM not detected".format(port_name))
+                continue
+            sfp = platform_chassis.get_sfp(physical_port)
+            ports.append((port_name, sfp, get_sfp_i2c_group(sfp)))
+    return ports
+
+
+# 'upgrade-batch' subcommand
+@firmware.command('upgrade-batch')
+@click.argument('port_list', required=True, default=None)
+@click.argument('filepath', required=True, default=None)
+@click.option('--download-only', is_flag=True, help="Only download the image, do not run and commit it")
+@click.option('--max-parallel', type=click.IntRange(1, 128), default=8, show_default=True,
+              help="Maximum number of transceivers upgraded at once")
+@click.option('--per-bus', type=click.IntRange(1, 128), default=4, show_default=True,
+              help="Maximum number of concurrent downloads behind one I2C root bus")
+@click.option('--state-file', metavar='<path>', default=None,
+              help="File to save the progress to. Run again with the same file to resume the failed ports")
+def upgrade_batch(port_list, filepath, download_only, max_parallel, per_bus, state_file):
+    """Upgrade firmware on several transceivers concurrently
+
+    PORT_LIST is a comma separated list of ports and port ranges, e.g. Ethernet0-124,Ethernet256
+    """
+    if not os.path.isfile(filepath):
+        click.echo("Firmware file {} NOT found".format(filepath))
+        sys.exit(EXIT_FAIL)
+
+    ports = get_batch_ports(port_list)
+    if not ports:
+        click.echo("No transceiver to upgrade")
+        sys.exit(EXIT_FAIL)
+
+    stages = firmware_batch.DOWNLOAD_STAGES if download_only else firmware_batch.UPGRADE_STAGES
+    batch = firmware_batch.FirmwareBatch(filepath, stages=stages, max_parallel=max_parallel,
+                                         per_group=per_bus, state_path=state_file)
+
+    start = time.time()
+    port_names = [port_name for port_name, _, _ in ports]
+    label = "Downloading to {} transceivers ...".format(len(ports))
+    with click.progressbar(length=batch.download_size(ports), label=label) as bar:
+        bar_lock = threading.Lock()
+
+        def progress(count):
+            with bar_lock:
+                bar.update(count)
+
+        batch.progress = progress
+        results = batch.run(ports)
+
+    table = []
+    failed = False
+    for port_name in port_names:
+        status, stage, error = results[port_name]
+        if status == firmware_batch.STATUS_DONE:
+            update_firmware_info_to_state_db(port_name)
+        failed = failed or status == firmware_batch.STATUS_FAILED
+        table.append([port_name, status, stage or '-', error or ''])
+    click.echo(tabulate(table, ['Port', 'Status', 'Last Stage', 'Error'], tablefmt='simple'))
+    click.echo("Total upgrade Time: {}".format(str(datetime.timedelta(seconds=time.time()-start))))
+
+    if failed:
+        if state_file:
+            click.echo("Run the command again with --state-file {} to retry the failed ports".format(state_file))
+        sys.exit(EXIT_FAIL)
+
+
 # 'unlock' subcommand
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
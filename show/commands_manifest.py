@@ -0,0 +1,322 @@
+# Generated by 'python -m utilities_common.cli_manifest show', do not edit.
+"""Name and help of the lazily loaded top-level 'show' commands, by import path,
+and of the top-level commands of the 'show' plugins, by plugin module"""
+
+COMMANDS = {
+    'show.acl:acl': {
+        'name': 'acl',
+        'help': 'Show ACL related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.chassis_modules:chassis': {
+        'name': 'chassis',
+        'help': 'Chassis commands group',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.dropcounters:dropcounters': {
+        'name': 'dropcounters',
+        'help': 'Show drop counter related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.evpn:evpn': {
+        'name': 'evpn',
+        'help': 'Show evpn related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.fabric:fabric': {
+        'name': 'fabric',
+        'help': 'Show fabric information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.feature:feature': {
+        'name': 'feature',
+        'help': 'Show feature status',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.fgnhg:fgnhg': {
+        'name': 'fgnhg',
+        'help': 'Show FGNHG information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.flow_counters:flowcnt_route': {
+        'name': 'flowcnt-route',
+        'help': 'Show route flow counter related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.flow_counters:flowcnt_trap': {
+        'name': 'flowcnt-trap',
+        'help': 'Show trap flow counter related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.hft:hft': {
+        'name': 'hft',
+        'help': 'Show high frequency telemetry configuration.',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.kdump:kdump': {
+        'name': 'kdump',
+        'help': 'Show kdump configuration, dump files and dmesg logs',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.interfaces:interfaces': {
+        'name': 'interfaces',
+        'help': 'Show details of the network interfaces',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.kube:kubernetes': {
+        'name': 'kubernetes',
+        'help': None,
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.muxcable:muxcable': {
+        'name': 'muxcable',
+        'help': "SONiC command line - 'show muxcable' command",
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.nat:nat': {
+        'name': 'nat',
+        'help': 'Show details of the nat',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.platform:platform': {
+        'name': 'platform',
+        'help': 'Show platform-specific hardware info',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.p4_table:p4_table': {
+        'name': 'p4-table',
+        'help': 'Display all P4RT tables',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.processes:processes': {
+        'name': 'processes',
+        'help': 'Show process information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.reboot_cause:reboot_cause': {
+        'name': 'reboot-cause',
+        'help': 'Show cause of most recent reboot',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.sflow:sflow': {
+        'name': 'sflow',
+        'help': 'Show sFlow related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.vlan:vlan': {
+        'name': 'vlan',
+        'help': 'Show VLAN information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.vnet:vnet': {
+        'name': 'vnet',
+        'help': 'Show vnet related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.vxlan:vxlan': {
+        'name': 'vxlan',
+        'help': 'Show vxlan related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.system_health:system_health': {
+        'name': 'system-health',
+        'help': 'Show system-health information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.warm_restart:warm_restart': {
+        'name': 'warm_restart',
+        'help': 'Show warm restart configuration and state',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.dns:dns': {
+        'name': 'dns',
+        'help': 'Show details of the static DNS configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.stp:spanning_tree': {
+        'name': 'spanning-tree',
+        'help': 'Show spanning_tree commands',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.llr:llr': {
+        'name': 'llr',
+        'help': 'Show LLR (Link Layer Retry) information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.srv6:srv6': {
+        'name': 'srv6',
+        'help': 'Show SRv6 related information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.switch:switch': {
+        'name': 'switch',
+        'help': 'Show switch configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.icmp:icmp': {
+        'name': 'icmp',
+        'help': 'Show icmp-offload information',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.copp:copp': {
+        'name': 'copp',
+        'help': 'Show copp configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.syslog:syslog': {
+        'name': 'syslog',
+        'help': 'Show syslog server configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.gearbox:gearbox': {
+        'name': 'gearbox',
+        'help': 'Show gearbox info',
+        'short_help': None,
+        'hidden': False,
+    },
+    'show.bgp_cli:BGP': {
+        'name': 'bgp',
+        'help': 'Show BGP configuration',
+        'short_help': None,
+        'hidden': False,
+    },
+}
+
+PLUGINS = {
+    'show.plugins.auto_techsupport': {
+        'auto-techsupport': {
+            'name': 'auto-techsupport',
+            'help': 'AUTO_TECHSUPPORT part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+        'auto-techsupport-feature': {
+            'name': 'auto-techsupport-feature',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+        'history': {
+            'name': 'history',
+            'help': None,
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.barefoot': {},
+    'show.plugins.cisco-8000': {},
+    'show.plugins.mlnx': {},
+    'show.plugins.nvgre_tunnel': {
+        'nvgre-tunnel': {
+            'name': 'nvgre-tunnel',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+        'nvgre-tunnel-map': {
+            'name': 'nvgre-tunnel-map',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.pbh': {
+        'pbh': {
+            'name': 'pbh',
+            'help': 'Show PBH (Policy based hashing) feature configuration',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.sonic-fine-grained-ecmp_yang': {
+        'fg-nhg': {
+            'name': 'fg-nhg',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+        'fg-nhg-prefix': {
+            'name': 'fg-nhg-prefix',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+        'fg-nhg-member': {
+            'name': 'fg-nhg-member',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.sonic-hash': {
+        'switch-hash': {
+            'name': 'switch-hash',
+            'help': 'Show switch hash feature configuration',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.sonic-passwh_yang': {
+        'passw-hardening': {
+            'name': 'passw-hardening',
+            'help': 'PASSWORD HARDENING part of config_db.json',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.sonic-system-ldap_yang': {
+        'ldap-server': {
+            'name': 'ldap-server',
+            'help': '[Callable command group]',
+            'short_help': None,
+            'hidden': False,
+        },
+        'ldap': {
+            'name': 'ldap',
+            'help': '',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+    'show.plugins.sonic-trimming': {
+        'switch-trimming': {
+            'name': 'switch-trimming',
+            'help': 'Show switch trimming feature configuration',
+            'short_help': None,
+            'hidden': False,
+        },
+    },
+}
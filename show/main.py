@@ -39,43 +39,53 @@ try:
 except KeyError:
     pass
 
-from . import acl
 from . import bgp_common
 from .vtysh_helper import vtysh_command
-from . import chassis_modules
-from . import dropcounters
-from . import evpn
-from . import fabric
-from . import feature
-from . import fgnhg
-from . import flow_counters
-from . import hft
-from . import gearbox
-from . import interfaces
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import platform
-from . import p4_table
-from . import processes
-from . import reboot_cause
-from . import sflow
-from . import vlan
-from . import vnet
-from . import vxlan
-from . import system_health
-from . import warm_restart
 from . import plugins
-from . import syslog
-from . import dns
-from . import bgp_cli
-from . import stp
-from . import llr
-from . import srv6
-from . import switch
-from . import icmp
-from . import copp
+from .commands_manifest import COMMANDS as COMMANDS_MANIFEST, PLUGINS as PLUGINS_MANIFEST
+
+# Top-level commands of the submodules, imported when they are first looked
+# up. Run 'python -m utilities_common.cli_manifest show' after changing them.
+LAZY_COMMANDS = [
+    'show.acl:acl',
+    'show.chassis_modules:chassis',
+    'show.dropcounters:dropcounters',
+    'show.evpn:evpn',
+    'show.fabric:fabric',
+    'show.feature:feature',
+    'show.fgnhg:fgnhg',
+    'show.flow_counters:flowcnt_route',
+    'show.flow_counters:flowcnt_trap',
+    'show.hft:hft',
+    'show.kdump:kdump',
+    'show.interfaces:interfaces',
+    'show.kube:kubernetes',
+    'show.muxcable:muxcable',
+    'show.nat:nat',
+    'show.platform:platform',
+    'show.p4_table:p4_table',
+    'show.processes:processes',
+    'show.reboot_cause:reboot_cause',
+    'show.sflow:sflow',
+    'show.vlan:vlan',
+    'show.vnet:vnet',
+    'show.vxlan:vxlan',
+    'show.system_health:system_health',
+    'show.warm_restart:warm_restart',
+    'show.dns:dns',
+    'show.stp:spanning_tree',
+    'show.llr:llr',
+    'show.srv6:srv6',
+    'show.switch:switch',
+    'show.icmp:icmp',
+    'show.copp:copp',
+    'show.syslog:syslog',
+    'show.gearbox:gearbox',
+    'show.bgp_cli:BGP',
+]
+
+# The submodules stay reachable as attributes, e.g. show.main.muxcable
+__getattr__ = clicommon.lazy_submodule_getattr(__name__, LAZY_COMMANDS)
 
 # Global Variables
 PLATFORM_JSON = 'platform.json'
@@ -293,9 +303,10 @@ CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help', '-?'])
 # 'cli' group (root group)
 #
 
+
 # This is our entrypoint - the main "show" command
 # TODO: Consider changing function name to 'show' for better understandability
-@click.group(cls=clicommon.AliasedGroup, context_settings=CONTEXT_SETTINGS)
+@click.group(cls=clicommon.LazyGroup, context_settings=CONTEXT_SETTINGS)
 @click.pass_context
 def cli(ctx):
     """SONiC command line - 'show' command"""
@@ -304,51 +315,12 @@ def cli(ctx):
     load_db_config()
     ctx.obj = Db()
 
-# Add groups from other modules
-cli.add_command(acl.acl)
-cli.add_command(chassis_modules.chassis)
-cli.add_command(dropcounters.dropcounters)
-cli.add_command(evpn.evpn)
-cli.add_command(fabric.fabric)
-cli.add_command(feature.feature)
-cli.add_command(fgnhg.fgnhg)
-cli.add_command(flow_counters.flowcnt_route)
-cli.add_command(flow_counters.flowcnt_trap)
-if hft_common.is_supported_platform():
-    cli.add_command(hft.hft)
-cli.add_command(kdump.kdump)
-cli.add_command(interfaces.interfaces)
-cli.add_command(kdump.kdump)
-cli.add_command(kube.kubernetes)
-cli.add_command(muxcable.muxcable)
-cli.add_command(nat.nat)
-cli.add_command(platform.platform)
-cli.add_command(p4_table.p4_table)
-cli.add_command(processes.processes)
-cli.add_command(reboot_cause.reboot_cause)
-cli.add_command(sflow.sflow)
-cli.add_command(vlan.vlan)
-cli.add_command(vnet.vnet)
-cli.add_command(vxlan.vxlan)
-cli.add_command(system_health.system_health)
-cli.add_command(warm_restart.warm_restart)
-cli.add_command(dns.dns)
-cli.add_command(stp.spanning_tree)
-cli.add_command(llr.llr)
-cli.add_command(srv6.srv6)
-cli.add_command(switch.switch)
-cli.add_command(icmp.icmp)
-cli.add_command(copp.copp)
-
-# syslog module
-cli.add_command(syslog.syslog)
-
-# Add greabox commands only if GEARBOX is configured
-if is_gearbox_configured():
-    cli.add_command(gearbox.gearbox)
-
-# bgp module
-cli.add_command(bgp_cli.BGP)
+
+# Add groups from other modules; gearbox commands only if GEARBOX is configured
+cli.add_lazy_commands(LAZY_COMMANDS, COMMANDS_MANIFEST, conditions={
+    'show.hft:hft': hft_common.is_supported_platform,
+    'show.gearbox:gearbox': is_gearbox_configured,
+})
 
 #
 # 'vrf' command ("show vrf")
@@ -1729,6 +1701,7 @@ def version(brief):
     """Show version information"""
     version_info = device_info.get_sonic_version_info()
     platform_info = device_info.get_platform_info()
+    from . import platform
     chassis_info = platform.get_chassis_info()
 
     sys_uptime_cmd = ["uptime"]
@@ -2996,9 +2969,10 @@ def show_fast_linkup_global(db, json_output):
     click.echo(tabulate(rows, headers=['Field', 'Value'], tablefmt='grid'))
 
 
-# Load plugins and register them
+# Load plugins and register them, when a command could be theirs
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, cli)
+cli.defer(lambda: helper.load_and_register_plugins(plugins, cli),
+          clicommon.plugin_manifest(plugins, PLUGINS_MANIFEST))
 
 if __name__ == '__main__':
     cli()
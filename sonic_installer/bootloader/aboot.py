@@ -177,14 +177,14 @@ class AbootBootloader(Bootloader):
             return False
         return True
 
-    def get_binary_image_version(self, image_path):
+    def get_binary_image_version(self, image_path, image_info=None):
         try:
             version = subprocess.check_output(['/usr/bin/unzip', '-qop', image_path, '.imagehash'], text=True)
         except subprocess.CalledProcessError:
             return None
         return IMAGE_PREFIX + version.strip()
 
-    def verify_image_platform(self, image_path):
+    def verify_image_platform(self, image_path, image_info=None):
         if not os.path.isfile(image_path):
             return False
 
@@ -151,11 +151,14 @@ class BmcUbootBootloader(OnieInstallerBootloader):
         subprocess.call(['rm', '-rf', os.path.join(HOST_PATH, image_dir)])
         click.echo('Done')
 
-    def verify_image_platform(self, image_path):
+    def verify_image_platform(self, image_path, image_info=None):
         if not os.path.isfile(image_path):
             return False
 
         platform = device_info.get_platform()
+        if image_info is not None and image_info.payload_scanned:
+            return image_info.platforms is not None and platform in image_info.platforms
+
         with open(os.devnull, 'w') as fnull:
             p1 = subprocess.Popen(
                 ['sed', '-e', '1,/^exit_marker$/d', image_path],
@@ -45,11 +45,11 @@ class Bootloader(object):
         """remove existing image"""
         raise NotImplementedError
 
-    def get_binary_image_version(self, image_path):
-        """returns the version of the image"""
+    def get_binary_image_version(self, image_path, image_info=None):
+        """returns the version of the image, from image_info if it has it"""
         raise NotImplementedError
 
-    def verify_image_platform(self, image_path):
+    def verify_image_platform(self, image_path, image_info=None):
         """verify that the image is of the same platform than running platform"""
         raise NotImplementedError
 
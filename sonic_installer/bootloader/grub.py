@@ -153,13 +153,17 @@ class GrubBootloader(OnieInstallerBootloader):
             p3.wait()
             return p3.returncode ==0
 
-    def verify_image_platform(self, image_path):
+    def verify_image_platform(self, image_path, image_info=None):
         if not os.path.isfile(image_path):
             return False
 
         # Get running platform
         platform = device_info.get_platform()
 
+        # Use the manifest found while the image was downloaded, if any
+        if image_info is not None and image_info.payload_scanned:
+            return image_info.platforms is None or platform in image_info.platforms
+
         # Check if platform is inside image's target platforms
         return self.platform_in_platforms_asic(platform, image_path)
 
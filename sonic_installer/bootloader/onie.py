@@ -26,8 +26,11 @@ class OnieInstallerBootloader(Bootloader): # pylint: disable=abstract-method
         # replaced as well.
         return current.replace(IMAGE_DIR_PREFIX, IMAGE_PREFIX, 1)
 
-    def get_binary_image_version(self, image_path):
+    def get_binary_image_version(self, image_path, image_info=None):
         """returns the version of the image"""
+        if image_info is not None and image_info.version:
+            return IMAGE_PREFIX + image_info.version
+
         p1 = subprocess.Popen(["cat", "-v", image_path], stdout=subprocess.PIPE, preexec_fn=default_sigpipe)
         p2 = subprocess.Popen(["grep", "-m 1", "^image_version"], stdin=p1.stdout, stdout=subprocess.PIPE, preexec_fn=default_sigpipe)
         p3 = subprocess.Popen(["sed", "-n", r"s/^image_version=\"\(.*\)\"$/\1/p"], stdin=p2.stdout, stdout=subprocess.PIPE, preexec_fn=default_sigpipe, text=True)
@@ -80,7 +80,7 @@ class UbootBootloader(OnieInstallerBootloader):
         subprocess.call(['rm','-rf', HOST_PATH + '/' + image_dir])
         click.echo('Done')
 
-    def verify_image_platform(self, image_path):
+    def verify_image_platform(self, image_path, image_info=None):
         return os.path.isfile(image_path)
 
     def set_fips(self, image, enable):
@@ -0,0 +1,296 @@
+"""
+Streaming download of SONiC images.
+
+The image is written to disk as it arrives, and the same bytes go through a
+SHA-256 digest and a scanner collecting the metadata install checks: the
+image version from the installer script header, and the platforms_asic
+manifest from the tar payload after exit_marker. The checks can then use
+the ImageInfo of the download instead of reading the multi-GB image again.
+
+A download which is interrupted is resumed with an HTTP range request from
+the last byte written. The bytes are kept in a partial file next to the
+image until the download completes, so a later run resumes it too. The URL
+and the validator (ETag or Last-Modified) of the partial file are saved
+with it and sent as If-Range: a partial file of another URL, or of an image
+which changed on the server since, is downloaded again from the start.
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import re
+import tarfile
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+PART_SUFFIX = '.part'
+PART_META_SUFFIX = '.part.json'
+CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_RETRIES = 5
+DOWNLOAD_TIMEOUT = 60  # seconds
+
+PLATFORMS_ASIC = "installer/platforms_asic"
+EXIT_MARKER = b"exit_marker\n"
+MAX_HEADER_SIZE = 1024 * 1024
+TAR_BLOCK_SIZE = tarfile.BLOCKSIZE
+IMAGE_VERSION_RE = re.compile(rb'^image_version="(.*)"$', re.MULTILINE)
+
+_SHARCH, _TAR_HEADER, _TAR_DATA, _DONE = range(4)
+
+
+class DownloadError(Exception):
+    """
+    The image could not be downloaded; a partial file may be left to resume.
+    """
+    pass
+
+
+class ImageInfo(object):
+    """
+    What was learnt about an image while it was read once.
+    :param size: Size of the image in bytes
+    :param sha256: Hex SHA-256 digest of the image
+    :param version: image_version of the installer script, or None
+    :param platforms: Lines of the platforms_asic manifest, or None if the
+                      payload has none
+    :param payload_scanned: Whether the tar payload was read to its end, so
+                            platforms is known
+    """
+
+    def __init__(self, size, sha256, version=None, platforms=None, payload_scanned=False):
+        self.size = size
+        self.sha256 = sha256
+        self.version = version
+        self.platforms = platforms
+        self.payload_scanned = payload_scanned
+
+
+class ImageScanner(object):
+    """
+    Metadata of an ONIE installer image (sharch script, exit_marker line,
+    tar payload), from its bytes fed in order. Images of another format
+    leave version and platforms unknown.
+    """
+
+    def __init__(self):
+        self.header = bytearray()
+        self.version = None
+        self.platforms = None
+        self.payload_scanned = False
+        self._state = _SHARCH
+        self._block = bytearray()
+        self._remaining = 0
+        self._member_size = 0
+        self._capture = None
+
+    def feed(self, data):
+        view = memoryview(data)
+        while view and self._state != _DONE:
+            if self._state == _SHARCH:
+                view = self._feed_header(view)
+            elif self._state == _TAR_HEADER:
+                take = min(TAR_BLOCK_SIZE - len(self._block), len(view))
+                self._block += view[:take]
+                view = view[take:]
+                if len(self._block) == TAR_BLOCK_SIZE:
+                    self._parse_tar_header(bytes(self._block))
+                    self._block.clear()
+            else:
+                take = min(self._remaining, len(view))
+                if self._capture is not None and len(self._capture) < self._member_size:
+                    self._capture += view[:min(take, self._member_size - len(self._capture))]
+                view = view[take:]
+                self._remaining -= take
+                if self._remaining == 0:
+                    if self._capture is not None:
+                        self.platforms = bytes(self._capture).decode('utf-8', 'replace').splitlines()
+                        self._capture = None
+                    self._state = _TAR_HEADER
+
+    def _feed_header(self, view):
+        start = max(len(self.header) - len(EXIT_MARKER), 0)
+        self.header += view
+        while True:
+            idx = self.header.find(EXIT_MARKER, start)
+            if idx < 0 or idx == 0 or self.header[idx - 1] == ord('\n'):
+                break
+            start = idx + 1
+        if idx < 0:
+            if len(self.header) > MAX_HEADER_SIZE:
+                self._state = _DONE
+                self.header = bytearray()
+            return view[len(view):]
+
+        end = idx + len(EXIT_MARKER)
+        rest = memoryview(bytes(self.header[end:]))
+        del self.header[end:]
+        match = IMAGE_VERSION_RE.search(self.header)
+        if match:
+            self.version = match.group(1).decode('utf-8', 'replace')
+        self._state = _TAR_HEADER
+        return rest
+
+    def _parse_tar_header(self, block):
+        if block == bytes(TAR_BLOCK_SIZE):
+            # End of archive
+            self.payload_scanned = True
+            self._state = _DONE
+            return
+        try:
+            member = tarfile.TarInfo.frombuf(block, tarfile.ENCODING, 'surrogateescape')
+        except tarfile.HeaderError:
+            self._state = _DONE
+            return
+        name = member.name[2:] if member.name.startswith('./') else member.name
+        self._member_size = member.size
+        self._remaining = member.size + (-member.size % TAR_BLOCK_SIZE)
+        self._capture = bytearray() if member.isreg() and name == PLATFORMS_ASIC else None
+        self._state = _TAR_DATA
+        if self._remaining == 0:
+            if self._capture is not None:
+                self.platforms = []
+                self._capture = None
+            self._state = _TAR_HEADER
+
+
+def scan_chunks(chunks, digest, scanner):
+    """
+    Feed chunks to the digest and the scanner.
+    :return: Number of bytes fed
+    """
+    size = 0
+    for chunk in chunks:
+        digest.update(chunk)
+        scanner.feed(chunk)
+        size += len(chunk)
+    return size
+
+
+def get_validator(headers):
+    """
+    Return the value to send as If-Range for a response with headers: its
+    strong ETag, or else its Last-Modified date, or None.
+    """
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified')
+
+
+def read_part_meta(meta_path):
+    """
+    Return the {'url': ..., 'validator': ...} saved with a partial file, or
+    None if there is none or it cannot be read.
+    """
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def write_part_meta(meta_path, url, validator):
+    tmp_path = meta_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'url': url, 'validator': validator}, f)
+    os.replace(tmp_path, meta_path)
+
+
+def remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def download_image(url, path, reporthook=None, retries=DOWNLOAD_RETRIES, timeout=DOWNLOAD_TIMEOUT):
+    """
+    Download url to path, hashing and scanning the image on the way.
+    :param reporthook: Callable as for urlretrieve, called with
+                       (bytes downloaded, 1, total size)
+    :param retries: Number of times an interruption without progress is
+                    retried with a range request
+    :return: ImageInfo of the image
+    """
+    part_path = path + PART_SUFFIX
+    meta_path = path + PART_META_SUFFIX
+    digest = hashlib.sha256()
+    scanner = ImageScanner()
+    offset = 0
+    validator = None
+    if os.path.exists(part_path):
+        meta = read_part_meta(meta_path)
+        if meta is not None and meta.get('url') == url and meta.get('validator'):
+            # Resume a download of the same image left by an earlier run
+            validator = meta['validator']
+            with open(part_path, 'rb') as f:
+                offset = scan_chunks(iter(lambda: f.read(CHUNK_SIZE), b''), digest, scanner)
+        else:
+            # Left by the download of another URL, or the image it is part of can't be told
+            remove_file(part_path)
+
+    failures = 0
+    with open(part_path, 'ab') as f:
+        while True:
+            request = Request(url)
+            if offset:
+                request.add_header('Range', 'bytes={}-'.format(offset))
+                if validator:
+                    # The server sends the whole image if it changed since
+                    request.add_header('If-Range', validator)
+            progress = offset
+            try:
+                with urlopen(request, timeout=timeout) as response:
+                    if offset and response.status != http.client.PARTIAL_CONTENT:
+                        # The server sends the whole image, start over
+                        f.truncate(0)
+                        digest = hashlib.sha256()
+                        scanner = ImageScanner()
+                        offset = progress = 0
+                    if not offset:
+                        validator = get_validator(response.headers)
+                        write_part_meta(meta_path, url, validator)
+                    length = response.headers.get('Content-Length')
+                    total = offset + int(length) if length is not None else None
+                    if reporthook is not None and total is not None:
+                        reporthook(0, 1, total)
+                    for chunk in iter(lambda: response.read(CHUNK_SIZE), b''):
+                        f.write(chunk)
+                        offset += scan_chunks([chunk], digest, scanner)
+                        if reporthook is not None and total is not None:
+                            reporthook(offset, 1, total)
+                    if total is not None and offset < total:
+                        raise http.client.IncompleteRead(b'', total - offset)
+                break
+            except HTTPError as e:
+                if e.code != http.client.REQUESTED_RANGE_NOT_SATISFIABLE or not offset:
+                    raise DownloadError("HTTP error {} {}".format(e.code, e.reason))
+                # The partial file is not a prefix of the image, start over
+                f.truncate(0)
+                digest = hashlib.sha256()
+                scanner = ImageScanner()
+                offset = 0
+                error = e
+            except (URLError, http.client.HTTPException, OSError) as e:
+                error = e
+            f.flush()
+            failures = 0 if offset > progress else failures + 1
+            if failures > retries:
+                raise DownloadError("Download interrupted at {} bytes: {}".format(offset, error))
+
+    os.replace(part_path, path)
+    remove_file(meta_path)
+    return ImageInfo(offset, digest.hexdigest(), scanner.version, scanner.platforms, scanner.payload_scanned)
+
+
+def scan_image(path):
+    """
+    Return the ImageInfo of a local image, read once.
+    """
+    digest = hashlib.sha256()
+    scanner = ImageScanner()
+    with open(path, 'rb') as f:
+        size = scan_chunks(iter(lambda: f.read(CHUNK_SIZE), b''), digest, scanner)
+    return ImageInfo(size, digest.hexdigest(), scanner.version, scanner.platforms, scanner.payload_scanned)
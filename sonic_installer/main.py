@@ -13,6 +13,7 @@ from sonic_py_common import logger
 from swsscommon.swsscommon import SonicV2Connector
 from sonic_py_common.general import getstatusoutput_noshell_pipe
 from .bootloader import get_bootloader
+from .download import DownloadError, download_image, scan_image
 from .common import (
     run_command, run_command_or_raise,
     IMAGE_PREFIX,
@@ -549,26 +550,39 @@ def sonic_installer():
               help='If system available memory is lower than threshold, setup SWAP memory',
               cls=clicommon.MutuallyExclusiveOption, mutually_exclusive=['skip_setup_swap'],
               callback=validate_positive_int)
+@click.option('--sha256', metavar='<digest>',
+              help='Expected SHA-256 digest of the image; abort if the image does not match it')
 @click.argument('url')
 def install(url, force, skip_platform_check=False, skip_migration=False, skip_package_migration=False,
-            skip_setup_swap=False, swap_mem_size=None, total_mem_threshold=None, available_mem_threshold=None):
+            skip_setup_swap=False, swap_mem_size=None, total_mem_threshold=None, available_mem_threshold=None,
+            sha256=None):
     """ Install image from local binary or URL"""
     bootloader = get_bootloader()
 
+    image_info = None
     if url.startswith('http://') or url.startswith('https://'):
         echo_and_log('Downloading image...')
         validate_url_or_abort(url)
         try:
-            urlretrieve(url, bootloader.DEFAULT_IMAGE_PATH, reporthook)
+            # The image is hashed and scanned while it is downloaded
+            image_info = download_image(url, bootloader.DEFAULT_IMAGE_PATH, reporthook)
             click.echo('')
-        except Exception as e:
-            echo_and_log("Download error", e)
+        except (DownloadError, OSError) as e:
+            echo_and_log("Download error: {}".format(e), LOG_ERR)
             raise click.Abort()
         image_path = bootloader.DEFAULT_IMAGE_PATH
     else:
         image_path = os.path.join("./", url)
+        if sha256 and os.path.isfile(image_path):
+            image_info = scan_image(image_path)
+
+    if sha256:
+        if image_info is None or image_info.sha256 != sha256.lower():
+            echo_and_log("Image file '{}' does not match SHA-256 digest {}. Aborting...".format(url, sha256), LOG_ERR)
+            raise click.Abort()
+        echo_and_log("Image SHA-256 digest verified")
 
-    binary_image_version = bootloader.get_binary_image_version(image_path)
+    binary_image_version = bootloader.get_binary_image_version(image_path, image_info)
     if not binary_image_version:
         echo_and_log("Image file does not exist or is not a valid SONiC image file", LOG_ERR)
         raise click.Abort()
@@ -588,7 +602,7 @@ def install(url, force, skip_platform_check=False, skip_migration=False, skip_pa
             raise click.Abort()
 
         # Verify that the binary image is of the same platform type as running platform
-        if not skip_platform_check and not bootloader.verify_image_platform(image_path):
+        if not skip_platform_check and not bootloader.verify_image_platform(image_path, image_info):
             echo_and_log("Image file '{}' is of a different platform ASIC type than running platform's.\n".format(url) +
                 "If you are sure you want to install this image, use --skip-platform-check.\n" +
                 "Aborting...", LOG_ERR)
@@ -6,7 +6,7 @@ import contextlib
 import io
 import tarfile
 import re
-from typing import Optional
+from typing import Iterable, Optional
 
 from sonic_package_manager.logger import log
 from sonic_package_manager.progress import ProgressManager
@@ -126,11 +126,22 @@ class DockerApi:
     def load(self, imgpath: str):
         """ Docker 'load' command.
         Args:
-
+            imgpath: path to image tarball
         """
 
         log.debug(f'loading image from {imgpath}')
 
+        with open(imgpath, 'rb') as imagefile:
+            return self.load_stream(imagefile)
+
+    def load_stream(self, data: Iterable[bytes]):
+        """ Docker 'load' command reading the image tarball from data,
+        e.g. the chunks of Image.save() from another docker, so that
+        the image does not have to be saved to a file first.
+        Args:
+            data: image tarball, file object or iterable of chunks
+        """
+
         api = self.client.api
         progress_manager = self.progress_manager
 
@@ -138,23 +149,22 @@ class DockerApi:
         repotag = None
 
         with progress_manager or contextlib.nullcontext():
-            with open(imgpath, 'rb') as imagefile:
-                for line in api.load_image(imagefile, quiet=False):
-                    log.debug(f'pull status: {line}')
+            for line in api.load_image(data, quiet=False):
+                log.debug(f'pull status: {line}')
 
-                    if progress_manager:
-                        process_progress(progress_manager, line)
+                if progress_manager:
+                    process_progress(progress_manager, line)
 
-                    if 'stream' not in line:
-                        continue
+                if 'stream' not in line:
+                    continue
 
-                    stream = line['stream']
-                    repotag_match = re.match(r'Loaded image: (?P<repotag>.*)\n', stream)
-                    if repotag_match:
-                        repotag = repotag_match.groupdict()['repotag']
-                    imageid_match = re.match(r'Loaded image ID: sha256:(?P<id>.*)\n', stream)
-                    if imageid_match:
-                        imageid = imageid_match.groupdict()['id']
+                stream = line['stream']
+                repotag_match = re.match(r'Loaded image: (?P<repotag>.*)\n', stream)
+                if repotag_match:
+                    repotag = repotag_match.groupdict()['repotag']
+                imageid_match = re.match(r'Loaded image ID: sha256:(?P<id>.*)\n', stream)
+                if imageid_match:
+                    imageid = imageid_match.groupdict()['id']
 
         imagename = repotag if repotag else imageid
         log.debug(f'Loaded image {imagename}')
@@ -213,6 +223,12 @@ class DockerApi:
     def get_image(self, name: str):
         return self.client.images.get(name)
 
+    def quiet(self) -> 'DockerApi':
+        """ Returns DockerApi for the same docker without progress bars,
+        which can be used from several threads at once. """
+
+        return DockerApi(self.client)
+
     def extract(self, image, src_path: str, dst_path: str):
         """ Copy src_path from the docker image to host dst_path. """
 
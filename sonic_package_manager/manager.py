@@ -5,7 +5,7 @@ import functools
 import os
 import pkgutil
 import subprocess
-import tempfile
+import time
 from inspect import signature
 from typing import Any, Iterable, List, Callable, Dict, Optional
 
@@ -13,6 +13,7 @@ import docker
 import filelock
 from config import config_mgmt
 from sonic_py_common import device_info
+from toposort import toposort_flatten, CircularDependencyError
 
 from sonic_cli_gen.generator import CliGenerator
 
@@ -56,6 +57,7 @@ from sonic_package_manager.service_creator.sonic_db import (
 from sonic_package_manager.service_creator.utils import in_chroot
 from sonic_package_manager.source import (
     PackageSource,
+    DockerImageSource,
     LocalSource,
     RegistrySource,
     TarballSource
@@ -73,8 +75,12 @@ import paramiko
 import urllib.parse
 from scp import SCPClient
 from sonic_package_manager.manifest import Manifest, MANIFESTS_LOCATION, DEFAULT_MANIFEST_FILE
+from utilities_common.parallel import imap_ordered
 LOCAL_JSON = "/tmp/local_json"
 
+# Number of packages whose manifest or image is fetched at once during migration
+MIGRATION_WORKERS = 4
+
 @contextlib.contextmanager
 def failure_ignore(ignore: bool):
     """ Ignores failures based on parameter passed. """
@@ -354,21 +360,25 @@ class PackageManager:
                 tarball: Optional[str] = None,
                 use_local_manifest: bool = False,
                 name: Optional[str] = None,
+                docker_image: Optional[Any] = None,
                 **kwargs):
         """ Install/Upgrade SONiC Package from either an expression
         representing the package and its version, repository and tag or
-        digest in same format as "docker pulL" accepts or an image tarball path.
+        digest in same format as "docker pulL" accepts, an image tarball path
+        or an image of another docker library.
 
         Args:
             expression: SONiC Package reference expression
             repotag: Install/Upgrade from REPO[:TAG][@DIGEST]
             tarball: Install/Upgrade from tarball, path to tarball file
+            docker_image: Install/Upgrade from docker image object
             kwargs: Install/Upgrade options for self.install_from_source
         Raises:
             PackageManagerError
         """
 
-        source = self.get_package_source(expression, repotag, tarball, use_local_manifest=use_local_manifest, name=name)
+        source = self.get_package_source(expression, repotag, tarball, use_local_manifest=use_local_manifest, name=name,
+                                         docker_image=docker_image)
         package = source.get_package()
 
         if self.is_installed(package.name):
@@ -756,7 +766,11 @@ class PackageManager:
         is installed in the passed database and in the current it is installed but with
         never version - no actions are taken. If dockerd_sock parameter is passed, the
         migration process will use loaded images from docker library of the currently
-        installed image.
+        installed image, streaming them to the local docker library.
+
+        Packages are installed after the packages they depend on. Manifests and images
+        of the packages are fetched concurrently, packages are installed one by one as
+        soon as their image is fetched.
 
         Args:
             old_package_database: SONiC Package Database to migrate packages from.
@@ -765,8 +779,18 @@ class PackageManager:
             PackageManagerError
         """
 
+        start = time.monotonic()
         self._migrate_package_database(old_package_database)
 
+        docker_api = None
+        if dockerd_sock:
+            # dockerd_sock is defined, so use docked_sock to connect to
+            # dockerd and fetch package images from it.
+            docker_api = DockerApi(self.get_docker_client(dockerd_sock))
+
+        # Arguments of self.install() by package name
+        migrations = {}
+
         def migrate_package(old_package_entry,
                             new_package_entry):
             """ Migrate package routine
@@ -779,27 +803,14 @@ class PackageManager:
             name = new_package_entry.name
             version = new_package_entry.version
 
-            if dockerd_sock:
-                # dockerd_sock is defined, so use docked_sock to connect to
-                # dockerd and fetch package image from it.
+            if docker_api:
                 log.info(f'installing {name} from old docker library')
-                docker_client = self.get_docker_client(dockerd_sock)
-                docker_api = DockerApi(docker_client)
-
                 image = docker_api.get_image(old_package_entry.image_id)
-
-                with tempfile.NamedTemporaryFile('wb') as file:
-                    for chunk in image.save(named=True):
-                        file.write(chunk)
-                    file.flush()
-
-                    self.install(tarball=file.name, name=name)
+                migrations[name] = ((), {'docker_image': image, 'name': name})
             else:
                 log.info(f'installing {name} version {version}')
+                migrations[name] = ((f'{name}={version}',), {})
 
-                self.install(f'{name}={version}')
-
-        # TODO: Topological sort packages by their dependencies first.
         for old_package in old_package_database:
             if not old_package.installed or old_package.built_in:
                 continue
@@ -832,15 +843,52 @@ class PackageManager:
                 else:
                     # self.install(f'{new_package.name}={new_package_default_version}')
                     repo_tag_formed = "{}:{}".format(new_package.repository, new_package.default_reference)
-                    self.install(None, repo_tag_formed, name=new_package.name)
+                    migrations[new_package.name] = ((None, repo_tag_formed), {'name': new_package.name})
             else:
                 # No default version and package is not installed.
                 # Migrate old package same version.
                 new_package.version = old_package.version
                 migrate_package(old_package, new_package)
 
+        sources = {}
+        for name, (args, kwargs) in migrations.items():
+            sources[name] = self.get_package_source(*args, **kwargs)
+
+        def get_package(name):
+            return sources[name].get_package()
+
+        # Install packages after the packages they depend on
+        packages = {}
+        for name, package, _ in imap_ordered(get_package, sources, workers=MIGRATION_WORKERS):
+            packages[name] = package
+
+        dependency_graph = {
+            name: {dependency.name for dependency in package.manifest['package']['depends']
+                   if dependency.name in packages}
+            for name, package in packages.items()
+        }
+        try:
+            order = toposort_flatten(dependency_graph)
+        except CircularDependencyError as err:
+            raise PackageManagerError(f'Circular dependency found when migrating packages: {err}')
+
+        # Images are fetched concurrently while packages are installed
+        # one by one, as soon as their image is in the local docker library.
+        fetch_docker_api = self.docker.quiet()
+
+        def fetch_image(name):
+            log.debug(f'fetching {name} image')
+            sources[name].fetch_image(fetch_docker_api, packages[name])
+
+        for name, _, _ in imap_ordered(fetch_image, order, workers=MIGRATION_WORKERS):
+            args, kwargs = migrations[name]
+            self.install(*args, **kwargs)
             self.database.commit()
 
+        self.database.commit()
+
+        log.info(f'migrated {len(order)} package(s) in {time.monotonic() - start:.1f}s')
+
     def get_installed_package(self, name: str, use_local_manifest: bool = False, use_edit: bool = False) -> Package:
         """ Get installed package by name.
 
@@ -866,7 +914,8 @@ class PackageManager:
                            tarboll_path: Optional[str] = None,
                            package_ref: Optional[PackageReference] = None,
                            use_local_manifest: bool = False,
-                           name: Optional[str] = None):
+                           name: Optional[str] = None,
+                           docker_image: Optional[Any] = None):
         """ Returns PackageSource object based on input source.
 
         Args:
@@ -874,6 +923,7 @@ class PackageManager:
              repository_reference: Install from REPO[:TAG][@DIGEST]
              tarboll_path: Install from image tarball
              package_ref: Package reference object
+             docker_image: Install from docker image object of another docker library
         Returns:
             SONiC Package object.
          Raises:
@@ -902,6 +952,13 @@ class PackageManager:
                                  self.metadata_resolver,
                                  use_local_manifest,
                                  name)
+        elif docker_image is not None:
+            return DockerImageSource(docker_image,
+                                     self.database,
+                                     self.docker,
+                                     self.metadata_resolver,
+                                     use_local_manifest,
+                                     name)
         elif package_ref:
             package_entry = self.database.get_package(package_ref.name)
             name = package_ref.name
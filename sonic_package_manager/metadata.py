@@ -84,6 +84,41 @@ class MetadataResolver:
                 return self.from_labels(labels)
 
         labels = self.docker.labels(image)
+        return self.from_image_labels(labels, name)
+
+    def from_docker_image(self, image, use_local_manifest: bool = False,
+                          name: Optional[str] = None) -> Metadata:
+        """ Reads manifest from docker image object, which may belong
+        to another docker library than the local one.
+
+        Args:
+            image: Docker image object
+        Returns:
+            Metadata
+        Raises:
+            MetadataError
+        """
+
+        if name and use_local_manifest:
+            labels = Manifest.get_manifest_from_local_file(name)
+            return self.from_labels(labels)
+
+        return self.from_image_labels(image.labels, name)
+
+    @classmethod
+    def from_image_labels(cls, labels: Optional[Dict[str, str]], name: Optional[str] = None) -> Metadata:
+        """ Reads manifest from image labels, or from the local manifest
+        of package name if the image has no manifest in its labels.
+
+        Args:
+            labels: Docker image labels
+            name: Package name
+        Returns:
+            Metadata
+        Raises:
+            MetadataError
+        """
+
         if labels is None or len(labels) == 0 or 'com.azure.sonic.manifest' not in labels:
             if name:
                 labels = Manifest.get_manifest_from_local_file(name)
@@ -92,7 +127,7 @@ class MetadataResolver:
             else:
                 raise MetadataError('No manifest found in image labels')
 
-        return self.from_labels(labels)
+        return cls.from_labels(labels)
 
     def from_registry(self,
                       repository: str,
@@ -555,12 +555,13 @@ class ServiceCreator:
                     key_cfg.update(fvs)
                     conn.mod_entry(table, key, key_cfg)
 
-        for conn in self.sonic_db.get_connectors():
-            cfg = conn.get_config()
-            new_cfg = init_cfg.copy()
-            utils.deep_update(new_cfg, cfg)
-            self.validate_config(new_cfg)
-            update_config_with_init_cfg(cfg, conn)
+        with self.sonic_db.transaction():
+            for conn in self.sonic_db.get_connectors():
+                cfg = conn.get_config()
+                new_cfg = init_cfg.copy()
+                utils.deep_update(new_cfg, cfg)
+                self.validate_config(new_cfg)
+                update_config_with_init_cfg(cfg, conn)
 
     def remove_config(self, package):
         """ Remove configuration based on package YANG module.
@@ -574,16 +575,17 @@ class ServiceCreator:
         if not package.metadata.yang_modules:
             return
 
-        for module in package.metadata.yang_modules:
-            module_name = self.cfg_mgmt.get_module_name(module)
-            for tablename, module in self.cfg_mgmt.sy.confDbYangMap.items():
-                if module.get('module') != module_name:
-                    continue
-
-                for conn in self.sonic_db.get_connectors():
-                    keys = conn.get_table(tablename).keys()
-                    for key in keys:
-                        conn.set_entry(tablename, key, None)
+        with self.sonic_db.transaction():
+            for module in package.metadata.yang_modules:
+                module_name = self.cfg_mgmt.get_module_name(module)
+                for tablename, module in self.cfg_mgmt.sy.confDbYangMap.items():
+                    if module.get('module') != module_name:
+                        continue
+
+                    for conn in self.sonic_db.get_connectors():
+                        keys = conn.get_table(tablename).keys()
+                        for key in keys:
+                            conn.set_entry(tablename, key, None)
 
     def validate_config(self, config):
         """ Validate configuration through YANG.
@@ -63,28 +63,30 @@ class FeatureRegistry:
             None.
         """
 
-        name = manifest['service']['name']
-        db_connectors = self._sonic_db.get_connectors()
-        cfg_entries = self.get_default_feature_entries(state, owner)
-        non_cfg_entries = self.get_non_configurable_feature_entries(manifest)
+        with self._sonic_db.transaction():
+            name = manifest['service']['name']
+            db_connectors = self._sonic_db.get_connectors()
+            cfg_entries = self.get_default_feature_entries(state, owner)
+            non_cfg_entries = self.get_non_configurable_feature_entries(manifest)
 
-        for conn in db_connectors:
-            current_cfg = conn.get_entry(FEATURE, name)
+            for conn in db_connectors:
+                current_cfg = conn.get_entry(FEATURE, name)
 
-            new_cfg = cfg_entries.copy()
-            # Override configurable entries with CONFIG DB data.
-            new_cfg = {**new_cfg, **current_cfg}
-            # Override CONFIG DB data with non configurable entries.
-            new_cfg = {**new_cfg, **non_cfg_entries}
+                new_cfg = cfg_entries.copy()
+                # Override configurable entries with CONFIG DB data.
+                new_cfg = {**new_cfg, **current_cfg}
+                # Override CONFIG DB data with non configurable entries.
+                new_cfg = {**new_cfg, **non_cfg_entries}
 
-            conn.set_entry(FEATURE, name, new_cfg)
+                conn.set_entry(FEATURE, name, new_cfg)
 
-        if self.register_auto_ts(name):
-            log.info(f'{name} entry is added to {AUTO_TS_FEATURE} table')
+            if self.register_auto_ts(name):
+                log.info(f'{name} entry is added to {AUTO_TS_FEATURE} table')
 
-        if 'syslog' in manifest['service'] and 'support-rate-limit' in manifest['service']['syslog'] and manifest['service']['syslog']['support-rate-limit']:
-            self.register_syslog_config(name)
-            log.info(f'{name} entry is added to {SYSLOG_CONFIG} table')
+            if 'syslog' in manifest['service'] and 'support-rate-limit' in manifest['service']['syslog'] and \
+                    manifest['service']['syslog']['support-rate-limit']:
+                self.register_syslog_config(name)
+                log.info(f'{name} entry is added to {SYSLOG_CONFIG} table')
 
     def deregister(self, name: str):
         """ Deregister feature by name.
@@ -95,11 +97,12 @@ class FeatureRegistry:
             None
         """
 
-        db_connetors = self._sonic_db.get_connectors()
-        for conn in db_connetors:
-            conn.set_entry(FEATURE, name, None)
-            conn.set_entry(AUTO_TS_FEATURE, name, None)
-            conn.set_entry(SYSLOG_CONFIG, name, None)
+        with self._sonic_db.transaction():
+            db_connetors = self._sonic_db.get_connectors()
+            for conn in db_connetors:
+                conn.set_entry(FEATURE, name, None)
+                conn.set_entry(AUTO_TS_FEATURE, name, None)
+                conn.set_entry(SYSLOG_CONFIG, name, None)
 
     def update(self,
                old_manifest: Manifest,
@@ -115,27 +118,29 @@ class FeatureRegistry:
             None
         """
 
-        old_name = old_manifest['service']['name']
-        new_name = new_manifest['service']['name']
-        db_connectors = self._sonic_db.get_connectors()
-        non_cfg_entries = self.get_non_configurable_feature_entries(new_manifest)
+        with self._sonic_db.transaction():
+            old_name = old_manifest['service']['name']
+            new_name = new_manifest['service']['name']
+            db_connectors = self._sonic_db.get_connectors()
+            non_cfg_entries = self.get_non_configurable_feature_entries(new_manifest)
 
-        for conn in db_connectors:
-            current_cfg = conn.get_entry(FEATURE, old_name)
-            conn.set_entry(FEATURE, old_name, None)
+            for conn in db_connectors:
+                current_cfg = conn.get_entry(FEATURE, old_name)
+                conn.set_entry(FEATURE, old_name, None)
 
-            new_cfg = current_cfg.copy()
-            # Override CONFIG DB data with non configurable entries.
-            new_cfg = {**new_cfg, **non_cfg_entries}
+                new_cfg = current_cfg.copy()
+                # Override CONFIG DB data with non configurable entries.
+                new_cfg = {**new_cfg, **non_cfg_entries}
 
-            conn.set_entry(FEATURE, new_name, new_cfg)
+                conn.set_entry(FEATURE, new_name, new_cfg)
 
-        if self.register_auto_ts(new_name, old_name):
-            log.info(f'{new_name} entry is added to {AUTO_TS_FEATURE} table')
+            if self.register_auto_ts(new_name, old_name):
+                log.info(f'{new_name} entry is added to {AUTO_TS_FEATURE} table')
 
-        if 'syslog' in new_manifest['service'] and 'support-rate-limit' in new_manifest['service']['syslog'] and new_manifest['service']['syslog']['support-rate-limit']:
-            self.register_syslog_config(new_name, old_name)
-            log.info(f'{new_name} entry is added to {SYSLOG_CONFIG} table')
+            if 'syslog' in new_manifest['service'] and 'support-rate-limit' in new_manifest['service']['syslog'] and \
+                    new_manifest['service']['syslog']['support-rate-limit']:
+                self.register_syslog_config(new_name, old_name)
+                log.info(f'{new_name} entry is added to {SYSLOG_CONFIG} table')
 
     def is_feature_enabled(self, name: str) -> bool:
         """ Returns whether the feature is current enabled
@@ -176,25 +181,27 @@ class FeatureRegistry:
     def register_auto_ts(self, new_name, old_name=None):
         """ Registers auto_ts feature
         """
-        # Infer and update default config
-        init_cfg_conn = self._sonic_db.get_initial_db_connector()
-        def_cfg = DEFAULT_AUTO_TS_FEATURE_CONFIG.copy()
-        (auto_ts_add_cfg, auto_ts_state) = self.infer_auto_ts_capability(init_cfg_conn)
-        def_cfg['state'] = auto_ts_state
-
-        if not auto_ts_add_cfg:
-            log.debug("Skip adding AUTO_TECHSUPPORT_FEATURE table because no AUTO_TECHSUPPORT|GLOBAL entry is found")
-            return False
-
-        for conn in self._sonic_db.get_connectors():
-            new_cfg = copy.deepcopy(def_cfg)
-            if old_name:
-                current_cfg = conn.get_entry(AUTO_TS_FEATURE, old_name)
-                conn.set_entry(AUTO_TS_FEATURE, old_name, None)
-                new_cfg.update(current_cfg)
-
-            conn.set_entry(AUTO_TS_FEATURE, new_name, new_cfg)
-        return True
+        with self._sonic_db.transaction():
+            # Infer and update default config
+            init_cfg_conn = self._sonic_db.get_initial_db_connector()
+            def_cfg = DEFAULT_AUTO_TS_FEATURE_CONFIG.copy()
+            (auto_ts_add_cfg, auto_ts_state) = self.infer_auto_ts_capability(init_cfg_conn)
+            def_cfg['state'] = auto_ts_state
+
+            if not auto_ts_add_cfg:
+                log.debug("Skip adding AUTO_TECHSUPPORT_FEATURE table because "
+                          "no AUTO_TECHSUPPORT|GLOBAL entry is found")
+                return False
+
+            for conn in self._sonic_db.get_connectors():
+                new_cfg = copy.deepcopy(def_cfg)
+                if old_name:
+                    current_cfg = conn.get_entry(AUTO_TS_FEATURE, old_name)
+                    conn.set_entry(AUTO_TS_FEATURE, old_name, None)
+                    new_cfg.update(current_cfg)
+
+                conn.set_entry(AUTO_TS_FEATURE, new_name, new_cfg)
+            return True
 
     def register_syslog_config(self, new_name, old_name=None):
         """ Registers syslog configuration
@@ -203,14 +210,15 @@ class FeatureRegistry:
             new_name (str): new table name
             old_name (str, optional): old table name. Defaults to None.
         """
-        for conn in self._sonic_db.get_connectors():
-            new_cfg = copy.deepcopy(DEFAULT_SYSLOG_FEATURE_CONFIG)
-            if old_name:
-                current_cfg = conn.get_entry(SYSLOG_CONFIG, old_name)
-                conn.set_entry(SYSLOG_CONFIG, old_name, None)
-                new_cfg.update(current_cfg)
-
-            conn.set_entry(SYSLOG_CONFIG, new_name, new_cfg)
+        with self._sonic_db.transaction():
+            for conn in self._sonic_db.get_connectors():
+                new_cfg = copy.deepcopy(DEFAULT_SYSLOG_FEATURE_CONFIG)
+                if old_name:
+                    current_cfg = conn.get_entry(SYSLOG_CONFIG, old_name)
+                    conn.set_entry(SYSLOG_CONFIG, old_name, None)
+                    new_cfg.update(current_cfg)
+
+                conn.set_entry(SYSLOG_CONFIG, new_name, new_cfg)
 
     @staticmethod
     def get_default_feature_entries(state=None, owner=None) -> Dict[str, str]:
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 import contextlib
+import copy
 import json
 import os
+import shutil
+import tempfile
 
 from swsscommon import swsscommon
 
@@ -18,16 +21,41 @@ INIT_CFG_JSON = os.path.join(ETC_SONIC_PATH, 'init_cfg.json')
 class PersistentConfigDbConnector:
     """ This class implements swsscommon.ConfigDBConnector methods for persistent DBs (JSON files).
     For method description refer to swsscommon.ConfigDBConnector.
+
+    Inside a transaction() block the file is read once, changes are applied
+    in memory and the file is written once, atomically, when the block
+    exits. Outside of one every method is a transaction of its own.
     """
 
     def __init__(self, filepath):
         self._filepath = filepath
+        self._config = None
+        self._modified = False
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """ Context manager batching the changes made in the block. They are
+        written to the file when the block exits, and dropped if it raises.
+        A transaction opened inside another one is part of the outer one. """
+
+        if self._config is not None:
+            yield self
+            return
+
+        self._config = self._read_config()
+        self._modified = False
+        try:
+            yield self
+            if self._modified:
+                self._write_config(self._config)
+        finally:
+            self._config = None
+            self._modified = False
 
     def get_config(self):
-        with open(self._filepath) as stream:
-            config = json.load(stream)
-        config = sonic_cfggen.FormatConverter.to_deserialized(config)
-        return config
+        if self._config is None:
+            return self._read_config()
+        return copy.deepcopy(self._config)
 
     def get_entry(self, table, key):
         table = table.upper()
@@ -36,38 +64,43 @@ class PersistentConfigDbConnector:
 
     def get_table(self, table):
         table = table.upper()
-        config = self.get_config()
-        return config.get(table, {})
+        if self._config is None:
+            return self._read_config().get(table, {})
+        return copy.deepcopy(self._config.get(table, {}))
 
     def set_entry(self, table, key, data):
         table = table.upper()
-        config = self.get_config()
-        if data is None:
-            self._del_key(config, table, key)
-        else:
-            table_data = config.setdefault(table, {})
-            table_data[key] = data
-        self._write_config(config)
+        with self.transaction():
+            config = self._config
+            if data is None:
+                self._del_key(config, table, key)
+            else:
+                table_data = config.setdefault(table, {})
+                table_data[key] = copy.deepcopy(data)
+            self._modified = True
 
     def mod_entry(self, table, key, data):
         table = table.upper()
-        config = self.get_config()
-        if data is None:
-            self._del_key(config, table, key)
-        else:
-            table_data = config.setdefault(table, {})
-            curr_data = table_data.setdefault(key, {})
-            curr_data.update(data)
-        self._write_config(config)
+        with self.transaction():
+            config = self._config
+            if data is None:
+                self._del_key(config, table, key)
+            else:
+                table_data = config.setdefault(table, {})
+                curr_data = table_data.setdefault(key, {})
+                curr_data.update(copy.deepcopy(data))
+            self._modified = True
 
     def mod_config(self, config):
-        for table_name in config:
-            table_data = config[table_name]
-            if table_data is None:
-                self._del_table(config, table_name)
-                continue
-            for key in table_data:
-                self.mod_entry(table_name, key, table_data[key])
+        with self.transaction():
+            for table_name in config:
+                table_data = config[table_name]
+                if table_data is None:
+                    self._del_table(self._config, table_name.upper())
+                    self._modified = True
+                    continue
+                for key in table_data:
+                    self.mod_entry(table_name, key, table_data[key])
 
     def _del_table(self, config, table):
         with contextlib.suppress(KeyError):
@@ -80,10 +113,30 @@ class PersistentConfigDbConnector:
         if table in config and not config[table]:
             self._del_table(config, table)
 
+    def _read_config(self):
+        with open(self._filepath) as stream:
+            config = json.load(stream)
+        config = sonic_cfggen.FormatConverter.to_deserialized(config)
+        return config
+
     def _write_config(self, config):
         config = sonic_cfggen.FormatConverter.to_serialized(config)
-        with open(self._filepath, 'w') as stream:
-            json.dump(config, stream, indent=4)
+        # Write a temporary file next to the file and rename it over the
+        # file, so that it is never left partially written.
+        dirname, basename = os.path.split(os.path.abspath(self._filepath))
+        fd, tmp_filepath = tempfile.mkstemp(prefix=f'.{basename}.', dir=dirname)
+        try:
+            with os.fdopen(fd, 'w') as stream:
+                json.dump(config, stream, indent=4)
+                stream.flush()
+                os.fsync(stream.fileno())
+            with contextlib.suppress(FileNotFoundError):
+                shutil.copymode(self._filepath, tmp_filepath)
+            os.replace(tmp_filepath, self._filepath)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_filepath)
+            raise
 
 
 class SonicDB:
@@ -92,6 +145,27 @@ class SonicDB:
     configs. """
 
     _running_db_conn = None
+    _initial_db_conn = None
+
+    @classmethod
+    @contextlib.contextmanager
+    def transaction(cls):
+        """ Context manager in which the initial DB connector is a single
+        PersistentConfigDbConnector transaction: init_cfg.json is read once
+        and written once, when the block exits. Changes to the running DB
+        are made as they come. """
+
+        if cls._initial_db_conn is not None:
+            yield
+            return
+
+        conn = PersistentConfigDbConnector(INIT_CFG_JSON)
+        with conn.transaction():
+            cls._initial_db_conn = conn
+            try:
+                yield
+            finally:
+                cls._initial_db_conn = None
 
     @classmethod
     def get_connectors(cls):
@@ -127,4 +201,6 @@ class SonicDB:
     def get_initial_db_connector(cls):
         """ Returns initial DB connector. """
 
+        if cls._initial_db_conn is not None:
+            return cls._initial_db_conn
         return PersistentConfigDbConnector(INIT_CFG_JSON)
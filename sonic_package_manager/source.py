@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from docker.errors import ImageNotFound
+
 from sonic_package_manager.database import PackageDatabase, PackageEntry
 from sonic_package_manager.dockerapi import DockerApi, get_repository_from_image
 from sonic_package_manager.metadata import Metadata, MetadataResolver
@@ -41,6 +43,19 @@ class PackageSource(object):
 
         raise NotImplementedError
 
+    def fetch_image(self, docker_api: DockerApi, package: Package):
+        """ Fetch image ahead of install(), so that install_image()
+        finds it in the local docker library. Called concurrently
+        for several packages, docker_api has to be safe for that.
+        Does nothing unless a child class implements it.
+
+        Args:
+            docker_api: Docker API to fetch image with
+            package: SONiC Package
+        """
+
+        pass
+
     def install(self, package: Package):
         """ Install image based on package source,
         record installation information in PackageEntry..
@@ -167,6 +182,59 @@ class RegistrySource(PackageSource):
             package.entry.default_reference = self.reference
         return image_id
 
+    def fetch_image(self, docker_api: DockerApi, package: Package):
+        """ Pulls image, pulling it again in install_image() only
+        checks that it is up to date. """
+
+        docker_api.pull(self.repository, self.reference)
+
+
+class DockerImageSource(PackageSource):
+    """ DockerImageSource implements PackageSource for an image
+    of another docker library (e.g. of the SONiC image packages
+    are migrated from), streamed to the local docker library. """
+
+    def __init__(self,
+                 image,
+                 database: PackageDatabase,
+                 docker: DockerApi,
+                 metadata_resolver: MetadataResolver,
+                 use_local_manifest: bool = False,
+                 name: Optional[str] = None):
+        super().__init__(database,
+                         docker,
+                         metadata_resolver)
+        self.image = image
+        self.use_local_manifest = use_local_manifest
+        self.name = name
+
+    def get_metadata(self) -> Metadata:
+        """ Returns manifest read from image labels. """
+
+        return self.metadata_resolver.from_docker_image(self.image,
+                                                        self.use_local_manifest,
+                                                        self.name)
+
+    def install_image(self, package: Package):
+        """ Installs image from the other docker library,
+        unless it has been fetched already. """
+
+        return self._load_image(self.docker)
+
+    def fetch_image(self, docker_api: DockerApi, package: Package):
+        """ Streams image to the local docker library. """
+
+        self._load_image(docker_api)
+
+    def _load_image(self, docker_api: DockerApi):
+        # Image ID is the digest of the image configuration,
+        # it is the same in both docker libraries.
+        try:
+            return docker_api.get_image(self.image.id)
+        except ImageNotFound:
+            pass
+        return docker_api.load_stream(self.image.save(named=True))
+
 
 class LocalSource(PackageSource):
     """ LocalSource accesses local docker library to retrieve manifest
@@ -10,6 +10,7 @@ sys.path.insert(0, modules_path)
 
 from acl_loader import *
 from acl_loader.main import *
+from acl_loader.main import AclLoader
 
 class TestAclLoader(object):
     @pytest.fixture(scope="class")
@@ -341,6 +342,43 @@ class TestAclLoader(object):
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
 
+    def test_incremental_update_dataplane_diff(self, acl_loader):
+        unchanged = {"PRIORITY": "9999", "PACKET_ACTION": "ACCEPT"}
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): unchanged,
+            ('DATAACL', 'RULE_2'): {"PRIORITY": "9998", "PACKET_ACTION": "ACCEPT", "L4_SRC_PORT": "22"},
+            ('DATAACL', 'RULE_3'): {"PRIORITY": "9997", "PACKET_ACTION": "DROP"},
+        }
+        acl_loader.rules_info = {
+            ('DATAACL', 'RULE_1'): dict(unchanged),
+            ('DATAACL', 'RULE_2'): {"PRIORITY": "9998", "PACKET_ACTION": "DROP"},
+            ('DATAACL', 'RULE_4'): {"PRIORITY": "9996", "PACKET_ACTION": "DROP"},
+        }
+        removed = (('DATAACL', 'RULE_3'), None, acl_loader.rules_db_info[('DATAACL', 'RULE_3')])
+        added = (('DATAACL', 'RULE_4'), acl_loader.rules_info[('DATAACL', 'RULE_4')], None)
+        changed = (('DATAACL', 'RULE_2'), acl_loader.rules_info[('DATAACL', 'RULE_2')],
+                   acl_loader.rules_db_info[('DATAACL', 'RULE_2')])
+
+        with mock.patch.object(acl_loader, 'write_rules') as mock_write:
+            acl_loader.incremental_update()
+            changes = mock_write.call_args[0][0]
+            assert len(changes) == 6
+            assert [c[0] for c in changes[:3]] == [('DATAACL', 'RULE_1'), ('DATAACL', 'RULE_2'), ('DATAACL', 'RULE_3')]
+
+            acl_loader.incremental_update(dataplane_diff=True)
+            assert mock_write.call_args[0][0] == [removed, added, changed]
+
+            acl_loader.incremental_update(make_before_break=True)
+            assert mock_write.call_args[0][0] == [added, changed, removed]
+
+    def test_write_rules(self, acl_loader):
+        changes = [(('DATAACL', 'RULE_1'), None, None)]
+        with mock.patch('acl_loader.main.bulk_db.set_entries_pipelined') as mock_set:
+            acl_loader.write_rules([])
+            mock_set.assert_not_called()
+            acl_loader.write_rules(changes)
+            mock_set.assert_called_once_with(acl_loader.configdb, AclLoader.ACL_RULE, changes)
+
 
 
 class TestMasicAclLoader(object):
@@ -380,3 +418,13 @@ class TestMasicAclLoader(object):
         acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input/incremental_2.json'))
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
+
+    def test_write_rules(self, acl_loader):
+        changes = [(('DATAACL', 'RULE_1'), None, None)]
+        with mock.patch('acl_loader.main.bulk_db.set_entries_pipelined') as mock_set:
+            acl_loader.write_rules(changes)
+            written = [c[0][0] for c in mock_set.call_args_list]
+            assert len(written) == 3
+            assert acl_loader.configdb in written
+            for configdb in acl_loader.per_npu_configdb.values():
+                assert configdb in written
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Startup benchmark of the show and config CLIs.
+
+Runs every command line below --runs times in a new Python process, once
+with the lazy loading of the top-level commands, and once loading every
+command module and plugin before dispatching, as the CLIs did at import
+before. The commands run with --help, so they resolve the command and
+exit without reading the databases: what is measured is the time to
+dispatch the command.
+
+Usage:
+    python tests/benchmark/cli_startup_bench.py [-r 10]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+
+COMMAND_LINES = [
+    ('show', 'cli', ['--help']),
+    ('show', 'cli', ['ip', 'route', '--help']),
+    ('config', 'config', ['interface', 'startup', '--help']),
+]
+
+RUN_SCRIPT = """
+import io, json, sys, time
+from contextlib import redirect_stdout
+start = time.monotonic()
+main = __import__(sys.argv[1] + '.main', fromlist=['main'])
+root = getattr(main, sys.argv[2])
+if sys.argv[3] == 'eager':
+    root.commands.items()
+with redirect_stdout(io.StringIO()):
+    try:
+        root(json.loads(sys.argv[4]), standalone_mode=False)
+    except SystemExit:
+        pass
+print(json.dumps({"seconds": time.monotonic() - start, "modules": len(sys.modules)}))
+"""
+
+
+def run_in_process(cli, root, args, mode):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get('PYTHONPATH')])))
+    out = subprocess.check_output([sys.executable, '-c', RUN_SCRIPT, cli, root, mode, json.dumps(args)],
+                                  env=env, stderr=subprocess.DEVNULL)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def best_of(runs, cli, root, args, mode):
+    results = [run_in_process(cli, root, args, mode) for _ in range(runs)]
+    return min(r["seconds"] for r in results), results[0]["modules"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-r', '--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    print("{:<36} {:>10} {:>10} {:>8} {:>8}".format("command", "eager(s)", "lazy(s)", "eager#", "lazy#"))
+    for cli, root, cli_args in COMMAND_LINES:
+        eager, eager_modules = best_of(args.runs, cli, root, cli_args, 'eager')
+        lazy, lazy_modules = best_of(args.runs, cli, root, cli_args, 'lazy')
+        print("{:<36} {:>10.3f} {:>10.3f} {:>8} {:>8}".format(
+            ' '.join([cli] + cli_args), eager, lazy, eager_modules, lazy_modules))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+"""
+Memory benchmark of the GCU patch sorter config simulation.
+
+Builds a large synthetic CONFIG_DB, then walks a chain of moves the way
+DfsSorter does: every move is applied once to build the simulated config
+the validators check and once more to build the next diff, and every diff
+on the chain stays alive until the sort completes. This is the part of
+`config apply-patch` whose memory grows with the running config size.
+
+The chain is run once copying the whole config per move, as JsonMove did
+before copy-on-write, and once with generic_config_updater.patch_sorter.
+Every run happens in its own process so peak RSS is reported per path.
+
+Usage:
+    python tests/benchmark/gcu_apply_bench.py [-p 4096] [-r 20000] [-m 100]
+"""
+
+import argparse
+import copy
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import generic_config_updater.patch_sorter as ps  # noqa: E402
+
+
+def gen_config(ports, rules):
+    config = {
+        "PORT": {},
+        "ACL_TABLE": {"DATAACL": {"type": "L3", "stage": "ingress", "ports": []}},
+        "ACL_RULE": {},
+    }
+    for i in range(ports):
+        name = "Ethernet{}".format(i * 4)
+        config["PORT"][name] = {
+            "lanes": ",".join(str(i * 4 + lane) for lane in range(4)),
+            "alias": "etp{}".format(i),
+            "speed": "100000",
+            "mtu": "9100",
+            "admin_status": "up",
+            "description": "synthetic port {}".format(i),
+        }
+        config["ACL_TABLE"]["DATAACL"]["ports"].append(name)
+    for i in range(rules):
+        config["ACL_RULE"]["DATAACL|RULE_{}".format(i)] = {
+            "PRIORITY": str(100000 - i),
+            "PACKET_ACTION": "DROP",
+            "SRC_IP": "10.{}.{}.0/24".format(i // 256 % 256, i % 256),
+        }
+    return config
+
+
+def gen_moves(config, count):
+    ports = list(config["PORT"])
+    moves = []
+    for i in range(count):
+        port = ports[i % len(ports)]
+        op = {"op": "replace", "path": "/PORT/{}/description".format(port), "value": "move {}".format(i)}
+        moves.append(ps.JsonMoveGroup("bench", ps.JsonMove.from_operation(op)))
+    return moves
+
+
+def apply_deepcopy(move, config):
+    config = copy.deepcopy(config)
+    for patch in move:
+        config = patch.patch.apply(config, in_place=True)
+    return config
+
+
+def apply_copy_on_write(move, config):
+    return move.apply(config)
+
+
+PATHS = {
+    "deepcopy": apply_deepcopy,
+    "copy_on_write": apply_copy_on_write,
+}
+
+
+def worker(path, ports, rules, count, queue):
+    apply = PATHS[path]
+    config = gen_config(ports, rules)
+    moves = gen_moves(config, count)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    chain = [config]
+    for move in moves:
+        simulated_config = apply(move, chain[-1])  # noqa: F841, validated then dropped
+        chain.append(apply(move, chain[-1]))
+    elapsed = time.perf_counter() - start
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, base_rss, peak_rss))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GCU config simulation memory")
+    parser.add_argument('-p', '--ports', type=int, default=4096, help='Number of PORT entries')
+    parser.add_argument('-r', '--rules', type=int, default=20000, help='Number of ACL_RULE entries')
+    parser.add_argument('-m', '--moves', type=int, default=100, help='Length of the move chain')
+    args = parser.parse_args()
+
+    print("{:>14} {:>10} {:>14} {:>14}".format("path", "wall(s)", "base RSS(KB)", "peak RSS(KB)"))
+    for path in PATHS:
+        queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=worker, args=(path, args.ports, args.rules, args.moves, queue))
+        proc.start()
+        elapsed, base_rss, peak_rss = queue.get()
+        proc.join()
+        print("{:>14} {:>10.3f} {:>14} {:>14}".format(path, elapsed, base_rss, peak_rss))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the GCU config digests.
+
+Builds a large synthetic CONFIG_DB and a chain of moves as gcu_apply_bench.py
+does, then digests every config on the chain the way the validation cache
+keys and the patch sorter diff hashes do: once serializing the whole config
+to JSON and hashing it, as before, and once with
+generic_config_updater.gu_common.ConfigDigest, which only serializes the
+tables and keys each move changed.
+
+Usage:
+    python tests/benchmark/gcu_config_digest_bench.py [-p 4096] [-r 20000] [-m 100]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from gcu_apply_bench import gen_config, gen_moves  # noqa: E402
+from generic_config_updater.gu_common import ConfigDigest  # noqa: E402
+
+
+def md5_json(config):
+    return hashlib.md5(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GCU config digests")
+    parser.add_argument('-p', '--ports', type=int, default=4096, help='Number of PORT entries')
+    parser.add_argument('-r', '--rules', type=int, default=20000, help='Number of ACL_RULE entries')
+    parser.add_argument('-m', '--moves', type=int, default=100, help='Length of the move chain')
+    args = parser.parse_args()
+
+    config = gen_config(args.ports, args.rules)
+    chain = [config]
+    for move in gen_moves(config, args.moves):
+        chain.append(move.apply(chain[-1]))
+
+    digests = {"md5_json": md5_json, "config_digest": ConfigDigest().digest}
+    results = {}
+    print("{:>14} {:>10} {:>14}".format("path", "wall(s)", "per config(ms)"))
+    for path, digest in digests.items():
+        start = time.perf_counter()
+        results[path] = [digest(c) for c in chain]
+        elapsed = time.perf_counter() - start
+        print("{:>14} {:>10.3f} {:>14.3f}".format(path, elapsed, elapsed * 1000 / len(chain)))
+
+    # Both tell the same configs apart
+    assert len(set(results["md5_json"])) == len(set(results["config_digest"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the counter diff computation of the stat tools.
+
+Builds new and old counter snapshots for --ports ports and computes the
+diff of --fields counters of every port, once with the per-counter
+ns_diff helper and once with utilities_common.netstat.CounterDelta. The batched
+run is repeated with NumPy disabled to time the pure Python fallback.
+
+Usage:
+    python tests/benchmark/netstat_diff_bench.py [-p 1000] [-f 16] [-r 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from utilities_common import netstat  # noqa: E402
+from utilities_common.netstat import CounterDelta, ns_diff  # noqa: E402
+
+
+def gen_snapshots(ports, fields):
+    rand = random.Random(0)
+    new = {}
+    old = {}
+    for port in range(ports):
+        key = "Ethernet{}".format(port * 4)
+        old[key] = {}
+        new[key] = {}
+        for field in fields:
+            value = rand.randrange(2**48)
+            old[key][field] = str(value)
+            new[key][field] = str(value + rand.randrange(2**24)) if rand.random() > 0.01 else netstat.STATUS_NA
+    return new, old
+
+
+def per_field(new, old, fields):
+    table = []
+    for key in new:
+        row = []
+        for field in fields:
+            row.append(ns_diff(new[key][field], old[key][field]))
+        table.append(row)
+    return table
+
+
+def batched(new, old, fields):
+    deltas = CounterDelta(new, old)
+    table = []
+    for key in new:
+        row = []
+        for field in fields:
+            row.append(deltas.diff(key, field))
+        table.append(row)
+    return table
+
+
+def timeit(func, repeat, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark counter diff computation")
+    parser.add_argument('-p', '--ports', type=int, default=1000, help='Number of ports')
+    parser.add_argument('-f', '--fields', type=int, default=16, help='Counters per port')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Runs per path, the best is reported')
+    args = parser.parse_args()
+
+    fields = ["counter{}".format(i) for i in range(args.fields)]
+    new, old = gen_snapshots(args.ports, fields)
+    print("{} ports, {} counters each, numpy {}".format(
+        args.ports, args.fields, "available" if netstat.numpy is not None else "not installed"))
+
+    elapsed, expected = timeit(per_field, args.repeat, new, old, fields)
+    print("{:>12} {:>10.3f}s".format("per-field", elapsed))
+
+    if netstat.numpy is not None:
+        elapsed, result = timeit(batched, args.repeat, new, old, fields)
+        print("{:>12} {:>10.3f}s".format("numpy", elapsed))
+        assert result == expected
+
+    numpy, netstat.numpy = netstat.numpy, None
+    try:
+        elapsed, result = timeit(batched, args.repeat, new, old, fields)
+        print("{:>12} {:>10.3f}s".format("fallback", elapsed))
+        assert result == expected
+    finally:
+        netstat.numpy = numpy
+
+
+if __name__ == "__main__":
+    main()
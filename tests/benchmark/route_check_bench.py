@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the route_check diff path.
+
+Generates synthetic APPL-DB / ASIC-DB / INTF_TABLE route tables and runs the
+diff and filter chain of check_routes_for_namespace on them, once with the
+legacy sorted-list helpers and once with utilities_common.prefix_set.
+Every run happens in its own process so peak RSS is reported per path.
+
+Usage:
+    python tests/benchmark/route_check_bench.py [-s 100000 1000000] [-m 0.01]
+"""
+
+import argparse
+import ipaddress
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from utilities_common.prefix_set import PrefixSet, diff_prefixes  # noqa: E402
+
+
+def gen_tables(size, miss_ratio, seed=1):
+    """
+    :return (appl, asic, intf, vnet) lists of prefix strings. Roughly
+    miss_ratio of the routes are present on one side only, and half of the
+    ASIC-only ones are VNET routes.
+    """
+    rnd = random.Random(seed)
+    routes = set()
+    while len(routes) < size:
+        if rnd.random() < 0.7:
+            addr = ipaddress.IPv4Address(rnd.getrandbits(32))
+            plen = rnd.choice((24, 28, 31, 32))
+            routes.add(str(ipaddress.ip_network("{}/{}".format(addr, plen), strict=False)))
+        else:
+            addr = ipaddress.IPv6Address(rnd.getrandbits(128))
+            plen = rnd.choice((48, 64, 126, 128))
+            routes.add(str(ipaddress.ip_network("{}/{}".format(addr, plen), strict=False)))
+    routes = list(routes)
+    rnd.shuffle(routes)
+
+    nmiss = int(size * miss_ratio)
+    appl = routes[nmiss:]
+    asic = routes[:len(routes) - nmiss]
+    intf = [r for r in routes[:nmiss] if r.endswith("/32") or r.endswith("/128")]
+    vnet = routes[len(routes) - nmiss:len(routes) - nmiss // 2]
+    return appl, asic, intf, vnet
+
+
+def cmps(s1, s2):
+    if (s1 == s2):
+        return 0
+    if (s1 < s2):
+        return -1
+    return 1
+
+
+def diff_sorted_lists(t1, t2):
+    t1_x = t2_x = 0
+    t1_miss = []
+    t2_miss = []
+    t1_len = len(t1)
+    t2_len = len(t2)
+    while t1_x < t1_len and t2_x < t2_len:
+        d = cmps(t1[t1_x], t2[t2_x])
+        if (d == 0):
+            t1_x += 1
+            t2_x += 1
+        elif (d < 0):
+            t1_miss.append(t1[t1_x])
+            t1_x += 1
+        else:
+            t2_miss.append(t2[t2_x])
+            t2_x += 1
+
+    while t1_x < t1_len:
+        t1_miss.append(t1[t1_x])
+        t1_x += 1
+
+    while t2_x < t2_len:
+        t2_miss.append(t2[t2_x])
+        t2_x += 1
+    return t1_miss, t2_miss
+
+
+def run_legacy(appl, asic, intf, vnet):
+    rt_appl = sorted(appl)
+    rt_asic = sorted(asic)
+    intf_appl = sorted(intf)
+
+    rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
+    _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
+    rt_asic_miss = [r for r in rt_asic_miss if r not in ("0.0.0.0/0", "::/0")]
+    rt_asic_miss = [r for r in rt_asic_miss if not (r in vnet)]
+    intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
+    rt_appl_miss, _ = diff_sorted_lists(rt_appl_miss, [])
+    rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, [])
+    return len(rt_appl_miss), len(rt_asic_miss), len(intf_appl_miss)
+
+
+def run_prefix_set(appl, asic, intf, vnet):
+    rt_appl = PrefixSet(appl)
+    rt_asic = PrefixSet(asic)
+    intf_appl = PrefixSet(intf)
+
+    rt_appl_miss, rt_asic_miss = diff_prefixes(rt_appl, rt_asic)
+    rt_asic_miss = rt_asic_miss.difference(intf_appl)
+    rt_asic_miss = rt_asic_miss.filter(lambda r: r not in ("0.0.0.0/0", "::/0"))
+    rt_asic_miss = rt_asic_miss.exclude(vnet)
+    intf_appl_miss = intf_appl.difference(rt_asic)
+    rt_appl_miss = rt_appl_miss.exclude([])
+    rt_asic_miss = rt_asic_miss.exclude([])
+    return len(rt_appl_miss.sorted()), len(rt_asic_miss.sorted()), len(intf_appl_miss.sorted())
+
+
+PATHS = {
+    "legacy": run_legacy,
+    "prefix_set": run_prefix_set,
+}
+
+
+def worker(path, size, miss_ratio, queue):
+    tables = gen_tables(size, miss_ratio)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    counts = PATHS[path](*tables)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, base_rss, peak_rss, counts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark route_check diff engines")
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[100000, 1000000],
+                        help='Route table sizes to generate')
+    parser.add_argument('-m', '--miss_ratio', type=float, default=0.01,
+                        help='Ratio of routes present on one side only')
+    args = parser.parse_args()
+
+    print("{:>10} {:>12} {:>10} {:>14} {:>14}  {}".format(
+        "routes", "path", "wall(s)", "base RSS(KB)", "peak RSS(KB)", "misses(appl, asic, intf)"))
+    for size in args.sizes:
+        for path in PATHS:
+            queue = multiprocessing.Queue()
+            proc = multiprocessing.Process(target=worker, args=(path, size, args.miss_ratio, queue))
+            proc.start()
+            elapsed, base_rss, peak_rss, counts = queue.get()
+            proc.join()
+            print("{:>10} {:>12} {:>10.3f} {:>14} {:>14}  {}".format(
+                size, path, elapsed, base_rss, peak_rss, counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+"""
+Throughput benchmark of the transceiver firmware batch download.
+
+Downloads one image to --ports mock modules (tests/mock_xcvr_api.py),
+once serially, one port after the other like `sfputil firmware download`
+per port, and once with sfputil.firmware_batch. Every CDB block write of
+a mock module costs --block-delay milliseconds, during which it holds the
+lock of its bus; the modules are spread over --buses buses.
+
+Usage:
+    python tests/benchmark/sfputil_fw_batch_bench.py [-p 32] [-b 4] [-s 256] [--block-delay 2]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sfputil import firmware_batch  # noqa: E402
+from mock_xcvr_api import MockSfp, MockXcvrApi  # noqa: E402
+
+
+def make_ports(args):
+    bus_locks = [threading.Lock() for _ in range(args.buses)]
+    ports = []
+    for i in range(args.ports):
+        bus = i % args.buses
+        api = MockXcvrApi(max_block_size=args.block_size, block_delay=args.block_delay / 1000.0,
+                          bus_lock=bus_locks[bus] if args.bus_lock else None)
+        ports.append(("Ethernet{}".format(i * 8), MockSfp(api), "i2c-{}".format(bus)))
+    return ports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transceiver firmware batch download")
+    parser.add_argument('-p', '--ports', type=int, default=32, help='Number of modules')
+    parser.add_argument('-b', '--buses', type=int, default=4, help='Number of I2C buses the modules are spread over')
+    parser.add_argument('-s', '--size', type=int, default=256, help='Image size in KB')
+    parser.add_argument('--block-size', type=int, default=2048, help='CDB block size in bytes')
+    parser.add_argument('--block-delay', type=float, default=2, help='Time per block write, in ms')
+    parser.add_argument('--bus-lock', action='store_true',
+                        help='Serialize the block writes of the modules of a bus, as if the bus was the bottleneck')
+    parser.add_argument('--max-parallel', type=int, default=32, help='Maximum number of modules upgraded at once')
+    parser.add_argument('--per-bus', type=int, default=8, help='Maximum number of concurrent downloads per bus')
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix='.bin') as image:
+        image.write(os.urandom(args.size * 1024))
+        image.flush()
+        print("{} modules on {} buses, {} KB image, {} blocks of {} ms per module".format(
+            args.ports, args.buses, args.size, -(-args.size * 1024 // args.block_size), args.block_delay))
+
+        ports = make_ports(args)
+        start = time.perf_counter()
+        for port in ports:
+            firmware_batch.FirmwareBatch(image.name, stages=firmware_batch.DOWNLOAD_STAGES,
+                                         max_parallel=1).run([port])
+        print("{:>12} {:>10.3f}s".format("serial", time.perf_counter() - start))
+
+        ports = make_ports(args)
+        start = time.perf_counter()
+        results = firmware_batch.FirmwareBatch(image.name, stages=firmware_batch.DOWNLOAD_STAGES,
+                                               max_parallel=args.max_parallel,
+                                               per_group=args.per_bus).run(ports)
+        print("{:>12} {:>10.3f}s".format("batch", time.perf_counter() - start))
+        assert all(status == firmware_batch.STATUS_DONE for status, _, _ in results.values())
+
+
+if __name__ == "__main__":
+    main()
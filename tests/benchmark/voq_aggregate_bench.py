@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the supervisor VOQ counter aggregation.
+
+Stands up one COUNTERS_DB stand-in per linecard ASIC and aggregates the
+VOQ counters of all of them, once the way queuestat did before (serially,
+one HGET per VOQ and counter) and once with utilities_common.voq_stats.
+
+By default the stand-ins are in-process fakes which sleep --rtt
+milliseconds per round trip. With --redis-server, a local redis-server is
+started per stand-in instead and read through redis-py, which pipelines.
+
+Usage:
+    python tests/benchmark/voq_aggregate_bench.py [-l 16] [-a 2] [-p 64] [-q 8] [--rtt 0.5]
+    python tests/benchmark/voq_aggregate_bench.py --redis-server [--base-port 16379]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from utilities_common import voq_stats  # noqa: E402
+
+COUNTER_NAMES = [
+    "SAI_QUEUE_STAT_PACKETS",
+    "SAI_QUEUE_STAT_BYTES",
+    "SAI_QUEUE_STAT_DROPPED_PACKETS",
+    "SAI_QUEUE_STAT_DROPPED_BYTES",
+    "SAI_QUEUE_STAT_CREDIT_WD_DELETED_PACKETS",
+]
+
+
+def gen_linecard(lc, asic, num_linecards, ports, queues):
+    """
+    :return dict of redis key to hash of one linecard ASIC. Every ASIC has
+    a VOQ for every system port of the chassis.
+    """
+    data = {voq_stats.COUNTERS_VOQ_NAME_MAP: {}}
+    for dst_lc in range(num_linecards):
+        for port in range(ports):
+            for queue in range(queues):
+                voq = "lc{}|asic0|Ethernet{}:{}".format(dst_lc, port * 4, queue)
+                oid = "oid:0x15{:02x}{:02x}{:04x}{:02x}".format(lc, asic, dst_lc * ports + port, queue)
+                data[voq_stats.COUNTERS_VOQ_NAME_MAP][voq] = oid
+                data["COUNTERS:" + oid] = {name: str(port + queue) for name in COUNTER_NAMES}
+    return data
+
+
+class FakeCountersDb(object):
+    """
+    COUNTERS_DB stand-in which costs rtt seconds per request.
+    """
+
+    def __init__(self, data, rtt):
+        self.data = data
+        self.rtt = rtt
+
+    def hgetall(self, key):
+        time.sleep(self.rtt)
+        return dict(self.data.get(key, {}))
+
+    def hget(self, key, field):
+        time.sleep(self.rtt)
+        return self.data.get(key, {}).get(field)
+
+
+def aggregate_legacy(clients):
+    stats = {}
+    for client in clients:
+        voq_name_map = client.hgetall(voq_stats.COUNTERS_VOQ_NAME_MAP)
+        for voq in voq_name_map:
+            sys_port, idx = voq.split(":")
+            for counter_name in COUNTER_NAMES:
+                stats.setdefault(sys_port, {}).setdefault(idx, {}).setdefault(counter_name, 0)
+                counter_data = client.hget("COUNTERS:" + voq_name_map[voq], counter_name)
+                if counter_data is not None:
+                    stats[sys_port][idx][counter_name] += int(counter_data)
+    return stats
+
+
+def start_redis_servers(datasets, base_port):
+    import redis
+
+    workdir = tempfile.mkdtemp(prefix="voq_bench_")
+    procs = []
+    clients = []
+    for i, data in enumerate(datasets):
+        port = base_port + i
+        procs.append(subprocess.Popen(["redis-server", "--port", str(port), "--save", "",
+                                       "--dir", workdir], stdout=subprocess.DEVNULL))
+        client = redis.Redis(port=port, decode_responses=True)
+        for _ in range(100):
+            try:
+                client.ping()
+                break
+            except redis.exceptions.ConnectionError:
+                time.sleep(0.05)
+        pipe = client.pipeline(transaction=False)
+        for key, fvs in data.items():
+            pipe.hset(key, mapping=fvs)
+        pipe.execute()
+        clients.append(client)
+    return procs, clients, workdir
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark VOQ counter aggregation")
+    parser.add_argument('-l', '--linecards', type=int, default=16, help='Number of linecards')
+    parser.add_argument('-a', '--asics', type=int, default=2, help='ASICs per linecard')
+    parser.add_argument('-p', '--ports', type=int, default=64, help='Ports per linecard')
+    parser.add_argument('-q', '--queues', type=int, default=8, help='VOQs per system port')
+    parser.add_argument('--rtt', type=float, default=0.5, help='Round trip time of the fake stand-ins, in ms')
+    parser.add_argument('--redis-server', action='store_true', help='Use local redis-server stand-ins')
+    parser.add_argument('--base-port', type=int, default=16379, help='First port of the redis-server stand-ins')
+    args = parser.parse_args()
+
+    datasets = [gen_linecard(lc, asic, args.linecards, args.ports, args.queues)
+                for lc in range(args.linecards) for asic in range(args.asics)]
+    ips = ["stand-in-{}".format(i) for i in range(len(datasets))]
+
+    procs = []
+    workdir = None
+    if args.redis_server:
+        if shutil.which("redis-server") is None:
+            sys.exit("redis-server not found")
+        procs, clients, workdir = start_redis_servers(datasets, args.base_port)
+    else:
+        clients = [FakeCountersDb(data, args.rtt / 1000.0) for data in datasets]
+    by_ip = dict(zip(ips, clients))
+
+    try:
+        print("{} stand-ins, {} VOQs each".format(len(clients), len(datasets[0]) - 1))
+        start = time.perf_counter()
+        legacy = aggregate_legacy(clients)
+        print("{:>12} {:>10.3f}s".format("legacy", time.perf_counter() - start))
+
+        start = time.perf_counter()
+        stats, unreachable = voq_stats.aggregate_voq_stats(ips, COUNTER_NAMES, timeout=600,
+                                                           connect=lambda ip, timeout: by_ip[ip])
+        print("{:>12} {:>10.3f}s".format("concurrent", time.perf_counter() - start))
+        assert not unreachable and stats == legacy
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the YANG model load at process start.
+
+Starts --runs Python processes which each create a SonicYang of --yang-dir
+and load its models, once with SonicYang.loadYangModel() and once with
+generic_config_updater.yang_cache.load_yang_models() and a warm cache, and
+reports the time to load the models in a new process for both. Needs
+sonic-yang-mgmt and the YANG models, i.e. a SONiC host or build container.
+
+Usage:
+    python tests/benchmark/yang_cache_bench.py [-d /usr/local/yang-models] [-r 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+REPO_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..')
+
+LOAD_SCRIPT = """
+import json, sys, time
+start = time.monotonic()
+import sonic_yang
+from generic_config_updater import yang_cache
+sy = sonic_yang.SonicYang(sys.argv[1])
+if sys.argv[2]:
+    yang_cache.load_yang_models(sy, sys.argv[2])
+else:
+    sy.loadYangModel()
+print(json.dumps({"seconds": time.monotonic() - start, "tables": len(sy.confDbYangMap)}))
+"""
+
+
+def load_in_process(yang_dir, cache_path):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get('PYTHONPATH')])))
+    out = subprocess.check_output([sys.executable, '-c', LOAD_SCRIPT, yang_dir, cache_path or ''], env=env)
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def best_of(runs, yang_dir, cache_path):
+    results = [load_in_process(yang_dir, cache_path) for _ in range(runs)]
+    return min(r["seconds"] for r in results), results[0]["tables"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-d', '--yang-dir', default='/usr/local/yang-models')
+    parser.add_argument('-r', '--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    cache_path = os.path.join(tmp_dir, 'yang_models.json')
+    try:
+        uncached, tables = best_of(args.runs, args.yang_dir, None)
+        # Fill the cache, then time the loads which use it
+        load_in_process(args.yang_dir, cache_path)
+        cached, cached_tables = best_of(args.runs, args.yang_dir, cache_path)
+        assert tables == cached_tables
+        size = os.path.getsize(cache_path)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    print("models: {} tables, cache {:.1f} MB".format(tables, size / 1e6))
+    print("loadYangModel: {:.3f}s".format(uncached))
+    print("cached load:   {:.3f}s ({:.1f}x)".format(cached, uncached / cached))
+
+
+if __name__ == '__main__':
+    main()
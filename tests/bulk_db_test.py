@@ -0,0 +1,189 @@
+from unittest import mock
+
+import pytest
+
+from utilities_common import bulk_db
+
+
+class FakePipeline(object):
+    def __init__(self, data):
+        self.data = data
+        self.queued = []
+
+    def hgetall(self, key):
+        self.queued.append(key)
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        self.queued.append(('hset', key, mapping))
+
+    def hdel(self, key, *fields):
+        self.queued.append(('hdel', key) + fields)
+
+    def delete(self, key):
+        self.queued.append(('delete', key))
+
+    def execute(self):
+        self.data.setdefault('executed', []).append(self.queued)
+        return [dict(self.data.get(key, {})) for key in self.queued if isinstance(key, str)]
+
+
+class FakeRedis(object):
+    def __init__(self, data, dup=False):
+        self.data = data
+        self.dup = dup
+        self.pipelines = 0
+
+    def scan(self, cursor=0, match=None, count=10):
+        keys = sorted(k for k in self.data if k.startswith(match.rstrip('*')))
+        cursor = int(cursor)
+        batch = keys[cursor:cursor + count]
+        if self.dup and cursor:
+            batch = [keys[0]] + batch
+        next_cursor = cursor + count if cursor + count < len(keys) else 0
+        return next_cursor, batch
+
+    def keys(self, pattern):
+        return [k for k in self.data if k.startswith(pattern.rstrip('*'))]
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        return FakePipeline(self.data)
+
+
+class TestBulkDb(object):
+    def setup_method(self):
+        self.data = {"T:{}".format(i): {"f": str(i)} for i in range(25)}
+        self.data["OTHER:1"] = {"f": "x"}
+
+    def test_scan_keys(self):
+        client = FakeRedis(self.data, dup=True)
+        batches = list(bulk_db.scan_keys(client, "T:*", batch_size=10))
+        keys = [k for batch in batches for k in batch]
+        assert len(batches) == 3
+        assert sorted(keys) == sorted(k for k in self.data if k.startswith("T:"))
+
+    def test_iter_tables(self):
+        client = FakeRedis(self.data)
+        result = dict(bulk_db.iter_tables(client, "T:*", batch_size=10))
+        assert len(result) == 25
+        assert result["T:7"] == {"f": "7"}
+        assert client.pipelines == 3
+
+    def test_get_all_pipelined_missing(self):
+        client = FakeRedis(self.data)
+        assert bulk_db.get_all_pipelined(client, ["T:1", "T:100"]) == [{"f": "1"}, {}]
+
+    def test_wait_for_keys(self):
+        client = FakeRedis(self.data)
+        with mock.patch("utilities_common.bulk_db.time.sleep") as mock_sleep:
+            assert len(bulk_db.wait_for_keys(client, "T:*", 25, timeout=1)) == 25
+            mock_sleep.assert_not_called()
+
+        published = iter([[], ["M:1"], ["M:1", "M:2"]])
+        client.keys = lambda pattern: next(published)
+        with mock.patch("utilities_common.bulk_db.time.sleep") as mock_sleep:
+            assert bulk_db.wait_for_keys(client, "M:*", 2, timeout=10) == ["M:1", "M:2"]
+            assert mock_sleep.call_count == 2
+
+    def test_wait_for_keys_timeout(self):
+        client = FakeRedis(self.data)
+        keys = bulk_db.wait_for_keys(client, "T:*", 30, timeout=0.1, interval=0.01)
+        assert len(keys) == 25
+
+    def test_get_redis_client(self):
+        db = mock.MagicMock()
+        db.get_redis_client.return_value = FakeRedis(self.data)
+        assert bulk_db.get_redis_client(db, "ASIC_DB") is db.get_redis_client.return_value
+
+    def test_get_redis_client_unix_socket(self):
+        # Socket and db id of each database, per namespace
+        sockets = {"": "/var/run/redis/redis.sock", "asic0": "/var/run/redis0/redis.sock",
+                   "asic1": "/var/run/redis1/redis.sock"}
+        db_ids = {"APPL_DB": 0, "ASIC_DB": 1, "COUNTERS_DB": 2}
+
+        db = mock.MagicMock()
+        db.get_redis_client.return_value = object()
+        with mock.patch("utilities_common.bulk_db.SonicDBConfig") as mock_cfg, \
+                mock.patch("utilities_common.bulk_db.redis.Redis") as mock_redis:
+            mock_cfg.getDbSock.side_effect = lambda db_name, ns: sockets[ns]
+            mock_cfg.getDbId.side_effect = lambda db_name, ns: db_ids[db_name]
+
+            db.namespace = ""
+            assert bulk_db.get_redis_client(db, "APPL_DB") is mock_redis.return_value
+            mock_redis.assert_called_with(unix_socket_path="/var/run/redis/redis.sock", db=0,
+                                          decode_responses=True)
+
+            db.namespace = "asic0"
+            bulk_db.get_redis_client(db, "ASIC_DB")
+            mock_cfg.getDbSock.assert_called_with("ASIC_DB", "asic0")
+            mock_cfg.getDbId.assert_called_with("ASIC_DB", "asic0")
+            mock_redis.assert_called_with(unix_socket_path="/var/run/redis0/redis.sock", db=1,
+                                          decode_responses=True)
+
+            # An explicit namespace wins over the one db is bound to
+            bulk_db.get_redis_client(db, "COUNTERS_DB", "asic1")
+            mock_cfg.getDbSock.assert_called_with("COUNTERS_DB", "asic1")
+            mock_redis.assert_called_with(unix_socket_path="/var/run/redis1/redis.sock", db=2,
+                                          decode_responses=True)
+
+    def test_get_redis_client_unknown_namespace(self):
+        db = mock.MagicMock(spec=["get_redis_client"])
+        db.get_redis_client.return_value = object()
+        with mock.patch("utilities_common.bulk_db.redis.Redis") as mock_redis:
+            with pytest.raises(ValueError):
+                bulk_db.get_redis_client(db, "ASIC_DB")
+            mock_redis.assert_not_called()
+
+        # A snapshot resolves the namespace of the db it wraps
+        db = mock.MagicMock()
+        db.get_redis_client.return_value = object()
+        db.namespace = "asic0"
+        with mock.patch("utilities_common.bulk_db.SonicDBConfig") as mock_cfg, \
+                mock.patch("utilities_common.bulk_db.redis.Redis"):
+            bulk_db.get_redis_client(bulk_db.DbSnapshot(db), "ASIC_DB")
+            mock_cfg.getDbSock.assert_called_with("ASIC_DB", "asic0")
+
+    def test_set_entries_pipelined(self):
+        configdb = mock.MagicMock()
+        configdb.TABLE_NAME_SEPARATOR = '|'
+        configdb.serialize_key = lambda key: '|'.join(key)
+        configdb.typed_to_raw = lambda data: dict(data)
+        data = {}
+        configdb.get_redis_client.return_value = FakeRedis(data)
+        changes = [
+            (('T', 'R1'), None, None),
+            (('T', 'R2'), {'a': '1'}, None),
+            (('T', 'R3'), {'a': '2'}, {'a': '1', 'b': '1'}),
+            (('T', 'R4'), {}, {'a': '1'}),
+        ]
+        assert bulk_db.set_entries_pipelined(configdb, 'acl_rule', changes, batch_size=2) == 4
+        assert data['executed'] == [
+            [('delete', 'ACL_RULE|T|R1'), ('hset', 'ACL_RULE|T|R2', {'a': '1'})],
+            [('hset', 'ACL_RULE|T|R3', {'a': '2'}), ('hdel', 'ACL_RULE|T|R3', 'b'),
+             ('hset', 'ACL_RULE|T|R4', {'NULL': 'NULL'}), ('hdel', 'ACL_RULE|T|R4', 'a')],
+        ]
+        assert bulk_db.set_entries_pipelined(configdb, 'ACL_RULE', []) == 0
+        assert len(data['executed']) == 2
+
+    def test_db_snapshot(self):
+        client = FakeRedis(self.data)
+        db = mock.MagicMock()
+        db.APPL_DB = "APPL_DB"
+        db.get_redis_client.return_value = client
+        db.get.return_value = "from_db"
+        snapshot = bulk_db.DbSnapshot(db)
+
+        snapshot.load(db.APPL_DB, ["T:1", "T:2", "T:100"])
+        snapshot.load(db.APPL_DB, ["T:1", "T:2"])
+        assert client.pipelines == 1
+
+        assert snapshot.APPL_DB == "APPL_DB"
+        assert snapshot.get(snapshot.APPL_DB, "T:1", "f") == "1"
+        assert snapshot.get(snapshot.APPL_DB, "T:1", "missing") is None
+        assert snapshot.get(snapshot.APPL_DB, "T:100", "f") is None
+        assert snapshot.get_all(snapshot.APPL_DB, "T:2") == {"f": "2"}
+        db.get.assert_not_called()
+
+        # Keys which are not loaded are read from db
+        assert snapshot.get(snapshot.APPL_DB, "T:3", "f") == "from_db"
+        db.get.assert_called_once_with("APPL_DB", "T:3", "f")
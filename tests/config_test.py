@@ -622,6 +622,68 @@ class TestConfigSaveMasic(object):
             assert result.exit_code == 0
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == save_config_filename_masic_output
 
+    def test_config_save_parallel_masic(self):
+        def read_json_file_side_effect(filename):
+            return {}
+
+        mock_file = MagicMock()
+        mock_file.fileno.return_value = 1
+        mock_file.__enter__.return_value = mock_file
+        mock_file.__exit__.return_value = None
+        with mock.patch("utilities_common.cli.run_command",
+                        mock.MagicMock(
+                            side_effect=mock_run_command_side_effect)), \
+                mock.patch('config.main.read_json_file',
+                           mock.MagicMock(
+                               side_effect=read_json_file_side_effect)), \
+                mock.patch('config.main.open',
+                           mock.MagicMock(return_value=mock_file)):
+
+            runner = CliRunner()
+
+            result = runner.invoke(config.config.commands["save"], ["-y", "--parallel"])
+
+            print(result.exit_code)
+            print(result.output)
+            traceback.print_tb(result.exc_info[2])
+
+            assert result.exit_code == 0
+            lines = [li.rstrip() for li in result.output.split('\n')]
+            # The namespaces are saved concurrently, so the commands run in any order
+            assert sorted(li for li in lines if li.startswith("Running command")) == \
+                sorted(save_config_masic_output.splitlines())
+            assert [li.split(" in ")[0] for li in lines if li.startswith("'save'")] == [
+                "'save' localhost done", "'save' asic0 done", "'save' asic1 done"]
+
+    def test_config_save_parallel_masic_failure(self):
+        def run_command_side_effect(*args, **kwargs):
+            mock_run_command_side_effect(*args, **kwargs)
+            if "-n asic0" in args[0]:
+                sys.exit(2)
+
+        mock_file = MagicMock()
+        mock_file.fileno.return_value = 1
+        mock_file.__enter__.return_value = mock_file
+        mock_file.__exit__.return_value = None
+        with mock.patch("utilities_common.cli.run_command",
+                        mock.MagicMock(side_effect=run_command_side_effect)), \
+                mock.patch('config.main.read_json_file', mock.MagicMock(return_value={})), \
+                mock.patch('config.main.open', mock.MagicMock(return_value=mock_file)):
+
+            runner = CliRunner()
+
+            result = runner.invoke(config.config.commands["save"], ["-y", "--parallel"])
+
+            print(result.exit_code)
+            print(result.output)
+
+            # The other namespaces are saved and the failure is reported once all are done
+            assert result.exit_code == 1
+            assert "'save' localhost done" in result.output
+            assert "'save' asic1 done" in result.output
+            assert result.output.endswith(
+                "'save' failed in 1 of 3 namespace(s):\n    asic0: exited with code 2\n")
+
     def test_config_save_filename_wrong_cnt_masic(self):
         def read_json_file_side_effect(filename):
             return {}
@@ -1211,6 +1273,46 @@ class TestConfigReloadMasic(object):
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == \
                 RELOAD_MASIC_CONFIG_DB_OUTPUT.format(config.SYSTEM_RELOAD_LOCK)
 
+    def test_config_reload_multiple_files_parallel(self):
+        dummy_cfg_file = os.path.join(os.sep, "tmp", "config.json")
+        dummy_cfg_file_asic0 = os.path.join(os.sep, "tmp", "config0.json")
+        dummy_cfg_file_asic1 = os.path.join(os.sep, "tmp", "config1.json")
+        device_metadata = {
+            "DEVICE_METADATA": {
+                "localhost": {
+                    "platform": "some_platform",
+                    "mac": "02:42:f0:7f:01:05"
+                }
+            }
+        }
+        self._create_dummy_config(dummy_cfg_file, device_metadata)
+        self._create_dummy_config(dummy_cfg_file_asic0, device_metadata)
+        self._create_dummy_config(dummy_cfg_file_asic1, device_metadata)
+
+        with mock.patch("utilities_common.cli.run_command",
+                        mock.MagicMock(side_effect=mock_run_command_side_effect)), \
+                mock.patch("config.main.delete_transceiver_tables") as mock_delete_transceiver_tables:
+            runner = CliRunner()
+            cfg_files = f"{dummy_cfg_file},{dummy_cfg_file_asic0},{dummy_cfg_file_asic1}"
+
+            result = runner.invoke(
+                config.config.commands["reload"],
+                [cfg_files, '-y', '-f', '--parallel'])
+
+            print(result.exit_code)
+            print(result.output)
+
+            assert result.exit_code == 0
+            lines = [li.rstrip() for li in result.output.split('\n')]
+            expected = RELOAD_MASIC_CONFIG_DB_OUTPUT.format(config.SYSTEM_RELOAD_LOCK).splitlines()
+            commands = [li for li in lines if li.startswith("Running command: /usr/local/bin/sonic-cfggen")]
+            # The host is loaded first, then the ASIC namespaces concurrently
+            assert commands[0] == expected[3]
+            assert sorted(commands[1:]) == expected[4:6]
+            assert [li.split(" in ")[0] for li in lines if li.startswith("'reload'")] == [
+                "'reload' localhost done", "'reload' asic0 done", "'reload' asic1 done"]
+            assert mock_delete_transceiver_tables.call_count == 1
+
     def test_config_reload_multiple_files_with_spaces(self):
         dummy_cfg_file = os.path.join(os.sep, "tmp", "config.json")
         dummy_cfg_file_asic0 = os.path.join(os.sep, "tmp", "config0.json")
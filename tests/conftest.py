@@ -292,6 +292,16 @@ generated_services_list = [
     'telemetry.timer']
 
 
+@pytest.fixture(autouse=True, scope='session')
+def disable_yang_model_cache():
+    """Load the YANG models from disk in every test, as tests mock loadYangModel.
+
+    Tests of the cache itself pass their own cache path.
+    """
+    with mock.patch('generic_config_updater.yang_cache.YANG_CACHE_PATH', None):
+        yield
+
+
 @pytest.fixture(autouse=True)
 def _ensure_sonic_platform_mock():
     """Ensure sonic_platform is always mockable in sys.modules.
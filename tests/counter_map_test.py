@@ -0,0 +1,67 @@
+from unittest import mock
+
+from utilities_common import counter_map
+
+
+class FakeCountersDb(object):
+    COUNTERS_DB = "COUNTERS_DB"
+
+    def __init__(self, maps):
+        self.maps = maps
+        self.get_all = mock.MagicMock(side_effect=lambda db, name: self.maps.get(name))
+
+
+class TestCounterMapIndex(object):
+    def setup_method(self):
+        counter_map.clear_cache()
+        self.maps = {
+            counter_map.COUNTERS_PORT_NAME_MAP: {"Ethernet0": "oid:p0", "Ethernet4": "oid:p4"},
+            counter_map.COUNTERS_QUEUE_NAME_MAP: {"Ethernet0:0": "oid:q0", "Ethernet0:1": "oid:q1",
+                                                  "Ethernet4:0": "oid:q4"},
+            counter_map.COUNTERS_QUEUE_PORT_MAP: {"oid:q0": "oid:p0", "oid:q1": "oid:p0", "oid:q4": "oid:p4"},
+            counter_map.COUNTERS_QUEUE_INDEX_MAP: {"oid:q0": "0", "oid:q1": "1", "oid:q4": "0"},
+        }
+
+    def test_maps_read_once(self):
+        db = FakeCountersDb(self.maps)
+        index = counter_map.CounterMapIndex(db)
+        assert index.get(counter_map.COUNTERS_QUEUE_INDEX_MAP, "oid:q1") == "1"
+        assert index.get(counter_map.COUNTERS_QUEUE_INDEX_MAP, "oid:q4") == "0"
+        assert index.get(counter_map.COUNTERS_QUEUE_INDEX_MAP, "oid:none") is None
+        assert index.get(counter_map.COUNTERS_PG_INDEX_MAP, "oid:q1") is None
+        assert db.get_all.call_count == 2
+
+    def test_port_objects(self):
+        db = FakeCountersDb(self.maps)
+        index = counter_map.CounterMapIndex(db)
+        table, unresolved = index.port_objects(counter_map.COUNTERS_QUEUE_NAME_MAP,
+                                               counter_map.COUNTERS_QUEUE_PORT_MAP)
+        assert table == {"Ethernet0": {"Ethernet0:0": "oid:q0", "Ethernet0:1": "oid:q1"},
+                         "Ethernet4": {"Ethernet4:0": "oid:q4"}}
+        assert unresolved == []
+        calls = db.get_all.call_count
+        index.port_objects(counter_map.COUNTERS_QUEUE_NAME_MAP, counter_map.COUNTERS_QUEUE_PORT_MAP)
+        assert db.get_all.call_count == calls
+
+        self.maps[counter_map.COUNTERS_PG_NAME_MAP] = {"Ethernet8:0": "oid:pg8"}
+        self.maps[counter_map.COUNTERS_PG_PORT_MAP] = {"oid:pg8": "oid:p8"}
+        table, unresolved = index.port_objects(counter_map.COUNTERS_PG_NAME_MAP, counter_map.COUNTERS_PG_PORT_MAP)
+        assert table == {"Ethernet0": {}, "Ethernet4": {}}
+        assert unresolved == ["oid:pg8"]
+
+    def test_get_index_cached_per_namespace(self):
+        db = FakeCountersDb(self.maps)
+        index = counter_map.get_index(db)
+        index.get_all(counter_map.COUNTERS_PORT_NAME_MAP)
+        index.get_all(counter_map.COUNTERS_QUEUE_NAME_MAP)
+        assert counter_map.get_index(db) is index
+        assert counter_map.get_index(db, "asic0") is not index
+
+        # syncd restart assigns new port OIDs
+        self.maps[counter_map.COUNTERS_PORT_NAME_MAP] = {"Ethernet0": "oid:p1"}
+        new_index = counter_map.get_index(db)
+        assert new_index is not index
+        assert new_index.get(counter_map.COUNTERS_PORT_NAME_MAP, "Ethernet0") == "oid:p1"
+
+        counter_map.clear_cache("")
+        assert counter_map.get_index(db) is not new_index
@@ -0,0 +1,52 @@
+from utilities_common.db import Db, LazyClients
+from utilities_common import constants
+
+
+class TestDb(object):
+    def test_no_connection_on_init(self):
+        db = Db()
+        assert db.stats.total_connects() == 0
+        assert constants.DEFAULT_NAMESPACE in db.db_clients
+        assert db.db_clients.connected() == []
+        assert db.cfgdb_clients.connected() == []
+
+    def test_connect_on_first_use(self):
+        db = Db()
+        db.db.keys(db.db.APPL_DB, "PORT_TABLE:*")
+        db.db.get_all(db.db.APPL_DB, "PORT_TABLE:Ethernet0")
+        assert db.stats.connects == {(constants.DEFAULT_NAMESPACE, 'APPL_DB'): 1}
+
+        db.db.get_all(db.db.STATE_DB, "PORT_TABLE|Ethernet0")
+        assert db.stats.total_connects() == 2
+        assert sorted(db.stats.to_dict()) == ['default/APPL_DB', 'default/STATE_DB']
+
+    def test_clients_reuse_default_connections(self):
+        db = Db()
+        assert db.cfgdb_clients[constants.DEFAULT_NAMESPACE] is db.cfgdb
+        assert db.db_clients.get(constants.DEFAULT_NAMESPACE) is db.db
+        assert db.get_data('PORT', 'Ethernet0') is not None
+        assert db.stats.connects == {(constants.DEFAULT_NAMESPACE, 'CONFIG_DB'): 1}
+
+    def test_clients_override(self):
+        db = Db()
+        db.cfgdb = "cfgdb"
+        assert db.cfgdb_clients[constants.DEFAULT_NAMESPACE] == "cfgdb"
+        db.cfgdb_clients["asic9"] = "asic9_cfgdb"
+        assert db.cfgdb_clients.get("asic9") == "asic9_cfgdb"
+        assert db.cfgdb_clients.get("asic10") is None
+
+    def test_lazy_clients(self):
+        created = []
+
+        def factory(ns):
+            created.append(ns)
+            return ns.upper()
+
+        clients = LazyClients(["", "asic0", "asic1"], factory)
+        assert list(clients) == ["", "asic0", "asic1"]
+        assert created == []
+        assert clients["asic1"] == "ASIC1"
+        assert clients["asic1"] == "ASIC1"
+        assert created == ["asic1"]
+        del clients["asic0"]
+        assert list(clients) == ["", "asic1"]
@@ -1,6 +1,7 @@
 import os
 import sys
 import json
+import click
 import pytest
 import traceback
 import dump.main as dump
@@ -218,6 +219,63 @@ class TestDumpState:
         ddiff = DeepDiff(set(expected_entries), set(rec_json.keys()))
         assert not ddiff, "Expected Entries were not recieved when passing all keyword"
 
+    def test_identifier_all_workers(self, match_engine):
+        runner = CliRunner()
+        serial = runner.invoke(dump.state, ["port", "all"], obj=match_engine)
+        assert serial.exit_code == 0, serial.exception
+        # Mock connectors can't be created per thread, share the ones of the fixture
+        with mock.patch.object(match_engine.conn_pool, "thread_cache", return_value=match_engine.conn_pool.cache):
+            parallel = runner.invoke(dump.state, ["port", "all", "--workers", "3"], obj=match_engine)
+        assert parallel.exit_code == 0, parallel.exception
+        assert len(json.loads(parallel.output)) == 7
+        assert serial.output == parallel.output
+
+    def test_identifiers_indexed_only_for_several_objects(self, match_engine):
+        runner = CliRunner()
+        pool = match_engine.conn_pool
+        pool.index_keys = False
+        pool.clear_key_index()
+        try:
+            result = runner.invoke(dump.state, ["port", "Ethernet0"], obj=match_engine)
+            assert result.exit_code == 0, result.exception
+            assert not pool.index_keys
+            assert not pool.key_index
+
+            result = runner.invoke(dump.state, ["port", "Ethernet0,Ethernet4"], obj=match_engine)
+            assert result.exit_code == 0, result.exception
+            assert pool.index_keys
+            assert pool.key_index
+        finally:
+            pool.index_keys = False
+            pool.clear_key_index()
+
+    def test_stream_dump(self):
+        runner = CliRunner()
+        info = [("Ethernet0", {"Ethernet0": {"CONFIG_DB": {"keys": [], "tables_not_found": ["PORT"]}}}),
+                ("Ethernet4", {"Ethernet4": {}}),
+                ("Ethernet8", {})]
+        result = runner.invoke(click.command()(lambda: dump.stream_dump(iter(info))))
+        assert result.output == json.dumps({k: v for _, d in info for k, v in d.items()}, indent=4) + "\n"
+        result = runner.invoke(click.command()(lambda: dump.stream_dump(iter([]))))
+        assert result.output == "{}\n"
+
+    def test_stream_dump_error_closes_object(self):
+        def results():
+            yield "Ethernet0", {"Ethernet0": {"CONFIG_DB": {"keys": [], "tables_not_found": ["PORT"]}}}
+            raise ValueError("plugin failed")
+
+        runner = CliRunner()
+        result = runner.invoke(click.command()(lambda: dump.stream_dump(results())))
+        assert isinstance(result.exception, ValueError)
+        assert json.loads(result.output) == {"Ethernet0": {"CONFIG_DB": {"keys": [], "tables_not_found": ["PORT"]}}}
+
+    def test_repeated_identifier_dumped_once(self, match_engine):
+        runner = CliRunner()
+        result = runner.invoke(dump.state, ["port", "Ethernet0,Ethernet4,Ethernet0", "--key-map"], obj=match_engine)
+        assert result.exit_code == 0, result.exception
+        assert result.output.count('"Ethernet0"') == 1
+        assert list(json.loads(result.output)) == ["Ethernet0", "Ethernet4"]
+
     def test_namespace_single_asic(self, match_engine):
         runner = CliRunner()
         result = runner.invoke(dump.state, ["port", "Ethernet0", "--table", "--key-map", "--namespace", "asic0"], obj=match_engine)
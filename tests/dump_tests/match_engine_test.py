@@ -2,10 +2,11 @@ import os
 import sys
 import unittest
 import pytest
-from dump.match_infra import MatchEngine, EXCEP_DICT, MatchRequest, MatchRequestOptimizer, ConnectionPool, CONN
+from dump.match_infra import MatchEngine, EXCEP_DICT, MatchRequest, MatchRequestOptimizer, ConnectionPool, CONN, \
+    KeyIndex
 from utilities_common.constants import DEFAULT_NAMESPACE
 from dump.helper import populate_mock
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from deepdiff import DeepDiff
 from importlib import reload
 
@@ -248,6 +249,58 @@ class TestMatchEngine:
         assert len(ret["keys"]) == 1
         assert "PORT|Ethernet60" in ret["keys"]
 
+    def test_table_keys_read_once(self, match_engine):
+        pool = match_engine.conn_pool
+        pool.clear_key_index()
+        pool.index_keys = True
+        conn = pool.cache[DEFAULT_NAMESPACE][CONN]
+        try:
+            with patch.object(conn, "keys", wraps=conn.keys) as mock_keys:
+                for port in ["Ethernet176", "Ethernet164", "Ethernet160"]:
+                    req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern=port)
+                    ret = match_engine.fetch(req)
+                    assert ret["error"] == ""
+                    assert ret["keys"] == ["PORT|" + port]
+                req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="Ethernet16*", return_fields=["lanes"])
+                ret = match_engine.fetch(req)
+                assert sorted(ret["keys"]) == ["PORT|Ethernet160", "PORT|Ethernet164"]
+                lanes = conn.get("CONFIG_DB", "PORT|Ethernet164", "lanes")
+                assert ret["return_values"]["PORT|Ethernet164"]["lanes"] == lanes
+                assert mock_keys.call_count == 1
+        finally:
+            pool.index_keys = False
+            pool.clear_key_index()
+
+    def test_exact_key_not_indexed(self, match_engine):
+        pool = match_engine.conn_pool
+        pool.clear_key_index()
+        conn = pool.cache[DEFAULT_NAMESPACE][CONN]
+        with patch.object(conn, "keys", wraps=conn.keys) as mock_keys:
+            req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="Ethernet176")
+            ret = match_engine.fetch(req)
+            assert ret["keys"] == ["PORT|Ethernet176"]
+            mock_keys.assert_called_once_with("CONFIG_DB", "PORT|Ethernet176")
+        assert not pool.key_index
+
+    def test_glob_pattern_not_indexed(self, match_engine):
+        pool = match_engine.conn_pool
+        pool.clear_key_index()
+        conn = pool.cache[DEFAULT_NAMESPACE][CONN]
+        with patch.object(conn, "keys", wraps=conn.keys) as mock_keys:
+            req = MatchRequest(db="CONFIG_DB", table="PORT", key_pattern="Ethernet16*")
+            ret = match_engine.fetch(req)
+            assert sorted(ret["keys"]) == ["PORT|Ethernet160", "PORT|Ethernet164"]
+            mock_keys.assert_called_once_with("CONFIG_DB", "PORT|Ethernet16*")
+        assert not pool.key_index
+
+    def test_key_index(self):
+        index = KeyIndex(["PORT|Ethernet0", "PORT|Ethernet4", "PORT|Ethernet40"])
+        assert index.match("PORT|Ethernet4") == ["PORT|Ethernet4"]
+        assert index.match("PORT|Ethernet8") == []
+        assert index.match("PORT|Ethernet4*") == ["PORT|Ethernet4", "PORT|Ethernet40"]
+        assert index.match("PORT|Ethernet[^4]") == ["PORT|Ethernet0"]
+        assert KeyIndex(None).match("*") == []
+
 @pytest.mark.usefixtures("match_engine")
 class TestNonDefaultNameSpace:
 
@@ -6,6 +6,8 @@ from click.testing import CliRunner
 import clear.main as clear
 import show.main as show
 from .utils import get_result_and_return_code
+from utilities_common import snapshot
+from utilities_common.general import load_module_from_source
 
 root_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(root_path)
@@ -425,3 +427,26 @@ class TestMultiAsicFabricStatCmd(object):
     @classmethod
     def teardown_class(cls):
         print("TEARDOWN")
+
+
+class TestFabricStatSnapshot(object):
+    def test_save_cnstat__counters_in_array__tuples_rebuilt(self, tmp_path):
+        fabricstat = load_module_from_source('fabricstat', os.path.join(scripts_path, 'fabricstat'))
+        path = str(tmp_path / 'fabric-stats-port0')
+        stats = {
+            'PORT0': fabricstat.PortStat('10', '2000', '30', '4000', '0', '5', 'N/A', '7'),
+            'PORT1': fabricstat.PortStat('1', '2', '3', '4', '5', '6', '7', '8'),
+        }
+
+        fabricstat.save_cnstat(path, stats)
+        loaded = snapshot.load(path)
+
+        # Every counter is a cell of the array, none is in the JSON header
+        assert loaded._other == {}
+        assert loaded._scalars == {}
+        assert loaded._fields == list(fabricstat.PortStat._fields)
+        assert list(loaded._cells[:8]) == [10, 2000, 30, 4000, 0, 5, snapshot.VALUE_NA, 7]
+        cached = {key: fabricstat.load_cached_stat(fabricstat.PortStat, loaded[key]) for key in loaded}
+        assert cached == stats
+        assert fabricstat.load_cached_stat(fabricstat.PortStat, ['0'] * 8) == ['0'] * 8
+        loaded.close()
@@ -1,8 +1,11 @@
 import os
+from unittest import mock
+
 from click.testing import CliRunner
 import pytest
 
 import show.main as show
+from utilities_common.general import load_module_from_source
 from .utils import get_result_and_return_code
 import subprocess
 
@@ -41,6 +44,10 @@ show_mac_count_output = """\
 Total number of entries 5
 """
 
+show_mac_count_vlan_output = """\
+Total number of entries 2
+"""
+
 show_mac__port_vlan_output = """\
   No.    Vlan  MacAddress         Port       Type
 -----  ------  -----------------  ---------  -------
@@ -241,6 +248,21 @@ class TestFdbshow():
         assert return_code == 0
         assert result == show_mac_count_output
 
+    def test_show_mac_count_vlan(self):
+        self.set_mock_variant("1")
+
+        result = self.runner.invoke(show.cli.commands["mac"], ["-c", "-v", "4"])
+        print(result.exit_code)
+        print(result.output)
+        assert result.exit_code == 0
+        assert result.output == show_mac_count_vlan_output
+
+        return_code, result = get_result_and_return_code(['fdbshow', '-c', '-v', '4'])
+        print("return_code: {}".format(return_code))
+        print("result = {}".format(result))
+        assert return_code == 0
+        assert result == show_mac_count_vlan_output
+
     def test_show_mac_port_vlan(self):
         self.set_mock_variant("1")
 
@@ -634,3 +656,24 @@ class TestFdbshow():
         assert return_code == 0
         assert "192.168.1.1" not in result
         assert "10.0.0.1" not in result
+
+    def test_iter_fdb_entries_vlan_filter_unknown_bvid(self):
+        """-v is checked against the Vlan id resolved for a bvid missing in the Vlan map"""
+        self.set_mock_variant("1")
+        fdbshow = load_module_from_source('fdbshow', os.path.join(scripts_path, 'fdbshow'))
+        fdb = fdbshow.FdbShow.__new__(fdbshow.FdbShow)
+        fdb.db = mock.Mock()
+        fdb.client = mock.Mock()
+        fdb.if_br_oid_map = {'1000000000001': 'oid:0x1000000000002'}
+        fdb.if_oid_map = {'oid:0x1000000000002': 'Ethernet0'}
+        fdb.bvid_tlb = {}
+        keys = ['ASIC_STATE:SAI_OBJECT_TYPE_FDB_ENTRY:{"bvid":"oid:0x26000000000001","mac":"11:22:33:44:55:66"}']
+        entry = {'SAI_FDB_ENTRY_ATTR_BRIDGE_PORT_ID': 'oid:0x1000000000001',
+                 'SAI_FDB_ENTRY_ATTR_TYPE': 'SAI_FDB_ENTRY_TYPE_DYNAMIC'}
+
+        with mock.patch.object(fdbshow.bulk_db, 'iter_tables', return_value=[]), \
+                mock.patch.object(fdbshow.bulk_db, 'scan_keys', return_value=[keys]), \
+                mock.patch.object(fdbshow.bulk_db, 'get_all_pipelined', return_value=[entry]), \
+                mock.patch.object(fdbshow.port_util, 'get_vlan_id_from_bvid', return_value='2'):
+            assert list(fdb.iter_fdb_entries(vlan=3)) == []
+            assert list(fdb.iter_fdb_entries(vlan=2)) == [(2, '11:22:33:44:55:66', 'Ethernet0', 'Dynamic')]
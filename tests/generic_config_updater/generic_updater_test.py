@@ -479,6 +479,22 @@ class TestGenericUpdateFactory(unittest.TestCase):
         # Act and assert
         self.recursively_test_create_func(options, 0, {}, [], self.validate_create_config_rollbacker)
 
+    def test_get_patch_sorter__validation_workers__passed_to_sort_algorithm_factory(self):
+        # Arrange
+        factory = gu.GenericUpdateFactory(validation_workers=3)
+        config_wrapper = Mock()
+        patch_wrapper = Mock()
+
+        # Act
+        strict = factory.get_patch_sorter(False, [], config_wrapper, patch_wrapper)
+        non_strict = factory.get_patch_sorter(True, [], config_wrapper, patch_wrapper)
+
+        # Assert
+        self.assertIsInstance(strict, gu.StrictPatchSorter)
+        self.assertEqual(3, strict.inner_patch_sorter.sort_algorithm_factory.validation_workers)
+        self.assertIsInstance(non_strict, gu.NonStrictPatchSorter)
+        self.assertEqual(3, non_strict.inner_patch_sorter.sort_algorithm_factory.validation_workers)
+
     def recursively_test_create_func(self, options, cur_option, params, expected_decorators, create_func):
         if cur_option == len(options):
             create_func(params, expected_decorators)
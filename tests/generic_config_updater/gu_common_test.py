@@ -65,6 +65,77 @@ class TestDryRunConfigWrapper(unittest.TestCase):
             # Assert
             self.assertDictEqual(expected, actual)
 
+
+class TestConfigDigest(unittest.TestCase):
+    def test_digest__equal_content__same_digest(self):
+        # Arrange
+        config_digest = gu_common.ConfigDigest()
+        config1 = {"PORT": {"Ethernet0": {"mtu": "9100", "lanes": "0"}}, "VLAN": {"Vlan1000": {}}}
+        config2 = {"VLAN": {"Vlan1000": {}}, "PORT": {"Ethernet0": {"lanes": "0", "mtu": "9100"}}}
+
+        # Act and assert
+        self.assertEqual(config_digest.digest(config1), config_digest.digest(config2))
+        self.assertEqual(config_digest.digest(config1), gu_common.ConfigDigest().digest(copy.deepcopy(config1)))
+
+    def test_digest__different_content__different_digests(self):
+        # Arrange
+        config_digest = gu_common.ConfigDigest()
+        configs = [
+            {},
+            {"PORT": {}},
+            {"PORT": {"Ethernet0": {}}},
+            {"PORT": {"Ethernet0": {"mtu": "9100"}}},
+            {"PORT": {"Ethernet0": {"mtu": "1500"}}},
+            {"PORT": {"Ethernet0": {"mtu": ["9100"]}}},
+            {"PORT": {"Ethernet0": {"mtu": "9100"}}, "VLAN": {}},
+            {"PORT": {"Ethernet0|mtu": {}}},
+            {"PORT|Ethernet0": {"mtu": {}}},
+        ]
+
+        # Act
+        digests = [config_digest.digest(config) for config in configs]
+
+        # Assert
+        self.assertEqual(len(configs), len(set(digests)))
+
+    def test_digest__config_sharing_tables__only_changed_table_serialized(self):
+        # Arrange
+        config_digest = gu_common.ConfigDigest()
+        config = Files.CONFIG_DB_AS_JSON
+        config_digest.digest(config)
+        # Shares what it does not change with config, as a config built by a move
+        new_config = dict(config)
+        new_config["PORT"] = dict(config["PORT"])
+        new_config["PORT"]["Ethernet0"] = dict(config["PORT"]["Ethernet0"], mtu="1500")
+        leaf_digest = config_digest._leaf_digest
+
+        # Act
+        with patch.object(config_digest, "_leaf_digest", side_effect=leaf_digest) as mock_leaf_digest:
+            actual = config_digest.digest(new_config)
+
+        # Assert
+        self.assertEqual(gu_common.ConfigDigest().digest(new_config), actual)
+        self.assertNotEqual(config_digest.digest(config), actual)
+        serialized = [call.args[0] for call in mock_leaf_digest.call_args_list]
+        self.assertEqual([new_config["PORT"]["Ethernet0"]], serialized)
+
+    def test_digest__more_containers_than_max_entries__least_recently_used_evicted(self):
+        # Arrange
+        config_digest = gu_common.ConfigDigest()
+        config_digest.MAX_ENTRIES = 4
+        hot = {"PORT": {"Ethernet0": {"mtu": "9100"}}}
+        config_digest.digest(hot)
+
+        # Act
+        for i in range(3):
+            config_digest.digest({f"VLAN{i}": {}})
+            config_digest.digest(hot)
+
+        # Assert
+        self.assertEqual(4, len(config_digest._memo))
+        self.assertIn((id(hot), 0), config_digest._memo)
+        self.assertEqual(gu_common.ConfigDigest().digest(hot), config_digest.digest(hot))
+
 class TestConfigWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -1,7 +1,9 @@
 from collections import OrderedDict
 import io
 import jsonpatch
+import pickle
 import sys
+import threading
 import unittest
 from unittest.mock import MagicMock, Mock
 import generic_config_updater.patch_sorter as ps
@@ -26,6 +28,45 @@ class TestDiff(unittest.TestCase):
         self.assertEqual(expected.current_config, actual.current_config)
         self.assertEqual(expected.target_config, actual.target_config)
 
+    def test_apply_move__copy_on_write__shares_untouched_config(self):
+        # Arrange
+        current_config = {"PORT": {"Ethernet0": {"mtu": "9100"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+        diff = ps.Diff(current_config=current_config, target_config={})
+        move = JsonMoveGroup("", ps.JsonMove.from_operation(
+            {"op": "replace", "path": "/PORT/Ethernet0/mtu", "value": "1500"}))
+        move.append(ps.JsonMove.from_operation({"op": "remove", "path": "/PORT/Ethernet0/mtu"}))
+        move.append(ps.JsonMove.from_operation({"op": "add", "path": "/PORT/Ethernet0/speed", "value": "10"}))
+
+        # Act
+        actual = diff.apply_move(move)
+
+        # Assert
+        self.assertEqual({"PORT": {"Ethernet0": {"speed": "10"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}},
+                         actual.current_config)
+        self.assertEqual({"PORT": {"Ethernet0": {"mtu": "9100"}}, "VLAN": {"Vlan1000": {"vlanid": "1000"}}},
+                         current_config)
+        self.assertIs(current_config["VLAN"], actual.current_config["VLAN"])
+
+        # Act
+        undone = actual.undo_move(move)
+
+        # Assert
+        self.assertEqual(current_config, undone.current_config)
+        self.assertEqual({"speed": "10"}, actual.current_config["PORT"]["Ethernet0"])
+
+    def test_copy_on_write__copies_path_only(self):
+        config = {"PORT": {"Ethernet0": {"lanes": ["0", "1"]}}, "VLAN": {}}
+
+        actual = ps.copy_on_write(config, "/PORT/Ethernet0/lanes/1")
+
+        self.assertEqual(config, actual)
+        self.assertIsNot(config, actual)
+        self.assertIsNot(config["PORT"]["Ethernet0"]["lanes"], actual["PORT"]["Ethernet0"]["lanes"])
+        self.assertIs(config["VLAN"], actual["VLAN"])
+
+        actual = ps.copy_on_write(config, "/ACL_TABLE/DATAACL/ports")
+        self.assertIs(config["PORT"], actual["PORT"])
+
     def test_has_no_diff__diff_exists__returns_false(self):
         # Arrange
         diff = ps.Diff(current_config=Files.CROPPED_CONFIG_DB_AS_JSON,
@@ -84,6 +125,34 @@ class TestDiff(unittest.TestCase):
         # Assert
         self.assertNotEqual(hash1, hash2)
 
+    def test_hash__diff_built_by_move__same_hash_as_new_diff(self):
+        # Arrange
+        diff = ps.Diff(current_config=Files.CROPPED_CONFIG_DB_AS_JSON, target_config=Files.ANY_CONFIG_DB)
+        move = ps.JsonMove.from_patch(Files.SINGLE_OPERATION_CONFIG_DB_PATCH)
+        hash(diff)
+
+        # Act
+        actual = diff.apply_move(move)
+
+        # Assert
+        self.assertIs(diff.config_digest, actual.config_digest)
+        self.assertEqual(hash(ps.Diff(current_config=Files.CONFIG_DB_AFTER_SINGLE_OPERATION,
+                                      target_config=Files.ANY_CONFIG_DB)), hash(actual))
+        self.assertEqual(hash(diff), hash(actual.undo_move(move)))
+
+    def test_pickle__config_digest_memo_not_sent(self):
+        # Arrange
+        diff = ps.Diff(current_config=Files.CROPPED_CONFIG_DB_AS_JSON, target_config=Files.ANY_CONFIG_DB)
+        expected = hash(diff)
+
+        # Act
+        actual = pickle.loads(pickle.dumps(diff))
+
+        # Assert
+        self.assertEqual({}, actual.config_digest._memo)
+        self.assertEqual(diff, actual)
+        self.assertEqual(expected, hash(actual))
+
     def test_eq__different_current_config__returns_false(self):
         # Arrange
         diff = ps.Diff(Files.ANY_CONFIG_DB, Files.ANY_CONFIG_DB)
@@ -427,6 +496,17 @@ class TestJsonMove(unittest.TestCase):
         self.assertListEqual(expected_current_config_tokens, jsonmove.current_config_tokens)
         self.assertEqual(expected_target_config_tokens, jsonmove.target_config_tokens)
 
+class SimulatedConfigOnlyValidator:
+    simulated_config_only = True
+
+    def __init__(self):
+        self.configs = []
+
+    def validate(self, move, diff, simulated_config):
+        self.configs.append(simulated_config)
+        return True, None
+
+
 class TestMoveWrapper(unittest.TestCase):
     def setUp(self):
         self.any_current_config = {}
@@ -750,6 +830,135 @@ class TestMoveWrapper(unittest.TestCase):
         # Act and assert
         self.assertTrue(move_wrapper.validate(JsonMoveGroup("", self.any_move), self.any_diff)[0])
 
+    def test_validate__same_simulated_config__simulated_config_only_validator_run_once(self):
+        # Arrange
+        validator = SimulatedConfigOnlyValidator()
+        move_wrapper = ps.MoveWrapper([], [], [], [validator, ps.DeleteWholeConfigMoveValidator()])
+        add_vlan = JsonMoveGroup("", ps.JsonMove.from_operation({"op": "add", "path": "/VLAN", "value": {}}))
+        add_port = JsonMoveGroup("", ps.JsonMove.from_operation({"op": "add", "path": "/PORT", "value": {}}))
+        target = {"PORT": {}, "VLAN": {}}
+
+        # Act
+        first = move_wrapper.validate(add_vlan, ps.Diff({"PORT": {}}, target))
+        second = move_wrapper.validate(add_port, ps.Diff({"VLAN": {}}, target))
+
+        # Assert
+        self.assertEqual((True, None), first)
+        self.assertEqual((True, None), second)
+        self.assertEqual([target], validator.configs)
+        self.assertEqual(2, move_wrapper.stats.validations)
+        self.assertEqual(1, move_wrapper.stats.cache_hits)
+        self.assertEqual(1, move_wrapper.stats.validators["SimulatedConfigOnlyValidator"][0])
+        self.assertEqual(2, move_wrapper.stats.validators["DeleteWholeConfigMoveValidator"][0])
+
+    def test_sort__moves_reaching_same_config__validation_reused(self):
+        # Arrange
+        validator = SimulatedConfigOnlyValidator()
+        move_wrapper = ps.MoveWrapper([ps.TableLevelMoveGenerator(PathAddressing())], [], [], [validator])
+        sorter = ps.BfsSorter(move_wrapper)
+        diff = ps.Diff({}, {"PORT": {}, "VLAN": {}})
+
+        # Act
+        moves = sorter.sort(diff)
+
+        # Assert
+        self.assertEqual(2, len(moves))
+        # {} -> {PORT}, {} -> {VLAN}, {PORT} -> {PORT, VLAN}, {VLAN} -> {PORT, VLAN}
+        self.assertEqual(4, move_wrapper.stats.validations)
+        self.assertEqual(1, move_wrapper.stats.cache_hits)
+        self.assertEqual(3, len(validator.configs))
+
+    def test_validate_all__sequential__lazy_and_ordered(self):
+        # Arrange
+        validator = ps.DeleteWholeConfigMoveValidator()
+        move_wrapper = ps.MoveWrapper([], [], [], [validator])
+        remove_all = JsonMoveGroup("", ps.JsonMove.from_operation({"op": "remove", "path": ""}))
+        add_table = JsonMoveGroup("", ps.JsonMove.from_operation({"op": "add", "path": "/PORT", "value": {}}))
+        diff = ps.Diff({"VLAN": {}}, {"PORT": {}})
+
+        # Act
+        results = move_wrapper.validate_all(iter([remove_all, add_table]), diff)
+        first = next(results)
+
+        # Assert
+        self.assertEqual((remove_all, False, "DeleteWholeConfigMoveValidator failed"), first)
+        self.assertEqual(1, move_wrapper.stats.validations)
+        self.assertEqual((add_table, True, None), next(results))
+        self.assertEqual(2, move_wrapper.stats.validators["DeleteWholeConfigMoveValidator"][0])
+        self.assertEqual("Move validations: 2 run, 0 cache hits", move_wrapper.stats.summary()[0])
+
+    def test_validate_all__validation_workers__same_results_as_sequential(self):
+        # Arrange
+        moves = [JsonMoveGroup("", ps.JsonMove.from_operation({"op": "remove", "path": ""}))]
+        moves += [JsonMoveGroup("", ps.JsonMove.from_operation({"op": "add", "path": f"/PORT{i}", "value": {}}))
+                  for i in range(5)]
+        diff = ps.Diff({"VLAN": {}}, {"PORT": {}})
+        sequential = ps.MoveWrapper([], [], [], [ps.DeleteWholeConfigMoveValidator()])
+        parallel = ps.MoveWrapper([], [], [], [ps.DeleteWholeConfigMoveValidator()], validation_workers=2)
+
+        # Act
+        expected = list(sequential.validate_all(moves, diff))
+        try:
+            actual = list(parallel.validate_all(moves, diff))
+        finally:
+            parallel.close()
+
+        # Assert
+        self.assertEqual(expected, actual)
+        self.assertEqual(6, parallel.stats.validations)
+        self.assertEqual(0, parallel.stats.cache_hits)
+        self.assertIsNone(parallel.pool)
+
+    def test_validate_all__validation_workers__pool_kept_for_same_target(self):
+        # Arrange
+        moves = [JsonMoveGroup("", ps.JsonMove.from_operation({"op": "add", "path": f"/PORT{i}", "value": {}}))
+                 for i in range(2)]
+        target = {"PORT": {}}
+        diff1 = ps.Diff({"VLAN": {}}, target)
+        diff2 = ps.Diff({"ACL_TABLE": {}}, target)
+        diff3 = ps.Diff({"ACL_TABLE": {}}, {"VLAN": {}})
+        validator = SimulatedConfigOnlyValidator()
+        move_wrapper = ps.MoveWrapper([], [], [], [validator], validation_workers=2)
+
+        # Act and assert
+        try:
+            list(move_wrapper.validate_all(moves, diff1))
+            first_pool = move_wrapper.pool
+            self.assertIsNotNone(first_pool)
+
+            self.assertEqual([(move, True, None) for move in moves], list(move_wrapper.validate_all(moves, diff2)))
+            self.assertIs(first_pool, move_wrapper.pool)
+            self.assertEqual(4, move_wrapper.stats.validations)
+
+            list(move_wrapper.validate_all(moves, diff3))
+            self.assertIsNot(first_pool, move_wrapper.pool)
+        finally:
+            move_wrapper.close()
+        self.assertIsNone(move_wrapper.pool)
+        # Validated in the workers
+        self.assertEqual([], validator.configs)
+
+    def test_validate_all__validation_workers_with_threads_running__validated_in_process(self):
+        # Arrange
+        move = JsonMoveGroup("", ps.JsonMove.from_operation({"op": "add", "path": "/PORT", "value": {}}))
+        validator = SimulatedConfigOnlyValidator()
+        move_wrapper = ps.MoveWrapper([], [], [], [validator], validation_workers=2)
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+
+        # Act
+        try:
+            actual = list(move_wrapper.validate_all([move], ps.Diff({}, {"PORT": {}})))
+        finally:
+            stop.set()
+            thread.join()
+
+        # Assert
+        self.assertEqual([(move, True, None)], actual)
+        self.assertIsNone(move_wrapper.pool)
+        self.assertEqual([{"PORT": {}}], validator.configs)
+
     def test_simulate__applies_move(self):
         # Arrange
         diff = Mock()
@@ -0,0 +1,163 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import sonic_yang
+
+import generic_config_updater.gu_common as gu_common
+import generic_config_updater.yang_cache as yang_cache
+
+MODULES = {
+    "sonic-port.yang": "module sonic-port { container sonic-port { container PORT; } }",
+    "sonic-vlan.yang": "module sonic-vlan { container sonic-vlan { container VLAN; } }",
+}
+
+
+class FakeSonicYang:
+    """Stand-in of the SonicYang model loading, recording what is loaded"""
+
+    def __init__(self, yang_dir):
+        self.yang_dir = yang_dir
+        self.yangFiles = []
+        self.yJson = []
+        self.confDbYangMap = {}
+        self.schema_modules = []
+        self.full_loads = 0
+
+    def loadYangModel(self):
+        self.full_loads += 1
+        self.yangFiles = yang_cache.get_yang_files(self.yang_dir)
+        for path in self.yangFiles:
+            self._load_schema_module(path)
+        self.yangFiles = [os.path.basename(f).split('.')[0] for f in self.yangFiles]
+        self.yJson = [{"module": {"@name": name, "container": {"@name": name}}} for name in self.yangFiles]
+        self._createDBTableToModuleMap()
+
+    def _load_schema_module(self, path):
+        self.schema_modules.append(os.path.basename(path))
+        return path if os.path.exists(path) else None
+
+    def _createDBTableToModuleMap(self):
+        for j in self.yJson:
+            self.confDbYangMap[j["module"]["@name"]] = {"module": j["module"]["@name"], "yangModule": j["module"]}
+
+
+class TestYangCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.yang_dir = os.path.join(self.tmp_dir, "yang-models")
+        os.mkdir(self.yang_dir)
+        for name, text in MODULES.items():
+            self.write_module(name, text)
+        self.cache_path = os.path.join(self.tmp_dir, "cache", "yang_models.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_module(self, name, text):
+        with open(os.path.join(self.yang_dir, name), 'w') as f:
+            f.write(text)
+
+    def load(self):
+        return yang_cache.load_yang_models(FakeSonicYang(self.yang_dir), self.cache_path)
+
+    def test_load__cache_miss__loads_models_and_saves_cache(self):
+        sy = self.load()
+
+        self.assertEqual(1, sy.full_loads)
+        self.assertTrue(os.path.exists(self.cache_path))
+        self.assertEqual(0o644, os.stat(self.cache_path).st_mode & 0o777)
+
+    def test_load__cache_hit__takes_parsed_models_from_cache(self):
+        expected = self.load()
+
+        sy = self.load()
+
+        self.assertEqual(0, sy.full_loads)
+        self.assertCountEqual(MODULES, sy.schema_modules)
+        self.assertEqual(expected.yangFiles, sy.yangFiles)
+        self.assertEqual(expected.yJson, sy.yJson)
+        self.assertEqual(expected.confDbYangMap, sy.confDbYangMap)
+
+    def test_load__module_changed__rebuilds_cache(self):
+        self.load()
+        self.write_module("sonic-vlan.yang", MODULES["sonic-vlan.yang"] + "\n")
+
+        self.assertEqual(1, self.load().full_loads)
+        self.assertEqual(0, self.load().full_loads)
+
+    def test_load__module_added__rebuilds_cache(self):
+        self.load()
+        self.write_module("sonic-acl.yang", "module sonic-acl { container sonic-acl { container ACL_TABLE; } }")
+
+        sy = self.load()
+
+        self.assertEqual(1, sy.full_loads)
+        self.assertIn("sonic-acl", sy.confDbYangMap)
+
+    def test_load__cache_writable_by_others__not_used(self):
+        self.load()
+        os.chmod(self.cache_path, 0o666)
+
+        self.assertEqual(1, self.load().full_loads)
+
+    def test_load__corrupt_cache__rebuilds_cache(self):
+        self.load()
+        with open(self.cache_path, 'w') as f:
+            f.write("{not json")
+
+        self.assertEqual(1, self.load().full_loads)
+        self.assertEqual(0, self.load().full_loads)
+
+    def test_load__cache_not_writable__loads_models(self):
+        blocker = os.path.join(self.tmp_dir, "file")
+        open(blocker, 'w').close()
+        self.cache_path = os.path.join(blocker, "yang_models.json")
+
+        self.assertEqual(1, self.load().full_loads)
+        self.assertEqual(1, self.load().full_loads)
+
+    def test_load__module_missing_on_hit__raises(self):
+        self.load()
+        cache = yang_cache.read_cache(self.cache_path, yang_cache.yang_dir_digest(
+            yang_cache.get_yang_files(self.yang_dir)))
+        sy = FakeSonicYang(self.yang_dir)
+        sy._load_schema_module = lambda path: None
+
+        with mock.patch.object(yang_cache, 'read_cache', return_value=cache):
+            with self.assertRaises(sonic_yang.SonicYangException):
+                yang_cache.load_yang_models(sy, self.cache_path)
+
+    def test_load__cache_disabled__loads_models(self):
+        with mock.patch.object(yang_cache, 'YANG_CACHE_PATH', None):
+            sy = yang_cache.load_yang_models(FakeSonicYang(self.yang_dir))
+
+        self.assertEqual(1, sy.full_loads)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+
+class TestYangCacheSonicYang(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.tmp_dir, "yang_models.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_load__cache_hit__same_models_as_load_yang_model(self):
+        expected = sonic_yang.SonicYang(gu_common.YANG_DIR)
+        expected.loadYangModel()
+        yang_cache.load_yang_models(sonic_yang.SonicYang(gu_common.YANG_DIR), self.cache_path)
+
+        with mock.patch.object(sonic_yang.SonicYang, 'loadYangModel') as mock_load:
+            sy = yang_cache.load_yang_models(sonic_yang.SonicYang(gu_common.YANG_DIR), self.cache_path)
+            mock_load.assert_not_called()
+
+        self.assertEqual(expected.yangFiles, sy.yangFiles)
+        self.assertEqual(expected.yJson, sy.yJson)
+        self.assertEqual(list(expected.confDbYangMap), list(sy.confDbYangMap))
+        # The libyang context of the cached load validates config
+        sy.loadData({"DEVICE_METADATA": {"localhost": {"hostname": "sonic"}}})
+        sy.validate_data_tree()
@@ -5,6 +5,7 @@ import pytest
 
 import sonic_installer.bootloader.bmc_uboot as bmc
 import sonic_installer.bootloader.uboot as generic_uboot
+from sonic_installer.download import ImageInfo
 
 
 def fake_verify_popen(tar_rc, grep_rc):
@@ -242,3 +243,22 @@ def test_get_bootloader_prefers_bmc_over_grub_when_both_detect():
     with patch('sonic_installer.bootloader.bmc_uboot.is_bmc', return_value=True), \
          patch('sonic_installer.bootloader.grub.os.path.isfile', return_value=True):
         assert isinstance(loader.get_bootloader(), bmc.BmcUbootBootloader)
+
+
+def test_verify_image_platform_image_info():
+    b = bmc.BmcUbootBootloader()
+    with patch('sonic_installer.bootloader.bmc_uboot.os.path.isfile', return_value=True), \
+         patch('sonic_installer.bootloader.bmc_uboot.device_info.get_platform',
+               return_value='arm64-plat-r0'), \
+         patch('sonic_installer.bootloader.bmc_uboot.subprocess.Popen') as mock_popen:
+        info = ImageInfo(1, 'digest', '1.0', ['arm64-plat-r0'], True)
+        assert b.verify_image_platform('/img.bin', info) is True
+        info.platforms = ['arm64-other-r0']
+        assert b.verify_image_platform('/img.bin', info) is False
+        # missing platforms_asic -> FAIL CLOSED
+        info.platforms = None
+        assert b.verify_image_platform('/img.bin', info) is False
+        mock_popen.assert_not_called()
+        # payload not scanned -> falls back to sed|tar|grep
+        mock_popen.side_effect = fake_verify_popen(tar_rc=0, grep_rc=0)
+        assert b.verify_image_platform('/img.bin', ImageInfo(1, 'digest')) is True
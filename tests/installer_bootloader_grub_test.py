@@ -4,6 +4,7 @@ from unittest.mock import Mock, patch, call
 
 # Import test module
 import sonic_installer.bootloader.grub as grub
+from sonic_installer.download import ImageInfo
 
 installed_images = [
     f'{grub.IMAGE_PREFIX}expeliarmus-{grub.IMAGE_PREFIX}abcde',
@@ -130,3 +131,18 @@ def test_verify_image():
     assert not bootloader.is_secure_upgrade_image_verification_supported()
     # command should fail
     assert not bootloader.verify_image_sign(image)
+
+
+def test_verify_image_platform_image_info():
+    bootloader = grub.GrubBootloader()
+    with patch('sonic_installer.bootloader.grub.os.path.isfile', return_value=True), \
+         patch('sonic_installer.bootloader.grub.device_info.get_platform', return_value='x86_64-plat-r0'), \
+         patch('sonic_installer.bootloader.grub.subprocess.Popen') as mock_popen:
+        info = ImageInfo(1, 'digest', '1.0', ['x86_64-other-r0', 'x86_64-plat-r0'], True)
+        assert bootloader.verify_image_platform('/img.bin', info)
+        info.platforms = ['x86_64-other-r0']
+        assert not bootloader.verify_image_platform('/img.bin', info)
+        # Images without platforms_asic are accepted
+        info.platforms = None
+        assert bootloader.verify_image_platform('/img.bin', info)
+        mock_popen.assert_not_called()
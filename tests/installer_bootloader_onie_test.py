@@ -2,6 +2,7 @@ from unittest.mock import Mock, patch
 
 # Import test module
 import sonic_installer.bootloader.onie as onie
+from sonic_installer.download import ImageInfo
 
 
 @patch("sonic_installer.bootloader.onie.re.search")
@@ -25,4 +26,12 @@ def test_verify_image_sign():
     except NotImplementedError:
         assert not is_supported
     else:
-        assert False, "Wrong return value from verify_image_sign, returned" + str(return_value)
\ No newline at end of file
+        assert False, "Wrong return value from verify_image_sign, returned" + str(return_value)
+
+
+def test_get_binary_image_version_image_info():
+    bootloader = onie.OnieInstallerBootloader()
+    with patch("sonic_installer.bootloader.onie.subprocess.Popen") as mock_popen:
+        info = ImageInfo(1, 'digest', '202505.1')
+        assert bootloader.get_binary_image_version('/tmp/sonic_image', info) == onie.IMAGE_PREFIX + '202505.1'
+        mock_popen.assert_not_called()
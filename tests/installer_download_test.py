@@ -0,0 +1,239 @@
+import hashlib
+import io
+import json
+import os
+import tarfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sonic_installer import download
+
+PLATFORMS = ["x86_64-accton_as7712_32x-r0", "x86_64-mlnx_msn2700-r0"]
+
+
+def make_image(version="202505.1", platforms=PLATFORMS, payload_size=300000):
+    """ Build a signed ONIE installer image: sharch script, tar payload, signature """
+    payload = io.BytesIO()
+    with tarfile.open(fileobj=payload, mode='w') as tar:
+        members = [("installer/install.sh", b"#!/bin/sh\n"),
+                   ("installer/fs.zip", os.urandom(payload_size))]
+        if platforms is not None:
+            members.insert(1, (download.PLATFORMS_ASIC, "".join(p + "\n" for p in platforms).encode()))
+        for name, data in members:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    payload = payload.getvalue()
+    header = ('#!/bin/sh\n'
+              'image_version="{}"\n'
+              'payload_image_size={}\n'
+              'echo "Installing SONiC"\n'
+              'exit 0\n'
+              'exit_marker\n').format(version, len(payload)).encode()
+    return header + payload + b"-----BEGIN CMS-----\nMIAGCSqGSIb3DQEHAqCAMIACAQExDTAL\n-----END CMS-----\n"
+
+
+class ImageServer(object):
+    """ Local HTTP server of one image, with range requests and dropped connections """
+
+    def __init__(self, image, etag='"v1"'):
+        self.image = image
+        self.etag = etag
+        self.ranges = []
+        self.if_ranges = []
+        # Number of bytes sent before the connection is dropped, per request
+        self.drop_after = []
+        self.honor_range = True
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                start = 0
+                header = self.headers.get('Range')
+                server.ranges.append(header)
+                server.if_ranges.append(self.headers.get('If-Range'))
+                if_range = self.headers.get('If-Range')
+                if header and server.honor_range and (if_range is None or if_range == server.etag):
+                    start = int(header[len('bytes='):].rstrip('-'))
+                    if start >= len(server.image):
+                        self.send_response(416)
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header('Content-Range', 'bytes {}-{}/{}'.format(
+                        start, len(server.image) - 1, len(server.image)))
+                else:
+                    self.send_response(200)
+                if server.etag:
+                    self.send_header('ETag', server.etag)
+                body = server.image[start:]
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if server.drop_after:
+                    body = body[:server.drop_after.pop(0)]
+                self.wfile.write(body)
+                self.close_connection = True
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = 'http://127.0.0.1:{}/sonic.bin'.format(self.httpd.server_address[1])
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture(scope='module')
+def image():
+    return make_image()
+
+
+def write_part(path, data, url, validator='"v1"'):
+    with open(path + download.PART_SUFFIX, 'wb') as f:
+        f.write(data)
+    with open(path + download.PART_META_SUFFIX, 'w') as f:
+        json.dump({'url': url, 'validator': validator}, f)
+
+
+def check_info(info, image):
+    assert info.size == len(image)
+    assert info.sha256 == hashlib.sha256(image).hexdigest()
+    assert info.version == "202505.1"
+    assert info.platforms == PLATFORMS
+    assert info.payload_scanned
+
+
+@pytest.mark.parametrize("chunk_size", [7, 512, 4096, 1 << 20])
+def test_scanner(image, chunk_size):
+    scanner = download.ImageScanner()
+    for i in range(0, len(image), chunk_size):
+        scanner.feed(image[i:i + chunk_size])
+    assert scanner.version == "202505.1"
+    assert scanner.platforms == PLATFORMS
+    assert scanner.payload_scanned
+
+
+def test_scanner_no_platforms_asic():
+    scanner = download.ImageScanner()
+    scanner.feed(make_image(platforms=None, payload_size=1000))
+    assert scanner.platforms is None
+    assert scanner.payload_scanned
+
+
+def test_scanner_not_onie_image():
+    scanner = download.ImageScanner()
+    data = b"PK\x03\x04" + os.urandom(2 * download.MAX_HEADER_SIZE)
+    for i in range(0, len(data), download.CHUNK_SIZE // 4):
+        scanner.feed(data[i:i + download.CHUNK_SIZE // 4])
+    assert scanner.version is None
+    assert not scanner.payload_scanned
+    assert len(scanner.header) == 0
+
+
+def test_download(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    reports = []
+    with ImageServer(image) as server:
+        info = download.download_image(server.url, path, lambda *args: reports.append(args))
+    check_info(info, image)
+    with open(path, 'rb') as f:
+        assert f.read() == image
+    assert not os.path.exists(path + download.PART_SUFFIX)
+    assert not os.path.exists(path + download.PART_META_SUFFIX)
+    assert server.ranges == [None]
+    assert reports[0] == (0, 1, len(image)) and reports[-1] == (len(image), 1, len(image))
+
+
+def test_download_resumes_after_interruption(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with ImageServer(image) as server:
+        server.drop_after = [100000, 50000]
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    with open(path, 'rb') as f:
+        assert f.read() == image
+    assert server.ranges == [None, 'bytes=100000-', 'bytes=150000-']
+    assert server.if_ranges == [None, '"v1"', '"v1"']
+
+
+def test_download_resumes_partial_file(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with ImageServer(image) as server:
+        write_part(path, image[:123456], server.url)
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    assert server.ranges == ['bytes=123456-']
+    assert server.if_ranges == ['"v1"']
+
+
+def test_download_partial_file_of_other_url(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with ImageServer(image) as server:
+        write_part(path, make_image(version="202411.1", payload_size=1000), server.url + ".old")
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    assert server.ranges == [None]
+
+
+def test_download_partial_file_without_meta(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with open(path + download.PART_SUFFIX, 'wb') as f:
+        f.write(image[:123456])
+    with ImageServer(image) as server:
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    assert server.ranges == [None]
+
+
+def test_download_image_changed_on_server(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    old_image = make_image(version="202411.1", payload_size=1000)
+    with ImageServer(image, etag='"v2"') as server:
+        write_part(path, old_image, server.url)
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    with open(path, 'rb') as f:
+        assert f.read() == image
+    # The server answers the range request with the whole new image
+    assert server.ranges == ['bytes={}-'.format(len(old_image))]
+    assert server.if_ranges == ['"v1"']
+
+
+def test_download_range_not_supported(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with ImageServer(image) as server:
+        write_part(path, b"stale" * 1000, server.url)
+        server.honor_range = False
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    with open(path, 'rb') as f:
+        assert f.read() == image
+
+
+def test_download_partial_file_too_long(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with ImageServer(image) as server:
+        write_part(path, image + b"garbage", server.url)
+        info = download.download_image(server.url, path)
+    check_info(info, image)
+    assert server.ranges == ['bytes={}-'.format(len(image) + 7), None]
+
+
+def test_download_gives_up(tmp_path, image):
+    path = str(tmp_path / "sonic_image")
+    with ImageServer(image) as server:
+        server.drop_after = [1000, 0, 0, 0]
+        with pytest.raises(download.DownloadError):
+            download.download_image(server.url, path, retries=2)
+    assert not os.path.exists(path)
+    with open(path + download.PART_SUFFIX, 'rb') as f:
+        assert f.read() == image[:1000]
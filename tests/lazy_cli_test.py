@@ -0,0 +1,278 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import click
+import pytest
+from click.testing import CliRunner
+
+import utilities_common.cli as clicommon
+from utilities_common import cli_manifest
+
+modules_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMMANDS_MODULE = '''
+import click
+
+
+@click.group()
+def vlan():
+    """Show VLAN information"""
+    pass
+
+
+@vlan.command()
+def brief():
+    """Show all bridge information"""
+    click.echo("Vlan1000")
+
+
+@click.command()
+def version():
+    """Show version information
+
+    Also shows the docker images.
+    """
+    click.echo("SONiC.master")
+'''
+
+PLUGIN_MODULE = '''
+import click
+
+
+@click.command()
+def mlnx():
+    """Mellanox platform specific information"""
+    click.echo("sniffer")
+
+
+def register(cli):
+    cli.commands['vlan'].add_command(mlnx)
+    cli.add_command(click.Command('pbh', help='Show PBH information', callback=lambda: click.echo('pbh')))
+'''
+
+LAZY_COMMANDS = ['lazycmds.commands:vlan', 'lazycmds.commands:version']
+
+
+@pytest.fixture
+def lazycmds(tmp_path, monkeypatch):
+    """Package of commands which is not imported yet"""
+    package = tmp_path / 'lazycmds'
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    (package / 'commands.py').write_text(textwrap.dedent(COMMANDS_MODULE))
+    (package / 'plugins').mkdir()
+    (package / 'plugins' / '__init__.py').write_text('')
+    (package / 'plugins' / 'plugin.py').write_text(textwrap.dedent(PLUGIN_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in list(sys.modules):
+        if name.startswith('lazycmds'):
+            del sys.modules[name]
+
+
+def make_cli(manifest, conditions=None, with_plugin=False, plugin_manifest=None):
+    @click.group(cls=clicommon.LazyGroup)
+    def cli():
+        """SONiC command line - 'show' command"""
+        pass
+
+    @cli.command()
+    def clock():
+        """Show date and time"""
+        click.echo("Mon 01 Jan 2024")
+
+    cli.add_lazy_commands(LAZY_COMMANDS, manifest, conditions)
+    if with_plugin:
+        cli.defer(lambda: clicommon.import_command('lazycmds.plugins.plugin:register')(cli), plugin_manifest)
+    return cli
+
+
+def build_plugin_manifest():
+    import lazycmds.plugins
+    manifest = cli_manifest.build_plugin_manifest(lazycmds.plugins)
+    del sys.modules['lazycmds.plugins.plugin']
+    return clicommon.plugin_manifest(lazycmds.plugins, manifest)
+
+
+class TestLazyGroup(object):
+    def test_invoke__imports_command_module(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS))
+        del sys.modules['lazycmds.commands']
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ['clock'])
+        assert result.exit_code == 0
+        assert 'lazycmds.commands' not in sys.modules
+
+        result = runner.invoke(cli, ['vlan', 'brief'])
+        assert result.exit_code == 0
+        assert result.output == 'Vlan1000\n'
+        assert 'lazycmds.commands' in sys.modules
+
+    def test_help__lists_commands_without_importing(self, lazycmds):
+        manifest = cli_manifest.build_manifest(LAZY_COMMANDS)
+        del sys.modules['lazycmds.commands']
+        cli = make_cli(manifest)
+
+        result = CliRunner().invoke(cli, ['--help'])
+
+        assert result.exit_code == 0
+        assert 'lazycmds.commands' not in sys.modules
+        commands = result.output.split('Commands:\n')[1]
+        assert commands.split() == ['clock', 'Show', 'date', 'and', 'time',
+                                    'version', 'Show', 'version', 'information',
+                                    'vlan', 'Show', 'VLAN', 'information']
+
+    def test_help__same_as_eager_group(self, lazycmds):
+        eager = make_cli({})
+        lazy = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS))
+
+        assert CliRunner().invoke(lazy, ['--help']).output == CliRunner().invoke(eager, ['--help']).output
+
+    def test_abbreviation__matches_lazy_command(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS))
+
+        result = CliRunner().invoke(cli, ['vl', 'brief'])
+
+        assert result.exit_code == 0
+        assert result.output == 'Vlan1000\n'
+
+    def test_condition__false__command_not_registered(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS),
+                       conditions={'lazycmds.commands:vlan': lambda: False})
+
+        assert 'vlan' not in cli.commands
+        assert sorted(cli.commands) == ['clock', 'version']
+        assert CliRunner().invoke(cli, ['vlan']).exit_code != 0
+
+    def test_not_in_manifest__imported_now(self, lazycmds):
+        cli = make_cli({})
+
+        assert 'lazycmds.commands' in sys.modules
+        assert sorted(cli.commands) == ['clock', 'version', 'vlan']
+
+    def test_deferred__runs_when_command_could_be_theirs(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS), with_plugin=True)
+        runner = CliRunner()
+
+        assert runner.invoke(cli, ['version']).exit_code == 0
+        assert 'lazycmds.plugins.plugin' not in sys.modules
+
+        # A plugin can add subcommands to a group
+        result = runner.invoke(cli, ['vlan', 'mlnx'])
+        assert result.exit_code == 0
+        assert result.output == 'sniffer\n'
+        assert 'pbh' in cli.commands
+
+    def test_deferred__runs_for_unknown_command(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS), with_plugin=True)
+
+        result = CliRunner().invoke(cli, ['pbh'])
+
+        assert result.exit_code == 0
+        assert result.output == 'pbh\n'
+
+    def test_deferred_manifest__help_lists_plugin_commands_without_loading(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS), with_plugin=True,
+                       plugin_manifest=build_plugin_manifest())
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ['--help'])
+        assert result.exit_code == 0
+        assert 'pbh      Show PBH information' in result.output
+        assert runner.invoke(cli, ['vlan', 'brief']).exit_code == 0
+        assert runner.invoke(cli, ['missing']).exit_code != 0
+        assert 'lazycmds.plugins.plugin' not in sys.modules
+
+        result = runner.invoke(cli, ['pbh'])
+        assert result.exit_code == 0
+        assert result.output == 'pbh\n'
+        assert 'lazycmds.plugins.plugin' in sys.modules
+        assert runner.invoke(cli, ['vlan', 'mlnx']).output == 'sniffer\n'
+
+    def test_deferred_manifest__missing_subcommand__loads_plugins(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS), with_plugin=True,
+                       plugin_manifest=build_plugin_manifest())
+
+        result = CliRunner().invoke(cli, ['vlan', 'mlnx'])
+
+        assert result.exit_code == 0
+        assert result.output == 'sniffer\n'
+
+    def test_plugin_manifest__plugin_not_in_manifest__none(self, lazycmds):
+        import lazycmds.plugins
+        auto = os.path.join(lazycmds.plugins.__path__[0], 'auto')
+        os.mkdir(auto)
+        with open(os.path.join(auto, '__init__.py'), 'w'):
+            pass
+        with open(os.path.join(auto, 'installed.py'), 'w') as f:
+            f.write(textwrap.dedent(PLUGIN_MODULE))
+        manifest = {'lazycmds.plugins.plugin': {'pbh': {'name': 'pbh'}}}
+
+        assert clicommon.plugin_module_names(lazycmds.plugins) == ['lazycmds.plugins.auto.installed',
+                                                                   'lazycmds.plugins.plugin']
+        assert clicommon.plugin_manifest(lazycmds.plugins, manifest) is None
+        manifest['lazycmds.plugins.auto.installed'] = {}
+        assert clicommon.plugin_manifest(lazycmds.plugins, manifest) == {'pbh': {'name': 'pbh'}}
+        assert 'lazycmds.plugins.auto' not in sys.modules
+
+    def test_commands__behaves_as_dict(self, lazycmds):
+        cli = make_cli(cli_manifest.build_manifest(LAZY_COMMANDS), with_plugin=True)
+
+        assert cli.commands['vlan'].name == 'vlan'
+        assert cli.commands.get('missing') is None
+        with pytest.raises(KeyError):
+            cli.commands['missing']
+        assert sorted(cli.commands) == ['clock', 'pbh', 'version', 'vlan']
+        assert len(cli.commands) == 4
+        assert sorted(name for name, _ in cli.commands.items()) == ['clock', 'pbh', 'version', 'vlan']
+
+        del cli.commands['version']
+        assert 'version' not in cli.commands
+
+    def test_shell_complete__completes_without_importing(self, lazycmds):
+        manifest = cli_manifest.build_manifest(LAZY_COMMANDS)
+        del sys.modules['lazycmds.commands']
+        cli = make_cli(manifest)
+
+        with cli.make_context('show', [], resilient_parsing=True) as ctx:
+            items = cli.shell_complete(ctx, 'v')
+
+        assert [(item.value, item.help) for item in items] == [
+            ('version', 'Show version information'), ('vlan', 'Show VLAN information')]
+        assert 'lazycmds.commands' not in sys.modules
+
+
+@pytest.mark.parametrize('cli', ['show', 'config'])
+def test_manifest__up_to_date(cli):
+    with open(cli_manifest.manifest_path(cli)) as f:
+        assert f.read() == cli_manifest.render_manifest(cli), \
+            "Run 'python -m utilities_common.cli_manifest {}'".format(cli)
+
+
+@pytest.mark.parametrize('cli, root, args, imported', [
+    ('show', 'cli', ['--help'], ''),
+    ('show', 'cli', ['ip', 'route', '--help'], ''),
+    ('show', 'cli', ['interfaces', 'status', '--help'], 'show.interfaces'),
+    ('config', 'config', ['--help'], ''),
+    ('config', 'config', ['interface', 'startup', '--help'], ''),
+])
+def test_startup__imports_only_invoked_command_module_and_no_plugin(cli, root, args, imported):
+    # In a new process: the test session has imported every command module
+    script = textwrap.dedent('''
+        import sys
+        import {cli}.main as main
+        try:
+            main.{root}({args!r}, standalone_mode=False)
+        except SystemExit:
+            pass
+        print(" ".join(p.split(":")[0] for p in main.LAZY_COMMANDS if p.split(":")[0] in sys.modules))
+        print(" ".join(m for m in sys.modules if m.startswith("{cli}.plugins.")))
+    ''').format(cli=cli, root=root, args=args)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [modules_path, os.environ.get('PYTHONPATH')])))
+
+    output = subprocess.check_output([sys.executable, '-c', script], env=env, cwd=modules_path, text=True)
+
+    assert output.splitlines()[-2:] == [imported, '']
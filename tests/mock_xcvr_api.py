@@ -0,0 +1,110 @@
+"""
+Mock CMIS module and xcvr API for the firmware download paths of sfputil.
+
+MockXcvrApi keeps the image written through the CDB block writes and
+follows the firmware image states of a CMIS module through download, run
+and commit. Each block write can cost block_delay seconds, and modules
+created with the same bus lock hold it during every write, like modules
+behind one I2C bus, so the throughput of concurrent downloads can be
+measured without hardware.
+"""
+
+import threading
+import time
+
+
+class MockXcvrApi(object):
+    def __init__(self, start_lpl_size=0, max_block_size=2048, lpl_only=False,
+                 block_delay=0, bus_lock=None, fail_at_block=None):
+        self.start_lpl_size = start_lpl_size
+        self.max_block_size = max_block_size
+        self.lpl_only = lpl_only
+        self.block_delay = block_delay
+        self.bus_lock = bus_lock if bus_lock is not None else threading.Lock()
+        self.fail_at_block = fail_at_block
+        self.blocks = []
+        self.downloading = False
+        self.downloaded = None
+        # Image A runs and is committed, image B is the inactive one
+        self.running = 'A'
+        self.committed = 'A'
+        self.has_new_image = False
+        self.calls = []
+
+    def get_module_fw_mgmt_feature(self):
+        return {'status': True, 'feature': (self.start_lpl_size, self.max_block_size, self.lpl_only, False, 0)}
+
+    def cdb_start_firmware_download(self, filepath):
+        self.calls.append('start')
+        self.downloading = True
+        self.blocks = []
+        return 1
+
+    def _block_write(self, address, data):
+        if not self.downloading:
+            return 0
+        if self.fail_at_block is not None and len(self.blocks) == self.fail_at_block:
+            self.fail_at_block = None
+            return 0
+        with self.bus_lock:
+            if self.block_delay:
+                time.sleep(self.block_delay)
+        self.blocks.append((address, bytes(data)))
+        return 1
+
+    def cdb_lpl_block_write(self, address, data):
+        return self._block_write(address, data)
+
+    def cdb_epl_block_write(self, address, data):
+        return self._block_write(address, data)
+
+    def cdb_firmware_download_complete(self):
+        self.calls.append('complete')
+        if not self.downloading:
+            return 0
+        self.downloading = False
+        self.downloaded = b''.join(data for _, data in self.blocks)
+        self.has_new_image = True
+        return 1
+
+    def cdb_run_firmware(self, mode):
+        self.calls.append('run')
+        if not self.has_new_image:
+            return 0
+        self.running = 'B' if self.running == 'A' else 'A'
+        return 1
+
+    def cdb_commit_firmware(self):
+        self.calls.append('commit')
+        self.committed = self.running
+        return 1
+
+    def get_module_fw_info(self):
+        a_running = int(self.running == 'A')
+        b_running = int(self.running == 'B')
+        return {'status': True,
+                'info': 'Image A running' if a_running else 'Image B running',
+                'result': ('1.0.0', a_running, int(self.committed == 'A'), 0,
+                           '2.0.0', b_running, int(self.committed == 'B'), 0,
+                           '1.0.0', '2.0.0')}
+
+
+class MockSfp(object):
+    def __init__(self, api, eeprom_path=None):
+        self.api = api
+        self.eeprom_path = eeprom_path
+        self.optoe_write_max = 1
+
+    def get_xcvr_api(self):
+        return self.api
+
+    def get_presence(self):
+        return True
+
+    def get_eeprom_path(self):
+        if self.eeprom_path is None:
+            raise NotImplementedError
+        return self.eeprom_path
+
+    def set_optoe_write_max(self, write_max):
+        self.optoe_write_max = write_max
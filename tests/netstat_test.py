@@ -0,0 +1,62 @@
+import pytest
+
+from utilities_common import netstat
+from utilities_common.netstat import CounterDelta, STATUS_NA, ns_diff
+
+FIELDS = ['rx_ok', 'rx_byt', 'trim_drop']
+
+NEW = {
+    'Ethernet0': {'rx_ok': '1500', 'rx_byt': '9000000', 'trim_drop': '5'},
+    'Ethernet4': {'rx_ok': '10', 'rx_byt': STATUS_NA, 'trim_drop': '2'},
+    'Ethernet8': {'rx_ok': '18446744073709551615', 'rx_byt': '100', 'trim_drop': '0'},
+    'Ethernet12': {'rx_ok': '7', 'rx_byt': '70', 'trim_drop': '1'},
+    'time': '2025-01-01T00:00:00',
+}
+OLD = {
+    'Ethernet0': {'rx_ok': '500', 'rx_byt': '1000000', 'trim_drop': '3'},
+    # Counters cleared or wrapped since the snapshot
+    'Ethernet4': {'rx_ok': '20', 'rx_byt': '300', 'trim_drop': '4'},
+    'Ethernet8': {'rx_ok': '18446744073709551610', 'rx_byt': STATUS_NA, 'trim_drop': '0'},
+    'time': '2024-12-31T23:59:00',
+}
+ZERO = {field: '0' for field in FIELDS}
+
+
+@pytest.fixture(params=[True, False], ids=['numpy', 'fallback'])
+def engine(request, monkeypatch):
+    if request.param:
+        numpy = pytest.importorskip('numpy')
+        monkeypatch.setattr(netstat, 'numpy', numpy)
+    else:
+        monkeypatch.setattr(netstat, 'numpy', None)
+
+
+class TestCounterDelta(object):
+    def test_matches_ns_diff(self, engine):
+        deltas = CounterDelta(NEW, OLD)
+        assert deltas.keys == ['Ethernet0', 'Ethernet4', 'Ethernet8', 'Ethernet12']
+        for key in deltas.keys:
+            old = OLD.get(key, ZERO)
+            for field in FIELDS:
+                new_value, old_value = NEW[key][field], old[field]
+                assert deltas.diff(key, field) == ns_diff(new_value, old_value)
+                assert deltas.diff(key, field, raw=True) == ns_diff(new_value, old_value, raw=True)
+
+    def test_values(self, engine):
+        deltas = CounterDelta(NEW, OLD, keys=['Ethernet4', 'Ethernet0'])
+        assert deltas.diff('Ethernet0', 'rx_ok') == '1,000'
+        assert deltas.diff('Ethernet4', 'rx_ok') == '0'
+        assert deltas.diff('Ethernet4', 'trim_drop', raw=True) == '-2'
+        assert deltas.diff('Ethernet4', 'rx_byt') == STATUS_NA
+        assert deltas.column('rx_ok')['delta'] == [0, 1000]
+
+    def test_nonzero(self, engine):
+        deltas = CounterDelta(NEW, OLD)
+        assert deltas.nonzero('Ethernet0', ('rx_ok',))
+        assert not deltas.nonzero('Ethernet4', ('rx_ok', 'rx_byt', 'trim_drop'))
+        assert deltas.nonzero('Ethernet8', ('trim_drop', 'rx_ok'))
+
+    def test_missing_field(self, engine):
+        deltas = CounterDelta({'Ethernet0': {'rx_ok': '5'}}, {'Ethernet0': {}})
+        assert deltas.diff('Ethernet0', 'rx_ok') == '5'
+        assert deltas.diff('Ethernet0', 'tx_ok') == STATUS_NA
@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+
+from utilities_common.parallel import imap_ordered, TaskTimeout
+
+
+def test_serial():
+    calls = []
+
+    def func(item):
+        calls.append((item, threading.current_thread()))
+        return item * 2
+
+    assert list(imap_ordered(func, [3, 1, 2])) == [(3, 6, None), (1, 2, None), (2, 4, None)]
+    assert all(thread is threading.current_thread() for _, thread in calls)
+
+
+def test_ordered_with_workers():
+    # Item 0 only returns once item 1 ran, so they have to run concurrently
+    item_1_done = threading.Event()
+
+    def func(item):
+        if item == 0:
+            assert item_1_done.wait(5)
+        if item == 1:
+            item_1_done.set()
+        return item * 2
+
+    results = list(imap_ordered(func, range(4), workers=4))
+    assert results == [(0, 0, None), (1, 2, None), (2, 4, None), (3, 6, None)]
+
+
+def test_streams_before_slow_items():
+    release = threading.Event()
+
+    def func(item):
+        if item == 2:
+            release.wait(5)
+        return item
+
+    results = imap_ordered(func, range(3), workers=2)
+    assert next(results) == (0, 0, None)
+    assert next(results) == (1, 1, None)
+    release.set()
+    assert next(results) == (2, 2, None)
+
+
+def test_timeout():
+    release = threading.Event()
+
+    def func(item):
+        if item == 1:
+            release.wait(5)
+        return item
+
+    try:
+        results = list(imap_ordered(func, range(4), workers=1, timeout=0.05))
+    finally:
+        release.set()
+    assert results[0] == (0, 0, None)
+    assert results[1][0] == 1 and results[1][1] is None
+    assert isinstance(results[1][2], TaskTimeout)
+    assert results[2:] == [(2, 2, None), (3, 3, None)]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_exceptions(workers):
+    def func(item):
+        if item == 1:
+            raise ValueError("bad item")
+        return item
+
+    results = imap_ordered(func, range(3), workers=workers)
+    assert next(results) == (0, 0, None)
+    with pytest.raises(ValueError):
+        next(results)
+
+    results = list(imap_ordered(func, range(3), workers=workers, return_exceptions=True))
+    assert [result for _, result, _ in results] == [0, None, 2]
+    assert isinstance(results[1][2], ValueError)
+
+
+def test_system_exit_raised_in_caller():
+    def func(item):
+        if item == 2:
+            raise SystemExit(5)
+        return item
+
+    seen = []
+    with pytest.raises(SystemExit):
+        for item, _, _ in imap_ordered(func, range(4), workers=2, return_exceptions=True):
+            seen.append(item)
+    assert seen == [0, 1]
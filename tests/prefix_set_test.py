@@ -0,0 +1,66 @@
+import pytest
+
+from utilities_common.prefix_set import PrefixSet, diff_prefixes, prefix_key
+
+
+class TestPrefixSet(object):
+    def test_prefix_key(self):
+        assert prefix_key("10.0.0.1") == prefix_key("10.0.0.1/32")
+        assert prefix_key("2001:DB8::1") == prefix_key("2001:db8:0::1/128")
+        assert prefix_key("10.0.0.0/24") != prefix_key("10.0.0.0/25")
+        with pytest.raises(OSError):
+            prefix_key("2001:zz::/64")
+
+    def test_prefix_key_canonical(self):
+        prefix = "2001:db8::/64"
+        assert prefix_key(prefix) is prefix
+        assert prefix_key("2001:DB8:0::/064") == prefix
+
+    def test_original_text_kept(self):
+        appl = PrefixSet(["2001:DB8::1/128", "10.0.0.1", "2001:db8::2/128"])
+        appl_miss, _ = diff_prefixes(appl, ["2001:db8::2"])
+        assert appl_miss.sorted() == ["10.0.0.1", "2001:DB8::1/128"]
+        assert appl_miss.filter(lambda p: p.startswith("2001")).sorted() == ["2001:DB8::1/128"]
+        assert dict(appl_miss.items()) == {"10.0.0.1/32": "10.0.0.1",
+                                           "2001:db8::1/128": "2001:DB8::1/128"}
+
+    def test_diff(self):
+        appl = PrefixSet(["10.0.0.0/24", "10.0.1.0/24", "2001:db8::/64"])
+        asic = PrefixSet(["10.0.0.0/24", "2001:DB8::/64", "20.0.0.0/8"])
+        appl_miss, asic_miss = diff_prefixes(appl, asic)
+        assert appl_miss.sorted() == ["10.0.1.0/24"]
+        assert asic_miss.sorted() == ["20.0.0.0/8"]
+        assert appl.intersection(asic).sorted() == ["10.0.0.0/24", "2001:db8::/64"]
+
+    def test_diff_lists(self):
+        left, right = diff_prefixes(["1.1.1.1/32", "2.2.2.2/32"], ["2.2.2.2"])
+        assert left.sorted() == ["1.1.1.1/32"]
+        assert not right
+
+    def test_filter_exclude(self):
+        routes = PrefixSet(["0.0.0.0/0", "10.0.0.0/24", "192.168.0.3/32"])
+        assert routes.filter(lambda p: p != "0.0.0.0/0").sorted() == ["10.0.0.0/24", "192.168.0.3/32"]
+        assert routes.exclude(["192.168.0.3"]).sorted() == ["0.0.0.0/0", "10.0.0.0/24"]
+        assert len(routes.exclude([])) == 3
+
+    def test_vrf_partitions(self):
+        routes = PrefixSet(["10.0.0.0/24"])
+        routes.add("10.0.0.0/24", vrf="Vrf-red")
+        assert len(routes) == 2
+        assert routes.vrfs() == ["", "Vrf-red"]
+        assert routes.contains("10.0.0.0/24", vrf="Vrf-red")
+
+        other = PrefixSet(["10.0.0.0/24"])
+        miss = routes.difference(other)
+        assert miss.vrfs() == ["Vrf-red"]
+
+        routes.discard("10.0.0.0/24", vrf="Vrf-red")
+        assert not routes.contains("10.0.0.0/24", vrf="Vrf-red")
+        assert "10.0.0.0/24" in routes
+
+    def test_invalid_prefix(self):
+        routes = PrefixSet(["10.0.0.0/24", "2001:zz::/64", "2001:db8::/300"])
+        assert routes.invalid == ["2001:zz::/64", "2001:db8::/300"]
+        assert routes.contains("2001:ZZ::/64")
+        appl_miss, _ = diff_prefixes(routes, ["2001:zz::/64"])
+        assert appl_miss.sorted() == ["10.0.0.0/24", "2001:db8::/300"]
@@ -6,6 +6,7 @@ import syslog
 import sys
 import time
 from sonic_py_common import device_info
+from utilities_common.prefix_set import PrefixSet
 from unittest.mock import MagicMock, patch
 from tests.route_check_test_data import (
     APPL_DB, MULTI_ASIC, NAMESPACE, DEFAULTNS, ARGS, ASIC_DB, CONFIG_DB,
@@ -367,3 +368,83 @@ class TestRouteCheck(object):
             route_check.mitigate_installed_not_offloaded_frr_routes(namespace, missed_frr_rt, rt_appl)
         # Verify that the stdout are suppressed in this function
         assert not mock_stdout.getvalue()
+
+    @pytest.mark.parametrize("test_num", ["0", "1", "2"])
+    def test_route_check_daemon(self, mock_dbs, test_num):
+        self.init()
+        ct_data = copy.deepcopy(TEST_DATA[test_num])
+        ct_data[ARGS] += " -d"
+        set_test_case_data(ct_data)
+        self.run_test(ct_data)
+
+    def test_route_check_daemon_no_interval(self):
+        with patch('sys.argv', ['route_check', '-d']):
+            ret, res = route_check.main()
+        assert ret == -1
+        assert res is None
+
+    def test_route_index_incremental(self, mock_dbs):
+        ct_data = TEST_DATA['0']
+        set_test_case_data(ct_data)
+        init_db_conns(ct_data[NAMESPACE])
+
+        index = route_check.RouteIndex(DEFAULTNS)
+        assert index.needs_resync(0)
+        index.resync()
+        index.refresh()
+        assert not index.needs_resync(0)
+        assert index.rt_appl_miss == {"10.10.196.30/31"}
+        assert not index.rt_asic_miss
+        assert not index.intf_appl_miss
+
+        asic_subs = subscribers_returned["db_{}_{}_tbl_{}".format(DEFAULTNS, ASIC_DB, "ASIC_STATE")]
+        asic_subs.del_keys.append(
+            'SAI_OBJECT_TYPE_ROUTE_ENTRY:{"dest":"10.10.196.12/31","switch_id":"oid:0x21000000000000",'
+            '"vr":"oid:0x3000000000023"}')
+        index.drain()
+        assert index.dirty == {"10.10.196.12/31"}
+        index.refresh()
+        assert not index.dirty
+        assert index.rt_appl_miss == {"10.10.196.12/31", "10.10.196.30/31"}
+
+    def test_prefix_index_refcount(self):
+        index = route_check.PrefixIndex(route_check.checkout_appl_rt_entry, route_check.split_appl_rt_key)
+        assert index.update("10.1.0.0/24", "SET") == "10.1.0.0/24"
+        assert index.update("Vrf-red:10.1.0.0/24", "SET") == "10.1.0.0/24"
+        assert index.update("fe80::1/128", "SET") is None
+        assert index.update("10.1.0.0/24", "DEL") == "10.1.0.0/24"
+        assert "10.1.0.0/24" in index
+        assert index.update("Vrf-red:10.1.0.0/24", "DEL") == "10.1.0.0/24"
+        assert "10.1.0.0/24" not in index
+        assert len(index) == 0
+
+    def test_prefix_index_asic_keys(self):
+        key = 'SAI_OBJECT_TYPE_ROUTE_ENTRY:{{"dest":"{}","switch_id":"oid:0x21000000000000","vr":"{}"}}'
+        index = route_check.PrefixIndex(route_check.checkout_rt_entry, route_check.split_rt_key)
+        assert index.update(key.format("10.1.0.0/24", "oid:0x3000000000022"), "SET") == "10.1.0.0/24"
+        assert index.update(key.format("10.1.0.0/24", "oid:0x3000000000023"), "SET") == "10.1.0.0/24"
+        assert index.update(key.format("10.2.0.0/24", "oid:0x3000000000022"), "SET") == "10.2.0.0/24"
+        assert len(index.keys) == 3
+        assert index.update(key.format("10.1.0.0/24", "oid:0x3000000000022"), "DEL") == "10.1.0.0/24"
+        assert "10.1.0.0/24" in index
+        assert index.update(key.format("10.1.0.0/24", "oid:0x3000000000023"), "DEL") == "10.1.0.0/24"
+        assert "10.1.0.0/24" not in index
+        assert "10.2.0.0/24" in index
+
+    def test_split_key(self):
+        for k in ('SAI_OBJECT_TYPE_ROUTE_ENTRY:{"dest":"10.1.0.0/24","vr":"oid:0x3"}', "Vrf-red:fc00::/64",
+                  "fc00::/64", "Vrf-red", "Ethernet0:10.0.0.1/31", "Ethernet0"):
+            for split in (route_check.split_rt_key, route_check.split_appl_rt_key, route_check.split_intf_key):
+                assert "".join(split(k)) == k
+        assert route_check.split_appl_rt_key("Vrf-red:fc00::/64") == ("Vrf-red:", "fc00::/64", "")
+        assert route_check.split_appl_rt_key("fc00::/64") == ("", "fc00::/64", "")
+
+    def test_report_invalid_prefixes_once(self):
+        reported = set()
+        with patch('route_check.print_message') as mock_print:
+            for _ in range(2):
+                route_check.report_invalid_prefixes(PrefixSet(["2001:zz::/64"]), 'ROUTE_TABLE', reported)
+            route_check.report_invalid_prefixes(PrefixSet(["2001:zz::/64"]), 'INTF_TABLE', reported)
+            assert mock_print.call_count == 2
+            route_check.report_invalid_prefixes(PrefixSet(["2001:zz::/64"]), 'ROUTE_TABLE')
+            assert mock_print.call_count == 3
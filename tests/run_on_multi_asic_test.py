@@ -0,0 +1,69 @@
+import threading
+from unittest import mock
+
+import pytest
+
+from utilities_common import multi_asic as multi_asic_util
+
+NAMESPACES = ['asic0', 'asic1', 'asic2']
+
+
+class Collector(object):
+    def __init__(self):
+        with mock.patch('utilities_common.multi_asic.load_db_config'):
+            self.multi_asic = multi_asic_util.MultiAsic()
+        self.db = None
+        self.config_db = None
+        self.table = []
+        self.barrier = threading.Barrier(len(NAMESPACES), timeout=5)
+
+    @multi_asic_util.run_on_multi_asic
+    def collect(self):
+        self.table.append((self.multi_asic.current_namespace, self.db))
+
+    @multi_asic_util.run_on_multi_asic_parallel
+    def collect_parallel(self):
+        self.current = self.multi_asic.current_namespace
+        # Every namespace has to be in flight at once to pass the barrier
+        self.barrier.wait()
+        return [(self.current, self.multi_asic.current_namespace, self.db)]
+
+    @multi_asic_util.run_on_multi_asic_parallel
+    def collect_failing(self):
+        if self.multi_asic.current_namespace != 'asic0':
+            raise ValueError(self.multi_asic.current_namespace)
+        return []
+
+
+@pytest.fixture
+def collector():
+    def connect(ns):
+        return 'db-' + ns
+
+    with mock.patch.object(multi_asic_util.MultiAsic, 'get_ns_list_based_on_options', return_value=NAMESPACES), \
+            mock.patch.object(multi_asic_util.multi_asic, 'connect_to_all_dbs_for_ns', side_effect=connect), \
+            mock.patch.object(multi_asic_util.multi_asic, 'connect_config_db_for_ns', side_effect=connect):
+        yield Collector()
+
+
+def test_run_on_multi_asic(collector):
+    collector.collect()
+
+    assert collector.table == [('asic0', 'db-asic0'), ('asic1', 'db-asic1'), ('asic2', 'db-asic2')]
+    assert collector.multi_asic.current_namespace == 'asic2'
+
+
+def test_run_on_multi_asic_parallel(collector):
+    results = collector.collect_parallel()
+
+    assert results == [[(ns, ns, 'db-' + ns)] for ns in NAMESPACES]
+    # The state of the object is left alone, the connections are kept for reuse
+    assert collector.multi_asic.current_namespace is None
+    assert collector.db is None
+    assert not hasattr(collector, 'current')
+    assert collector.multi_asic.ns_connections == {ns: ('db-' + ns, 'db-' + ns) for ns in NAMESPACES}
+
+
+def test_run_on_multi_asic_parallel_raises_first_error(collector):
+    with pytest.raises(ValueError, match='asic1'):
+        collector.collect_failing()
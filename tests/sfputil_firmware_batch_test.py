@@ -0,0 +1,146 @@
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from sfputil import firmware_batch
+from sfputil.firmware_batch import FirmwareBatch, STATUS_DONE, STATUS_FAILED, STATUS_SKIPPED
+
+from .mock_xcvr_api import MockSfp, MockXcvrApi
+
+IMAGE = bytes(range(256)) * 20
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "fw.bin"
+    path.write_bytes(IMAGE)
+    return str(path)
+
+
+def make_ports(count, **kwargs):
+    return [("Ethernet{}".format(i * 8), MockSfp(MockXcvrApi(**kwargs)), None) for i in range(count)]
+
+
+class TestFirmwareBatch(object):
+    def test_upgrade(self, image_path):
+        written = []
+        batch = FirmwareBatch(image_path, max_parallel=4, progress=written.append)
+        ports = make_ports(6, start_lpl_size=112, max_block_size=1000)
+        assert batch.download_size(ports) == 6 * (len(IMAGE) - 112)
+        results = batch.run(ports)
+
+        assert sum(written) == 6 * (len(IMAGE) - 112)
+        for port, sfp, _ in ports:
+            assert results[port] == (STATUS_DONE, firmware_batch.STAGE_COMMIT, None)
+            assert sfp.api.downloaded == IMAGE[112:]
+            assert sfp.api.running == 'B' and sfp.api.committed == 'B'
+            assert sfp.api.calls == ['start', 'complete', 'run', 'commit']
+            assert sfp.optoe_write_max == 1
+
+    def test_lpl_only_block_size(self, image_path):
+        batch = FirmwareBatch(image_path, stages=firmware_batch.DOWNLOAD_STAGES)
+        ports = make_ports(1, max_block_size=2048, lpl_only=True)
+        results = batch.run(ports)
+        api = ports[0][1].api
+        assert results["Ethernet0"] == (STATUS_DONE, firmware_batch.STAGE_DOWNLOAD, None)
+        assert {len(data) for _, data in api.blocks[:-1]} == {firmware_batch.MAX_LPL_FIRMWARE_BLOCK_SIZE}
+        assert api.calls == ['start', 'complete']
+
+    def test_resume_after_failure(self, image_path, tmp_path):
+        state_path = str(tmp_path / "state.json")
+        ports = make_ports(3)
+        ports[1][1].api.fail_at_block = 1
+
+        results = FirmwareBatch(image_path, state_path=state_path).run(ports)
+        assert results["Ethernet0"][0] == STATUS_DONE
+        assert results["Ethernet8"] == (STATUS_FAILED, None, "CDB: firmware download failed! - status 0")
+        with open(state_path) as f:
+            state = json.load(f)
+        assert state['ports']["Ethernet16"]['stage'] == firmware_batch.STAGE_COMMIT
+
+        for _, sfp, _ in ports:
+            sfp.api.calls = []
+        written = []
+        batch = FirmwareBatch(image_path, state_path=state_path, progress=written.append)
+        assert batch.download_size(ports) == len(IMAGE)
+        results = batch.run(ports)
+        assert results["Ethernet0"] == (STATUS_SKIPPED, firmware_batch.STAGE_COMMIT, None)
+        assert results["Ethernet8"] == (STATUS_DONE, firmware_batch.STAGE_COMMIT, None)
+        assert ports[0][1].api.calls == []
+        assert ports[1][1].api.downloaded == IMAGE
+        assert sum(written) == len(IMAGE)
+
+    def test_resume_ignores_other_image(self, image_path, tmp_path):
+        state_path = str(tmp_path / "state.json")
+        FirmwareBatch(image_path, state_path=state_path).run(make_ports(1))
+        with open(image_path, 'wb') as f:
+            f.write(IMAGE[::-1])
+        batch = FirmwareBatch(image_path, state_path=state_path)
+        assert batch.pending_stages("Ethernet0") == firmware_batch.UPGRADE_STAGES
+
+    def test_resume_after_run_failure(self, image_path, tmp_path):
+        state_path = str(tmp_path / "state.json")
+        ports = make_ports(1)
+        api = ports[0][1].api
+        with patch.object(api, 'cdb_run_firmware', return_value=0):
+            results = FirmwareBatch(image_path, state_path=state_path).run(ports)
+        assert results["Ethernet0"] == (STATUS_FAILED, firmware_batch.STAGE_DOWNLOAD,
+                                        'Failed to run firmware in mode=0 ! CDB status: 0')
+
+        api.calls = []
+        results = FirmwareBatch(image_path, state_path=state_path).run(ports)
+        assert results["Ethernet0"] == (STATUS_DONE, firmware_batch.STAGE_COMMIT, None)
+        assert api.calls == ['run', 'commit']
+
+    @patch('sfputil.firmware_batch.time.sleep')
+    def test_switch_timeout(self, mock_sleep, image_path):
+        ports = make_ports(1)
+        with patch.object(ports[0][1].api, 'cdb_run_firmware', return_value=1), \
+                patch('sfputil.firmware_batch.time.time', side_effect=[0, 0, 61]):
+            results = FirmwareBatch(image_path).run(ports)
+        assert results["Ethernet0"] == (STATUS_FAILED, firmware_batch.STAGE_RUN, "FW switch : Timeout!")
+
+    def test_not_implemented(self, image_path):
+        ports = make_ports(1)
+        with patch.object(ports[0][1].api, 'get_module_fw_mgmt_feature', side_effect=NotImplementedError):
+            results = FirmwareBatch(image_path).run(ports)
+        assert results["Ethernet0"][0] == STATUS_FAILED
+
+    def test_group_bound(self, image_path):
+        active = {}
+        peak = {}
+        lock = threading.Lock()
+
+        class CountingApi(MockXcvrApi):
+            def cdb_start_firmware_download(self, filepath):
+                with lock:
+                    active[self.group] = active.get(self.group, 0) + 1
+                    peak[self.group] = max(peak.get(self.group, 0), active[self.group])
+                return super(CountingApi, self).cdb_start_firmware_download(filepath)
+
+            def cdb_firmware_download_complete(self):
+                with lock:
+                    active[self.group] -= 1
+                return super(CountingApi, self).cdb_firmware_download_complete()
+
+        ports = []
+        for i in range(8):
+            api = CountingApi(block_delay=0.001)
+            api.group = "i2c-{}".format(i % 2)
+            ports.append(("Ethernet{}".format(i * 8), MockSfp(api), api.group))
+        results = FirmwareBatch(image_path, stages=firmware_batch.DOWNLOAD_STAGES,
+                                max_parallel=8, per_group=2).run(ports)
+        assert all(status == STATUS_DONE for status, _, _ in results.values())
+        assert max(peak.values()) <= 2
+
+
+@pytest.mark.parametrize("fw_info, expected", [
+    ({'status': True, 'result': ("1.0.1", 1, 0, 0, "1.0.2", 0, 1, 0, "1.0.1", "1.0.2")}, 1),
+    ({'status': True, 'result': ("1.0.1", 1, 1, 0, "1.0.2", 0, 0, 0, "1.0.1", "1.0.2")}, None),
+    ({'status': True, 'result': ("1.0.1", 1, 0, 1, "1.0.2", 0, 1, 0, "1.0.1", "1.0.2")}, -1),
+    ({'status': False, 'result': 0}, None),
+])
+def test_check_fw_switch(fw_info, expected):
+    assert firmware_batch.check_fw_switch(fw_info)[0] == expected
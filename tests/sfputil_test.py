@@ -1,5 +1,6 @@
 import sys
 import os
+import threading
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -1190,6 +1191,62 @@ EEPROM hexdump for port Ethernet4
 """
         assert expected_output == result.output
 
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.platform_sfputil')
+    @patch('sfputil.main.logical_port_to_physical_port_index',
+           MagicMock(side_effect=lambda port: int(port[len('Ethernet'):]) // 4 + 1))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.isinstance', MagicMock(side_effect=lambda obj, cls: obj.api_class == cls.__name__))
+    def test_eeprom_hexdump_all_workers_archive(self, mock_sfputil, mock_chassis, tmp_path):
+        from sfputil import eeprom_archive
+
+        mock_sfputil.logical = ['Ethernet8', 'Ethernet4', 'Ethernet0']
+        mock_sfputil.is_logical_port.return_value = 1
+        eeproms = {port: bytes((port * 16 + x) % 256 for x in range(512)) for port in (1, 2, 3)}
+        sfps = {}
+        for port, eeprom in eeproms.items():
+            sfp = MagicMock()
+            sfp.get_presence.return_value = True
+            sfp.get_xcvr_api.return_value = MagicMock(api_class='Sff8472Api' if port == 2 else 'CmisApi')
+            sfp.get_xcvr_api.return_value.is_flat_memory.return_value = True
+            sfp.read_eeprom.side_effect = lambda offset, size, eeprom=eeprom: bytearray(eeprom[offset:offset + size])
+            sfps[port] = sfp
+        mock_chassis.get_sfp.side_effect = lambda port: sfps[port]
+
+        runner = CliRunner()
+        result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom-hexdump'])
+        assert result.exit_code == 0
+        serial_output = result.output
+        assert serial_output.index('port Ethernet0') < serial_output.index('port Ethernet4') < \
+            serial_output.index('port Ethernet8')
+
+        archive = str(tmp_path / "eeprom.bin")
+        result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom-hexdump'],
+                               ['--workers', '3', '--archive', archive])
+        assert result.exit_code == 0
+        assert result.output == serial_output
+
+        records = list(eeprom_archive.read_archive(archive))
+        assert [(port, page) for port, page, _, _, _ in records] == \
+            [('Ethernet0', 0), ('Ethernet0', 0), ('Ethernet4', 0), ('Ethernet8', 0), ('Ethernet8', 0)]
+        archived = eeprom_archive.load_archive(archive)
+        assert archived['Ethernet0'].read_eeprom(0, 256) == eeproms[1][:256]
+        assert archived['Ethernet4'].read_eeprom(0, 128) == eeproms[2][:128]
+        assert archived['Ethernet8'].read_eeprom(100, 50) == eeproms[3][100:150]
+        assert archived['Ethernet8'].read_eeprom(200, 100) is None
+
+        # A port which hangs is reported once the timeout expires, the others are still dumped
+        release = threading.Event()
+        sfps[2].read_eeprom.side_effect = lambda offset, size: release.wait(10) and None
+        try:
+            result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom-hexdump'],
+                                   ['--workers', '2', '--timeout', '1'])
+        finally:
+            release.set()
+        assert result.exit_code == 0
+        assert 'EEPROM hexdump for port Ethernet4\n        Error: Timed out after 1 seconds\n\n' in result.output
+        assert serial_output.split('EEPROM hexdump for port Ethernet8')[1] in result.output
+
     def test_test_eeprom_hexdump_all_invalid_page(self):
         runner = CliRunner()
         result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom-hexdump'], ['--page', '-1'])
@@ -1578,6 +1635,49 @@ EEPROM hexdump for port Ethernet4
         assert result.output == 'Firmware download complete success\nFirmware run in mode 0 successful\nFirmware commit successful\n'
         assert result.exit_code == 0
 
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.platform_sfputil')
+    @patch('sfputil.main.logical_port_to_physical_port_index')
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
+    @patch('sfputil.main.update_firmware_info_to_state_db')
+    def test_firmware_upgrade_batch(self, mock_update, mock_physical_port, mock_sfputil, mock_chassis, tmp_path):
+        from .mock_xcvr_api import MockSfp, MockXcvrApi
+
+        image_path = tmp_path / "fw.bin"
+        image_path.write_bytes(b'\x5a' * 4096)
+        sfps = {port: MockSfp(MockXcvrApi(), "/sys/bus/i2c/devices/i2c-{}/{}-0050/eeprom".format(port, port))
+                for port in range(1, 4)}
+        sfps[3].api.fail_at_block = 0
+        logical_ports = {"Ethernet0": 1, "Ethernet4": 1, "Ethernet8": 2, "Ethernet16": 3}
+        mock_sfputil.is_logical_port.side_effect = lambda port: port in logical_ports
+        mock_physical_port.side_effect = lambda port: logical_ports[port]
+        mock_chassis.get_sfp.side_effect = lambda port: sfps[port]
+
+        runner = CliRunner()
+        state_file = str(tmp_path / "state.json")
+        result = runner.invoke(sfputil.cli.commands['firmware'].commands['upgrade-batch'],
+                               ["Ethernet0-16", str(image_path), "--state-file", state_file])
+        assert result.exit_code == EXIT_FAIL
+        assert "Ethernet0   done      commit" in result.output
+        assert "Ethernet4" not in result.output
+        assert "Ethernet16  failed    -             CDB: firmware download failed! - status 0" in result.output
+        assert "Run the command again with --state-file {}".format(state_file) in result.output
+        assert sfps[1].api.downloaded == b'\x5a' * 4096
+        assert sfps[1].api.committed == 'B'
+        assert [call.args for call in mock_update.call_args_list] == [("Ethernet0",), ("Ethernet8",)]
+
+        result = runner.invoke(sfputil.cli.commands['firmware'].commands['upgrade-batch'],
+                               ["Ethernet0-16", str(image_path), "--state-file", state_file])
+        assert result.exit_code == 0
+        assert "Ethernet0   skipped   commit" in result.output
+        assert "Ethernet16  done      commit" in result.output
+
+        result = runner.invoke(sfputil.cli.commands['firmware'].commands['upgrade-batch'],
+                               ["Ethernet0", str(tmp_path / "missing.bin")])
+        assert result.output == "Firmware file {} NOT found\n".format(tmp_path / "missing.bin")
+        assert result.exit_code == EXIT_FAIL
+
     @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
     @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=True))
     def test_firmware_run_RJ45(self):
@@ -0,0 +1,66 @@
+import datetime
+import json
+import os
+
+from utilities_common import snapshot
+
+
+def json_round_trip(data):
+    return json.loads(json.dumps(data, default=snapshot._json_default))
+
+
+class TestSnapshot(object):
+    def setup_method(self):
+        self.data = {
+            "time": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "Ethernet0": {"rx_ok": "10", "rx_err": "N/A", "rx_drp": "0", "big": str(2 ** 64 - 1)},
+            "Ethernet4": {"rx_ok": "18446744073709551612", "tx_ok": "007", "type": "UC", "count": 3},
+            "Ethernet8": {},
+            "queues": {
+                "time": "2024-01-02T03:04:05",
+                "Ethernet0:0": {"queueindex": "0", "queuetype": "UC", "totalpacket": "5"},
+                "Ethernet0:1": {"queueindex": "1", "queuetype": "MC", "totalpacket": "N/A"},
+            },
+            "history": {"Ethernet0": {"PFC0": {"total": "1", "last": None}}},
+        }
+
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "stats")
+        snapshot.save(path, self.data)
+        loaded = snapshot.load(path)
+        assert isinstance(loaded, snapshot.Snapshot)
+
+        expected = json_round_trip(self.data)
+        assert list(loaded) == list(expected)
+        assert {key: loaded[key] for key in loaded} == expected
+        assert loaded.get("time") == "2024-01-02T03:04:05"
+        assert "Ethernet8" in loaded and "Ethernet12" not in loaded
+        assert loaded.get("Ethernet12") is None
+        loaded.close()
+
+    def test_counters_packed(self, tmp_path):
+        path = str(tmp_path / "stats")
+        fields = ["counter_{}".format(i) for i in range(64)]
+        rows = {"Ethernet{}".format(i * 4): {field: str(i * 1000003) for field in fields} for i in range(512)}
+        rows["Ethernet2044"]["counter_0"] = "N/A"
+        snapshot.save(path, rows)
+        # Counters are in the array, not in the JSON header
+        assert os.path.getsize(path) < 512 * 64 * 8 + 512 * 32 + 64 * 16
+        loaded = snapshot.load(path)
+        assert loaded["Ethernet4"]["counter_63"] == "1000003"
+        assert loaded["Ethernet2044"]["counter_0"] == "N/A"
+
+    def test_load_json(self, tmp_path):
+        path = str(tmp_path / "stats")
+        with open(path, "w") as f:
+            json.dump(self.data, f, default=snapshot._json_default)
+        assert snapshot.load(path) == json_round_trip(self.data)
+
+    def test_save_replaces(self, tmp_path):
+        path = str(tmp_path / "stats")
+        snapshot.save(path, {"Ethernet0": {"rx_ok": "1"}})
+        old = snapshot.load(path)
+        snapshot.save(path, {"Ethernet0": {"rx_ok": "2"}})
+        assert old["Ethernet0"] == {"rx_ok": "1"}
+        assert snapshot.load(path)["Ethernet0"] == {"rx_ok": "2"}
+        assert os.listdir(str(tmp_path)) == ["stats"]
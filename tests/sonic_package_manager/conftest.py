@@ -152,6 +152,9 @@ def fake_metadata_resolver():
             yang = self.metadata_store[ref['name']][ref['tag']]['yang']
             return Metadata(manifest, components, yang)
 
+        def from_docker_image(self, image, use_local_manifest=None, name=None):
+            return self.from_local(image.tags[0])
+
         def from_tarball(self, filepath: str, use_local_manifest=None, name=None) -> Manifest:
             path, ref = filepath.split(':')
             manifest = Manifest.marshal(self.metadata_store[path][ref]['manifest'])
@@ -5,9 +5,11 @@ import subprocess
 import unittest
 from unittest.mock import Mock, call, patch, mock_open, MagicMock
 import pytest
+from docker.errors import ImageNotFound
 
 import sonic_package_manager
 from sonic_package_manager.errors import *
+from sonic_package_manager.errors import PackageManagerError
 from sonic_package_manager.manager import PackageManager
 from sonic_package_manager.version import Version
 import json
@@ -388,20 +390,49 @@ def test_manager_migration(package_manager, fake_db_for_migration):
     )
 
 
+def test_manager_migration_dependency_order(package_manager, fake_db_for_migration, fake_metadata_resolver):
+    manifest = fake_metadata_resolver.metadata_store['Azure/docker-test-3']['1.6.0']['manifest']
+    manifest['package']['depends'] = ['test-package-6>=1.0.0']
+    package_manager.install = Mock()
+    package_manager.migrate_packages(fake_db_for_migration)
+
+    # test-package-3 depends on test-package-6, it is installed after it
+    assert package_manager.install.call_args_list == [
+        call(None, 'Azure/docker-test-4:1.5.0', name='test-package-4'),
+        call(None, 'Azure/docker-test-5:1.9.0', name='test-package-5'),
+        call('test-package-6=2.0.0'),
+        call('test-package-3=1.6.0'),
+    ]
+
+
+def test_manager_migration_circular_dependency(package_manager, fake_db_for_migration, fake_metadata_resolver):
+    manifest = fake_metadata_resolver.metadata_store['Azure/docker-test-3']['1.6.0']['manifest']
+    manifest['package']['depends'] = ['test-package-6>=1.0.0']
+    manifest = fake_metadata_resolver.metadata_store['Azure/docker-test-6']['2.0.0']['manifest']
+    manifest['package']['depends'] = ['test-package-3>=1.0.0']
+    package_manager.install = Mock()
+
+    with pytest.raises(PackageManagerError, match='Circular dependency'):
+        package_manager.migrate_packages(fake_db_for_migration)
+
+    package_manager.install.assert_not_called()
+
+
 def mock_get_docker_client(dockerd_sock):
     class DockerClient:
         def __init__(self, dockerd_sock):
             class Image:
                 def __init__(self, image_id):
                     self.image_id = image_id
+                    self.id = image_id
+                    self.tags = [image_id]
 
                 def save(self, named):
                     return ["named: {}".format(named).encode()]
 
-            image = Image("dummy_id")
             self.images = {
-                "Azure/docker-test-3:1.6.0": image,
-                "Azure/docker-test-6:2.0.0": image
+                "Azure/docker-test-3:1.6.0": Image("Azure/docker-test-3:1.6.0"),
+                "Azure/docker-test-6:2.0.0": Image("Azure/docker-test-6:2.0.0")
             }
             self.dockerd_sock = dockerd_sock
 
@@ -416,6 +447,38 @@ def test_manager_migration_dockerd(package_manager, fake_db_for_migration, mock_
         call('/var/run/docker.sock')], any_order=True)
 
 
+def test_manager_migration_dockerd_streams_images(package_manager, fake_db_for_migration, mock_docker_api):
+    fetch_docker_api = mock_docker_api.quiet.return_value
+    fetch_docker_api.get_image.side_effect = ImageNotFound('image not found')
+    package_manager.install = Mock()
+    package_manager.get_docker_client = Mock(side_effect=mock_get_docker_client)
+    package_manager.migrate_packages(fake_db_for_migration, '/var/run/docker.sock')
+
+    # Images are streamed from the old docker library, not saved to a file
+    fetch_docker_api.load_stream.assert_has_calls([call([b'named: True'])] * 2)
+    images = [kwargs['docker_image'] for _, kwargs in package_manager.install.call_args_list
+              if 'docker_image' in kwargs]
+    assert [image.id for image in images] == ['Azure/docker-test-3:1.6.0', 'Azure/docker-test-6:2.0.0']
+    fetch_docker_api.pull.assert_has_calls([
+        call('Azure/docker-test-4', '1.5.0'),
+        call('Azure/docker-test-5', '1.9.0')],
+        any_order=True
+    )
+
+
+def test_installation_from_docker_image(package_manager, mock_docker_api):
+    image = Mock(id='Azure/docker-test:1.6.0', tags=['Azure/docker-test:1.6.0'])
+    image.save.return_value = iter([b'layer'])
+    mock_docker_api.get_image.side_effect = ImageNotFound('image not found')
+    mock_docker_api.load_stream.return_value = image
+
+    package_manager.install(docker_image=image, name='test-package')
+
+    image.save.assert_called_once_with(named=True)
+    mock_docker_api.load_stream.assert_called_once_with(image.save.return_value)
+    assert package_manager.get_installed_package('test-package').installed
+
+
 def test_create_package_manifest_default_manifest(package_manager):
     """Test case for creating a default manifest."""
 
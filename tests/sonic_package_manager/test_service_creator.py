@@ -3,6 +3,8 @@
 import os
 import sys
 import copy
+import json
+import stat
 from unittest.mock import Mock, MagicMock, call, patch
 
 import pytest
@@ -14,6 +16,11 @@ from sonic_package_manager.package import Package
 from sonic_package_manager.service_creator.creator import *
 from sonic_package_manager.service_creator.creator import ETC_SYSTEMD_LOCATION
 from sonic_package_manager.service_creator.feature import FeatureRegistry
+from sonic_package_manager.service_creator.sonic_db import (
+    INIT_CFG_JSON,
+    PersistentConfigDbConnector,
+    SonicDB,
+)
 
 
 @pytest.fixture
@@ -585,3 +592,104 @@ class TestSyslogRateLimit:
             ],
             any_order = True
         )
+
+
+class TestPersistentConfigDbConnector:
+    @pytest.fixture(autouse=True)
+    def format_converter(self):
+        # The tables used here have no multi part keys to convert
+        with patch('sonic_package_manager.service_creator.sonic_db.sonic_cfggen.FormatConverter') as converter:
+            converter.to_serialized.side_effect = lambda config: config
+            converter.to_deserialized.side_effect = lambda config: config
+            yield converter
+
+    @pytest.fixture
+    def cfg_file(self, tmp_path):
+        path = tmp_path / 'init_cfg.json'
+        path.write_text(json.dumps({
+            'FEATURE': {'swss': {'state': 'enabled'}},
+            'AUTO_TECHSUPPORT_FEATURE': {'swss': {'state': 'enabled'}},
+        }))
+        path.chmod(0o640)
+        return path
+
+    def test_transaction_reads_and_writes_once(self, cfg_file):
+        conn = PersistentConfigDbConnector(str(cfg_file))
+
+        with patch.object(conn, '_read_config', wraps=conn._read_config) as read, \
+                patch.object(conn, '_write_config', wraps=conn._write_config) as write:
+            with conn.transaction():
+                conn.set_entry('FEATURE', 'test', {'state': 'disabled'})
+                conn.mod_entry('FEATURE', 'test', {'auto_restart': 'enabled'})
+                conn.set_entry('FEATURE', 'swss', None)
+                assert conn.get_entry('FEATURE', 'test') == {'state': 'disabled', 'auto_restart': 'enabled'}
+                # Nothing is written before the transaction ends
+                assert 'test' not in json.loads(cfg_file.read_text())['FEATURE']
+
+        assert read.call_count == 1
+        assert write.call_count == 1
+        assert json.loads(cfg_file.read_text())['FEATURE'] == {
+            'test': {'state': 'disabled', 'auto_restart': 'enabled'}
+        }
+
+    def test_transaction_without_changes_does_not_write(self, cfg_file):
+        conn = PersistentConfigDbConnector(str(cfg_file))
+
+        with patch.object(conn, '_write_config') as write:
+            with conn.transaction():
+                conn.get_table('FEATURE')
+
+        write.assert_not_called()
+
+    def test_transaction_rolls_back_on_error(self, cfg_file):
+        conn = PersistentConfigDbConnector(str(cfg_file))
+        content = cfg_file.read_text()
+
+        with pytest.raises(ValueError):
+            with conn.transaction():
+                conn.set_entry('FEATURE', 'test', {'state': 'disabled'})
+                raise ValueError
+
+        assert cfg_file.read_text() == content
+        assert conn.get_entry('FEATURE', 'test') == {}
+
+    def test_write_replaces_file_atomically(self, cfg_file):
+        conn = PersistentConfigDbConnector(str(cfg_file))
+
+        with patch('sonic_package_manager.service_creator.sonic_db.json.dump', side_effect=OSError):
+            with pytest.raises(OSError):
+                conn.set_entry('FEATURE', 'test', {'state': 'disabled'})
+
+        # The file is intact and no temporary file is left behind
+        assert 'test' not in json.loads(cfg_file.read_text())['FEATURE']
+        assert os.listdir(cfg_file.parent) == ['init_cfg.json']
+
+        conn.set_entry('FEATURE', 'test', {'state': 'disabled'})
+
+        assert json.loads(cfg_file.read_text())['FEATURE']['test'] == {'state': 'disabled'}
+        assert os.listdir(cfg_file.parent) == ['init_cfg.json']
+        assert stat.S_IMODE(cfg_file.stat().st_mode) == 0o640
+
+    def test_mod_config_deletes_tables(self, cfg_file):
+        conn = PersistentConfigDbConnector(str(cfg_file))
+
+        conn.mod_config({
+            'AUTO_TECHSUPPORT_FEATURE': None,
+            'FEATURE': {'test': {'state': 'disabled'}},
+        })
+
+        assert json.loads(cfg_file.read_text()) == {
+            'FEATURE': {'swss': {'state': 'enabled'}, 'test': {'state': 'disabled'}},
+        }
+
+
+def test_sonic_db_transaction_shares_initial_db_connector():
+    with patch('sonic_package_manager.service_creator.sonic_db.PersistentConfigDbConnector') as conn_cls:
+        with SonicDB.transaction():
+            assert SonicDB.get_initial_db_connector() is conn_cls.return_value
+            with SonicDB.transaction():
+                assert SonicDB.get_initial_db_connector() is conn_cls.return_value
+
+        conn_cls.assert_called_once_with(INIT_CFG_JSON)
+        conn_cls.return_value.transaction.assert_called_once_with()
+        assert SonicDB._initial_db_conn is None
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import sys
 import pytest
@@ -113,6 +114,37 @@ def test_install(run_command, run_command_or_raise, get_bootloader, swap, fs):
     ]
     assert run_command_or_raise.call_args_list == expected_call_list
 
+
+@patch("sonic_installer.main.get_bootloader")
+@patch("sonic_installer.main.run_command")
+def test_install_sha256(run_command, get_bootloader, tmp_path, monkeypatch):
+    """ This test covers "sonic-installer install --sha256" with a local image. """
+    image = b"#!/bin/sh\nimage_version=\"image_2\"\nexit_marker\n"
+    (tmp_path / "sonic.bin").write_bytes(image)
+    monkeypatch.chdir(tmp_path)
+
+    mock_bootloader = Mock()
+    mock_bootloader.get_binary_image_version = Mock(return_value="image_2")
+    mock_bootloader.get_installed_images = Mock(return_value=["image_1", "image_2"])
+    get_bootloader.return_value = mock_bootloader
+
+    runner = CliRunner()
+    result = runner.invoke(sonic_installer.commands["install"], ["sonic.bin", "-y", "--sha256", "0" * 64])
+    print(result.output)
+    assert result.exit_code != 0
+    assert "does not match SHA-256 digest" in result.output
+    mock_bootloader.get_binary_image_version.assert_not_called()
+
+    digest = hashlib.sha256(image).hexdigest()
+    result = runner.invoke(sonic_installer.commands["install"], ["sonic.bin", "-y", "--sha256", digest.upper()])
+    print(result.output)
+    assert result.exit_code == 0
+    assert "Image SHA-256 digest verified" in result.output
+    image_info = mock_bootloader.get_binary_image_version.call_args[0][1]
+    assert image_info.sha256 == digest
+    assert image_info.version == "image_2"
+    mock_bootloader.set_default_image.assert_called_with("image_2")
+
 @patch("sonic_installer.main.get_bootloader")
 def test_set_fips(get_bootloader):
     """ This test covers the execution of "sonic-installer set-fips/get-fips" command. """
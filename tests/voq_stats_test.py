@@ -0,0 +1,96 @@
+import threading
+
+from utilities_common import voq_stats
+
+COUNTERS = ["SAI_QUEUE_STAT_PACKETS", "SAI_QUEUE_STAT_BYTES"]
+
+
+class FakeLinecard(object):
+    def __init__(self, voqs):
+        self.data = {voq_stats.COUNTERS_VOQ_NAME_MAP: {}}
+        for voq, (oid, counters) in voqs.items():
+            self.data[voq_stats.COUNTERS_VOQ_NAME_MAP][voq] = oid
+            self.data["COUNTERS:" + oid] = counters
+        self.reads = 0
+
+    def hgetall(self, key):
+        self.reads += 1
+        return dict(self.data.get(key, {}))
+
+
+class FakePipelinedLinecard(FakeLinecard):
+    def pipeline(self, transaction=True):
+        linecard = self
+
+        class Pipeline(object):
+            def __init__(self):
+                self.queued = []
+
+            def hgetall(self, key):
+                self.queued.append(key)
+
+            def execute(self):
+                linecard.reads += 1
+                return [dict(linecard.data.get(key, {})) for key in self.queued]
+
+        return Pipeline()
+
+
+class TestVoqStats(object):
+    def setup_method(self):
+        self.lc1 = FakeLinecard({
+            "lc1|asic0|Ethernet0:0": ("oid:1", {"SAI_QUEUE_STAT_PACKETS": "8", "SAI_QUEUE_STAT_BYTES": "976"}),
+            "lc1|asic0|Ethernet0:1": ("oid:2", {"SAI_QUEUE_STAT_PACKETS": "1"}),
+        })
+        self.lc2 = FakeLinecard({
+            "lc1|asic0|Ethernet0:0": ("oid:9", {"SAI_QUEUE_STAT_PACKETS": "2", "SAI_QUEUE_STAT_BYTES": "24"}),
+        })
+
+    def test_read_linecard_voqs(self):
+        counters = voq_stats.read_linecard_voqs(self.lc1, COUNTERS)
+        assert counters == {
+            "lc1|asic0|Ethernet0:0": {"SAI_QUEUE_STAT_PACKETS": 8, "SAI_QUEUE_STAT_BYTES": 976},
+            "lc1|asic0|Ethernet0:1": {"SAI_QUEUE_STAT_PACKETS": 1},
+        }
+        # One read for the name map and one per VOQ
+        assert self.lc1.reads == 3
+
+        pipelined = FakePipelinedLinecard({"lc2|asic0|Ethernet4:1": ("oid:3", {"SAI_QUEUE_STAT_BYTES": "5"})})
+        counters = voq_stats.read_linecard_voqs(pipelined, COUNTERS)
+        assert counters == {"lc2|asic0|Ethernet4:1": {"SAI_QUEUE_STAT_BYTES": 5}}
+        assert pipelined.reads == 2
+
+    def test_aggregate_voq_stats(self):
+        clients = {"10.0.0.1": self.lc1, "10.0.0.2": self.lc2}
+        stats, unreachable = voq_stats.aggregate_voq_stats(list(clients), COUNTERS,
+                                                           connect=lambda ip, timeout: clients[ip])
+        assert unreachable == []
+        assert stats == {"lc1|asic0|Ethernet0": {
+            "0": {"SAI_QUEUE_STAT_PACKETS": 10, "SAI_QUEUE_STAT_BYTES": 1000},
+            "1": {"SAI_QUEUE_STAT_PACKETS": 1, "SAI_QUEUE_STAT_BYTES": 0},
+        }}
+
+    def test_aggregate_voq_stats_partial(self):
+        hang = threading.Event()
+        hung_threads = []
+
+        def connect(ip, timeout):
+            if ip == "10.0.0.2":
+                raise RuntimeError("Unable to connect")
+            if ip == "10.0.0.3":
+                hung_threads.append(threading.current_thread())
+                hang.wait(5)
+            return self.lc1
+
+        try:
+            stats, unreachable = voq_stats.aggregate_voq_stats(["10.0.0.1", "10.0.0.2", "10.0.0.3"], COUNTERS,
+                                                               timeout=0.2, connect=connect)
+        finally:
+            hang.set()
+        assert unreachable == ["10.0.0.2", "10.0.0.3"]
+        assert stats["lc1|asic0|Ethernet0"]["0"]["SAI_QUEUE_STAT_PACKETS"] == 8
+        # A hung linecard is left to a daemon thread, it does not block the exit
+        assert [thread.daemon for thread in hung_threads] == [True]
+
+    def test_aggregate_voq_stats_no_linecards(self):
+        assert voq_stats.aggregate_voq_stats([], COUNTERS) == ({}, [])
@@ -0,0 +1,168 @@
+"""
+Bulk redis readers for tables too large for one round trip per key.
+
+SonicV2Connector reads one hash per request. The helpers here SCAN keys in
+batches and fetch the hashes of each batch through a redis-py pipeline,
+so reading N keys costs about N / batch round trips.
+"""
+
+import time
+
+import redis
+from swsscommon.swsscommon import SonicDBConfig
+
+SCAN_BATCH_SIZE = 1000
+POLL_INTERVAL = 0.05
+
+
+def get_redis_client(db, db_name, namespace=None):
+    """
+    Return a redis-py client, which supports pipelines, for db_name of the
+    namespace SonicV2Connector db is bound to, or of namespace if given.
+    Raises ValueError if a new connection is needed and the namespace of db
+    is not known.
+    """
+    client = db.get_redis_client(db_name)
+    if hasattr(client, 'pipeline'):
+        return client
+
+    # swsscommon DBConnector has no pipelining; open a redis-py
+    # connection on the same unix socket instead.
+    if namespace is None:
+        namespace = getattr(db, 'namespace', None)
+        if namespace is None:
+            raise ValueError("Cannot determine the namespace of {} to connect to {}".format(
+                type(db).__name__, db_name))
+    return redis.Redis(unix_socket_path=SonicDBConfig.getDbSock(db_name, namespace),
+                       db=SonicDBConfig.getDbId(db_name, namespace),
+                       decode_responses=True)
+
+
+def scan_keys(client, pattern, batch_size=SCAN_BATCH_SIZE):
+    """
+    Generator of lists of keys matching pattern, about batch_size at a time.
+    Keys returned more than once by SCAN are only yielded the first time.
+    """
+    seen = set()
+    cursor = 0
+    while True:
+        cursor, keys = client.scan(cursor=cursor, match=pattern, count=batch_size)
+        batch = [key for key in keys if key not in seen]
+        seen.update(batch)
+        if batch:
+            yield batch
+        if int(cursor) == 0:
+            break
+
+
+def get_all_pipelined(client, keys):
+    """
+    Fetch the hashes of keys in one pipelined round trip.
+    Returns a list of dicts in the order of keys; missing keys give {}.
+    """
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.hgetall(key)
+    return [entry or {} for entry in pipe.execute()]
+
+
+def iter_tables(client, pattern, batch_size=SCAN_BATCH_SIZE):
+    """
+    Generator of (key, hash) for all keys matching pattern.
+    """
+    for keys in scan_keys(client, pattern, batch_size):
+        for key, entry in zip(keys, get_all_pipelined(client, keys)):
+            yield key, entry
+
+
+def wait_for_keys(client, pattern, count, timeout, interval=POLL_INTERVAL):
+    """
+    Poll until at least count keys match pattern or timeout seconds pass.
+    Returns the matching keys seen last, which may be fewer than count.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        keys = client.keys(pattern)
+        if len(keys) >= count:
+            return keys
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return keys
+        time.sleep(min(interval, remaining))
+
+
+def set_entries_pipelined(configdb, table, changes, batch_size=SCAN_BATCH_SIZE):
+    """
+    Write changes to table through ConfigDBConnector configdb, batch_size
+    entries per pipelined round trip. changes is an iterable of
+    (key, data, old) in the order to apply them: data None deletes the
+    entry, otherwise the entry is set to data and, like set_entry, the
+    fields of old which are not in data are removed.
+    Returns the number of entries written.
+    """
+    client = get_redis_client(configdb, 'CONFIG_DB')
+    separator = configdb.TABLE_NAME_SEPARATOR
+    written = 0
+    pipe = None
+    for key, data, old in changes:
+        if pipe is None:
+            pipe = client.pipeline(transaction=False)
+        hash_key = '{}{}{}'.format(table.upper(), separator, configdb.serialize_key(key))
+        if data is None:
+            pipe.delete(hash_key)
+        else:
+            # An entry without fields is stored as NULL: NULL, as set_entry does
+            raw = configdb.typed_to_raw(data) or {'NULL': 'NULL'}
+            pipe.hset(hash_key, mapping=raw)
+            stale = [field for field in configdb.typed_to_raw(old or {}) if field not in raw]
+            if stale:
+                pipe.hdel(hash_key, *stale)
+        written += 1
+        if written % batch_size == 0:
+            pipe.execute()
+            pipe = None
+    if pipe is not None:
+        pipe.execute()
+    return written
+
+
+class DbSnapshot(object):
+    """
+    Hashes read in bulk from the databases of SonicV2Connector db.
+
+    Stands in for db where code reads fields with db.get(db_name, key,
+    field): the hashes of the keys given to load() are fetched in one
+    pipelined round trip per database and answered from memory, any other
+    key is read from db.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.hashes = {}
+        self.clients = {}
+
+    def __getattr__(self, name):
+        # Database names (APPL_DB, STATE_DB, ...) and other methods of db
+        return getattr(self.db, name)
+
+    def load(self, db_name, keys):
+        keys = [key for key in keys if (db_name, key) not in self.hashes]
+        if not keys:
+            return
+        client = self.clients.get(db_name)
+        if client is None:
+            client = self.clients[db_name] = get_redis_client(self.db, db_name)
+        for key, entry in zip(keys, get_all_pipelined(client, keys)):
+            self.hashes[(db_name, key)] = entry
+
+    def get(self, db_name, key, field, *args, **kwargs):
+        entry = self.hashes.get((db_name, key))
+        if entry is None:
+            return self.db.get(db_name, key, field, *args, **kwargs)
+        return entry.get(field)
+
+    def get_all(self, db_name, key, *args, **kwargs):
+        entry = self.hashes.get((db_name, key))
+        if entry is None:
+            return self.db.get_all(db_name, key, *args, **kwargs)
+        return dict(entry)
@@ -1,6 +1,8 @@
 import configparser
 import datetime
+import importlib
 import os
+import pkgutil
 import re
 import subprocess
 import sys
@@ -126,6 +128,301 @@ class AliasedGroup(click.Group):
         ctx.fail('Too many matches: %s' % ', '.join(sorted(matches)))
 
 
+def import_command(import_path):
+    """Imports the command at import_path, given as 'package.module:attribute'"""
+    module_name, _, attribute = import_path.partition(':')
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class LazyCommand(object):
+    """A subcommand of a lazy group, imported the first time it is looked up
+
+    Holds what the group help and completion show of the command, from the
+    manifest, so listing the subcommands does not import them.
+    """
+
+    def __init__(self, import_path, help=None, short_help=None, hidden=False, condition=None):
+        self.import_path = import_path
+        self.help = help
+        self.short_help = short_help
+        self.hidden = hidden
+        self.condition = condition
+        self._enabled = None
+
+    def is_enabled(self):
+        """Whether the command is registered: its condition, checked once, passes"""
+        if self._enabled is None:
+            self._enabled = self.condition is None or bool(self.condition())
+        return self._enabled
+
+    def load(self):
+        return import_command(self.import_path)
+
+    def placeholder(self, name):
+        """A command with the help of the lazy command, for help and completion"""
+        return click.Command(name, help=self.help, short_help=self.short_help, hidden=self.hidden)
+
+
+class LazyCommands(dict):
+    """The subcommands of a lazy group
+
+    A dict of the commands loaded so far, like the commands of a click.Group,
+    which loads a lazy command when it is looked up and runs the deferred
+    loaders, e.g. the plugin registration, when a command could be one of
+    theirs. The manifest of the deferred loaders lists the names of their
+    commands; without it any missing command or the list of all commands
+    runs them.
+    """
+
+    def __init__(self, commands=None):
+        super().__init__(commands or {})
+        self.lazy = {}
+        self.deferred = []
+        # LazyCommand of each command the deferred loaders register, and
+        # whether that is all they register
+        self.deferred_commands = {}
+        self.deferred_complete = True
+
+    def load_deferred(self):
+        while self.deferred:
+            self.deferred.pop(0)()
+        self.deferred_commands = {}
+
+    def _may_be_deferred(self, name):
+        return bool(self.deferred) and (not self.deferred_complete or name in self.deferred_commands)
+
+    def _lookup(self, name):
+        if dict.__contains__(self, name):
+            return dict.__getitem__(self, name)
+        lazy = self.lazy.get(name)
+        if lazy is None or not lazy.is_enabled():
+            return None
+        command = lazy.load()
+        del self.lazy[name]
+        dict.__setitem__(self, name, command)
+        return command
+
+    def peek(self, name):
+        """Returns the command, or the placeholder of a lazy command, without importing it"""
+        lazy = self.lazy.get(name)
+        if lazy is not None:
+            return lazy.placeholder(name) if lazy.is_enabled() else None
+        if self.deferred and not dict.__contains__(self, name) and name in self.deferred_commands:
+            return self.deferred_commands[name].placeholder(name)
+        return self.get(name)
+
+    def __getitem__(self, name):
+        command = self._lookup(name)
+        if command is None and self._may_be_deferred(name):
+            self.load_deferred()
+            command = self._lookup(name)
+        if command is None:
+            raise KeyError(name)
+        if isinstance(command, click.Group) and self.deferred and not isinstance(command.commands, LazyCommands):
+            # Plugins may add subcommands to the group, they are loaded when
+            # a subcommand is missing or all of them are listed
+            command.commands = LazyCommands(command.commands)
+            command.commands.deferred = self.deferred
+            command.commands.deferred_complete = False
+        return command
+
+    def get(self, name, default=None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def __setitem__(self, name, command):
+        self.lazy.pop(name, None)
+        dict.__setitem__(self, name, command)
+
+    def __delitem__(self, name):
+        if self.lazy.pop(name, None) is None:
+            dict.__delitem__(self, name)
+
+    def __contains__(self, name):
+        if dict.__contains__(self, name):
+            return True
+        if name in self.lazy:
+            return self.lazy[name].is_enabled()
+        if self._may_be_deferred(name):
+            self.load_deferred()
+            return dict.__contains__(self, name)
+        return False
+
+    def __iter__(self):
+        if not self.deferred_complete:
+            self.load_deferred()
+        names = list(dict.__iter__(self))
+        names.extend(name for name, lazy in self.lazy.items() if lazy.is_enabled())
+        if self.deferred:
+            names.extend(name for name in self.deferred_commands if name not in names)
+        return iter(names)
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def keys(self):
+        return list(iter(self))
+
+    def values(self):
+        return [self[name] for name in self]
+
+    def items(self):
+        return [(name, self[name]) for name in self]
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, self.keys())
+
+
+class LazyGroupMixin(object):
+    """Lazy loading of the subcommands of a click group
+
+    The subcommands registered with add_lazy_commands() are imported when
+    they are first invoked, and the loaders registered with defer() run when
+    a command could be one of theirs. Help and completion take the help of
+    the lazy commands from the manifest generated by
+    utilities_common/cli_manifest.py, so `show --help` or tab completion do
+    not import every command module.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands = LazyCommands(self.commands)
+
+    def add_lazy_commands(self, import_paths, manifest, conditions=None):
+        """Registers the commands at import_paths, imported on first use
+
+        :param import_paths: 'package.module:attribute' of the commands
+        :param manifest: Dict of the import paths to the name and help of
+                         their command; a command not in it is imported now
+        :param conditions: Dict of import paths to callables, a command is
+                           only registered if its callable returns True
+        """
+        conditions = conditions or {}
+        for import_path in import_paths:
+            condition = conditions.get(import_path)
+            entry = manifest.get(import_path)
+            if entry is None:
+                if condition is None or condition():
+                    self.add_command(import_command(import_path))
+                continue
+            self.commands.lazy[entry['name']] = LazyCommand(import_path, help=entry.get('help'),
+                                                            short_help=entry.get('short_help'),
+                                                            hidden=entry.get('hidden', False),
+                                                            condition=condition)
+
+    def defer(self, loader, manifest=None):
+        """Runs loader, which registers more commands, when they are looked up
+
+        :param manifest: Dict of the names of the top-level commands loader
+                         registers to their help, see plugin_manifest(); None
+                         if they are not known, then any missing command or
+                         the list of all commands runs loader
+        """
+        self.commands.deferred.append(loader)
+        if manifest is None:
+            self.commands.deferred_complete = False
+            return
+        for name, entry in manifest.items():
+            self.commands.deferred_commands[name] = LazyCommand(None, help=entry.get('help'),
+                                                                short_help=entry.get('short_help'),
+                                                                hidden=entry.get('hidden', False))
+
+    def format_commands(self, ctx, formatter):
+        commands = []
+        for name in self.list_commands(ctx):
+            cmd = self.commands.peek(name)
+            if cmd is None or cmd.hidden:
+                continue
+            commands.append((name, cmd))
+
+        if commands:
+            # allow for 3 times the default spacing, as click.MultiCommand does
+            limit = formatter.width - 6 - max(len(name) for name, _ in commands)
+            rows = [(name, cmd.get_short_help_str(limit)) for name, cmd in commands]
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx, incomplete):
+        from click.shell_completion import CompletionItem
+
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            cmd = self.commands.peek(name)
+            if cmd is None or cmd.hidden:
+                continue
+            results.append(CompletionItem(name, help=cmd.get_short_help_str()))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+
+class LazyGroup(LazyGroupMixin, AliasedGroup):
+    """AliasedGroup with lazily loaded subcommands, see LazyGroupMixin"""
+    pass
+
+
+class LazyAbbreviationGroup(LazyGroupMixin, AbbreviationGroup):
+    """AbbreviationGroup with lazily loaded subcommands, see LazyGroupMixin"""
+    pass
+
+
+def plugin_module_names(plugins):
+    """Returns the names of the modules of the plugins package, without importing them
+
+    The modules are the ones UtilHelper.load_plugins() loads, including
+    those of the subpackages, e.g. installed by sonic-package-manager.
+    """
+    def iter_modules(path, prefix):
+        for _, name, ispkg in pkgutil.iter_modules(path, prefix):
+            if ispkg:
+                sub_path = [os.path.join(p, name.rpartition('.')[2]) for p in path]
+                yield from iter_modules(sub_path, name + '.')
+            else:
+                yield name
+
+    return list(iter_modules(plugins.__path__, plugins.__name__ + '.'))
+
+
+def plugin_manifest(plugins, manifest):
+    """Returns the names and help of the top-level commands of the plugins
+
+    :param plugins: The plugins package, e.g. show.plugins
+    :param manifest: Dict of the plugin module names to the commands they
+                     register, PLUGINS of the generated manifest
+    :return: The manifest of the commands, for LazyGroupMixin.defer(), or
+             None if a plugin is not in the manifest, e.g. one installed by
+             sonic-package-manager
+    """
+    commands = {}
+    for module_name in plugin_module_names(plugins):
+        if module_name not in manifest:
+            return None
+        commands.update(manifest[module_name])
+    return commands
+
+
+def lazy_submodule_getattr(module_name, import_paths):
+    """Returns a module __getattr__ importing the modules of lazy commands
+
+    Keeps e.g. show.main.muxcable, the submodule of a command which is no
+    longer imported by show.main, reachable as an attribute of show.main.
+    """
+    submodules = {}
+    for import_path in import_paths:
+        submodule = import_path.partition(':')[0]
+        submodules[submodule.rpartition('.')[2]] = submodule
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(submodules[name])
+        raise AttributeError("module '{}' has no attribute '{}'".format(module_name, name))
+
+    return __getattr__
+
+
 class InterfaceAliasConverter(object):
     """Class which handles conversion between interface name and alias"""
 
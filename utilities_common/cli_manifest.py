@@ -0,0 +1,141 @@
+"""
+Generates the manifest of the lazily loaded commands of a CLI.
+
+The root group of a CLI (e.g. show.main.cli) registers the top-level
+commands of its submodules with LazyGroupMixin.add_lazy_commands(), from
+the list of their import paths in LAZY_COMMANDS of the CLI main module. The
+manifest, <cli>/commands_manifest.py, holds the name and help of every one
+of them, so the CLI can list them without importing them. It also holds the
+top-level commands each plugin of <cli>/plugins registers, so the plugins
+are only loaded when one of their commands is looked up.
+
+Regenerate the manifest after adding a command to LAZY_COMMANDS or a
+plugin, or changing the help of one:
+
+    python -m utilities_common.cli_manifest show config
+"""
+
+import argparse
+import importlib
+import os
+import pprint
+
+import click
+
+from utilities_common.cli import import_command
+from utilities_common.util_base import UtilHelper
+
+MANIFEST_MODULE = 'commands_manifest'
+LINE_LENGTH = 120
+
+HEADER = '''\
+# Generated by 'python -m utilities_common.cli_manifest {cli}', do not edit.
+"""Name and help of the lazily loaded top-level '{cli}' commands, by import path,
+and of the top-level commands of the '{cli}' plugins, by plugin module"""
+
+'''
+
+
+def first_paragraph(text):
+    """Returns the first paragraph of text, all click shows in group help"""
+    if not text:
+        return text
+    return ' '.join(text.split('\n\n')[0].split())
+
+
+def command_entry(command):
+    return {
+        'name': command.name,
+        'help': first_paragraph(command.help),
+        'short_help': command.short_help,
+        'hidden': command.hidden,
+    }
+
+
+def build_manifest(import_paths):
+    """Returns the manifest of the commands at import_paths"""
+    manifest = {}
+    for import_path in import_paths:
+        manifest[import_path] = command_entry(import_command(import_path))
+    return manifest
+
+
+class RecordingCommands(dict):
+    """Commands of a root group a plugin registers in, any other group it
+    adds subcommands to is a throwaway one"""
+
+    def __missing__(self, name):
+        return click.Group(name)
+
+
+def build_plugin_manifest(plugins):
+    """Returns the manifest of the top-level commands of the plugins package
+
+    The commands a plugin registers only on some platforms, e.g. the
+    subcommands it adds to 'platform', are not in it. They are found by
+    the groups, which load the plugins when a subcommand is missing.
+    """
+    manifest = {}
+    for plugin in UtilHelper().load_plugins(plugins):
+        root = click.Group('root')
+        root.commands = RecordingCommands()
+        plugin.register(root)
+        manifest[plugin.__name__] = {name: command_entry(command) for name, command in root.commands.items()}
+    return manifest
+
+
+def format_entry(lines, key, entry, indent):
+    if not entry:
+        lines.append(indent + '{!r}: {{}},'.format(key))
+        return
+    lines.append(indent + '{!r}: {{'.format(key))
+    for field, value in entry.items():
+        prefix = indent + '    {!r}: '.format(field)
+        if isinstance(value, dict):
+            format_entry(lines, field, value, indent + '    ')
+            continue
+        text = pprint.pformat(value, width=LINE_LENGTH - len(prefix) - 1)
+        lines.append(prefix + text.replace('\n', '\n' + ' ' * len(prefix)) + ',')
+    lines.append(indent + '},')
+
+
+def format_manifest(manifest, plugin_manifest=None):
+    """Returns the Python text of manifest, one line per field of a command"""
+    lines = ['COMMANDS = {']
+    for import_path, entry in manifest.items():
+        format_entry(lines, import_path, entry, '    ')
+    lines.append('}')
+    if plugin_manifest is not None:
+        lines.extend(['', 'PLUGINS = {'])
+        for module_name, commands in plugin_manifest.items():
+            format_entry(lines, module_name, commands, '    ')
+        lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def manifest_path(cli):
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), cli,
+                        MANIFEST_MODULE + '.py')
+
+
+def render_manifest(cli):
+    """Returns the text of the manifest module of cli, e.g. 'show'"""
+    main = importlib.import_module(cli + '.main')
+    manifest = build_manifest(main.LAZY_COMMANDS)
+    plugin_manifest = build_plugin_manifest(importlib.import_module(cli + '.plugins'))
+    return HEADER.format(cli=cli) + format_manifest(manifest, plugin_manifest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the manifest of the lazily loaded CLI commands')
+    parser.add_argument('cli', nargs='+', help='CLI package, e.g. show')
+    args = parser.parse_args()
+
+    for cli in args.cli:
+        text = render_manifest(cli)
+        with open(manifest_path(cli), 'w') as f:
+            f.write(text)
+
+
+if __name__ == '__main__':
+    main()
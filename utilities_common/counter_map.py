@@ -0,0 +1,114 @@
+"""
+Index of the COUNTERS_DB object maps (COUNTERS_*_MAP hashes).
+
+The counter CLIs resolve every queue and PG through the name, port, index
+and type maps. Reading those one field at a time costs a round trip per
+object and field; CounterMapIndex instead reads each map whole, with one
+get_all, the first time it is needed and answers every later lookup from
+memory.
+
+Indexes are cached per namespace for the life of the process. Object IDs
+are reassigned whenever syncd restarts, which always changes
+COUNTERS_PORT_NAME_MAP, so a cached index is dropped when that map no
+longer matches the copy it was built with.
+"""
+
+from utilities_common import constants
+
+COUNTERS_PORT_NAME_MAP = "COUNTERS_PORT_NAME_MAP"
+COUNTERS_SYSTEM_PORT_NAME_MAP = "COUNTERS_SYSTEM_PORT_NAME_MAP"
+COUNTERS_QUEUE_NAME_MAP = "COUNTERS_QUEUE_NAME_MAP"
+COUNTERS_VOQ_NAME_MAP = "COUNTERS_VOQ_NAME_MAP"
+COUNTERS_QUEUE_TYPE_MAP = "COUNTERS_QUEUE_TYPE_MAP"
+COUNTERS_QUEUE_INDEX_MAP = "COUNTERS_QUEUE_INDEX_MAP"
+COUNTERS_QUEUE_PORT_MAP = "COUNTERS_QUEUE_PORT_MAP"
+COUNTERS_PG_NAME_MAP = "COUNTERS_PG_NAME_MAP"
+COUNTERS_PG_PORT_MAP = "COUNTERS_PG_PORT_MAP"
+COUNTERS_PG_INDEX_MAP = "COUNTERS_PG_INDEX_MAP"
+
+_indexes = {}
+
+
+class CounterMapIndex(object):
+    """
+    Lookup tables built from the COUNTERS_DB maps of one namespace.
+    """
+
+    def __init__(self, db, namespace=constants.DEFAULT_NAMESPACE):
+        """
+        :param db: SonicV2Connector connected to COUNTERS_DB of namespace
+        """
+        self.db = db
+        self.namespace = namespace
+        self.maps = {}
+        self.port_objects_cache = {}
+
+    def get_all(self, map_name):
+        """
+        Return the whole map, as db.get_all returns it, reading it only once.
+        """
+        if map_name not in self.maps:
+            self.maps[map_name] = self.db.get_all(self.db.COUNTERS_DB, map_name)
+        return self.maps[map_name]
+
+    def get(self, map_name, field):
+        """
+        Return the value of field in the map, or None if it is not there.
+        """
+        return (self.get_all(map_name) or {}).get(field)
+
+    def port_objects(self, name_map, port_map, port_name_map=COUNTERS_PORT_NAME_MAP):
+        """
+        Group the objects of name_map by port.
+        :param name_map: Map of object name to OID, e.g. COUNTERS_QUEUE_NAME_MAP
+        :param port_map: Map of object OID to port OID, e.g. COUNTERS_QUEUE_PORT_MAP
+        :param port_name_map: Map of port name to port OID
+        :return: Tuple of {port name: {object name: object OID}} and the list
+                 of object OIDs whose port could not be resolved
+        """
+        key = (name_map, port_map, port_name_map)
+        if key not in self.port_objects_cache:
+            port_oids = {oid: port for port, oid in (self.get_all(port_name_map) or {}).items()}
+            object_ports = self.get_all(port_map) or {}
+            table = {port: {} for port in port_oids.values()}
+            unresolved = []
+            for name, oid in (self.get_all(name_map) or {}).items():
+                port = port_oids.get(object_ports.get(oid))
+                if port is None:
+                    unresolved.append(oid)
+                else:
+                    table[port][name] = oid
+            self.port_objects_cache[key] = (table, unresolved)
+        return self.port_objects_cache[key]
+
+    def is_current(self):
+        """
+        Check that the maps read so far were not rebuilt since by syncd.
+        """
+        if COUNTERS_PORT_NAME_MAP not in self.maps:
+            return not self.maps
+        return self.db.get_all(self.db.COUNTERS_DB, COUNTERS_PORT_NAME_MAP) == self.maps[COUNTERS_PORT_NAME_MAP]
+
+
+def get_index(db, namespace=constants.DEFAULT_NAMESPACE):
+    """
+    Return the CounterMapIndex of namespace, reusing the cached one while
+    COUNTERS_DB still holds the maps it was built from.
+    """
+    index = _indexes.get(namespace)
+    if index is not None:
+        index.db = db
+        if index.is_current():
+            return index
+    index = _indexes[namespace] = CounterMapIndex(db, namespace)
+    return index
+
+
+def clear_cache(namespace=None):
+    """
+    Drop the cached index of namespace, or of all namespaces.
+    """
+    if namespace is None:
+        _indexes.clear()
+    else:
+        _indexes.pop(namespace, None)
@@ -1,18 +1,139 @@
+import time
+from collections.abc import MutableMapping
+
 from sonic_py_common import multi_asic, device_info
 from swsscommon.swsscommon import ConfigDBConnector, ConfigDBPipeConnector, SonicV2Connector, SonicDBConfig
 from utilities_common import constants
 from utilities_common.multi_asic import multi_asic_ns_choices
 
 
+class ConnectionStats(object):
+    """
+    Counters of the connections opened by a Db, keyed on (namespace, db name).
+    """
+
+    def __init__(self):
+        self.connects = {}
+        self.connect_time = {}
+
+    def record(self, namespace, db_name, elapsed):
+        key = (namespace, db_name)
+        self.connects[key] = self.connects.get(key, 0) + 1
+        self.connect_time[key] = self.connect_time.get(key, 0.0) + elapsed
+
+    def timed(self, namespace, db_name, connect, *args, **kwargs):
+        start = time.monotonic()
+        try:
+            return connect(*args, **kwargs)
+        finally:
+            self.record(namespace, db_name, time.monotonic() - start)
+
+    def total_connects(self):
+        return sum(self.connects.values())
+
+    def total_time(self):
+        return sum(self.connect_time.values())
+
+    def to_dict(self):
+        return {"{}/{}".format(ns or "default", db_name): {
+                    "connects": self.connects[(ns, db_name)],
+                    "seconds": round(self.connect_time[(ns, db_name)], 6)}
+                for ns, db_name in sorted(self.connects)}
+
+
+class LazySonicV2Connector(SonicV2Connector):
+    """
+    SonicV2Connector which connects each database on its first use instead
+    of requiring an upfront connect() per database.
+    """
+
+    # Methods whose first argument is the database name
+    DB_METHODS = ('get_redis_client', 'publish', 'exists', 'keys', 'scan', 'get',
+                  'hexists', 'get_all', 'hgetall', 'hmset', 'set', 'delete',
+                  'delete_all_by_pattern')
+
+    def __init__(self, *args, stats=None, **kwargs):
+        super(LazySonicV2Connector, self).__init__(*args, **kwargs)
+        self.lazy_connected = set()
+        self.lazy_stats = stats if stats is not None else ConnectionStats()
+        self.lazy_namespace = kwargs.get('namespace') or constants.DEFAULT_NAMESPACE
+
+    def connect(self, db_name, *args, **kwargs):
+        self.lazy_stats.timed(self.lazy_namespace, db_name,
+                              super(LazySonicV2Connector, self).connect, db_name, *args, **kwargs)
+        self.lazy_connected.add(db_name)
+
+    def ensure_connected(self, db_name):
+        if db_name not in self.lazy_connected:
+            self.connect(db_name)
+
+
+def _lazy_db_method(name):
+    def method(self, db_name, *args, **kwargs):
+        self.ensure_connected(db_name)
+        return getattr(super(LazySonicV2Connector, self), name)(db_name, *args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+for _name in LazySonicV2Connector.DB_METHODS:
+    if hasattr(SonicV2Connector, _name):
+        setattr(LazySonicV2Connector, _name, _lazy_db_method(_name))
+
+
+class LazyClients(MutableMapping):
+    """
+    Mapping of namespace to DB client, creating each client on first access.
+    Iterating the keys does not connect anything.
+    """
+
+    def __init__(self, namespaces, factory):
+        self._namespaces = list(namespaces)
+        self._factory = factory
+        self._clients = {}
+
+    def __getitem__(self, namespace):
+        if namespace not in self._clients:
+            if namespace not in self._namespaces:
+                raise KeyError(namespace)
+            self._clients[namespace] = self._factory(namespace)
+        return self._clients[namespace]
+
+    def __setitem__(self, namespace, client):
+        if namespace not in self._namespaces:
+            self._namespaces.append(namespace)
+        self._clients[namespace] = client
+
+    def __delitem__(self, namespace):
+        self._namespaces.remove(namespace)
+        self._clients.pop(namespace, None)
+
+    def __iter__(self):
+        return iter(list(self._namespaces))
+
+    def __len__(self):
+        return len(self._namespaces)
+
+    def connected(self):
+        """
+        Namespaces whose client has been created
+        """
+        return list(self._clients)
+
+
 class Db(object):
+    """
+    Connection manager for the CLIs. Connections are opened per
+    (namespace, db) on first use and kept for reuse, so commands only pay
+    for the databases they touch. Connection counts and times are kept in
+    self.stats.
+    """
+
     def __init__(self):
-        self.cfgdb_clients = {}
-        self.db_clients = {}
-        self.cfgdb = ConfigDBConnector()
-        self.cfgdb.connect()
-        self.cfgdb_pipe = ConfigDBPipeConnector()
-        self.cfgdb_pipe.connect()
-        self.db = SonicV2Connector(host="127.0.0.1")
+        self.stats = ConnectionStats()
+        self._cfgdb = None
+        self._cfgdb_pipe = None
+        self._db = None
 
         # Skip connecting to chassis databases in line cards
         self.db_list = list(self.db.get_db_list())
@@ -23,21 +144,57 @@ class Db(object):
             except Exception:
                 pass
 
-        for db_id in self.db_list:
-            self.db.connect(db_id)
-
-        self.cfgdb_clients[constants.DEFAULT_NAMESPACE] = self.cfgdb
-        self.db_clients[constants.DEFAULT_NAMESPACE] = self.db
-
+        ns_list = [constants.DEFAULT_NAMESPACE]
         if multi_asic.is_multi_asic():
             if not SonicDBConfig.isGlobalInit():
                 SonicDBConfig.initializeGlobalConfig()
             self.ns_list = multi_asic_ns_choices()
-            for ns in self.ns_list:
-                self.cfgdb_clients[ns] = (
-                    multi_asic.connect_config_db_for_ns(ns)
-                )
-                self.db_clients[ns] = multi_asic.connect_to_all_dbs_for_ns(ns)
+            ns_list += [ns for ns in self.ns_list if ns != constants.DEFAULT_NAMESPACE]
+
+        self.cfgdb_clients = LazyClients(ns_list, self._connect_cfgdb)
+        self.db_clients = LazyClients(ns_list, self._connect_db)
+
+    def _connect_cfgdb(self, namespace):
+        if namespace == constants.DEFAULT_NAMESPACE:
+            return self.cfgdb
+        return self.stats.timed(namespace, 'CONFIG_DB', multi_asic.connect_config_db_for_ns, namespace)
+
+    def _connect_db(self, namespace):
+        if namespace == constants.DEFAULT_NAMESPACE:
+            return self.db
+        return LazySonicV2Connector(use_unix_socket_path=True, namespace=namespace, stats=self.stats)
+
+    @property
+    def cfgdb(self):
+        if self._cfgdb is None:
+            self._cfgdb = ConfigDBConnector()
+            self.stats.timed(constants.DEFAULT_NAMESPACE, 'CONFIG_DB', self._cfgdb.connect)
+        return self._cfgdb
+
+    @cfgdb.setter
+    def cfgdb(self, value):
+        self._cfgdb = value
+
+    @property
+    def cfgdb_pipe(self):
+        if self._cfgdb_pipe is None:
+            self._cfgdb_pipe = ConfigDBPipeConnector()
+            self.stats.timed(constants.DEFAULT_NAMESPACE, 'CONFIG_DB', self._cfgdb_pipe.connect)
+        return self._cfgdb_pipe
+
+    @cfgdb_pipe.setter
+    def cfgdb_pipe(self, value):
+        self._cfgdb_pipe = value
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = LazySonicV2Connector(host="127.0.0.1", stats=self.stats)
+        return self._db
+
+    @db.setter
+    def db(self, value):
+        self._db = value
 
     def get_data(self, table, key):
         data = self.cfgdb.get_table(table)
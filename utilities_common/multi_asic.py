@@ -1,4 +1,5 @@
 import argparse
+import copy
 import functools
 
 import click
@@ -6,6 +7,7 @@ import netifaces
 from natsort import natsorted
 from sonic_py_common import multi_asic, device_info
 from utilities_common import constants
+from utilities_common import parallel
 from utilities_common.general import load_db_config
 
 
@@ -44,6 +46,9 @@ class MultiAsic(object):
         self.current_namespace = None
         self.is_multi_asic = multi_asic.is_multi_asic()
         self.db = db
+        # namespace -> (config_db, db) opened by run_on_multi_asic when no
+        # Db object was given, reused by every later call on this object
+        self.ns_connections = {}
 
     def get_display_option(self):
         return self.display_option
@@ -176,13 +181,37 @@ def multi_asic_click_option_namespace(func=None, required=False, default=None,
         help=help
     )
 
+
+def _connect_ns(multi_asic_obj, ns):
+    '''
+    Returns the (config_db, db) handles of namespace ns for run_on_multi_asic:
+    those of the Db object of multi_asic_obj when it has one, otherwise the
+    ones opened by an earlier call, or new ones.
+    '''
+    config_db, db = multi_asic_obj.ns_connections.get(ns, (None, None))
+    # if object instance already has db connections, use them
+    if multi_asic_obj.db and multi_asic_obj.db.cfgdb_clients.get(ns):
+        config_db = multi_asic_obj.db.cfgdb_clients[ns]
+    elif config_db is None:
+        config_db = multi_asic.connect_config_db_for_ns(ns)
+
+    if multi_asic_obj.db and multi_asic_obj.db.db_clients.get(ns):
+        db = multi_asic_obj.db.db_clients[ns]
+    elif db is None:
+        db = multi_asic.connect_to_all_dbs_for_ns(ns)
+
+    multi_asic_obj.ns_connections[ns] = (config_db, db)
+    return config_db, db
+
+
 def run_on_multi_asic(func):
     '''
     This decorator is used on the CLI functions which needs to be
     run on all the namespaces in the multi ASIC platform
     The decorator loops through all the required namespaces,
-    for every iteration, it connects to all the DBs and provides an handle
-    to the wrapped function.
+    for every iteration, it provides the DB handles of the namespace
+    to the wrapped function. Handles come from the Db object when there
+    is one, otherwise they are opened on the first call and reused.
 
     '''
     @functools.wraps(func)
@@ -190,18 +219,37 @@ def run_on_multi_asic(func):
         ns_list = self.multi_asic.get_ns_list_based_on_options()
         for ns in ns_list:
             self.multi_asic.current_namespace = ns
-            # if object instance already has db connections, use them
-            if self.multi_asic.db and self.multi_asic.db.cfgdb_clients.get(ns):
-                self.config_db = self.multi_asic.db.cfgdb_clients[ns]
-            else:
-                self.config_db = multi_asic.connect_config_db_for_ns(ns)
+            self.config_db, self.db = _connect_ns(self.multi_asic, ns)
+            func(self,  *args, **kwargs)
+    return wrapped_run_on_all_asics
 
-            if self.multi_asic.db and self.multi_asic.db.db_clients.get(ns):
-                self.db = self.multi_asic.db.db_clients[ns]
-            else:
-                self.db = multi_asic.connect_to_all_dbs_for_ns(ns)
 
-            func(self,  *args, **kwargs)
+def run_on_multi_asic_parallel(func):
+    '''
+    Parallel variant of run_on_multi_asic, for functions which collect
+    data of a namespace without changing the state of the object.
+    The wrapped function runs for all the namespaces at once, one thread
+    each. Every thread gets a shallow copy of the object, with its own
+    copy of multi_asic for current_namespace and its own DB handles of
+    the namespace in config_db and db, so the function returns what it
+    collected instead of adding it to the attributes of the object.
+    The decorator returns the list of the returned values, in the order
+    of the namespaces, and raises the first exception in that order.
+
+    '''
+    @functools.wraps(func)
+    def wrapped_run_on_all_asics(self, *args, **kwargs):
+        ns_list = self.multi_asic.get_ns_list_based_on_options()
+
+        def run_on_ns(ns):
+            worker = copy.copy(self)
+            worker.multi_asic = copy.copy(self.multi_asic)
+            worker.multi_asic.current_namespace = ns
+            worker.config_db, worker.db = _connect_ns(self.multi_asic, ns)
+            return func(worker, *args, **kwargs)
+
+        results = parallel.imap_ordered(run_on_ns, ns_list, workers=len(ns_list))
+        return [result for _, result, _ in results]
     return wrapped_run_on_all_asics
 
 
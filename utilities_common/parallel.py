@@ -0,0 +1,121 @@
+"""
+Ordered worker pool for per-object collection (ports, namespaces, ...).
+
+imap_ordered runs a function for many items on a few threads and yields
+the results in the order of the items as soon as each is ready, so the
+output can be streamed while later items are still being collected. Only
+a window of items is in flight at a time.
+
+A call which does not return within the timeout is reported as failed and
+left running on its own; a new worker takes its place. Workers are daemon
+threads, so such a call does not keep the process alive either.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+
+class TaskTimeout(Exception):
+    """
+    The call for an item did not return in time.
+    """
+    pass
+
+
+class _Task(object):
+    def __init__(self, item):
+        self.item = item
+        self.started = threading.Event()
+        self.done = threading.Event()
+        self.start_time = None
+        self.result = None
+        self.error = None
+
+
+def _worker(tasks, func):
+    while True:
+        task = tasks.get()
+        if task is None:
+            return
+        task.start_time = time.monotonic()
+        task.started.set()
+        try:
+            task.result = func(task.item)
+        except BaseException as e:
+            task.error = e
+        task.done.set()
+
+
+def imap_ordered(func, items, workers=1, timeout=None, return_exceptions=False):
+    """
+    Generator of (item, result, error) of func(item) for every item, in the
+    order of items.
+    :param workers: Number of threads; with 1 and no timeout, func runs in
+                    the calling thread
+    :param timeout: Seconds a call may take from its start, or None
+    :param return_exceptions: Yield the Exception raised by func as error
+                              instead of raising it in the calling thread
+    error is None or TaskTimeout, or the exception raised by func with
+    return_exceptions; result is None when error is set. Exceptions are
+    raised in the calling thread when their item is reached, so the items
+    before are yielded first.
+    """
+    if workers <= 1 and timeout is None:
+        for item in items:
+            try:
+                result = func(item)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                yield item, None, e
+            else:
+                yield item, result, None
+        return
+
+    tasks = queue.Queue()
+    threads = []
+
+    def start_worker():
+        thread = threading.Thread(target=_worker, args=(tasks, func), daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    for _ in range(max(workers, 1)):
+        start_worker()
+
+    pending = deque()
+    items = iter(items)
+    try:
+        while True:
+            for item in items:
+                task = _Task(item)
+                tasks.put(task)
+                pending.append(task)
+                if len(pending) >= 2 * max(workers, 1):
+                    break
+            if not pending:
+                break
+
+            task = pending.popleft()
+            # Tasks start in order, so this one starts as soon as a worker is free
+            task.started.wait()
+            remaining = None if timeout is None else max(task.start_time + timeout - time.monotonic(), 0)
+            if not task.done.wait(remaining):
+                # Leave the call behind and keep the number of workers
+                start_worker()
+                yield task.item, None, TaskTimeout("Timed out after {} seconds".format(timeout))
+                continue
+            if task.error is not None and not (return_exceptions and isinstance(task.error, Exception)):
+                raise task.error
+            yield task.item, task.result, task.error
+    finally:
+        # Drop the items not started yet, if the caller stopped early
+        while True:
+            try:
+                tasks.get_nowait()
+            except queue.Empty:
+                break
+        for _ in threads:
+            tasks.put(None)
@@ -9,9 +9,10 @@ from sonic_py_common import device_info
 from swsscommon.swsscommon import SonicV2Connector, CounterTable, PortCounter
 
 from utilities_common import constants
+from utilities_common import bulk_db
 import utilities_common.multi_asic as multi_asic_util
-from utilities_common.netstat import ns_diff, table_as_json, format_brate, format_prate, \
-                                     format_util, format_number_with_comma, format_util_directly, \
+from utilities_common.netstat import ns_diff, CounterDelta, table_as_json, format_brate, format_prate, \
+                                     format_util, format_util_directly, \
                                      format_fec_ber, format_fec_flr, format_fec_flr_predicted
 
 """
@@ -156,6 +157,13 @@ PORT_STATE_DISABLED = 'X'
 LINECARD_PORT_STAT_TABLE = 'LINECARD_PORT_STAT_TABLE'
 LINECARD_PORT_STAT_MARK_TABLE = 'LINECARD_PORT_STAT_MARK_TABLE'
 CHASSIS_MIDPLANE_INFO_TABLE = 'CHASSIS_MIDPLANE_TABLE'
+# Seconds to wait for the linecards to publish their counters
+LINECARD_PULL_TIMEOUT = 2
+# LINECARD_PORT_STAT_TABLE fields, in NStats and RateStats order
+LINECARD_NSTATS_FIELDS = ["rx_ok", "rx_err", "rx_drop", "rx_ovr", "tx_ok", "tx_err", "tx_drop", "tx_ovr"]
+LINECARD_RATES_FIELDS = ["rx_bps", "rx_pps", "rx_util", "tx_bps", "tx_pps", "tx_util", "fec_pre_ber",
+                         "fec_post_ber", "fec_pre_ber_max", "fec_flr", "fec_flr_predicted",
+                         "fec_flr_r_squared", "fec_max_t"]
 
 
 def intfsorted(intf_list):
@@ -168,18 +176,6 @@ def intfsorted(intf_list):
     return sorted(intf_list, key=sort_key)
 
 
-def is_non_zero(value):
-    """
-        Check if the value is non-zero.
-    """
-    if value == STATUS_NA:
-        return False
-    if type(value) is str and ',' in value:
-        value = value.replace(',', '')
-
-    return int(value) != 0
-
-
 class Portstat(object):
     def __init__(self, namespace, display_option):
         self.db = None
@@ -230,11 +226,13 @@ class Portstat(object):
                     lc_count += 1
 
         # Notify the Linecards to publish their counter values instantly
+        # and wait for every connected one to mark its table as published
         self.db.set(self.db.CHASSIS_STATE_DB, "GET_LINECARD_COUNTER|pull", "enable", "true")
-        time.sleep(2)
+        client = bulk_db.get_redis_client(self.db, self.db.CHASSIS_STATE_DB)
+        linecard_names = bulk_db.wait_for_keys(client, LINECARD_PORT_STAT_MARK_TABLE + "*", lc_count,
+                                               LINECARD_PULL_TIMEOUT)
 
         # Check if all LCs have published counters
-        linecard_names = self.db.keys(self.db.CHASSIS_STATE_DB, LINECARD_PORT_STAT_MARK_TABLE + "*")
         linecard_port_aliases = self.db.keys(self.db.CHASSIS_STATE_DB, LINECARD_PORT_STAT_TABLE + "*")
         if not linecard_port_aliases:
             # LC has not published it's Counter which could be due to chassis_port_counter_monitor.service not running
@@ -249,35 +247,12 @@ class Portstat(object):
         cnstat_dict['time'] = datetime.datetime.now()
         ratestat_dict = OrderedDict()
 
-        # Get the counter values from CHASSIS_STATE_DB
-        for key in linecard_port_aliases:
-            rx_ok = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_ok")
-            rx_bps = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_bps")
-            rx_pps = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_pps")
-            rx_util = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_util")
-            rx_err = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_err")
-            rx_drop = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_drop")
-            rx_ovr = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_ovr")
-            tx_ok = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_ok")
-            tx_bps = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_bps")
-            tx_pps = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_pps")
-            tx_util = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_util")
-            tx_err = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_err")
-            tx_drop = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_drop")
-            tx_ovr = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_ovr")
-            fec_pre_ber = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_pre_ber")
-            fec_post_ber = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_post_ber")
-            fec_pre_ber_max = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_pre_ber_max")
-            fec_flr = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_flr")
-            fec_flr_predicted = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_flr_predicted")
-            fec_flr_r_squared = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_flr_r_squared")
-            fec_max_t = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_max_t")
+        # Get the counter values of all ports from CHASSIS_STATE_DB in one round trip
+        for key, fvs in zip(linecard_port_aliases, bulk_db.get_all_pipelined(client, linecard_port_aliases)):
             port_alias = key.split("|")[-1]
-            cnstat_dict[port_alias] = NStats._make([rx_ok, rx_err, rx_drop, rx_ovr, tx_ok, tx_err, tx_drop, tx_ovr] +
-                                                   [STATUS_NA] * (len(NStats._fields) - 8))._asdict()
-            ratestat_dict[port_alias] = RateStats._make([rx_bps, rx_pps, rx_util, tx_bps,
-                                                        tx_pps, tx_util, fec_pre_ber, fec_post_ber, fec_pre_ber_max,
-                                                        fec_flr, fec_flr_predicted, fec_flr_r_squared, fec_max_t])
+            nstats = [fvs.get(field) for field in LINECARD_NSTATS_FIELDS]
+            cnstat_dict[port_alias] = NStats._make(nstats + [STATUS_NA] * (len(NStats._fields) - len(nstats)))._asdict()
+            ratestat_dict[port_alias] = RateStats._make([fvs.get(field) for field in LINECARD_RATES_FIELDS])
         self.cnstat_dict.update(cnstat_dict)
         self.ratestat_dict.update(ratestat_dict)
 
@@ -592,16 +567,10 @@ class Portstat(object):
         table = []
         header = None
 
+        deltas = CounterDelta(cnstat_new_dict, cnstat_old_dict)
         for key in self.sorted(cnstat_new_dict.keys()):
-            cntr = cnstat_new_dict.get(key)
             if key == 'time':
                 continue
-            old_cntr = None
-            if key in cnstat_old_dict:
-                old_cntr = cnstat_old_dict.get(key)
-            else:
-                old_cntr = NStats._make([0] * len(counter_bucket_dict))._asdict()
-
             rates = ratestat_dict.get(key, RateStats._make([STATUS_NA] * len(ratestat_fields)))
 
             if intf_list and key not in intf_list:
@@ -611,60 +580,48 @@ class Portstat(object):
             if print_all:
                 header = header_all
 
-                if not nonzero or is_non_zero(ns_diff(cntr["rx_ok"], old_cntr["rx_ok"])) or \
-                   is_non_zero(ns_diff(cntr["tx_ok"], old_cntr["tx_ok"])) or \
-                   is_non_zero(ns_diff(cntr["rx_err"], old_cntr["rx_err"])) or \
-                   is_non_zero(ns_diff(cntr["tx_err"], old_cntr["tx_err"])) or \
-                   is_non_zero(ns_diff(cntr["rx_drop"], old_cntr["rx_drop"])) or \
-                   is_non_zero(ns_diff(cntr["tx_drop"], old_cntr["tx_drop"])) or \
-                   is_non_zero(ns_diff(cntr["rx_ovr"], old_cntr["rx_ovr"])) or \
-                   is_non_zero(ns_diff(cntr["tx_ovr"], old_cntr["tx_ovr"])):
+                if not nonzero or deltas.nonzero(key, ("rx_ok", "tx_ok", "rx_err", "tx_err",
+                                                       "rx_drop", "tx_drop", "rx_ovr", "tx_ovr")):
                     table.append((key, self.get_port_state(key),
-                                  ns_diff(cntr["rx_ok"], old_cntr["rx_ok"]),
+                                  deltas.diff(key, "rx_ok"),
                                   format_brate(rates.rx_bps),
                                   format_prate(rates.rx_pps),
                                   format_util(rates.rx_bps, port_speed)
                                   if rates.rx_util == STATUS_NA else format_util_directly(rates.rx_util),
-                                  ns_diff(cntr["rx_err"], old_cntr["rx_err"]),
-                                  ns_diff(cntr["rx_drop"], old_cntr["rx_drop"]),
-                                  ns_diff(cntr["rx_ovr"], old_cntr["rx_ovr"]),
-                                  ns_diff(cntr["tx_ok"], old_cntr["tx_ok"]),
+                                  deltas.diff(key, "rx_err"),
+                                  deltas.diff(key, "rx_drop"),
+                                  deltas.diff(key, "rx_ovr"),
+                                  deltas.diff(key, "tx_ok"),
                                   format_brate(rates.tx_bps),
                                   format_prate(rates.tx_pps),
                                   format_util(rates.tx_bps, port_speed)
                                   if rates.tx_util == STATUS_NA else format_util_directly(rates.tx_util),
-                                  ns_diff(cntr["tx_err"], old_cntr["tx_err"]),
-                                  ns_diff(cntr["tx_drop"], old_cntr["tx_drop"]),
-                                  ns_diff(cntr["tx_ovr"], old_cntr["tx_ovr"]),
-                                  ns_diff(cntr["trim"], old_cntr["trim"]),
-                                  ns_diff(cntr["trim_sent"], old_cntr["trim_sent"]),
-                                  ns_diff(cntr["trim_drop"], old_cntr["trim_drop"], raw=True)))
+                                  deltas.diff(key, "tx_err"),
+                                  deltas.diff(key, "tx_drop"),
+                                  deltas.diff(key, "tx_ovr"),
+                                  deltas.diff(key, "trim"),
+                                  deltas.diff(key, "trim_sent"),
+                                  deltas.diff(key, "trim_drop", raw=True)))
             elif errors_only:
                 header = header_errors_only
 
-                if not nonzero or is_non_zero(ns_diff(cntr["rx_err"], old_cntr["rx_err"])) or \
-                   is_non_zero(ns_diff(cntr["tx_err"], old_cntr["tx_err"])) or \
-                   is_non_zero(ns_diff(cntr["rx_drop"], old_cntr["rx_drop"])) or \
-                   is_non_zero(ns_diff(cntr["tx_drop"], old_cntr["tx_drop"])) or \
-                   is_non_zero(ns_diff(cntr["rx_ovr"], old_cntr["rx_ovr"])) or \
-                   is_non_zero(ns_diff(cntr["tx_ovr"], old_cntr["tx_ovr"])):
+                if not nonzero or deltas.nonzero(key, ("rx_err", "tx_err", "rx_drop",
+                                                       "tx_drop", "rx_ovr", "tx_ovr")):
                     table.append((key, self.get_port_state(key),
-                                  ns_diff(cntr["rx_err"], old_cntr["rx_err"]),
-                                  ns_diff(cntr["rx_drop"], old_cntr["rx_drop"]),
-                                  ns_diff(cntr["rx_ovr"], old_cntr["rx_ovr"]),
-                                  ns_diff(cntr["tx_err"], old_cntr["tx_err"]),
-                                  ns_diff(cntr["tx_drop"], old_cntr["tx_drop"]),
-                                  ns_diff(cntr["tx_ovr"], old_cntr["tx_ovr"])))
+                                  deltas.diff(key, "rx_err"),
+                                  deltas.diff(key, "rx_drop"),
+                                  deltas.diff(key, "rx_ovr"),
+                                  deltas.diff(key, "tx_err"),
+                                  deltas.diff(key, "tx_drop"),
+                                  deltas.diff(key, "tx_ovr")))
             elif fec_stats_only:
                 header = header_fec_only
 
-                if not nonzero or is_non_zero(ns_diff(cntr['fec_corr'], old_cntr['fec_corr'])) or \
-                   is_non_zero(ns_diff(cntr['fec_uncorr'], old_cntr['fec_uncorr'])) or \
-                   is_non_zero(ns_diff(cntr['fec_symbol_err'], old_cntr['fec_symbol_err'])):
+                if not nonzero or deltas.nonzero(key, ("fec_corr", "fec_uncorr", "fec_symbol_err")):
                     table.append((key, self.get_port_state(key),
-                                  ns_diff(cntr['fec_corr'], old_cntr['fec_corr']),
-                                  ns_diff(cntr['fec_uncorr'], old_cntr['fec_uncorr']),
-                                  ns_diff(cntr['fec_symbol_err'], old_cntr['fec_symbol_err']),
+                                  deltas.diff(key, "fec_corr"),
+                                  deltas.diff(key, "fec_uncorr"),
+                                  deltas.diff(key, "fec_symbol_err"),
                                   format_fec_ber(rates.fec_pre_ber),
                                   format_fec_ber(rates.fec_post_ber),
                                   format_fec_ber(rates.fec_pre_ber_max),
@@ -675,36 +632,35 @@ class Portstat(object):
             elif fec_hist_only:
                 header = header_fec_hist_only
 
-                table.append((key, ns_diff(cntr['fec_bin0'], old_cntr['fec_bin0']),
-                              ns_diff(cntr['fec_bin1'], old_cntr['fec_bin1']),
-                              ns_diff(cntr['fec_bin2'], old_cntr['fec_bin2']),
-                              ns_diff(cntr['fec_bin3'], old_cntr['fec_bin3']),
-                              ns_diff(cntr['fec_bin4'], old_cntr['fec_bin4']),
-                              ns_diff(cntr['fec_bin5'], old_cntr['fec_bin5']),
-                              ns_diff(cntr['fec_bin6'], old_cntr['fec_bin6']),
-                              ns_diff(cntr['fec_bin7'], old_cntr['fec_bin7']),
-                              ns_diff(cntr['fec_bin8'], old_cntr['fec_bin8']),
-                              ns_diff(cntr['fec_bin9'], old_cntr['fec_bin9']),
-                              ns_diff(cntr['fec_bin10'], old_cntr['fec_bin10']),
-                              ns_diff(cntr['fec_bin11'], old_cntr['fec_bin11']),
-                              ns_diff(cntr['fec_bin12'], old_cntr['fec_bin12']),
-                              ns_diff(cntr['fec_bin13'], old_cntr['fec_bin13']),
-                              ns_diff(cntr['fec_bin14'], old_cntr['fec_bin14']),
-                              ns_diff(cntr['fec_bin15'], old_cntr['fec_bin15'])))
+                table.append((key, deltas.diff(key, "fec_bin0"),
+                              deltas.diff(key, "fec_bin1"),
+                              deltas.diff(key, "fec_bin2"),
+                              deltas.diff(key, "fec_bin3"),
+                              deltas.diff(key, "fec_bin4"),
+                              deltas.diff(key, "fec_bin5"),
+                              deltas.diff(key, "fec_bin6"),
+                              deltas.diff(key, "fec_bin7"),
+                              deltas.diff(key, "fec_bin8"),
+                              deltas.diff(key, "fec_bin9"),
+                              deltas.diff(key, "fec_bin10"),
+                              deltas.diff(key, "fec_bin11"),
+                              deltas.diff(key, "fec_bin12"),
+                              deltas.diff(key, "fec_bin13"),
+                              deltas.diff(key, "fec_bin14"),
+                              deltas.diff(key, "fec_bin15")))
 
             elif rates_only:
                 header = header_rates_only
 
-                if not nonzero or is_non_zero(ns_diff(cntr["rx_ok"], old_cntr["rx_ok"])) or \
-                   is_non_zero(ns_diff(cntr["tx_ok"], old_cntr["tx_ok"])):
+                if not nonzero or deltas.nonzero(key, ("rx_ok", "tx_ok")):
                     table.append((key,
                                   self.get_port_state(key),
-                                  ns_diff(cntr["rx_ok"], old_cntr["rx_ok"]),
+                                  deltas.diff(key, "rx_ok"),
                                   format_brate(rates.rx_bps),
                                   format_prate(rates.rx_pps),
                                   format_util(rates.rx_bps, port_speed)
                                   if rates.rx_util == STATUS_NA else format_util_directly(rates.rx_util),
-                                  ns_diff(cntr["tx_ok"], old_cntr["tx_ok"]),
+                                  deltas.diff(key, "tx_ok"),
                                   format_brate(rates.tx_bps),
                                   format_prate(rates.tx_pps),
                                   format_util(rates.tx_bps, port_speed)
@@ -712,38 +668,32 @@ class Portstat(object):
             elif trim_stats_only:  # Packet Trimming related statistics
                 header = header_trim_only
 
-                if not nonzero or is_non_zero(ns_diff(cntr['trim'], old_cntr['trim'])):
+                if not nonzero or deltas.nonzero(key, ("trim",)):
                     table.append((key, self.get_port_state(key),
-                                  ns_diff(cntr["trim"], old_cntr["trim"]),
-                                  ns_diff(cntr["trim_sent"], old_cntr["trim_sent"]),
-                                  ns_diff(cntr["trim_drop"], old_cntr["trim_drop"], raw=True)))
+                                  deltas.diff(key, "trim"),
+                                  deltas.diff(key, "trim_sent"),
+                                  deltas.diff(key, "trim_drop", raw=True)))
             else:
                 header = header_std
 
-                if not nonzero or is_non_zero(ns_diff(cntr["rx_ok"], old_cntr["rx_ok"])) or \
-                   is_non_zero(ns_diff(cntr["tx_ok"], old_cntr["tx_ok"])) or \
-                   is_non_zero(ns_diff(cntr["rx_err"], old_cntr["rx_err"])) or \
-                   is_non_zero(ns_diff(cntr["tx_err"], old_cntr["tx_err"])) or \
-                   is_non_zero(ns_diff(cntr["rx_drop"], old_cntr["rx_drop"])) or \
-                   is_non_zero(ns_diff(cntr["tx_drop"], old_cntr["tx_drop"])) or \
-                   is_non_zero(ns_diff(cntr["rx_ovr"], old_cntr["rx_ovr"])) or \
-                   is_non_zero(ns_diff(cntr["tx_ovr"], old_cntr["tx_ovr"])):
+                if not nonzero or deltas.nonzero(key, ("rx_ok", "tx_ok", "rx_err", "tx_err",
+                                                       "rx_drop", "tx_drop", "rx_ovr", "tx_ovr")):
                     table.append((key,
                                   self.get_port_state(key),
-                                  ns_diff(cntr["rx_ok"], old_cntr["rx_ok"]),
+                                  deltas.diff(key, "rx_ok"),
                                   format_brate(rates.rx_bps),
                                   format_util(rates.rx_bps, port_speed)
                                   if rates.rx_util == STATUS_NA else format_util_directly(rates.rx_util),
-                                  ns_diff(cntr["rx_err"], old_cntr["rx_err"]),
-                                  ns_diff(cntr["rx_drop"], old_cntr["rx_drop"]),
-                                  ns_diff(cntr["rx_ovr"], old_cntr["rx_ovr"]),
-                                  ns_diff(cntr["tx_ok"], old_cntr["tx_ok"]),
+                                  deltas.diff(key, "rx_err"),
+                                  deltas.diff(key, "rx_drop"),
+                                  deltas.diff(key, "rx_ovr"),
+                                  deltas.diff(key, "tx_ok"),
                                   format_brate(rates.tx_bps),
                                   format_util(rates.tx_bps, port_speed)
                                   if rates.tx_util == STATUS_NA else format_util_directly(rates.tx_util),
-                                  ns_diff(cntr["tx_err"], old_cntr["tx_err"]),
-                                  ns_diff(cntr["tx_drop"], old_cntr["tx_drop"]),
-                                  ns_diff(cntr["tx_ovr"], old_cntr["tx_ovr"])))
+                                  deltas.diff(key, "tx_err"),
+                                  deltas.diff(key, "tx_drop"),
+                                  deltas.diff(key, "tx_ovr")))
 
         if table:
             if use_json:
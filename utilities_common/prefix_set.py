@@ -0,0 +1,210 @@
+# Set based IP prefix diff engine
+
+import socket
+
+DEFAULT_VRF = ""
+PREFIX_SEPARATOR = "/"
+IPV6_SEPARATOR = ":"
+
+
+def prefix_key(prefix):
+    """
+    Normalize an IP prefix string into its canonical "ip/len" text.
+    IPv4 dotted quads have a single textual form, so only a missing length
+    is filled in. IPv6 goes through inet_pton/inet_ntop, so case and zero
+    compression variants of the same prefix compare equal without going
+    through ipaddress objects. A prefix already in canonical form is
+    returned as is, so no second copy of the string is kept.
+    :param prefix: "ip" or "ip/len" string, IPv4 or IPv6
+    :return str key
+    :raise OSError or ValueError on a malformed IPv6 prefix
+    """
+    if IPV6_SEPARATOR not in prefix:
+        return prefix if PREFIX_SEPARATOR in prefix else prefix + "/32"
+    addr, _, plen = prefix.partition(PREFIX_SEPARATOR)
+    plen = int(plen or 128)
+    if not 0 <= plen <= 128:
+        raise ValueError("invalid IPv6 prefix length {}".format(plen))
+    key = "{}/{}".format(socket.inet_ntop(socket.AF_INET6, socket.inet_pton(socket.AF_INET6, addr)), plen)
+    return prefix if key == prefix else key
+
+
+def _safe_key(prefix):
+    """
+    :return (key, valid); a malformed prefix keys on its lowercase text,
+    so it still compares as it did before normalization
+    """
+    try:
+        return prefix_key(prefix), True
+    except (OSError, ValueError):
+        return prefix.lower(), False
+
+
+class _Partition(object):
+    """
+    Prefixes of one VRF: the set of keys, and the original string of the
+    few entries whose text is not their key.
+    """
+
+    __slots__ = ("keys", "orig")
+
+    def __init__(self, keys=None, orig=None):
+        self.keys = set() if keys is None else keys
+        self.orig = {} if orig is None else orig
+
+    def prefix(self, key):
+        return self.orig.get(key, key) if self.orig else key
+
+    def subset(self, keys):
+        """
+        :return _Partition of keys, a subset of self.keys
+        """
+        orig = self.orig
+        if len(orig) > len(keys):
+            orig = {k: orig[k] for k in keys if k in orig}
+        else:
+            orig = {k: v for k, v in orig.items() if k in keys}
+        return _Partition(keys, orig)
+
+
+class PrefixSet(object):
+    """
+    Set of IP prefixes, partitioned per VRF.
+    Each prefix is normalized once, when added; every diff or filter after
+    that is a set operation on the keys. The original string is only kept
+    aside for a prefix not written in canonical form, for reporting.
+    Malformed prefixes added are kept and listed in invalid.
+    """
+
+    def __init__(self, prefixes=(), vrf=DEFAULT_VRF):
+        self._vrfs = {}
+        self.invalid = []
+        self.update(prefixes, vrf)
+
+    def _partition(self, vrf):
+        part = self._vrfs.get(vrf)
+        if part is None:
+            part = self._vrfs[vrf] = _Partition()
+        return part
+
+    def add(self, prefix, vrf=DEFAULT_VRF):
+        self.update((prefix,), vrf)
+
+    def update(self, prefixes, vrf=DEFAULT_VRF):
+        part = self._partition(vrf)
+        keys = part.keys
+        for prefix in prefixes:
+            key, valid = _safe_key(prefix)
+            if key not in keys:
+                keys.add(key)
+                if key is not prefix:
+                    part.orig[key] = prefix
+                if not valid:
+                    self.invalid.append(prefix)
+
+    def discard(self, prefix, vrf=DEFAULT_VRF):
+        part = self._vrfs.get(vrf)
+        if part:
+            key = _safe_key(prefix)[0]
+            part.keys.discard(key)
+            part.orig.pop(key, None)
+
+    def contains(self, prefix, vrf=DEFAULT_VRF):
+        part = self._vrfs.get(vrf)
+        return part is not None and _safe_key(prefix)[0] in part.keys
+
+    def __contains__(self, prefix):
+        return self.contains(prefix)
+
+    def __len__(self):
+        return sum(len(part.keys) for part in self._vrfs.values())
+
+    def __bool__(self):
+        return any(part.keys for part in self._vrfs.values())
+
+    def __iter__(self):
+        for part in self._vrfs.values():
+            if part.orig:
+                yield from map(part.prefix, part.keys)
+            else:
+                yield from part.keys
+
+    def vrfs(self):
+        return [vrf for vrf, part in self._vrfs.items() if part.keys]
+
+    def items(self, vrf=DEFAULT_VRF):
+        """
+        :return iterable of (key, prefix) of one VRF
+        """
+        part = self._vrfs.get(vrf)
+        if part is None:
+            return ()
+        return ((key, part.prefix(key)) for key in part.keys)
+
+    @classmethod
+    def _from_parts(cls, parts):
+        new = cls()
+        new._vrfs = parts
+        return new
+
+    def difference(self, other):
+        """
+        :return PrefixSet of the entries of self not in other, VRF by VRF
+        """
+        parts = {}
+        for vrf, part in self._vrfs.items():
+            other_part = other._vrfs.get(vrf)
+            if other_part is not None:
+                parts[vrf] = part.subset(part.keys - other_part.keys)
+            else:
+                parts[vrf] = part.subset(set(part.keys))
+        return self._from_parts(parts)
+
+    def intersection(self, other):
+        """
+        :return PrefixSet of the entries of self also in other, VRF by VRF
+        """
+        parts = {}
+        for vrf, part in self._vrfs.items():
+            other_part = other._vrfs.get(vrf)
+            keys = part.keys & other_part.keys if other_part is not None else set()
+            parts[vrf] = part.subset(keys)
+        return self._from_parts(parts)
+
+    def filter(self, predicate):
+        """
+        :param predicate: callable taking the prefix string, True to keep it
+        :return PrefixSet of the entries matching predicate
+        """
+        parts = {}
+        for vrf, part in self._vrfs.items():
+            parts[vrf] = part.subset({k for k in part.keys if predicate(part.prefix(k))})
+        return self._from_parts(parts)
+
+    def exclude(self, prefixes):
+        """
+        :param prefixes: iterable of prefix strings to drop from every VRF
+        :return PrefixSet without those
+        """
+        keys = {_safe_key(p)[0] for p in prefixes}
+        return self._from_parts({vrf: part.subset(part.keys - keys)
+                                 for vrf, part in self._vrfs.items()})
+
+    def sorted(self):
+        """
+        :return sorted list of the prefix strings of all VRFs
+        """
+        return sorted(self)
+
+
+def diff_prefixes(left, right):
+    """
+    Diff two collections of prefix strings.
+    :return (<left entries not in right>, <right entries not in left>)
+    as PrefixSet
+    """
+    if not isinstance(left, PrefixSet):
+        left = PrefixSet(left)
+    if not isinstance(right, PrefixSet):
+        right = PrefixSet(right)
+    return left.difference(right), right.difference(left)
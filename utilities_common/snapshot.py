@@ -0,0 +1,227 @@
+"""
+Compact on-disk store for the counter baselines saved by 'clear counters'.
+
+A snapshot is a dict as built by the *stat tools, e.g.
+{'time': datetime, 'Ethernet0': {'rx_ok': '10', 'rx_err': 'N/A', ...}, ...},
+nested to any depth. Every innermost dict is a row; rows are stored as one
+array of unsigned 64 bit integers with a column per field name, so saving
+and loading do not format or parse a decimal string per counter. Values
+which are not canonical decimal strings (and the scalars outside rows,
+like 'time') are kept in a small JSON header next to the row names.
+
+File layout:
+    MAGIC | version (u32) | header length (u32) | header JSON | padding |
+    rows x columns array of native u64
+
+load() maps the file and decodes a row only when it is looked up. Files
+written by json.dump, the format used before, are still read.
+"""
+
+import array
+import datetime
+import json
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Mapping
+
+MAGIC = b"SNAP"
+VERSION = 1
+PREAMBLE = struct.Struct("=4sII")
+ITEM_SIZE = 8
+
+STATUS_NA = 'N/A'
+# Reserved cell values, at the top of the u64 range
+VALUE_NA = 0xFFFFFFFFFFFFFFFF
+VALUE_ABSENT = 0xFFFFFFFFFFFFFFFE
+VALUE_OTHER = 0xFFFFFFFFFFFFFFFD
+VALUE_MAX = 0xFFFFFFFFFFFFFFFC
+
+
+def _json_default(obj):
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    raise TypeError("Type %s not serializable" % type(obj))
+
+
+def _encode(value):
+    """
+    Return the cell for value, or VALUE_OTHER if it has to go to the header.
+    """
+    if value == STATUS_NA:
+        return VALUE_NA
+    if isinstance(value, str) and value.isdigit() and value.isascii() and \
+            (value == "0" or value[0] != "0") and int(value) <= VALUE_MAX:
+        return int(value)
+    return VALUE_OTHER
+
+
+def _key(key):
+    """
+    Return key the way json.dump writes it as an object key.
+    """
+    return key if isinstance(key, str) else json.dumps(key)
+
+
+def _flatten(node, path, rows, scalars):
+    if path and not any(isinstance(value, dict) for value in node.values()):
+        rows.append((path, {_key(k): v for k, v in node.items()}))
+        return
+    for key, value in node.items():
+        if isinstance(value, dict):
+            _flatten(value, path + [_key(key)], rows, scalars)
+        else:
+            # Remember how many rows came before, to restore the key order
+            scalars.append((path + [_key(key)], value, len(rows)))
+
+
+def save(path, data):
+    """
+    Write the snapshot data to path, replacing the file atomically.
+    """
+    rows = []
+    scalars = []
+    _flatten(data, [], rows, scalars)
+
+    fields = {}
+    for _, row in rows:
+        for field in row:
+            fields.setdefault(field, len(fields))
+
+    cells = array.array('Q', [VALUE_ABSENT]) * (len(rows) * len(fields))
+    other = {}
+    for row_idx, (_, row) in enumerate(rows):
+        base = row_idx * len(fields)
+        for field, value in row.items():
+            cell = _encode(value)
+            if cell == VALUE_OTHER:
+                other[base + fields[field]] = value
+            cells[base + fields[field]] = cell
+
+    header = json.dumps({
+        "fields": list(fields),
+        "rows": [row_path for row_path, _ in rows],
+        "scalars": scalars,
+        "other": sorted(other.items()),
+    }, default=_json_default).encode()
+    padding = -(PREAMBLE.size + len(header)) % ITEM_SIZE
+
+    dirname = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            f.write(b"\0" * padding)
+            cells.tofile(f)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class Snapshot(Mapping):
+    """
+    Read-only view of a saved snapshot, with the same keys and values the
+    dict passed to save() had after a JSON round trip.
+    """
+
+    def __init__(self, buf):
+        magic, version, header_len = PREAMBLE.unpack_from(buf)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Unsupported snapshot format")
+        header = json.loads(bytes(buf[PREAMBLE.size:PREAMBLE.size + header_len]))
+        offset = PREAMBLE.size + header_len
+        offset += -offset % ITEM_SIZE
+
+        self._buf = buf
+        self._fields = header["fields"]
+        self._rows = header["rows"]
+        self._other = {int(idx): value for idx, value in header["other"]}
+        self._cells = memoryview(buf)[offset:offset + len(self._rows) * len(self._fields) * ITEM_SIZE].cast('Q')
+
+        # Rows and scalars grouped by their top level key, in saved order
+        entries = [(row_path, row_idx, None) for row_idx, row_path in enumerate(self._rows)]
+        for row_path, value, rows_before in reversed(header["scalars"]):
+            entries.insert(rows_before, (row_path, None, value))
+        self._scalars = {}
+        self._children = {}
+        for row_path, row_idx, value in entries:
+            if len(row_path) == 1 and row_idx is None:
+                self._scalars[row_path[0]] = value
+            else:
+                self._children.setdefault(row_path[0], []).append((row_path[1:], row_idx, value))
+        self._top = list(dict.fromkeys(row_path[0] for row_path, _, _ in entries))
+        self._decoded = {}
+
+    def _decode_row(self, row_idx):
+        row = {}
+        base = row_idx * len(self._fields)
+        for col, field in enumerate(self._fields):
+            cell = self._cells[base + col]
+            if cell == VALUE_ABSENT:
+                continue
+            elif cell == VALUE_NA:
+                row[field] = STATUS_NA
+            elif cell == VALUE_OTHER:
+                row[field] = self._other[base + col]
+            else:
+                row[field] = str(cell)
+        return row
+
+    def _build(self, key):
+        node = {}
+        for sub_path, row_idx, value in self._children[key]:
+            if row_idx is None:
+                parent = node
+                for part in sub_path[:-1]:
+                    parent = parent.setdefault(part, {})
+                parent[sub_path[-1]] = value
+                continue
+            row = self._decode_row(row_idx)
+            if not sub_path:
+                node.update(row)
+                continue
+            parent = node
+            for part in sub_path[:-1]:
+                parent = parent.setdefault(part, {})
+            parent.setdefault(sub_path[-1], {}).update(row)
+        return node
+
+    def __getitem__(self, key):
+        if key in self._scalars:
+            return self._scalars[key]
+        if key not in self._children:
+            raise KeyError(key)
+        if key not in self._decoded:
+            self._decoded[key] = self._build(key)
+        return self._decoded[key]
+
+    def __contains__(self, key):
+        return key in self._scalars or key in self._children
+
+    def __iter__(self):
+        return iter(self._top)
+
+    def __len__(self):
+        return len(self._top)
+
+    def close(self):
+        self._cells.release()
+        if isinstance(self._buf, mmap.mmap):
+            self._buf.close()
+
+
+def load(path):
+    """
+    Load the snapshot at path, written by save() or by json.dump.
+    :return: Snapshot, or dict for a JSON file
+    """
+    with open(path, 'rb') as f:
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            f.seek(0)
+            return json.load(f)
+        return Snapshot(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
@@ -8,7 +8,8 @@ from datetime import datetime
 from swsscommon.swsscommon import COUNTERS_SWITCH_NAME_MAP, COUNTERS_TABLE
 from utilities_common import multi_asic as multi_asic_util
 from utilities_common.netstat import ns_diff, format_number_with_comma
-from utilities_common.cli import UserCache, json_serial
+from utilities_common.cli import UserCache
+from utilities_common import snapshot
 
 
 HEADER_ALL = ["TrimSent/pkts", "TrimDrop/pkts"]
@@ -50,10 +51,10 @@ class SwitchStat(object):
             self.cache.remove()
 
     def load_stats(self):
-        return json.load(open(self.cnstat_fqn_file, "r"))
+        return snapshot.load(self.cnstat_fqn_file)
 
     def save_stats(self, cnstat_dict):
-        json.dump(cnstat_dict, open(self.cnstat_fqn_file, "w"), default=json_serial)
+        snapshot.save(self.cnstat_fqn_file, cnstat_dict)
 
     def get_cnstat(self):
         cnstat_dict = {}
@@ -0,0 +1,88 @@
+"""
+Aggregation of the VOQ counters of all linecards, on a chassis supervisor.
+
+Every linecard ASIC keeps its VOQ counters in its own redis instance. The
+instances are read concurrently, one worker per instance, and each VOQ is
+read with a single HGETALL instead of one HGET per counter. DBConnector has
+no pipeline, so that is still one round trip per VOQ; clients which have
+one (redis-py) read all the VOQs of an instance in pipelined batches.
+
+An instance that cannot be reached or does not answer in time is reported
+back instead of failing the whole aggregation. The workers are daemon
+threads, so an instance that hangs does not keep the CLI from exiting.
+"""
+
+from swsscommon import swsscommon
+from utilities_common import bulk_db
+from utilities_common.parallel import imap_ordered
+
+COUNTERS_VOQ_NAME_MAP = "COUNTERS_VOQ_NAME_MAP"
+COUNTER_TABLE_PREFIX = "COUNTERS:"
+
+LINECARD_REDIS_PORT = 6379
+LINECARD_TIMEOUT = 10  # seconds
+
+
+def connect_linecard(ip, timeout=LINECARD_TIMEOUT):
+    """
+    Connect to COUNTERS_DB of the linecard redis instance at ip.
+    """
+    return swsscommon.DBConnector(swsscommon.COUNTERS_DB, ip, LINECARD_REDIS_PORT, int(timeout * 1000))
+
+
+def read_linecard_voqs(client, counter_names):
+    """
+    Read the VOQ counters of one linecard redis instance.
+    :param client: Connection to the COUNTERS_DB of the instance
+    :param counter_names: Names of the counters to read
+    :return: Dict of VOQ name to {counter name: int} of the counters present
+    """
+    voq_name_map = client.hgetall(COUNTERS_VOQ_NAME_MAP)
+    if not voq_name_map:
+        return {}
+
+    voqs = list(voq_name_map)
+    keys = [COUNTER_TABLE_PREFIX + voq_name_map[voq] for voq in voqs]
+    if hasattr(client, 'pipeline'):
+        tables = bulk_db.get_all_pipelined(client, keys)
+    else:
+        tables = [client.hgetall(key) for key in keys]
+
+    counters = {}
+    for voq, table in zip(voqs, tables):
+        table = table or {}
+        counters[voq] = {name: int(table[name]) for name in counter_names if table.get(name) is not None}
+    return counters
+
+
+def aggregate_voq_stats(redis_ips, counter_names, timeout=LINECARD_TIMEOUT, connect=connect_linecard):
+    """
+    Sum the VOQ counters of all linecard redis instances.
+    :param redis_ips: Addresses of the linecard redis instances
+    :param counter_names: Names of the counters to aggregate
+    :param timeout: Seconds to wait for the instances to answer
+    :param connect: Callable returning a COUNTERS_DB client for (ip, timeout)
+    :return: Tuple of {system port: {VOQ index: {counter name: total}}} and
+             the list of instances which failed or did not answer in time
+    """
+    voq_stats = {}
+    if not redis_ips:
+        return voq_stats, []
+
+    def read(ip):
+        return read_linecard_voqs(connect(ip, timeout), counter_names)
+
+    unreachable = []
+    for ip, linecard_counters, error in imap_ordered(read, redis_ips, workers=len(redis_ips),
+                                                     timeout=timeout, return_exceptions=True):
+        if error is not None:
+            unreachable.append(ip)
+            continue
+        for voq, counters in linecard_counters.items():
+            # key LINECARD|ASIC|EthernetXXX:INDEX
+            sys_port, idx = voq.split(":")
+            voq_counters = voq_stats.setdefault(sys_port, {}).setdefault(idx, {})
+            for name in counter_names:
+                voq_counters[name] = voq_counters.get(name, 0) + counters.get(name, 0)
+
+    return voq_stats, unreachable